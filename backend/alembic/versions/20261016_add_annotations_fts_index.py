@@ -0,0 +1,148 @@
+"""add_annotations_fts_index
+
+Full-text index over annotation notes and highlighted text. On SQLite, add an
+FTS5 table ``annotations_fts`` with a rowid mapping table and sync triggers,
+and backfill it. On PostgreSQL, add a stored generated ``search_vector``
+tsvector column with a GIN index.
+
+Revision ID: 20261016_annotations_fts
+Revises: 20261016_collections_updated_at
+Create Date: 2026-10-16 00:00:07.000000
+
+"""
+from alembic import op
+from sqlalchemy.engine import Connection
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_annotations_fts'
+down_revision = '20261016_collections_updated_at'
+branch_labels = None
+depends_on = None
+
+
+def _sqlite_has_fts5(conn: Connection) -> bool:
+    try:
+        conn.exec_driver_sql(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS temp.__fts5_probe USING fts5(x);"
+        )
+        conn.exec_driver_sql("DROP TABLE IF EXISTS temp.__fts5_probe;")
+        return True
+    except Exception:
+        return False
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if conn.dialect.name == "postgresql":
+        op.execute(
+            """
+            ALTER TABLE annotations
+            ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple', COALESCE(note, '')), 'A') ||
+                setweight(to_tsvector('simple', COALESCE(highlighted_text, '')), 'B')
+            ) STORED;
+            """
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_annotations_search_vector "
+            "ON annotations USING GIN (search_vector);"
+        )
+        return
+
+    if conn.dialect.name != "sqlite" or not _sqlite_has_fts5(conn):
+        return
+
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS annotations_fts_doc (
+            rowid INTEGER PRIMARY KEY,
+            annotation_id TEXT UNIQUE NOT NULL
+        );
+        """
+    )
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS annotations_fts USING fts5(
+            note,
+            highlighted_text,
+            tokenize = 'unicode61'
+        );
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_annotations_ai_fts
+        AFTER INSERT ON annotations
+        BEGIN
+            INSERT OR IGNORE INTO annotations_fts_doc(annotation_id) VALUES (NEW.id);
+            INSERT INTO annotations_fts(rowid, note, highlighted_text)
+            VALUES (
+                (SELECT rowid FROM annotations_fts_doc WHERE annotation_id = NEW.id),
+                COALESCE(NEW.note, ''),
+                NEW.highlighted_text
+            );
+        END;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_annotations_au_fts
+        AFTER UPDATE OF note, highlighted_text ON annotations
+        BEGIN
+            UPDATE annotations_fts
+            SET note = COALESCE(NEW.note, ''),
+                highlighted_text = NEW.highlighted_text
+            WHERE rowid = (
+                SELECT rowid FROM annotations_fts_doc WHERE annotation_id = NEW.id
+            );
+        END;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_annotations_ad_fts
+        AFTER DELETE ON annotations
+        BEGIN
+            DELETE FROM annotations_fts
+            WHERE rowid = (
+                SELECT rowid FROM annotations_fts_doc WHERE annotation_id = OLD.id
+            );
+            DELETE FROM annotations_fts_doc WHERE annotation_id = OLD.id;
+        END;
+        """
+    )
+    op.execute(
+        """
+        INSERT OR IGNORE INTO annotations_fts_doc(annotation_id)
+        SELECT id FROM annotations;
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO annotations_fts(rowid, note, highlighted_text)
+        SELECT d.rowid, COALESCE(a.note, ''), a.highlighted_text
+        FROM annotations a
+        JOIN annotations_fts_doc d ON d.annotation_id = a.id;
+        """
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    if conn.dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS idx_annotations_search_vector;")
+        op.execute("ALTER TABLE annotations DROP COLUMN IF EXISTS search_vector;")
+        return
+
+    if conn.dialect.name != "sqlite":
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS trg_annotations_ai_fts;")
+    op.execute("DROP TRIGGER IF EXISTS trg_annotations_au_fts;")
+    op.execute("DROP TRIGGER IF EXISTS trg_annotations_ad_fts;")
+    op.execute("DROP TABLE IF EXISTS annotations_fts;")
+    op.execute("DROP TABLE IF EXISTS annotations_fts_doc;")
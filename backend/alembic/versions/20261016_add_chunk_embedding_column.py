@@ -0,0 +1,98 @@
+"""add_chunk_embedding_column
+
+Move chunk embeddings out of ``chunk_metadata["embedding_vector"]`` JSON into
+a compact float32 ``document_chunks.embedding`` binary column, and index
+``created_at`` for the chunk vector index delta sync.
+
+Revision ID: 20261016_chunk_embedding
+Revises: 20261016_fts_bm25
+Create Date: 2026-10-16 00:00:02.000000
+
+"""
+import json
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_chunk_embedding'
+down_revision = '20261016_fts_bm25'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def _chunks_table():
+    return sa.table(
+        'document_chunks',
+        sa.column('id'),
+        sa.column('chunk_metadata', sa.JSON()),
+        sa.column('embedding', sa.LargeBinary()),
+    )
+
+
+def _load_metadata(value):
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
+    return value
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('document_chunks') as batch_op:
+        batch_op.add_column(sa.Column('embedding', sa.LargeBinary(), nullable=True))
+    op.create_index('idx_chunk_created_at', 'document_chunks', ['created_at'])
+
+    # Backfill: copy JSON vectors into the binary column and drop them from metadata
+    conn = op.get_bind()
+    chunks = _chunks_table()
+    last_id = None
+    while True:
+        stmt = sa.select(chunks.c.id, chunks.c.chunk_metadata).order_by(chunks.c.id)
+        if last_id is not None:
+            stmt = stmt.where(chunks.c.id > last_id)
+        rows = conn.execute(stmt.limit(BATCH_SIZE)).fetchall()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        for chunk_id, raw_metadata in rows:
+            metadata = _load_metadata(raw_metadata)
+            if not isinstance(metadata, dict) or 'embedding_vector' not in metadata:
+                continue
+            vector = metadata.pop('embedding_vector')
+            embedding = (
+                np.asarray(vector, dtype='<f4').tobytes() if vector else None
+            )
+            conn.execute(
+                chunks.update()
+                .where(chunks.c.id == chunk_id)
+                .values(chunk_metadata=metadata, embedding=embedding)
+            )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    chunks = _chunks_table()
+    rows = conn.execute(
+        sa.select(chunks.c.id, chunks.c.chunk_metadata, chunks.c.embedding).where(
+            chunks.c.embedding.isnot(None)
+        )
+    ).fetchall()
+    for chunk_id, raw_metadata, embedding in rows:
+        metadata = _load_metadata(raw_metadata) or {}
+        metadata['embedding_vector'] = np.frombuffer(embedding, dtype='<f4').tolist()
+        conn.execute(
+            chunks.update()
+            .where(chunks.c.id == chunk_id)
+            .values(chunk_metadata=metadata)
+        )
+
+    op.drop_index('idx_chunk_created_at', table_name='document_chunks')
+    with op.batch_alter_table('document_chunks') as batch_op:
+        batch_op.drop_column('embedding')
@@ -0,0 +1,38 @@
+"""add_collection_embedding_sums
+
+Add ``collections.embedding_sum`` and ``collections.embedding_count``: the
+running sum of member embeddings and the number of members in it. Membership
+changes and member re-embedding adjust the sum instead of re-averaging every
+member. Existing collections are rebuilt on their next membership change, or
+all at once with ``scripts/rebuild_collection_embeddings.py``.
+
+Revision ID: 20261016_collection_sums
+Revises: 20261016_repo_manifests
+Create Date: 2026-10-16 00:00:05.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_collection_sums'
+down_revision = '20261016_repo_manifests'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('collections') as batch_op:
+        batch_op.add_column(sa.Column('embedding_sum', sa.JSON(), nullable=True))
+        batch_op.add_column(
+            sa.Column(
+                'embedding_count', sa.Integer(), nullable=False, server_default='0'
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('collections') as batch_op:
+        batch_op.drop_column('embedding_count')
+        batch_op.drop_column('embedding_sum')
@@ -0,0 +1,26 @@
+"""add_collections_updated_at_index
+
+Index ``collections.updated_at`` so the collection vector index can delta-sync
+collections whose embedding changed since its watermark with a range scan.
+
+Revision ID: 20261016_collections_updated_at
+Revises: 20261016_collection_sums
+Create Date: 2026-10-16 00:00:06.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_collections_updated_at'
+down_revision = '20261016_collection_sums'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_collections_updated_at', 'collections', ['updated_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_collections_updated_at', table_name='collections')
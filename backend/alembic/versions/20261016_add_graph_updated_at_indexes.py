@@ -0,0 +1,29 @@
+"""add_graph_updated_at_indexes
+
+Index ``citations.updated_at`` and ``graph_edges.updated_at`` so the
+process-wide graph snapshot can delta-sync rows changed since its watermark
+instead of re-reading both tables.
+
+Revision ID: 20261016_graph_updated_at
+Revises: 20261016_chunk_embedding
+Create Date: 2026-10-16 00:00:03.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_graph_updated_at'
+down_revision = '20261016_chunk_embedding'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_citations_updated_at', 'citations', ['updated_at'])
+    op.create_index('idx_graph_edges_updated_at', 'graph_edges', ['updated_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_graph_edges_updated_at', table_name='graph_edges')
+    op.drop_index('idx_citations_updated_at', table_name='citations')
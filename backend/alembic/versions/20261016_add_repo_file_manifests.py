@@ -0,0 +1,62 @@
+"""add_repo_file_manifests
+
+Add ``repo_file_manifests``: one row per ingested repository file with the
+SHA-256 of its content and the Resource it was ingested into, so repository
+re-ingestion skips unchanged files and updates changed ones in place.
+
+Revision ID: 20261016_repo_manifests
+Revises: 20261016_graph_updated_at
+Create Date: 2026-10-16 00:00:04.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_repo_manifests'
+down_revision = '20261016_graph_updated_at'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name == 'postgresql':
+        guid_type = postgresql.UUID()
+    else:
+        guid_type = sa.CHAR(36)
+
+    op.create_table(
+        'repo_file_manifests',
+        sa.Column('id', guid_type, nullable=False),
+        sa.Column('repo_key', sa.String(), nullable=False),
+        sa.Column('path', sa.String(), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('resource_id', guid_type, nullable=False),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.current_timestamp(),
+        ),
+        sa.ForeignKeyConstraint(['resource_id'], ['resources.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'idx_repo_file_manifests_repo_path',
+        'repo_file_manifests',
+        ['repo_key', 'path'],
+        unique=True,
+    )
+    op.create_index(
+        'ix_repo_file_manifests_resource_id', 'repo_file_manifests', ['resource_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_repo_file_manifests_resource_id', table_name='repo_file_manifests')
+    op.drop_index('idx_repo_file_manifests_repo_path', table_name='repo_file_manifests')
+    op.drop_table('repo_file_manifests')
@@ -0,0 +1,26 @@
+"""add_resources_updated_at_index
+
+Index resources.updated_at so the dense vector index can delta-sync
+changed rows with a range scan instead of a full table scan.
+
+Revision ID: 20261016_resources_updated_idx
+Revises: 39167d546c0c
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_resources_updated_idx'
+down_revision = '39167d546c0c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_resources_updated_at', 'resources', ['updated_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_resources_updated_at', table_name='resources')
@@ -0,0 +1,154 @@
+"""fts_bm25_index
+
+Replace the contentless SQLite FTS5 table with a regular FTS5 table (porter
+tokenizer) that the existing sync triggers can update and delete from, and
+backfill it. On PostgreSQL ``search_vector`` is already a trigger-maintained
+tsvector column (20251215_add_search_vector); only its GIN index is ensured.
+
+Revision ID: 20261016_fts_bm25
+Revises: 20261016_resources_updated_idx
+Create Date: 2026-10-16 00:00:01.000000
+
+"""
+from alembic import op
+from sqlalchemy.engine import Connection
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_fts_bm25'
+down_revision = '20261016_resources_updated_idx'
+branch_labels = None
+depends_on = None
+
+
+def _sqlite_has_fts5(conn: Connection) -> bool:
+    try:
+        conn.exec_driver_sql(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS temp.__fts5_probe USING fts5(x);"
+        )
+        conn.exec_driver_sql("DROP TABLE IF EXISTS temp.__fts5_probe;")
+        return True
+    except Exception:
+        return False
+
+
+def _create_sqlite_triggers() -> None:
+    op.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_resources_ai_fts
+        AFTER INSERT ON resources
+        BEGIN
+            INSERT OR IGNORE INTO resources_fts_doc(resource_id) VALUES (NEW.id);
+            INSERT INTO resources_fts(rowid, title, description)
+            VALUES (
+                (SELECT rowid FROM resources_fts_doc WHERE resource_id = NEW.id),
+                NEW.title,
+                COALESCE(NEW.description, '')
+            );
+        END;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_resources_au_fts
+        AFTER UPDATE OF title, description ON resources
+        BEGIN
+            UPDATE resources_fts
+            SET title = NEW.title,
+                description = COALESCE(NEW.description, '')
+            WHERE rowid = (
+                SELECT rowid FROM resources_fts_doc WHERE resource_id = NEW.id
+            );
+        END;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_resources_ad_fts
+        AFTER DELETE ON resources
+        BEGIN
+            DELETE FROM resources_fts
+            WHERE rowid = (
+                SELECT rowid FROM resources_fts_doc WHERE resource_id = OLD.id
+            );
+            DELETE FROM resources_fts_doc WHERE resource_id = OLD.id;
+        END;
+        """
+    )
+
+
+def _backfill_sqlite() -> None:
+    op.execute(
+        """
+        INSERT OR IGNORE INTO resources_fts_doc(resource_id)
+        SELECT id FROM resources;
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO resources_fts(rowid, title, description)
+        SELECT d.rowid, r.title, COALESCE(r.description, '')
+        FROM resources r
+        JOIN resources_fts_doc d ON d.resource_id = r.id;
+        """
+    )
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if conn.dialect.name == "postgresql":
+        # The column and its update trigger come from 20251215_add_search_vector
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_resources_search_vector "
+            "ON resources USING GIN (search_vector);"
+        )
+        return
+
+    if conn.dialect.name != "sqlite" or not _sqlite_has_fts5(conn):
+        return
+
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS resources_fts_doc (
+            rowid INTEGER PRIMARY KEY,
+            resource_id TEXT UNIQUE NOT NULL
+        );
+        """
+    )
+    op.execute("DROP TABLE IF EXISTS resources_fts;")
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE resources_fts USING fts5(
+            title,
+            description,
+            tokenize = 'porter unicode61'
+        );
+        """
+    )
+    _create_sqlite_triggers()
+    _backfill_sqlite()
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    if conn.dialect.name == "postgresql":
+        # Nothing to undo: the column and index belong to 20251215_add_search_vector
+        return
+
+    if conn.dialect.name != "sqlite" or not _sqlite_has_fts5(conn):
+        return
+
+    # Restore the original contentless table
+    op.execute("DROP TABLE IF EXISTS resources_fts;")
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE resources_fts USING fts5(
+            title,
+            description,
+            content=''
+        );
+        """
+    )
+    _backfill_sqlite()
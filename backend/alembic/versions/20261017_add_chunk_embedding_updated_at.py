@@ -0,0 +1,42 @@
+"""add_chunk_embedding_updated_at
+
+Add indexed ``document_chunks.embedding_updated_at``, set whenever a chunk's
+embedding is written. The chunk vector index delta sync watermarks on it
+instead of ``created_at``, so chunks embedded after creation (e.g. by the
+PDF<->code auto-linker) reach every process's index. Existing embedded
+chunks are backfilled with their ``created_at``.
+
+Revision ID: 20261017_chunk_embedding_updated
+Revises: 20261017_citation_url_keys
+Create Date: 2026-10-17 00:00:01.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_chunk_embedding_updated'
+down_revision = '20261017_citation_url_keys'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('document_chunks') as batch_op:
+        batch_op.add_column(
+            sa.Column('embedding_updated_at', sa.DateTime(timezone=True), nullable=True)
+        )
+    op.execute(
+        "UPDATE document_chunks SET embedding_updated_at = created_at "
+        "WHERE embedding IS NOT NULL"
+    )
+    op.create_index(
+        'idx_chunk_embedding_updated_at', 'document_chunks', ['embedding_updated_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_chunk_embedding_updated_at', table_name='document_chunks')
+    with op.batch_alter_table('document_chunks') as batch_op:
+        batch_op.drop_column('embedding_updated_at')
@@ -0,0 +1,40 @@
+"""add_citation_url_keys
+
+Add indexed ``resources.source_url_key`` and ``citations.target_url_key``:
+normalized, lower-cased URLs (see ``app.database.models.url_key``) so
+citation resolution is an equality join instead of one lookup per citation.
+Keys of existing rows are backfilled by ``CitationService`` on its next
+resolution run.
+
+Revision ID: 20261017_citation_url_keys
+Revises: 20261016_annotations_fts
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_citation_url_keys'
+down_revision = '20261016_annotations_fts'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('resources') as batch_op:
+        batch_op.add_column(sa.Column('source_url_key', sa.String(), nullable=True))
+    with op.batch_alter_table('citations') as batch_op:
+        batch_op.add_column(sa.Column('target_url_key', sa.String(), nullable=True))
+    op.create_index('idx_resources_source_url_key', 'resources', ['source_url_key'])
+    op.create_index('idx_citations_url_key', 'citations', ['target_url_key'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_citations_url_key', table_name='citations')
+    op.drop_index('idx_resources_source_url_key', table_name='resources')
+    with op.batch_alter_table('citations') as batch_op:
+        batch_op.drop_column('target_url_key')
+    with op.batch_alter_table('resources') as batch_op:
+        batch_op.drop_column('source_url_key')
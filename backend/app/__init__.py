@@ -25,10 +25,10 @@ from typing import List, Tuple, Callable
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
-from .shared.database import Base, sync_engine, get_pool_usage_warning, init_database
+from .shared.database import get_pool_usage_warning, init_database
 from .config.settings import get_settings
 
-# Ensure models are imported so Base.metadata is populated for create_all
+# Ensure models are imported so Base.metadata is populated for ensure_schema
 # Only import in non-test mode to avoid circular dependencies during test discovery
 import os
 
@@ -195,12 +195,17 @@ async def lifespan(app: FastAPI):
 
     Startup:
     - Warmup embedding model to avoid cold start latency
+    - Preload the models listed in MODEL_PRELOAD into the model registry
+    - Ensure the full-text search index exists
     - Register event hooks for automatic data consistency
     - Initialize Redis cache connection
     - Log event system initialization
 
+    - Start the event dispatcher for asynchronously delivered handlers
+
     Shutdown:
-    - Clean up resources if needed
+    - Stop the event dispatcher after delivering queued events
+    - Flush buffered subject usage counts
     """
     # Startup
     logger.info("Starting Neo Alexandria 2.0...")
@@ -217,6 +222,24 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Embedding model warmup failed: {e} - first encoding may be slow")
 
+    # Preload configured models (rerankers, summarizers, ...) into the registry
+    try:
+        from .shared.model_registry import preload_models
+
+        preload_models()
+    except Exception as e:
+        logger.warning(f"Model preload failed: {e}")
+
+    # Create the full-text index for create_all databases before the first search
+    try:
+        from .modules.search.fts_index import ensure_fts_schema
+        from .shared import database as shared_database
+
+        if shared_database.sync_engine is not None:
+            ensure_fts_schema(shared_database.sync_engine)
+    except Exception as e:
+        logger.warning(f"Full-text index check failed: {e}")
+
     # Initialize Redis cache connection
     try:
         from .shared.cache import cache
@@ -241,12 +264,31 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to register event hooks: {e}", exc_info=True)
 
+    # Start the event dispatcher (tests keep every handler inline)
+    from .shared.event_bus import event_bus
+
+    settings = get_settings()
+    event_bus.set_history_size(settings.EVENT_HISTORY_SIZE)
+    if not settings.is_test_mode:
+        event_bus.start_dispatcher(
+            workers=settings.EVENT_BUS_WORKERS,
+            queue_size=settings.EVENT_BUS_QUEUE_SIZE,
+        )
+
     logger.info("Neo Alexandria 2.0 startup complete")
 
     yield
 
     # Shutdown
     logger.info("Shutting down Neo Alexandria 2.0...")
+    event_bus.stop_dispatcher()
+
+    try:
+        from .modules.authority.subject_index import flush_all_usage
+
+        flush_all_usage()
+    except Exception as e:
+        logger.warning(f"Failed to flush subject usage counts: {e}")
 
 
 def create_app() -> FastAPI:
@@ -510,12 +552,6 @@ def create_app() -> FastAPI:
                 content={"detail": "Internal server error"},
             )
 
-    # Ensure tables exist for SQLite environments without migrations
-    try:
-        Base.metadata.create_all(bind=sync_engine)
-    except Exception:
-        pass
-
     # Register modular vertical slices (Collections, Resources, Search, and Phase 14 modules)
     # This must happen before processing requests to ensure event handlers are registered
     logger.info("Registering modular vertical slices...")
@@ -78,6 +78,11 @@ class Settings(BaseSettings):
         return os.getenv("TESTING", "").lower() in ("true", "1", "yes")
 
     MIN_QUALITY_THRESHOLD: float = 0.7
+
+    # Corpus-wide quality sweeps (degradation monitoring, outlier detection)
+    QUALITY_SWEEP_CHUNK_SIZE: int = 2000  # Resources per chunk (one bulk UPDATE each)
+    QUALITY_SWEEP_WORKERS: int = 0  # Worker processes for chunk scoring (0 = inline)
+    QUALITY_OUTLIER_SAMPLE_SIZE: int = 10000  # Rows the Isolation Forest is fitted on
     BACKUP_FREQUENCY: Literal["daily", "weekly", "monthly"] = "weekly"
     TIMEZONE: str = "UTC"
 
@@ -88,10 +93,41 @@ class Settings(BaseSettings):
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/1"
 
+    # Event bus dispatch (handlers subscribed with DeliveryMode.ASYNC)
+    EVENT_BUS_WORKERS: int = 4  # Dispatch worker threads (0 = deliver inline)
+    EVENT_BUS_QUEUE_SIZE: int = 1000  # Pending deliveries per priority level
+    EVENT_HISTORY_SIZE: int = 0  # Recent events kept for /monitoring/events/history (0 = off)
+
+    # Hook-triggered task coalescing (app/tasks/coalescing.py)
+    TASK_COALESCE_MAX_BATCH: int = 500  # Resources per coalesced batch task
+
     # Vector embedding configuration for Phase 4
     EMBEDDING_MODEL_NAME: str = "nomic-ai/nomic-embed-text-v1"
     DEFAULT_HYBRID_SEARCH_WEIGHT: float = 0.5  # 0.0=keyword only, 1.0=semantic only
     EMBEDDING_CACHE_SIZE: int = 1000  # for model caching if needed
+    EMBEDDING_MAX_BATCH_TOKENS: int = 8192  # Padded tokens per encode() batch
+    EMBEDDING_MAX_BATCH_SIZE: int = 64  # Texts per encode() batch
+    EMBEDDING_COALESCE_WINDOW_MS: int = 0  # Micro-batch window for single texts (0=off)
+    EMBEDDING_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # In-process embedding LRU budget
+    EMBEDDING_CACHE_TTL: int = 86400  # Redis TTL for content-addressed embeddings
+
+    # Shared ML model registry (app/shared/model_registry.py)
+    MODEL_REGISTRY_MAX_BYTES: int = 0  # RAM budget for idle models (0 = unlimited)
+    MODEL_PRELOAD: list[str] = []  # "kind:model_name[@device]" loaded at startup
+
+    # Dense ANN vector index (IVF-flat, file-backed)
+    VECTOR_INDEX_DIR: str = "storage/vector_index"
+    VECTOR_INDEX_NPROBE: int = 8  # Inverted lists probed per query
+    VECTOR_INDEX_TRAIN_THRESHOLD: int = 4096  # Exact search below this size
+    ANNOTATION_VECTOR_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # Per-user annotation matrices
+
+    # Three-way hybrid search execution
+    SEARCH_PARALLEL_LEGS: bool = True  # Run FTS/dense/sparse legs concurrently
+    SEARCH_LEG_TIMEOUT_MS: int = 2000  # Legs slower than this are dropped from RRF
+
+    # Search result cache (generation-namespaced, see search/result_cache.py)
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_TTL: int = 300  # Seconds a cached search response lives
 
     # Graph configuration for Phase 5 - Hybrid Knowledge Graph
     DEFAULT_GRAPH_NEIGHBORS: int = 7
@@ -99,7 +135,17 @@ class Settings(BaseSettings):
     GRAPH_WEIGHT_VECTOR: float = 0.6
     GRAPH_WEIGHT_TAGS: float = 0.3
     GRAPH_WEIGHT_CLASSIFICATION: float = 0.1
+    GRAPH_SNAPSHOT_SYNC_SECONDS: float = 5.0  # Max age before readers delta-sync the graph snapshot
+    GRAPH_SNAPSHOT_REBUILD_SECONDS: int = 3600  # Full rebuild interval (reconciles deletions)
     GRAPH_VECTOR_MIN_SIM_THRESHOLD: float = 0.85  # for overview candidate pruning
+    GRAPH_OVERVIEW_TOP_K: int = 20  # Vector neighbors kept per resource in the overview join
+    GRAPH_OVERVIEW_MAX_SUBJECT_SIZE: int = 1000  # Subjects on more resources are not paired by tag overlap
+    CENTRALITY_BETWEENNESS_SAMPLES: int = 256  # Betweenness pivots per refresh (0 = exact)
+
+    # In-memory subject authority index (app/modules/authority/subject_index.py)
+    AUTHORITY_CACHE_REFRESH_SECONDS: int = 300  # Full reload interval (other processes' writes)
+    AUTHORITY_USAGE_FLUSH_SIZE: int = 500  # Buffered usage increments before a bulk flush
+    AUTHORITY_USAGE_FLUSH_SECONDS: float = 30.0  # Max age of buffered usage increments
 
     # Phase 5.5 - Personalized Recommendation Engine
     RECOMMENDATION_PROFILE_SIZE: int = 50
@@ -114,6 +160,8 @@ class Settings(BaseSettings):
     CHUNKING_STRATEGY: str = "semantic"  # "semantic" or "fixed"
     CHUNK_SIZE: int = 500  # Words for semantic, characters for fixed
     CHUNK_OVERLAP: int = 50  # Words or characters overlap between chunks
+    AUTO_LINK_TOP_K: int = 10  # Linked chunks kept per source chunk in PDF<->code auto-linking
+    AUTO_LINK_BACKFILL_BATCH_SIZE: int = 256  # Chunks embedded per page by the link target backfill
 
     # Graph Extraction Configuration
     GRAPH_EXTRACTION_ENABLED: bool = True  # Enable graph extraction
@@ -349,6 +397,168 @@ def get_settings() -> Settings:
             f"got {settings.DEFAULT_HYBRID_SEARCH_WEIGHT}. Expected type: float (0.0-1.0)"
         )
 
+    if settings.SEARCH_LEG_TIMEOUT_MS <= 0:
+        raise ValueError(
+            f"Configuration validation failed: SEARCH_LEG_TIMEOUT_MS must be positive, "
+            f"got {settings.SEARCH_LEG_TIMEOUT_MS}. Expected type: int (> 0)"
+        )
+
+    # Validate quality sweeps
+    if settings.QUALITY_SWEEP_CHUNK_SIZE <= 0:
+        raise ValueError(
+            f"Configuration validation failed: QUALITY_SWEEP_CHUNK_SIZE must be positive, "
+            f"got {settings.QUALITY_SWEEP_CHUNK_SIZE}. Expected type: int (> 0)"
+        )
+    if settings.QUALITY_SWEEP_WORKERS < 0:
+        raise ValueError(
+            f"Configuration validation failed: QUALITY_SWEEP_WORKERS must be non-negative, "
+            f"got {settings.QUALITY_SWEEP_WORKERS}. Expected type: int (>= 0)"
+        )
+    if settings.QUALITY_OUTLIER_SAMPLE_SIZE < 10:
+        raise ValueError(
+            f"Configuration validation failed: QUALITY_OUTLIER_SAMPLE_SIZE must be at least 10, "
+            f"got {settings.QUALITY_OUTLIER_SAMPLE_SIZE}. Expected type: int (>= 10)"
+        )
+
+    # Validate model registry
+    if settings.MODEL_REGISTRY_MAX_BYTES < 0:
+        raise ValueError(
+            f"Configuration validation failed: MODEL_REGISTRY_MAX_BYTES must be non-negative, "
+            f"got {settings.MODEL_REGISTRY_MAX_BYTES}. Expected type: int (>= 0)"
+        )
+    for spec in settings.MODEL_PRELOAD:
+        if ":" not in spec:
+            raise ValueError(
+                f"Configuration validation failed: MODEL_PRELOAD entries must look like "
+                f"'kind:model_name', got {spec!r}. Expected type: list[str]"
+            )
+
+    # Validate event bus dispatch
+    if settings.EVENT_BUS_WORKERS < 0:
+        raise ValueError(
+            f"Configuration validation failed: EVENT_BUS_WORKERS must be non-negative, "
+            f"got {settings.EVENT_BUS_WORKERS}. Expected type: int (>= 0)"
+        )
+    if settings.EVENT_BUS_QUEUE_SIZE <= 0:
+        raise ValueError(
+            f"Configuration validation failed: EVENT_BUS_QUEUE_SIZE must be positive, "
+            f"got {settings.EVENT_BUS_QUEUE_SIZE}. Expected type: int (> 0)"
+        )
+    if settings.EVENT_HISTORY_SIZE < 0:
+        raise ValueError(
+            f"Configuration validation failed: EVENT_HISTORY_SIZE must be non-negative, "
+            f"got {settings.EVENT_HISTORY_SIZE}. Expected type: int (>= 0)"
+        )
+
+    # Validate search result cache
+    if settings.SEARCH_CACHE_TTL <= 0:
+        raise ValueError(
+            f"Configuration validation failed: SEARCH_CACHE_TTL must be positive, "
+            f"got {settings.SEARCH_CACHE_TTL}. Expected type: int (> 0)"
+        )
+
+    # Validate annotation vector cache
+    if settings.ANNOTATION_VECTOR_CACHE_MAX_BYTES < 0:
+        raise ValueError(
+            f"Configuration validation failed: ANNOTATION_VECTOR_CACHE_MAX_BYTES must be "
+            f"non-negative, got {settings.ANNOTATION_VECTOR_CACHE_MAX_BYTES}. "
+            f"Expected type: int (>= 0)"
+        )
+
+    # Validate task coalescing
+    if settings.TASK_COALESCE_MAX_BATCH <= 0:
+        raise ValueError(
+            f"Configuration validation failed: TASK_COALESCE_MAX_BATCH must be positive, "
+            f"got {settings.TASK_COALESCE_MAX_BATCH}. Expected type: int (> 0)"
+        )
+
+    # Validate auto-linking top-k
+    if settings.AUTO_LINK_TOP_K <= 0:
+        raise ValueError(
+            f"Configuration validation failed: AUTO_LINK_TOP_K must be positive, "
+            f"got {settings.AUTO_LINK_TOP_K}. Expected type: int (> 0)"
+        )
+    if settings.AUTO_LINK_BACKFILL_BATCH_SIZE <= 0:
+        raise ValueError(
+            f"Configuration validation failed: AUTO_LINK_BACKFILL_BATCH_SIZE must be positive, "
+            f"got {settings.AUTO_LINK_BACKFILL_BATCH_SIZE}. Expected type: int (> 0)"
+        )
+
+    # Validate global overview top-k
+    if settings.GRAPH_OVERVIEW_TOP_K <= 0:
+        raise ValueError(
+            f"Configuration validation failed: GRAPH_OVERVIEW_TOP_K must be positive, "
+            f"got {settings.GRAPH_OVERVIEW_TOP_K}. Expected type: int (> 0)"
+        )
+
+    # Validate global overview tag-overlap subject cap
+    if settings.GRAPH_OVERVIEW_MAX_SUBJECT_SIZE < 2:
+        raise ValueError(
+            f"Configuration validation failed: GRAPH_OVERVIEW_MAX_SUBJECT_SIZE must be at least 2, "
+            f"got {settings.GRAPH_OVERVIEW_MAX_SUBJECT_SIZE}. Expected type: int (>= 2)"
+        )
+
+    # Validate graph snapshot refresh intervals
+    if settings.GRAPH_SNAPSHOT_SYNC_SECONDS < 0:
+        raise ValueError(
+            f"Configuration validation failed: GRAPH_SNAPSHOT_SYNC_SECONDS must be non-negative, "
+            f"got {settings.GRAPH_SNAPSHOT_SYNC_SECONDS}. Expected type: float (>= 0)"
+        )
+    if settings.GRAPH_SNAPSHOT_REBUILD_SECONDS <= 0:
+        raise ValueError(
+            f"Configuration validation failed: GRAPH_SNAPSHOT_REBUILD_SECONDS must be positive, "
+            f"got {settings.GRAPH_SNAPSHOT_REBUILD_SECONDS}. Expected type: int (> 0)"
+        )
+    if settings.CENTRALITY_BETWEENNESS_SAMPLES < 0:
+        raise ValueError(
+            f"Configuration validation failed: CENTRALITY_BETWEENNESS_SAMPLES must be non-negative, "
+            f"got {settings.CENTRALITY_BETWEENNESS_SAMPLES}. Expected type: int (>= 0)"
+        )
+
+    # Validate subject authority index
+    if settings.AUTHORITY_CACHE_REFRESH_SECONDS <= 0:
+        raise ValueError(
+            f"Configuration validation failed: AUTHORITY_CACHE_REFRESH_SECONDS must be positive, "
+            f"got {settings.AUTHORITY_CACHE_REFRESH_SECONDS}. Expected type: int (> 0)"
+        )
+    if settings.AUTHORITY_USAGE_FLUSH_SIZE <= 0:
+        raise ValueError(
+            f"Configuration validation failed: AUTHORITY_USAGE_FLUSH_SIZE must be positive, "
+            f"got {settings.AUTHORITY_USAGE_FLUSH_SIZE}. Expected type: int (> 0)"
+        )
+    if settings.AUTHORITY_USAGE_FLUSH_SECONDS < 0:
+        raise ValueError(
+            f"Configuration validation failed: AUTHORITY_USAGE_FLUSH_SECONDS must be non-negative, "
+            f"got {settings.AUTHORITY_USAGE_FLUSH_SECONDS}. Expected type: float (>= 0)"
+        )
+
+    # Validate embedding batching
+    if settings.EMBEDDING_MAX_BATCH_TOKENS <= 0:
+        raise ValueError(
+            f"Configuration validation failed: EMBEDDING_MAX_BATCH_TOKENS must be positive, "
+            f"got {settings.EMBEDDING_MAX_BATCH_TOKENS}. Expected type: int (> 0)"
+        )
+    if settings.EMBEDDING_MAX_BATCH_SIZE <= 0:
+        raise ValueError(
+            f"Configuration validation failed: EMBEDDING_MAX_BATCH_SIZE must be positive, "
+            f"got {settings.EMBEDDING_MAX_BATCH_SIZE}. Expected type: int (> 0)"
+        )
+    if settings.EMBEDDING_COALESCE_WINDOW_MS < 0:
+        raise ValueError(
+            f"Configuration validation failed: EMBEDDING_COALESCE_WINDOW_MS must be non-negative, "
+            f"got {settings.EMBEDDING_COALESCE_WINDOW_MS}. Expected type: int (>= 0)"
+        )
+    if settings.EMBEDDING_CACHE_MAX_BYTES < 0:
+        raise ValueError(
+            f"Configuration validation failed: EMBEDDING_CACHE_MAX_BYTES must be non-negative, "
+            f"got {settings.EMBEDDING_CACHE_MAX_BYTES}. Expected type: int (>= 0)"
+        )
+    if settings.EMBEDDING_CACHE_TTL <= 0:
+        raise ValueError(
+            f"Configuration validation failed: EMBEDDING_CACHE_TTL must be positive, "
+            f"got {settings.EMBEDDING_CACHE_TTL}. Expected type: int (> 0)"
+        )
+
     # Validate Advanced RAG configuration (Phase 17.5)
     if settings.CHUNKING_STRATEGY not in ("semantic", "fixed"):
         raise ValueError(
@@ -7,4 +7,5 @@ and session management. It provides the data layer for the Neo Alexandria 2.0 sy
 Modules:
 - base: Database engine configuration and session management
 - models: SQLAlchemy models for all database entities
+- load_profiles: Named column projections for Resource queries
 """
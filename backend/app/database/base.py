@@ -13,9 +13,7 @@ Related files:
 Features:
 - Cross-database compatibility (SQLite, PostgreSQL) with async support
 - Database-specific connection pool optimization
-- Automatic table creation for development environments
 - Async session lifecycle management with dependency injection
-- Event listeners for robust table creation in test environments
 - Transaction isolation and concurrency handling for PostgreSQL
 - Retry logic for serialization errors
 """
@@ -627,20 +625,14 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     Async database dependency for FastAPI dependency injection.
 
     Provides an async database session that is automatically created and closed
-    for each request. Ensures table creation for SQLite environments
-    and handles connection lifecycle management.
+    for each request and handles connection lifecycle management. Tables
+    come from migrations (see app/shared/database.py:ensure_schema).
 
     Yields:
         AsyncSession: SQLAlchemy async database session
     """
     session_maker = get_async_session_local()
     async with session_maker() as session:
-        # Ensure metadata exists for this connection (esp. sqlite in-memory)
-        try:
-            async with session.bind.begin() as conn:
-                await conn.run_sync(Base.metadata.create_all)
-        except Exception:
-            pass
         yield session
 
 
@@ -657,34 +649,11 @@ def get_sync_db():
     session_maker = get_session_local()
     db = session_maker()
     try:
-        # Ensure metadata exists for this connection (esp. sqlite in-memory)
-        try:
-            Base.metadata.create_all(bind=db.get_bind())
-        except Exception:
-            pass
         yield db
     finally:
         db.close()
 
 
-# Ensure tables exist for any Session bind (helps in-memory SQLite tests)
-@event.listens_for(OrmSession, "before_flush")
-def _ensure_tables_before_flush(session: OrmSession, flush_context, instances):  # type: ignore[no-redef]
-    """
-    Event listener to ensure tables exist before any flush operation.
-
-    This is particularly useful for in-memory SQLite databases used in tests,
-    where tables need to be created on-demand for each session.
-    """
-    try:
-        bind = session.get_bind()
-        if bind is not None:
-            Base.metadata.create_all(bind=bind)
-    except Exception:
-        # Best-effort; ignore if fails
-        pass
-
-
 def get_pool_status() -> dict:
     """
     Get connection pool statistics for monitoring.
@@ -0,0 +1,109 @@
+"""
+Neo Alexandria 2.0 - Resource Load Profiles
+
+Named column projections for queries over the wide ``Resource`` model.
+
+The large Text columns of ``Resource`` are deferred in column groups (see
+models.py), so a plain ``db.query(Resource)`` no longer fetches them:
+- "vectors": embedding, sparse_embedding
+- "search_index": search_vector
+- "scholarly_content": equations, tables, figures
+
+Profiles narrow a query further to what a code path actually reads:
+- card: identity and display fields (graph nodes, lists, candidate ranking)
+- vectors: card fields plus the dense embedding
+- quality: card fields plus quality scores and the metadata they are computed from
+- full: every column, including all deferred groups
+
+Touching a column outside the chosen profile still works but costs one extra
+query per row, so pick the narrowest profile that covers the code path.
+
+Example:
+    >>> db.query(Resource).options(*resource_profile("card")).all()
+
+Related files:
+- app/database/models.py: Resource model and deferred column groups
+- scripts/benchmark_load_profiles.py: Bytes fetched / hydration time per profile
+"""
+
+from typing import Dict, Tuple
+
+from sqlalchemy.orm import load_only, undefer_group
+from sqlalchemy.orm.interfaces import ORMOption
+
+from .models import Resource
+
+RESOURCE_DEFERRED_GROUPS = ("vectors", "search_index", "scholarly_content")
+
+CARD_COLUMNS = (
+    Resource.id,
+    Resource.title,
+    Resource.description,
+    Resource.creator,
+    Resource.type,
+    Resource.format,
+    Resource.language,
+    Resource.subject,
+    Resource.classification_code,
+    Resource.read_status,
+    Resource.quality_score,
+    Resource.publication_year,
+    Resource.created_at,
+    Resource.updated_at,
+)
+
+QUALITY_COLUMNS = CARD_COLUMNS + (
+    Resource.publisher,
+    Resource.source,
+    Resource.identifier,
+    Resource.date_created,
+    Resource.date_modified,
+    Resource.quality_accuracy,
+    Resource.quality_completeness,
+    Resource.quality_consistency,
+    Resource.quality_timeliness,
+    Resource.quality_relevance,
+    Resource.quality_overall,
+    Resource.quality_weights,
+    Resource.quality_last_computed,
+    Resource.quality_computation_version,
+    Resource.is_quality_outlier,
+    Resource.outlier_score,
+    Resource.outlier_reasons,
+    Resource.needs_quality_review,
+    Resource.summary_coherence,
+    Resource.summary_consistency,
+    Resource.summary_fluency,
+    Resource.summary_relevance,
+)
+
+_PROFILES: Dict[str, Tuple[ORMOption, ...]] = {
+    "card": (load_only(*CARD_COLUMNS),),
+    "vectors": (load_only(*CARD_COLUMNS, Resource.embedding),),
+    "quality": (load_only(*QUALITY_COLUMNS),),
+    "full": tuple(undefer_group(group) for group in RESOURCE_DEFERRED_GROUPS),
+}
+
+RESOURCE_PROFILES = tuple(_PROFILES)
+
+
+def resource_profile(name: str) -> Tuple[ORMOption, ...]:
+    """
+    Return the loader options for a named Resource load profile.
+
+    Args:
+        name: Profile name ("card", "vectors", "quality" or "full")
+
+    Returns:
+        Tuple of loader options to pass to ``Query.options()`` / ``Select.options()``
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    try:
+        return _PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown resource load profile: {name}. "
+            f"Expected one of: {', '.join(RESOURCE_PROFILES)}"
+        ) from None
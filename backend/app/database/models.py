@@ -5,7 +5,7 @@ This module is the SINGLE SOURCE OF TRUTH for all SQLAlchemy database models.
 All models are defined here to avoid circular import dependencies.
 
 Model Organization:
-- Resources: Resource model with ResourceStatus enum
+- Resources: Resource model with ResourceStatus enum, RepoFileManifest
 - Collections: Collection, CollectionResource models
 - Annotations: Annotation model
 - Graph: Citation, GraphEdge, GraphEmbedding, DiscoveryHypothesis models
@@ -27,8 +27,9 @@ Related files:
 
 import enum
 import uuid
-from datetime import datetime
-from typing import List
+from datetime import datetime, timezone
+from typing import List, Optional
+from urllib.parse import urlparse, urlunparse
 
 from sqlalchemy import (
     String,
@@ -42,12 +43,43 @@ from sqlalchemy import (
     Index,
     ARRAY,
     Boolean,
+    LargeBinary,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship, backref
+from sqlalchemy.orm import Mapped, mapped_column, relationship, backref, validates
 from sqlalchemy.dialects import postgresql
 
 from ..shared.base_model import Base, GUID
 
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def url_key(url: Optional[str]) -> Optional[str]:
+    """Comparison key for a URL.
+
+    Lower-cased, without fragment or trailing slash, so citation targets can
+    be matched to resource sources with an indexed equality join.
+    """
+    if url is None:
+        return None
+    try:
+        parsed = urlparse(url)
+        normalized = urlunparse(
+            (
+                parsed.scheme,
+                parsed.netloc,
+                parsed.path.rstrip("/"),
+                parsed.params,
+                parsed.query,
+                "",  # Remove fragment
+            )
+        )
+    except Exception:
+        normalized = url.rstrip("/")
+    return normalized.lower()
+
+
 # ============================================================================
 # Enums
 # ============================================================================
@@ -102,6 +134,8 @@ class Resource(Base):
     format: Mapped[str | None] = mapped_column(String, nullable=True)
     identifier: Mapped[str | None] = mapped_column(String, nullable=True)
     source: Mapped[str | None] = mapped_column(String, nullable=True)
+    # url_key(source), kept in sync by validate_source (citation resolution)
+    source_url_key: Mapped[str | None] = mapped_column(String, nullable=True)
     language: Mapped[str | None] = mapped_column(String(16), nullable=True)
     coverage: Mapped[str | None] = mapped_column(String, nullable=True)
     rights: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -139,15 +173,21 @@ class Resource(Base):
         String(255), nullable=True, index=True
     )
 
+    # Large Text columns below are deferred in groups (see database/load_profiles.py)
+
     # Vector embedding for Phase 4 hybrid search
     # Use Text to avoid JSON casting issues with NULL in PostgreSQL
     embedding: Mapped[List[float] | None] = mapped_column(
         Text,
         nullable=True,
+        deferred=True,
+        deferred_group="vectors",
     )
 
     # Phase 8: Sparse vector embeddings for three-way hybrid search
-    sparse_embedding: Mapped[str | None] = mapped_column(Text, nullable=True)
+    sparse_embedding: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="vectors"
+    )
     sparse_embedding_model: Mapped[str | None] = mapped_column(
         String(100), nullable=True
     )
@@ -155,8 +195,14 @@ class Resource(Base):
         DateTime(timezone=True), nullable=True
     )
 
-    # Phase 13: PostgreSQL full-text search vector
-    search_vector: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Phase 13: PostgreSQL full-text search vector (trigger-maintained tsvector;
+    # unused text column elsewhere)
+    search_vector: Mapped[str | None] = mapped_column(
+        Text().with_variant(postgresql.TSVECTOR(), "postgresql"),
+        nullable=True,
+        deferred=True,
+        deferred_group="search_index",
+    )
 
     # Phase 6.5: Scholarly Metadata Fields
     authors: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -185,9 +231,15 @@ class Resource(Base):
         Integer, nullable=False, default=0, server_default="0"
     )
     reference_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    equations: Mapped[str | None] = mapped_column(Text, nullable=True)
-    tables: Mapped[str | None] = mapped_column(Text, nullable=True)
-    figures: Mapped[str | None] = mapped_column(Text, nullable=True)
+    equations: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="scholarly_content"
+    )
+    tables: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="scholarly_content"
+    )
+    figures: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="scholarly_content"
+    )
     metadata_completeness_score: Mapped[float | None] = mapped_column(
         Float, nullable=True
     )
@@ -265,8 +317,15 @@ class Resource(Base):
 
     __table_args__ = (
         Index("idx_resources_sparse_updated", "sparse_embedding_updated_at"),
+        Index("idx_resources_updated_at", "updated_at"),
+        Index("idx_resources_source_url_key", "source_url_key"),
     )
 
+    @validates("source")
+    def validate_source(self, key: str, value: Optional[str]) -> Optional[str]:
+        self.source_url_key = url_key(value)
+        return value
+
     def __repr__(self) -> str:
         scholarly_info = f", doi={self.doi!r}" if self.doi else ""
         return f"<Resource(id={self.id!r}, title={self.title!r}{scholarly_info})>"
@@ -312,6 +371,16 @@ class DocumentChunk(Base):
     # For Code: {"start_line": 10, "end_line": 25, "function_name": "calculate_loss", "file_path": "src/model.py"}
     chunk_metadata: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
+    # Chunk embedding as little-endian float32 bytes (see shared.vector_index.encode_vector)
+    embedding: Mapped[bytes | None] = mapped_column(
+        LargeBinary, nullable=True, deferred=True
+    )
+    # Set whenever ``embedding`` is assigned (see validate_embedding);
+    # watermark for the chunk vector index delta sync
+    embedding_updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
     # Audit fields
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.current_timestamp()
@@ -327,8 +396,15 @@ class DocumentChunk(Base):
     __table_args__ = (
         Index("idx_chunk_resource", "resource_id"),
         Index("idx_chunk_resource_index", "resource_id", "chunk_index"),
+        Index("idx_chunk_created_at", "created_at"),
+        Index("idx_chunk_embedding_updated_at", "embedding_updated_at"),
     )
 
+    @validates("embedding")
+    def validate_embedding(self, key: str, value: Optional[bytes]) -> Optional[bytes]:
+        self.embedding_updated_at = datetime.now(timezone.utc) if value else None
+        return value
+
     def __repr__(self) -> str:
         return f"<DocumentChunk(id={self.id!r}, resource_id={self.resource_id!r}, chunk_index={self.chunk_index})>"
 
@@ -393,6 +469,52 @@ class ChunkLink(Base):
         return f"<ChunkLink(source={self.source_chunk_id!r}, target={self.target_chunk_id!r}, similarity={self.similarity_score:.3f})>"
 
 
+class RepoFileManifest(Base):
+    """
+    Content-hash manifest entry for a file ingested from a code repository.
+
+    Records which Resource a repository file was ingested into and the hash of
+    the content it was ingested from, so re-ingestion can skip unchanged files
+    and update changed ones in place.
+    """
+
+    __tablename__ = "repo_file_manifests"
+
+    # Primary key
+    id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True, default=uuid.uuid4)
+
+    # Repository key (local root path or Git URL) and repo-relative file path
+    repo_key: Mapped[str] = mapped_column(String, nullable=False)
+    path: Mapped[str] = mapped_column(String, nullable=False)
+
+    # Content fingerprint (SHA-256 of the raw file bytes)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    size: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    resource_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        ForeignKey("resources.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Audit fields
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.current_timestamp(),
+        onupdate=func.current_timestamp(),
+    )
+
+    # Indexes
+    __table_args__ = (
+        Index("idx_repo_file_manifests_repo_path", "repo_key", "path", unique=True),
+    )
+
+    def __repr__(self) -> str:
+        return f"<RepoFileManifest(repo_key={self.repo_key!r}, path={self.path!r}, hash={self.content_hash[:12]!r})>"
+
+
 class PlanningSession(Base):
     """
     Stores multi-hop planning sessions for iterative refinement.
@@ -483,6 +605,14 @@ class Collection(Base):
     embedding: Mapped[List[float] | None] = mapped_column(
         JSON, nullable=True, default=None
     )
+    # Running sum of member embeddings and the number of members in it, so
+    # membership changes update the embedding without re-reading all members
+    embedding_sum: Mapped[List[float] | None] = mapped_column(
+        JSON, nullable=True, default=None
+    )
+    embedding_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.current_timestamp()
     )
@@ -510,6 +640,8 @@ class Collection(Base):
         "Resource", secondary="collection_resources", back_populates="collections"
     )
 
+    __table_args__ = (Index("idx_collections_updated_at", "updated_at"),)
+
     def __repr__(self) -> str:
         return f"<Collection(id={self.id!r}, name={self.name!r}, owner_id={self.owner_id!r}, visibility={self.visibility!r})>"
 
@@ -710,6 +842,8 @@ class Citation(Base):
         index=True,
     )
     target_url: Mapped[str] = mapped_column(String, nullable=False)
+    # url_key(target_url), kept in sync by validate_target_url
+    target_url_key: Mapped[str | None] = mapped_column(String, nullable=True)
     citation_type: Mapped[str] = mapped_column(
         String, nullable=False, server_default="reference"
     )
@@ -720,15 +854,25 @@ class Citation(Base):
         DateTime(timezone=True), nullable=False, server_default=func.current_timestamp()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.current_timestamp()
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.current_timestamp(),
+        onupdate=func.current_timestamp(),
     )
 
     __table_args__ = (
         Index("idx_citations_source", "source_resource_id"),
         Index("idx_citations_target", "target_resource_id"),
         Index("idx_citations_url", "target_url"),
+        Index("idx_citations_updated_at", "updated_at"),
+        Index("idx_citations_url_key", "target_url_key"),
     )
 
+    @validates("target_url")
+    def validate_target_url(self, key: str, value: str) -> str:
+        self.target_url_key = url_key(value)
+        return value
+
     def __repr__(self) -> str:
         return f"<Citation(source_resource_id={self.source_resource_id!r}, target_resource_id={self.target_resource_id!r})>"
 
@@ -777,6 +921,7 @@ class GraphEdge(Base):
             "edge_type",
             unique=True,
         ),
+        Index("idx_graph_edges_updated_at", "updated_at"),
     )
 
     def __repr__(self) -> str:
@@ -55,6 +55,9 @@ class SystemEvent(str, Enum):
     GRAPH_CACHE_INVALIDATED = "graph.cache_invalidated"
     CITATIONS_EXTRACTED = "citations.extracted"
 
+    # Authority events
+    AUTHORITY_SUBJECT_CHANGED = "authority.subject_changed"
+
     # Cache events
     CACHE_HIT = "cache.hit"
     CACHE_MISS = "cache.miss"
@@ -10,20 +10,23 @@ Hook Architecture:
 - Each hook is a simple function that receives an Event object
 - Hooks extract relevant data from the event payload
 - Hooks queue appropriate Celery tasks with priority and delay
-- Hooks use debounce delays to prevent duplicate work
+- Embedding, quality and graph-edge hooks submit to the task coalescer
+  (app/tasks/coalescing.py), which collapses repeated submissions for a
+  resource within a window and runs the due resources as one batch task
 
 Related files:
 - app/events/event_system.py: Event emitter and Event class
 - app/events/event_types.py: System event type definitions
 - app/tasks/celery_tasks.py: Celery task implementations
+- app/tasks/coalescing.py: Debouncing delay queue for batched tasks
 - app/services/: Service layer that emits events
 
 Design Patterns:
 - Event-driven architecture: Decoupled components communicate via events
 - Automatic consistency: Derived data updates happen automatically
 - Priority queuing: Critical tasks (search, cache) execute first
-- Debounce delays: Prevent duplicate work from rapid updates
-- Batch delays: Allow grouping similar operations
+- Debouncing: Rapid updates to a resource collapse into one run
+- Batching: Resources due in the same window share one task
 """
 
 import logging
@@ -68,11 +71,11 @@ def on_content_changed_regenerate_embedding(event: Event) -> None:
 
     Triggered by: resource.content_changed event
     Priority: HIGH (7)
-    Delay: 5 seconds (debounce rapid updates)
+    Delay: 5-second coalescing window
 
     This hook ensures that embedding vectors stay synchronized with resource
-    content. The 5-second delay prevents duplicate work if content is updated
-    multiple times in quick succession.
+    content. Repeated content changes within the window collapse into one
+    regeneration, and all resources due together are embedded in one batch.
 
     Args:
         event: Event object containing resource_id in data
@@ -85,18 +88,13 @@ def on_content_changed_regenerate_embedding(event: Event) -> None:
 
     try:
         # Import here to avoid circular dependencies
-        from ..tasks.celery_tasks import regenerate_embedding_task
+        from ..tasks.coalescing import get_coalescer
 
-        # Queue embedding regeneration with HIGH priority and 5s debounce
-        regenerate_embedding_task.apply_async(
-            args=[resource_id],
-            priority=7,  # HIGH priority
-            countdown=5,  # 5-second debounce delay
-        )
+        scheduled = get_coalescer().submit("embedding", str(resource_id))
 
         logger.info(
-            f"Queued embedding regeneration for resource {resource_id} "
-            f"(priority=7, countdown=5s)"
+            f"{'Scheduled' if scheduled else 'Coalesced'} embedding regeneration "
+            f"for resource {resource_id}"
         )
 
     except Exception as e:
@@ -117,11 +115,11 @@ def on_metadata_changed_recompute_quality(event: Event) -> None:
 
     Triggered by: resource.metadata_changed event
     Priority: MEDIUM (5)
-    Delay: 10 seconds (debounce rapid updates)
+    Delay: 10-second coalescing window
 
     This hook ensures that quality scores stay synchronized with resource
-    metadata. The 10-second delay allows multiple metadata updates to be
-    batched into a single quality recomputation.
+    metadata. Multiple metadata updates within the window collapse into a
+    single quality recomputation, batched with other due resources.
 
     Args:
         event: Event object containing resource_id in data
@@ -133,18 +131,13 @@ def on_metadata_changed_recompute_quality(event: Event) -> None:
         return
 
     try:
-        from ..tasks.celery_tasks import recompute_quality_task
+        from ..tasks.coalescing import get_coalescer
 
-        # Queue quality recomputation with MEDIUM priority and 10s debounce
-        recompute_quality_task.apply_async(
-            args=[resource_id],
-            priority=5,  # MEDIUM priority
-            countdown=10,  # 10-second debounce delay
-        )
+        scheduled = get_coalescer().submit("quality", str(resource_id))
 
         logger.info(
-            f"Queued quality recomputation for resource {resource_id} "
-            f"(priority=5, countdown=10s)"
+            f"{'Scheduled' if scheduled else 'Coalesced'} quality recomputation "
+            f"for resource {resource_id}"
         )
 
     except Exception as e:
@@ -211,11 +204,11 @@ def on_citation_extracted_update_graph(event: Event) -> None:
 
     Triggered by: citations.extracted event
     Priority: MEDIUM (5)
-    Delay: 30 seconds (batch delay for grouping)
+    Delay: 30-second coalescing window
 
     This hook ensures that the knowledge graph stays synchronized with
-    citation relationships. The 30-second delay allows multiple citation
-    extractions to be batched together for efficiency.
+    citation relationships. Resources whose citations were extracted within
+    the same window have their citations resolved into edges in one batch.
 
     Args:
         event: Event object containing resource_id and citations in data
@@ -228,18 +221,13 @@ def on_citation_extracted_update_graph(event: Event) -> None:
         return
 
     try:
-        from ..tasks.celery_tasks import update_graph_edges_task
+        from ..tasks.coalescing import get_coalescer
 
-        # Queue graph edge update with MEDIUM priority and 30s batch delay
-        update_graph_edges_task.apply_async(
-            args=[resource_id, citations],
-            priority=5,  # MEDIUM priority
-            countdown=30,  # 30-second batch delay
-        )
+        scheduled = get_coalescer().submit("graph_edges", str(resource_id))
 
         logger.info(
-            f"Queued graph edge update for resource {resource_id} "
-            f"with {len(citations)} citations (priority=5, countdown=30s)"
+            f"{'Scheduled' if scheduled else 'Coalesced'} graph edge update for "
+            f"resource {resource_id} with {len(citations)} citations"
         )
 
     except Exception as e:
@@ -269,7 +257,10 @@ def on_resource_updated_invalidate_caches(event: Event) -> None:
     - embedding:{resource_id} - Embedding vector cache
     - quality:{resource_id} - Quality score cache
     - resource:{resource_id} - Full resource data cache
-    - search_query:* - All search query result caches
+
+    Cached search results are not deleted here: the search module bumps the
+    search result cache generation on resource changes (a single INCR
+    instead of a KEYS scan over search_query:*).
 
     Args:
         event: Event object containing resource_id in data
@@ -288,7 +279,6 @@ def on_resource_updated_invalidate_caches(event: Event) -> None:
             f"embedding:{resource_id}",
             f"quality:{resource_id}",
             f"resource:{resource_id}",
-            "search_query:*",  # Invalidate all search query caches
         ]
 
         # Queue cache invalidation with URGENT priority and no delay
@@ -461,54 +451,6 @@ def on_author_extracted_normalize_names(event: Event) -> None:
         )
 
 
-# ============================================================================
-# Hook 5.9: Collection Embedding Update on Resource Deletion
-# ============================================================================
-
-
-def on_resource_deleted_update_collections(event: Event) -> None:
-    """
-    Hook: Update collection embeddings when a resource is deleted.
-
-    Triggered by: resource.deleted event
-    Priority: MEDIUM (5)
-    Delay: 5 seconds (debounce)
-
-    This hook ensures that collection embeddings are recomputed when a member
-    resource is deleted. The 5-second delay allows multiple deletions to be
-    batched if needed.
-
-    Args:
-        event: Event object containing resource_id in data
-    """
-    resource_id = event.data.get("resource_id")
-
-    if not resource_id:
-        logger.warning("resource_deleted event missing resource_id")
-        return
-
-    try:
-        from ..tasks.celery_tasks import update_collection_embeddings_task
-
-        # Queue collection embedding update with MEDIUM priority and 5s delay
-        update_collection_embeddings_task.apply_async(
-            args=[resource_id],
-            priority=5,  # MEDIUM priority
-            countdown=5,  # 5-second debounce delay
-        )
-
-        logger.info(
-            f"Queued collection embedding updates for deleted resource {resource_id} "
-            f"(priority=5, countdown=5s)"
-        )
-
-    except Exception as e:
-        logger.error(
-            f"Error queuing collection embedding update for {resource_id}: {e}",
-            exc_info=True,
-        )
-
-
 # ============================================================================
 # Hook Registration
 # ============================================================================
@@ -531,7 +473,10 @@ def register_all_hooks() -> None:
     6. Recommendation profile refresh (user interactions)
     7. Classification suggestion (resource creation)
     8. Author normalization (author extraction)
-    9. Collection embedding update (resource deletion)
+
+    Collection embeddings are not updated here: resource deletion and
+    re-embedding adjust collection running sums in their own transaction
+    (see CollectionService).
     """
     hooks = [
         (SystemEvent.RESOURCE_CONTENT_CHANGED, on_content_changed_regenerate_embedding),
@@ -542,7 +487,6 @@ def register_all_hooks() -> None:
         (SystemEvent.USER_INTERACTION_TRACKED, on_user_interaction_refresh_profile),
         (SystemEvent.RESOURCE_CREATED, on_resource_created_suggest_classification),
         (SystemEvent.AUTHORS_EXTRACTED, on_author_extracted_normalize_names),
-        (SystemEvent.RESOURCE_DELETED, on_resource_deleted_update_collections),
     ]
 
     # Create wrapper to convert dict payload to Event object for backward compatibility
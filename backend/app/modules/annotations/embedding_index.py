@@ -0,0 +1,171 @@
+"""
+Annotation Embedding Index
+
+Per-user in-memory matrices of annotation embeddings for semantic search.
+
+Each user's embedded annotations are decoded once into a ``VectorIndex``
+(exact matrix search, see app/shared/vector_index.py), so a query is one
+matrix-vector product instead of a Python loop over JSON rows. Matrices are
+kept in an LRU bounded by ``ANNOTATION_VECTOR_CACHE_MAX_BYTES``.
+
+Consistency:
+- AnnotationService upserts/removes single annotations as they are
+  embedded or deleted
+- Each lookup compares a cheap signature (count and latest ``updated_at``
+  of the user's embedded annotations, from the user index) against the
+  cached matrix and reloads it when another process changed the rows
+"""
+
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, List, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ...shared.vector_index import VectorIndex, parse_embedding
+from .model import Annotation
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _UserMatrix:
+    index: VectorIndex
+    signature: Tuple[Any, ...]
+
+
+class AnnotationEmbeddingCache:
+    """LRU of per-user annotation embedding matrices.
+
+    Attributes:
+        max_bytes: Memory budget for all cached matrices
+        hits: Lookups served from a current matrix
+        misses: Lookups that (re)loaded a matrix
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._users: "OrderedDict[str, _UserMatrix]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _signature(db: Session, user_id: str) -> Tuple[Any, ...]:
+        count, latest = db.execute(
+            select(func.count(Annotation.id), func.max(Annotation.updated_at)).where(
+                Annotation.user_id == user_id, Annotation.embedding.isnot(None)
+            )
+        ).one()
+        return (count, latest)
+
+    def _load(self, db: Session, user_id: str) -> VectorIndex:
+        # Never trained: per-user matrices are searched exactly
+        index = VectorIndex(f"annotations:{user_id}")
+        keys, vectors = [], []
+        rows = db.execute(
+            select(Annotation.id, Annotation.embedding).where(
+                Annotation.user_id == user_id, Annotation.embedding.isnot(None)
+            )
+        )
+        for annotation_id, raw in rows:
+            vector = parse_embedding(raw)
+            if vector and (not vectors or len(vector) == len(vectors[0])):
+                keys.append(str(annotation_id))
+                vectors.append(vector)
+        if keys:
+            index.upsert_many(keys, vectors)
+        return index
+
+    def _evict(self) -> None:
+        total = sum(entry.index.stats()["memory_bytes"] for entry in self._users.values())
+        while total > self.max_bytes and len(self._users) > 1:
+            _, entry = self._users.popitem(last=False)
+            total -= entry.index.stats()["memory_bytes"]
+
+    def get(self, db: Session, user_id: str) -> VectorIndex:
+        """Return the user's current embedding matrix, loading it if needed.
+
+        Args:
+            db: Database session
+            user_id: Annotation owner
+
+        Returns:
+            VectorIndex keyed by annotation ID
+        """
+        signature = self._signature(db, user_id)
+        with self._lock:
+            entry = self._users.get(user_id)
+            if entry is not None and entry.signature == signature:
+                self._users.move_to_end(user_id)
+                self.hits += 1
+                return entry.index
+
+        index = self._load(db, user_id)
+        with self._lock:
+            self.misses += 1
+            self._users[user_id] = _UserMatrix(index, signature)
+            self._users.move_to_end(user_id)
+            self._evict()
+        return index
+
+    def upsert(
+        self, db: Session, user_id: str, annotation_id: str, embedding: Any
+    ) -> None:
+        """Apply a new or changed annotation embedding to a cached matrix."""
+        with self._lock:
+            entry = self._users.get(user_id)
+            if entry is None:
+                return
+            vector = parse_embedding(embedding)
+            if not vector or not entry.index.upsert(str(annotation_id), vector):
+                entry.index.remove(str(annotation_id))
+            entry.signature = self._signature(db, user_id)
+            self._evict()
+
+    def remove(self, db: Session, user_id: str, annotation_id: str) -> None:
+        """Drop a deleted annotation from a cached matrix."""
+        with self._lock:
+            entry = self._users.get(user_id)
+            if entry is None:
+                return
+            entry.index.remove(str(annotation_id))
+            entry.signature = self._signature(db, user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._users.clear()
+
+
+_caches: "weakref.WeakKeyDictionary[Any, AnnotationEmbeddingCache]" = (
+    weakref.WeakKeyDictionary()
+)
+_caches_lock = threading.Lock()
+
+
+def get_annotation_cache(db: Session) -> AnnotationEmbeddingCache:
+    """Return the process-wide annotation embedding cache for the session's engine."""
+    engine = db.get_bind().engine
+    with _caches_lock:
+        cache = _caches.get(engine)
+        if cache is None:
+            try:
+                from ...config.settings import get_settings
+
+                max_bytes = get_settings().ANNOTATION_VECTOR_CACHE_MAX_BYTES
+            except Exception:
+                max_bytes = 256 * 1024 * 1024
+            cache = _caches[engine] = AnnotationEmbeddingCache(max_bytes)
+        return cache
+
+
+def search_user_annotations(
+    db: Session, user_id: str, query_embedding: Any, limit: int
+) -> List[Tuple[str, float]]:
+    """Top-k (annotation_id, cosine similarity) for one user's annotations."""
+    index = get_annotation_cache(db).get(db, user_id)
+    return index.search(query_embedding, k=limit)
@@ -0,0 +1,221 @@
+"""
+Annotation Full-Text Index
+
+Ranked keyword search over annotation notes and highlighted text, backed by
+the database's native full-text index:
+
+- SQLite: FTS5 table ``annotations_fts`` (unicode61 tokenizer, prefix
+  matching) with a stable rowid mapping table ``annotations_fts_doc`` and
+  sync triggers; scored with BM25 (note weighted above highlight)
+- PostgreSQL: stored generated ``annotations.search_vector`` tsvector column
+  with a GIN index; scored with ``ts_rank_cd``
+
+The schema is created by the ``20261016_annotations_fts`` migration. For
+SQLite databases created with ``Base.metadata.create_all`` (tests, dev) it is
+created on first use by ``ensure_annotation_fts_schema``.
+
+See app/modules/search/fts_index.py for the resource-level counterpart.
+"""
+
+import logging
+import re
+import threading
+import weakref
+from typing import Any, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# BM25 column weights for (note, highlighted_text)
+NOTE_WEIGHT = 2.0
+HIGHLIGHT_WEIGHT = 1.0
+
+SQLITE_FTS_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS annotations_fts_doc (
+        rowid INTEGER PRIMARY KEY,
+        annotation_id TEXT UNIQUE NOT NULL
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS annotations_fts USING fts5(
+        note,
+        highlighted_text,
+        tokenize = 'unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_annotations_ai_fts
+    AFTER INSERT ON annotations
+    BEGIN
+        INSERT OR IGNORE INTO annotations_fts_doc(annotation_id) VALUES (NEW.id);
+        INSERT INTO annotations_fts(rowid, note, highlighted_text)
+        VALUES (
+            (SELECT rowid FROM annotations_fts_doc WHERE annotation_id = NEW.id),
+            COALESCE(NEW.note, ''),
+            NEW.highlighted_text
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_annotations_au_fts
+    AFTER UPDATE OF note, highlighted_text ON annotations
+    BEGIN
+        UPDATE annotations_fts
+        SET note = COALESCE(NEW.note, ''),
+            highlighted_text = NEW.highlighted_text
+        WHERE rowid = (
+            SELECT rowid FROM annotations_fts_doc WHERE annotation_id = NEW.id
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_annotations_ad_fts
+    AFTER DELETE ON annotations
+    BEGIN
+        DELETE FROM annotations_fts
+        WHERE rowid = (
+            SELECT rowid FROM annotations_fts_doc WHERE annotation_id = OLD.id
+        );
+        DELETE FROM annotations_fts_doc WHERE annotation_id = OLD.id;
+    END
+    """,
+]
+
+SQLITE_FTS_BACKFILL = [
+    "INSERT OR IGNORE INTO annotations_fts_doc(annotation_id) SELECT id FROM annotations",
+    """
+    INSERT INTO annotations_fts(rowid, note, highlighted_text)
+    SELECT d.rowid, COALESCE(a.note, ''), a.highlighted_text
+    FROM annotations a
+    JOIN annotations_fts_doc d ON d.annotation_id = a.id
+    WHERE d.rowid NOT IN (SELECT rowid FROM annotations_fts)
+    """,
+]
+
+# Engines whose full-text schema has been checked: engine -> bool (available)
+_checked: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+_checked_lock = threading.Lock()
+
+
+def query_tokens(query: str) -> List[str]:
+    """Lower-cased word tokens of a query."""
+    return re.findall(r"\w+", (query or "").lower())
+
+
+def ensure_annotation_fts_schema(bind: Any) -> bool:
+    """Make sure the annotation full-text schema exists for an engine.
+
+    On SQLite the FTS5 table, mapping table and triggers are created (and
+    backfilled) if missing. On PostgreSQL the stored ``search_vector``
+    column is only detected; it is added by migration. Failures are only
+    cached when definitive (SQLite built without FTS5).
+
+    Args:
+        bind: SQLAlchemy engine or connection
+
+    Returns:
+        True if indexed full-text search is available
+    """
+    engine = getattr(bind, "engine", bind)
+    with _checked_lock:
+        if engine in _checked:
+            return _checked[engine]
+
+        available = False
+        try:
+            dialect = engine.dialect.name
+            with engine.begin() as conn:
+                if dialect == "sqlite":
+                    exists = conn.execute(
+                        text(
+                            "SELECT 1 FROM sqlite_master "
+                            "WHERE type = 'table' AND name = 'annotations_fts'"
+                        )
+                    ).first()
+                    if exists is None:
+                        for stmt in SQLITE_FTS_DDL + SQLITE_FTS_BACKFILL:
+                            conn.execute(text(stmt))
+                        logger.info("Created SQLite FTS5 index for annotations")
+                    available = True
+                elif dialect == "postgresql":
+                    available = (
+                        conn.execute(
+                            text(
+                                "SELECT 1 FROM information_schema.columns "
+                                "WHERE table_name = 'annotations' "
+                                "AND column_name = 'search_vector'"
+                            )
+                        ).first()
+                        is not None
+                    )
+        except Exception as e:
+            logger.warning(
+                f"Annotation full-text index unavailable, using LIKE search: {e}"
+            )
+            # Transient errors (locks, timeouts, database not up yet) are not
+            # cached, so the next call retries; a SQLite without FTS5 is final
+            if "no such module: fts5" not in str(e).lower():
+                return False
+            available = False
+
+        _checked[engine] = available
+        return available
+
+
+def annotation_fts_search(
+    db: Session, user_id: str, tokens: List[str], limit: int = 50
+) -> List[Tuple[str, float]]:
+    """Ranked keyword search over one user's annotations.
+
+    Every token must match as a word prefix in the note or the highlighted
+    text (so "learn" finds "learning", like the previous LIKE search did for
+    word starts).
+
+    Args:
+        db: Database session
+        user_id: Annotation owner
+        tokens: Query tokens (see ``query_tokens``)
+        limit: Maximum number of results
+
+    Returns:
+        List of (annotation_id, score) tuples, highest score first
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        match = " ".join(f'"{t}"*' for t in tokens)
+        rows = db.execute(
+            text(
+                f"""
+                SELECT a.id,
+                       -bm25(annotations_fts, {NOTE_WEIGHT}, {HIGHLIGHT_WEIGHT}) AS score
+                FROM annotations_fts
+                JOIN annotations_fts_doc d ON d.rowid = annotations_fts.rowid
+                JOIN annotations a ON a.id = d.annotation_id
+                WHERE annotations_fts MATCH :match AND a.user_id = :user_id
+                ORDER BY score DESC
+                LIMIT :limit
+                """
+            ),
+            {"match": match, "user_id": user_id, "limit": limit},
+        )
+        return [(str(row[0]), float(row[1])) for row in rows]
+
+    rows = db.execute(
+        text(
+            """
+            SELECT id, ts_rank_cd(search_vector, q, 1) AS score
+            FROM annotations, to_tsquery('simple', :query) AS q
+            WHERE user_id = :user_id AND search_vector @@ q
+            ORDER BY score DESC
+            LIMIT :limit
+            """
+        ),
+        {
+            "query": " & ".join(f"{t}:*" for t in tokens),
+            "user_id": user_id,
+            "limit": limit,
+        },
+    )
+    return [(str(row[0]), float(row[1])) for row in rows]
@@ -10,12 +10,13 @@ Related files:
 """
 
 import json
-from typing import Optional, List
+from typing import Iterator, Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
 from ...shared.database import get_sync_db
+from ...shared.streaming import buffer_chunks, gzip_chunks
 from .service import AnnotationService
 from .schema import (
     AnnotationCreate,
@@ -548,6 +549,18 @@ async def search_annotations_by_tags(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _close_after(service: AnnotationService, chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Close the service's session once a streamed body is exhausted.
+
+    Dependencies with yield exit before a StreamingResponse body is sent,
+    so the session is reopened while streaming and must be closed here.
+    """
+    try:
+        yield from chunks
+    finally:
+        service.db.close()
+
+
 @router.get("/annotations/export/markdown", response_class=PlainTextResponse)
 async def export_annotations_markdown(
     resource_id: Optional[str] = Query(
@@ -560,7 +573,8 @@ async def export_annotations_markdown(
     Export annotations to Markdown format.
 
     Exports all user annotations or annotations for a specific resource.
-    Annotations are grouped by resource with formatted headers.
+    Annotations are grouped by resource with formatted headers. The body is
+    streamed, so memory use does not grow with the number of annotations.
 
     Args:
         resource_id: Optional resource UUID to filter by
@@ -571,14 +585,72 @@ async def export_annotations_markdown(
         Markdown-formatted text
     """
     try:
-        markdown = service.export_annotations_markdown(
+        fragments = service.stream_annotations_markdown(
             user_id=user_id, resource_id=resource_id
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        _close_after(service, buffer_chunks(fragments)), media_type="text/markdown"
+    )
 
-        return PlainTextResponse(content=markdown, media_type="text/markdown")
+
+@router.get("/annotations/export/stream")
+async def stream_annotations_export(
+    format: str = Query(
+        "markdown", pattern="^(markdown|jsonl)$", description="markdown or jsonl"
+    ),
+    gzip: bool = Query(False, description="Gzip-compress the stream"),
+    resource_id: Optional[str] = Query(
+        None, description="Optional resource ID to filter by"
+    ),
+    user_id: str = Depends(_get_current_user_id),
+    service: AnnotationService = Depends(_get_annotation_service),
+):
+    """
+    Stream an annotations export as Markdown or JSON Lines, optionally gzipped.
+
+    Annotations are read from the database in batches and written as they
+    are read, so memory use stays constant regardless of annotation count.
+
+    Args:
+        format: "markdown" or "jsonl" (one JSON object per line)
+        gzip: Compress the body with gzip
+        resource_id: Optional resource UUID to filter by
+        user_id: Authenticated user ID
+        service: Annotation service instance
+
+    Returns:
+        Streaming response with the export
+    """
+    try:
+        if format == "jsonl":
+            fragments = service.stream_annotations_jsonl(
+                user_id=user_id, resource_id=resource_id
+            )
+            media_type, extension = "application/x-ndjson", "jsonl"
+        else:
+            fragments = service.stream_annotations_markdown(
+                user_id=user_id, resource_id=resource_id
+            )
+            media_type, extension = "text/markdown", "md"
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    filename = f"annotations.{extension}"
+    if gzip:
+        chunks = gzip_chunks(fragments)
+        media_type, filename = "application/gzip", f"{filename}.gz"
+    else:
+        chunks = buffer_chunks(fragments)
+
+    return StreamingResponse(
+        _close_after(service, chunks),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
 
 @router.get("/annotations/export/json", response_model=List[dict])
 async def export_annotations_json(
@@ -16,7 +16,7 @@ Features:
 - Text offset-based highlighting with context extraction
 - Full-text and semantic search across annotations
 - Tag-based organization and filtering
-- Markdown and JSON export
+- Markdown, JSON and streaming (Markdown / JSON Lines) export
 - Automatic embedding generation for semantic search
 """
 
@@ -24,7 +24,7 @@ from __future__ import annotations
 
 import uuid
 import json
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -42,6 +42,26 @@ DEFAULT_SEMANTIC_LIMIT = 10
 DEFAULT_USER_ANNOTATIONS_LIMIT = 100
 DEFAULT_COLOR = "#FFFF00"
 MAX_EXPORT_ANNOTATIONS = 1000
+EXPORT_BATCH_SIZE = 500  # Rows fetched per round trip when exporting
+
+# Annotation columns read by exports (everything but the embedding)
+EXPORT_COLUMNS = (
+    Annotation.id,
+    Annotation.resource_id,
+    Annotation.user_id,
+    Annotation.start_offset,
+    Annotation.end_offset,
+    Annotation.highlighted_text,
+    Annotation.note,
+    Annotation.tags,
+    Annotation.color,
+    Annotation.context_before,
+    Annotation.context_after,
+    Annotation.is_shared,
+    Annotation.collection_ids,
+    Annotation.created_at,
+    Annotation.updated_at,
+)
 
 
 class AnnotationService:
@@ -347,6 +367,10 @@ class AnnotationService:
         self.db.delete(annotation)
         self.db.commit()
 
+        from .embedding_index import get_annotation_cache
+
+        get_annotation_cache(self.db).remove(self.db, user_id, str(annotation_uuid))
+
         # Emit annotation.deleted event
         from .handlers import emit_annotation_deleted
 
@@ -561,9 +585,12 @@ class AnnotationService:
         """
         Full-text search across annotation notes and highlighted text.
 
-        Searches both the note content and highlighted_text fields using
-        LIKE queries. Results are filtered to only include annotations
-        owned by the requesting user.
+        Uses the annotation full-text index (FTS5 on SQLite, tsvector on
+        PostgreSQL, see fts_index.py): every query word must match a word
+        prefix in the note or highlighted text, and results are ranked by
+        relevance with note matches weighted above highlight matches. Falls
+        back to LIKE queries when no full-text index is available. Results
+        only include annotations owned by the requesting user.
 
         Args:
             user_id: User ID to filter annotations by
@@ -571,14 +598,26 @@ class AnnotationService:
             limit: Maximum number of results to return (default: 50)
 
         Returns:
-            List of matching Annotation objects
+            List of matching Annotation objects, most relevant first
 
         Requirements: 4.1, 4.2, 4.3, 4.4, 4.5, 12.2
         Target: <100ms for 10,000 annotations
+        (tests/modules/annotations/test_search_benchmark.py)
         """
         if not query:
             return []
 
+        from .fts_index import (
+            annotation_fts_search,
+            ensure_annotation_fts_schema,
+            query_tokens,
+        )
+
+        tokens = query_tokens(query)
+        if tokens and ensure_annotation_fts_schema(self.db.get_bind()):
+            hits = annotation_fts_search(self.db, user_id, tokens, limit=limit)
+            return [annotation for annotation, _ in self._load_ranked(hits)]
+
         # Build LIKE pattern
         search_pattern = f"%{query}%"
 
@@ -611,10 +650,9 @@ class AnnotationService:
 
         Algorithm:
         1. Generate embedding for query text
-        2. Retrieve all user annotations that have embeddings
-        3. Compute cosine similarity between query and each annotation
-        4. Sort by similarity descending
-        5. Return top N matches with similarity scores
+        2. Score it against the user's cached annotation embedding matrix
+           (one matrix-vector product, see embedding_index.py)
+        3. Load the top N annotations and return them with similarity scores
 
         Args:
             user_id: User ID to filter annotations by
@@ -637,31 +675,38 @@ class AnnotationService:
         except Exception:
             return []
 
-        # Retrieve user annotations with embeddings
-        query_stmt = select(Annotation).filter(
-            and_(Annotation.user_id == user_id, Annotation.embedding.isnot(None))
-        )
-
-        result = self.db.execute(query_stmt)
-        annotations = result.scalars().all()
+        # Score against the user's cached embedding matrix
+        from .embedding_index import search_user_annotations
 
-        if not annotations:
-            return []
+        hits = search_user_annotations(self.db, user_id, query_embedding, limit)
 
-        # Compute cosine similarity for each annotation
-        results = []
-        for annotation in annotations:
-            if annotation.embedding:
-                similarity = self._cosine_similarity(
-                    query_embedding, annotation.embedding
-                )
-                results.append((annotation, similarity))
+        # Clamp to [0, 1] like _cosine_similarity
+        return [
+            (annotation, max(0.0, min(1.0, score)))
+            for annotation, score in self._load_ranked(hits)
+        ]
 
-        # Sort by similarity descending
-        results.sort(key=lambda x: x[1], reverse=True)
+    def _load_ranked(
+        self, hits: List[Tuple[str, float]]
+    ) -> List[Tuple[Annotation, float]]:
+        """Load annotations for ranked (id, score) hits, keeping their order."""
+        ids = []
+        for annotation_id, _ in hits:
+            try:
+                ids.append(uuid.UUID(annotation_id))
+            except (ValueError, TypeError):
+                continue
+        if not ids:
+            return []
 
-        # Return top N matches
-        return results[:limit]
+        result = self.db.execute(select(Annotation).filter(Annotation.id.in_(ids)))
+        by_id = {str(annotation.id): annotation for annotation in result.scalars()}
+        ranked = []
+        for annotation_id, score in hits:
+            annotation = by_id.get(str(uuid.UUID(annotation_id)))
+            if annotation is not None:
+                ranked.append((annotation, score))
+        return ranked
 
     def search_annotations_by_tags(
         self, user_id: str, tags: List[str], match_all: bool = False
@@ -729,6 +774,12 @@ class AnnotationService:
                 # Update annotation with embedding
                 annotation.embedding = embedding
                 self.db.commit()
+
+                from .embedding_index import get_annotation_cache
+
+                get_annotation_cache(self.db).upsert(
+                    self.db, annotation.user_id, str(annotation.id), embedding
+                )
         except Exception:
             # Silently fail - embedding generation is not critical
             # In production, this should be logged
@@ -771,37 +822,24 @@ class AnnotationService:
         except Exception:
             return 0.0
 
-    def export_annotations_markdown(
-        self, user_id: str, resource_id: Optional[str] = None
-    ) -> str:
+    def _export_statement(
+        self, user_id: str, resource_id: Optional[str], *order_by
+    ):
         """
-        Export annotations to Markdown format.
-
-        Algorithm:
-        1. Retrieve annotations (filtered by resource if specified)
-        2. Group by resource_id
-        3. For each resource:
-           - Add resource title header
-           - For each annotation:
-             - Format as blockquote (highlighted text)
-             - Add note, tags, timestamp
-             - Add separator
-        4. Concatenate all sections
+        Build the export query: annotation columns plus the resource fields
+        exports print, via an outer join (no ORM objects, no embeddings).
 
-        Args:
-            user_id: User ID to export annotations for
-            resource_id: Optional resource UUID to filter by (exports all if None)
-
-        Returns:
-            Markdown-formatted string with all annotations
-
-        Requirements: 7.1, 7.2, 7.3, 7.5, 12.3
-        Target: <2s for 1,000 annotations
+        Raises:
+            ValueError: If resource_id is not a valid UUID
         """
-        # Build query with eager loading of resource relationship
         query_stmt = (
-            select(Annotation)
-            .options(joinedload(Annotation.resource))
+            select(
+                *EXPORT_COLUMNS,
+                Resource.id.label("resource_pk"),
+                Resource.title.label("resource_title"),
+                Resource.type.label("resource_type"),
+            )
+            .outerjoin(Resource, Resource.id == Annotation.resource_id)
             .filter(Annotation.user_id == user_id)
         )
 
@@ -809,149 +847,194 @@ class AnnotationService:
         if resource_id:
             try:
                 resource_uuid = uuid.UUID(resource_id)
-                query_stmt = query_stmt.filter(Annotation.resource_id == resource_uuid)
             except (ValueError, TypeError):
                 raise ValueError(f"Invalid resource_id format: {resource_id}")
+            query_stmt = query_stmt.filter(Annotation.resource_id == resource_uuid)
 
-        # Order by resource and then by offset within resource
-        query_stmt = query_stmt.order_by(
-            Annotation.resource_id.asc(), Annotation.start_offset.asc()
+        return query_stmt.order_by(*order_by).execution_options(
+            yield_per=EXPORT_BATCH_SIZE
         )
 
-        # Execute query
-        result = self.db.execute(query_stmt)
-        annotations = result.scalars().all()
+    def _iter_export_rows(self, query_stmt) -> Iterator[Any]:
+        """Stream export rows in batches (server-side cursor where supported)."""
+        yield from self.db.execute(query_stmt)
 
-        if not annotations:
-            return "# Annotations Export\n\nNo annotations found.\n"
+    def stream_annotations_markdown(
+        self, user_id: str, resource_id: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream an annotations export in Markdown format.
+
+        Annotations are read in batches ordered by resource and offset, and
+        grouped by resource from the ordered stream, so memory use does not
+        grow with the number of annotations.
 
-        # Group annotations by resource
+        Args:
+            user_id: User ID to export annotations for
+            resource_id: Optional resource UUID to filter by (exports all if None)
+
+        Returns:
+            Iterator of Markdown fragments
+
+        Raises:
+            ValueError: If resource_id is invalid (raised before streaming starts)
+        """
+        query_stmt = self._export_statement(
+            user_id,
+            resource_id,
+            Annotation.resource_id.asc(),
+            Annotation.start_offset.asc(),
+        )
+        return self._markdown_fragments(self._iter_export_rows(query_stmt))
+
+    def _markdown_fragments(self, rows: Iterable[Any]) -> Iterator[str]:
         from itertools import groupby
 
-        markdown_parts = ["# Annotations Export\n\n"]
+        yield "# Annotations Export\n\n"
 
-        # Group by resource_id
-        for resource_id_key, resource_annotations in groupby(
-            annotations, key=lambda a: a.resource_id
-        ):
-            resource_annotations_list = list(resource_annotations)
+        empty = True
+        for _, resource_rows in groupby(rows, key=lambda row: row.resource_id):
+            first = next(resource_rows)
+            empty = False
 
-            # Get resource title from first annotation's relationship
+            # Resource header
             resource_title = "Unknown Resource"
-            if resource_annotations_list and resource_annotations_list[0].resource:
-                resource_title = (
-                    resource_annotations_list[0].resource.title or "Untitled Resource"
-                )
+            if first.resource_pk is not None:
+                resource_title = first.resource_title or "Untitled Resource"
+            yield f"## {resource_title}\n\n"
 
-            # Add resource header
-            markdown_parts.append(f"## {resource_title}\n\n")
+            yield self._format_markdown_annotation(first)
+            for row in resource_rows:
+                yield self._format_markdown_annotation(row)
 
-            # Format each annotation
-            for annotation in resource_annotations_list:
-                # Highlighted text as blockquote
-                markdown_parts.append(f"> {annotation.highlighted_text}\n\n")
+            # Add spacing between resources
+            yield "\n"
 
-                # Note (if present)
-                if annotation.note:
-                    markdown_parts.append(f"**Note:** {annotation.note}\n\n")
+        if empty:
+            yield "No annotations found.\n"
 
-                # Tags (if present)
-                if annotation.tags:
-                    try:
-                        tags_list = json.loads(annotation.tags)
-                        if tags_list:
-                            tags_str = ", ".join(f"`{tag}`" for tag in tags_list)
-                            markdown_parts.append(f"**Tags:** {tags_str}\n\n")
-                    except (json.JSONDecodeError, TypeError):
-                        pass
+    @staticmethod
+    def _format_markdown_annotation(row: Any) -> str:
+        # Highlighted text as blockquote
+        parts = [f"> {row.highlighted_text}\n\n"]
 
-                # Color (if not default)
-                if annotation.color and annotation.color != "#FFFF00":
-                    markdown_parts.append(f"**Color:** {annotation.color}\n\n")
+        # Note (if present)
+        if row.note:
+            parts.append(f"**Note:** {row.note}\n\n")
 
-                # Timestamp
-                created_str = annotation.created_at.strftime("%Y-%m-%d %H:%M:%S")
-                markdown_parts.append(f"*Created: {created_str}*\n\n")
+        # Tags (if present)
+        if row.tags:
+            try:
+                tags_list = json.loads(row.tags)
+                if tags_list:
+                    tags_str = ", ".join(f"`{tag}`" for tag in tags_list)
+                    parts.append(f"**Tags:** {tags_str}\n\n")
+            except (json.JSONDecodeError, TypeError):
+                pass
 
-                # Separator
-                markdown_parts.append("---\n\n")
+        # Color (if not default)
+        if row.color and row.color != DEFAULT_COLOR:
+            parts.append(f"**Color:** {row.color}\n\n")
 
-            # Add spacing between resources
-            markdown_parts.append("\n")
+        # Timestamp
+        created_str = row.created_at.strftime("%Y-%m-%d %H:%M:%S")
+        parts.append(f"*Created: {created_str}*\n\n")
 
-        # Concatenate all parts efficiently
-        return "".join(markdown_parts)
+        # Separator
+        parts.append("---\n\n")
+        return "".join(parts)
 
-    def export_annotations_json(
+    def export_annotations_markdown(
         self, user_id: str, resource_id: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> str:
         """
-        Export annotations to JSON format with complete metadata.
+        Export annotations to Markdown format.
 
-        Algorithm:
-        1. Retrieve annotations with resource metadata
-        2. Convert to JSON-serializable dicts
+        Builds the whole document in memory; use stream_annotations_markdown
+        for large exports.
 
         Args:
             user_id: User ID to export annotations for
             resource_id: Optional resource UUID to filter by (exports all if None)
 
         Returns:
-            List of annotation dictionaries with complete metadata
+            Markdown-formatted string with all annotations
 
-        Requirements: 7.3, 7.4
+        Requirements: 7.1, 7.2, 7.3, 7.5, 12.3
+        Target: <2s for 1,000 annotations
         """
-        # Build query with eager loading of resource relationship
-        query_stmt = (
-            select(Annotation)
-            .options(joinedload(Annotation.resource))
-            .filter(Annotation.user_id == user_id)
-        )
+        return "".join(self.stream_annotations_markdown(user_id, resource_id))
 
-        # Filter by resource if specified
-        if resource_id:
-            try:
-                resource_uuid = uuid.UUID(resource_id)
-                query_stmt = query_stmt.filter(Annotation.resource_id == resource_uuid)
-            except (ValueError, TypeError):
-                raise ValueError(f"Invalid resource_id format: {resource_id}")
+    def stream_annotations_jsonl(
+        self, user_id: str, resource_id: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream an annotations export as JSON Lines (one annotation per line).
 
-        # Order by created_at descending (most recent first)
-        query_stmt = query_stmt.order_by(Annotation.created_at.desc())
+        Args:
+            user_id: User ID to export annotations for
+            resource_id: Optional resource UUID to filter by (exports all if None)
 
-        # Execute query
-        result = self.db.execute(query_stmt)
-        annotations = result.scalars().all()
+        Returns:
+            Iterator of newline-terminated JSON objects, most recent first
 
-        # Convert to JSON-serializable dicts
-        json_annotations = []
-        for annotation in annotations:
-            annotation_dict = {
-                "id": str(annotation.id),
-                "resource_id": str(annotation.resource_id),
-                "user_id": annotation.user_id,
-                "start_offset": annotation.start_offset,
-                "end_offset": annotation.end_offset,
-                "highlighted_text": annotation.highlighted_text,
-                "note": annotation.note,
-                "tags": json.loads(annotation.tags) if annotation.tags else [],
-                "color": annotation.color,
-                "context_before": annotation.context_before,
-                "context_after": annotation.context_after,
-                "is_shared": annotation.is_shared,
-                "collection_ids": json.loads(annotation.collection_ids)
-                if annotation.collection_ids
-                else [],
-                "created_at": annotation.created_at.isoformat(),
-                "updated_at": annotation.updated_at.isoformat(),
-                "resource": {
-                    "id": str(annotation.resource.id) if annotation.resource else None,
-                    "title": annotation.resource.title if annotation.resource else None,
-                    "type": annotation.resource.type if annotation.resource else None,
-                }
-                if annotation.resource
-                else None,
+        Raises:
+            ValueError: If resource_id is invalid (raised before streaming starts)
+        """
+        query_stmt = self._export_statement(
+            user_id, resource_id, Annotation.created_at.desc()
+        )
+        rows = self._iter_export_rows(query_stmt)
+        return (json.dumps(self._export_dict(row)) + "\n" for row in rows)
+
+    @staticmethod
+    def _export_dict(row: Any) -> Dict[str, Any]:
+        return {
+            "id": str(row.id),
+            "resource_id": str(row.resource_id),
+            "user_id": row.user_id,
+            "start_offset": row.start_offset,
+            "end_offset": row.end_offset,
+            "highlighted_text": row.highlighted_text,
+            "note": row.note,
+            "tags": json.loads(row.tags) if row.tags else [],
+            "color": row.color,
+            "context_before": row.context_before,
+            "context_after": row.context_after,
+            "is_shared": row.is_shared,
+            "collection_ids": json.loads(row.collection_ids)
+            if row.collection_ids
+            else [],
+            "created_at": row.created_at.isoformat(),
+            "updated_at": row.updated_at.isoformat(),
+            "resource": {
+                "id": str(row.resource_pk),
+                "title": row.resource_title,
+                "type": row.resource_type,
             }
-            json_annotations.append(annotation_dict)
+            if row.resource_pk is not None
+            else None,
+        }
 
-        return json_annotations
+    def export_annotations_json(
+        self, user_id: str, resource_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Export annotations to JSON format with complete metadata.
+
+        Builds the whole list in memory; use stream_annotations_jsonl for
+        large exports.
+
+        Args:
+            user_id: User ID to export annotations for
+            resource_id: Optional resource UUID to filter by (exports all if None)
+
+        Returns:
+            List of annotation dictionaries with complete metadata
+
+        Requirements: 7.3, 7.4
+        """
+        query_stmt = self._export_statement(
+            user_id, resource_id, Annotation.created_at.desc()
+        )
+        return [self._export_dict(row) for row in self._iter_export_rows(query_stmt)]
@@ -9,13 +9,14 @@ Public Interface:
 - authority_router: FastAPI router for authority endpoints
 - AuthorityControl: Service for authority control operations
 - PersonalClassification: Service for classification tree management
+- SubjectAuthorityIndex / get_subject_index: In-memory subject authority index
 - Schema classes: SubjectSuggestionResponse, ClassificationTreeNode, ClassificationTreeResponse
 
 Events Emitted:
-- None (read-only module)
+- authority.subject_changed: A subject was created or gained a variant
 
 Events Subscribed:
-- None (read-only module)
+- authority.subject_changed: Reload the other in-memory subject indexes
 """
 
 __version__ = "1.0.0"
@@ -23,17 +24,22 @@ __domain__ = "authority"
 
 from .router import router as authority_router
 from .service import AuthorityControl, PersonalClassification
+from .subject_index import SubjectAuthorityIndex, get_subject_index
 from .schema import (
     SubjectSuggestionResponse,
     ClassificationTreeNode,
     ClassificationTreeResponse,
 )
+from .handlers import register_handlers
 
 __all__ = [
     "authority_router",
     "AuthorityControl",
     "PersonalClassification",
+    "SubjectAuthorityIndex",
+    "get_subject_index",
     "SubjectSuggestionResponse",
     "ClassificationTreeNode",
     "ClassificationTreeResponse",
+    "register_handlers",
 ]
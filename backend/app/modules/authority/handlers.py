@@ -0,0 +1,46 @@
+"""
+Authority Event Handlers
+
+Keeps the in-memory subject authority indexes of this process in sync.
+
+Events Emitted:
+- authority.subject_changed: When AuthorityControl creates a subject or adds
+  a variant (see service.py)
+
+Events Subscribed:
+- authority.subject_changed: Reload every other subject index on next use
+"""
+
+import logging
+from typing import Any, Dict
+
+from app.shared.event_bus import event_bus
+from app.events.event_types import SystemEvent
+
+logger = logging.getLogger(__name__)
+
+
+def handle_subject_changed(payload: Dict[str, Any]) -> None:
+    """Invalidate subject indexes other than the one that made the change.
+
+    The originating index was already updated in place; the others may hold
+    a different database and simply reload from it.
+    """
+    from app.modules.authority.subject_index import get_all_subject_indexes
+
+    origin = payload.get("index_token")
+    for index in get_all_subject_indexes():
+        if index.token != origin:
+            index.invalidate()
+
+
+def register_handlers():
+    """
+    Register all event handlers for the authority module.
+
+    This function should be called during application startup.
+    """
+    event_bus.subscribe(
+        SystemEvent.AUTHORITY_SUBJECT_CHANGED.value, handle_subject_changed
+    )
+    logger.info("Authority module event handlers registered")
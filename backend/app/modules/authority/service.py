@@ -9,7 +9,8 @@ It also provides rule-based classification using UDC-inspired codes with keyword
 and hierarchical organization.
 
 Features:
-- Subject normalization with built-in synonyms and database-backed variants
+- Subject normalization with built-in synonyms and database-backed variants,
+  served from a process-wide in-memory index (see subject_index.py)
 - Creator and publisher normalization with smart name formatting
 - Usage tracking and suggestion systems
 - UDC-inspired 000-999 classification hierarchy
@@ -19,13 +20,23 @@ Features:
 
 from __future__ import annotations
 
+import logging
 import re
 from typing import List, Optional, Dict, Any
 
-from sqlalchemy import func, cast, String
+from sqlalchemy import func, cast, String, inspect as sa_inspect
 from sqlalchemy.orm import Session
 
 from ...database import models as db_models
+from ...events.event_types import SystemEvent
+from ...shared.event_bus import event_bus
+from .subject_index import (
+    SubjectAuthorityIndex,
+    clean_subject,
+    get_subject_index,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class AuthorityControl:
@@ -34,6 +45,8 @@ class AuthorityControl:
     - Provides subject normalization with canonical forms and synonyms
     - Supports creator and publisher normalization
     - Persists authority maps (canonical + variants) and usage counts when a DB session is provided
+    - Resolves known subjects from the in-memory SubjectAuthorityIndex; only new
+      subjects and variants, and buffered usage flushes, touch the database
     """
 
     SYNONYMS = {
@@ -48,18 +61,16 @@ class AuthorityControl:
         "database": "Database",
     }
 
-    _PUNCT_RE = re.compile(r"[\,;\|]+")
-
     def __init__(self, db: Optional[Session] = None) -> None:
         self.db = db
+        self._index: Optional[SubjectAuthorityIndex] = None
+        self._subjects_written = False
 
     # ------------- Subject Normalization -------------
     def normalize_subject(self, raw: str) -> str:
         if not raw:
             return ""
-        s = raw.strip()
-        s = self._PUNCT_RE.sub(" ", s)
-        s = re.sub(r"\s+", " ", s)
+        s = clean_subject(raw)
         lower = s.lower()
 
         # Built-in synonyms
@@ -90,6 +101,7 @@ class AuthorityControl:
                 seen.add(n)
                 result.append(n)
                 self._increment_subject_usage(n)
+        self._flush_subject_usage()
         return result
 
     def add_subject_variant(self, canonical: str, variant: str) -> None:
@@ -102,6 +114,7 @@ class AuthorityControl:
             row.variants = variants
             self.db.add(row)
             self.db.commit()
+        self._subject_written(row)
 
     def get_subject_suggestions(self, partial: str) -> List[str]:
         if not partial:
@@ -114,7 +127,11 @@ class AuthorityControl:
         }
         suggestions.extend(sorted(builtin_targets))
 
-        if self.db:
+        index = self._subject_index()
+        if index is not None:
+            # Word-prefix matches, most used first
+            suggestions.extend(index.suggest(partial, limit=10))
+        elif self.db:
             # Match canonical by substring, order by usage_count desc
             rows = (
                 self.db.query(db_models.AuthoritySubject)
@@ -213,9 +230,27 @@ class AuthorityControl:
         norm_tokens = [smart_title_token(t) for t in tokens if t]
         return " ".join(norm_tokens)
 
+    def _subject_index(self) -> Optional[SubjectAuthorityIndex]:
+        """The loaded in-memory index for this session's database, if usable."""
+        if not self.db:
+            return None
+        if self._index is None:
+            try:
+                index = get_subject_index(self.db.get_bind())
+                index.ensure_loaded(self.db)
+            except Exception as e:
+                logger.warning(f"Subject authority index unavailable: {e}")
+                self.db.rollback()
+                return None
+            self._index = index
+        return self._index
+
     def _lookup_subject_canonical(self, lower_value: str) -> Optional[str]:
         if not self.db:
             return None
+        index = self._subject_index()
+        if index is not None:
+            return index.lookup(lower_value)
         # Exact match by canonical_form (case-insensitive)
         row = (
             self.db.query(db_models.AuthoritySubject)
@@ -313,11 +348,40 @@ class AuthorityControl:
     def _ensure_subject_persisted(self, canonical: str, variant: Optional[str]) -> None:
         if not self.db:
             return
+        if not (
+            variant and variant.strip() and variant.strip().lower() != canonical.lower()
+        ):
+            variant = None
+        index = self._subject_index()
+        if index is not None and index.is_known(canonical, variant):
+            return
         row = self._get_or_create_subject(canonical)
-        if variant and variant.strip() and variant.strip().lower() != canonical.lower():
+        if variant:
             self._add_variant(row, variant)
+        self._subject_written(row)
         # Do not increment usage here; we do that in normalize_subjects to count per-resource tag once
 
+    def _subject_written(self, row: db_models.AuthoritySubject) -> None:
+        """Record a stored subject in the index and announce the change."""
+        index = self._subject_index()
+        if index is None or not sa_inspect(row).persistent:
+            return
+        index.add_subject(
+            row.id, row.canonical_form, row.variants or [], row.usage_count or 0
+        )
+        self._subjects_written = True
+        try:
+            event_bus.emit(
+                SystemEvent.AUTHORITY_SUBJECT_CHANGED.value,
+                {
+                    "subject_id": str(row.id),
+                    "canonical_form": row.canonical_form,
+                    "index_token": index.token,
+                },
+            )
+        except Exception as e:
+            logger.error(f"Error emitting authority.subject_changed event: {e}")
+
     def _add_variant(self, row_with_variants, variant: str) -> None:
         variants = [v for v in (row_with_variants.variants or [])]
         if not any(v.lower() == variant.lower() for v in variants):
@@ -329,6 +393,9 @@ class AuthorityControl:
     def _increment_subject_usage(self, canonical: str) -> None:
         if not self.db:
             return
+        index = self._subject_index()
+        if index is not None and index.record_usage(canonical):
+            return
         try:
             row = self._get_or_create_subject(canonical)
             row.usage_count = int(row.usage_count or 0) + 1
@@ -340,6 +407,20 @@ class AuthorityControl:
             pass
 
 
+    def _flush_subject_usage(self) -> None:
+        """Flush buffered usage counts when due or when subjects were written.
+
+        Riding along with a subject write keeps the counts of new subjects
+        current at no extra commit cost.
+        """
+        index = self._index
+        if index is None or not index.pending:
+            return
+        if self._subjects_written or index.should_flush():
+            index.flush(self.db)
+            self._subjects_written = False
+
+
 class PersonalClassification:
     """Rule-based personal classifier with UDC-inspired 000-999 hierarchy.
 
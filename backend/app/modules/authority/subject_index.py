@@ -0,0 +1,344 @@
+"""
+Subject Authority Index
+
+Process-wide, in-memory copy of the ``authority_subjects`` table so subject
+normalization and suggestions do not query the database per tag or per
+keystroke:
+- A dictionary from normalized key (canonical form or variant, cleaned and
+  lower-cased) to canonical form
+- A sorted word-prefix index of canonical forms for suggestions, ranked by
+  usage count
+- A buffer of usage-count increments, written back in one bulk UPDATE
+
+Synchronization:
+- AuthorityControl updates the index of its engine directly when it creates
+  a subject or adds a variant, and emits authority.subject_changed so other
+  indexes in the process reload (see handlers.py)
+- A full reload every AUTHORITY_CACHE_REFRESH_SECONDS picks up writes from
+  other processes
+- Buffered increments are flushed once AUTHORITY_USAGE_FLUSH_SIZE accumulate,
+  when they are older than AUTHORITY_USAGE_FLUSH_SECONDS, with the next
+  subject write, at API shutdown and when a Celery worker process exits
+
+Related files:
+- app/modules/authority/service.py: AuthorityControl reads the index
+- app/modules/graph/snapshot.py: Same per-engine registry pattern
+"""
+
+import bisect
+import logging
+import re
+import threading
+import time
+import uuid
+import weakref
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session
+
+from ...config.settings import get_settings
+from ...database.models import AuthoritySubject
+
+logger = logging.getLogger(__name__)
+
+_PUNCT_RE = re.compile(r"[\,;\|]+")
+_WORD_RE = re.compile(r"\w+")
+
+
+def clean_subject(raw: str) -> str:
+    """Strip separators and collapse whitespace in a raw subject."""
+    s = _PUNCT_RE.sub(" ", raw.strip())
+    return re.sub(r"\s+", " ", s)
+
+
+def subject_key(raw: str) -> str:
+    """Dictionary key of a subject or variant (cleaned, lower-cased)."""
+    return clean_subject(raw).lower()
+
+
+def _setting(name: str, default: float) -> float:
+    value = getattr(get_settings(), name, default)
+    return value if isinstance(value, (int, float)) else default
+
+
+class SubjectAuthorityIndex:
+    """In-memory authority dictionary for one database.
+
+    Canonical forms are tracked by their lower-cased form, matching the
+    case-insensitive lookups of AuthorityControl.
+
+    Attributes:
+        token: Identifies this index in change events
+        loaded_at: Monotonic time of the last full load (None = never)
+    """
+
+    def __init__(self) -> None:
+        self.token = uuid.uuid4().hex
+        self.loaded_at: Optional[float] = None
+        self._lock = threading.RLock()
+        self._stale = True
+        self._canonical: Dict[str, str] = {}  # key -> canonical form
+        self._ids: Dict[str, Any] = {}  # lower canonical -> row id
+        self._forms: Dict[str, str] = {}  # lower canonical -> canonical form
+        self._variants: Dict[str, Set[str]] = {}  # lower canonical -> variants
+        self._usage: Dict[str, int] = {}  # lower canonical -> usage count
+        self._prefixes: List[Tuple[str, str]] = []  # sorted (word suffix, lower)
+        self._pending: Counter = Counter()
+        self._pending_since: Optional[float] = None
+        self.loads = 0
+        self.flushes = 0
+
+    # ------------- Loading -------------
+    def invalidate(self) -> None:
+        """Reload from the database on next use."""
+        self._stale = True
+
+    def ensure_loaded(self, db: Session) -> None:
+        """Load the index if it is empty, invalidated or too old."""
+        refresh = _setting("AUTHORITY_CACHE_REFRESH_SECONDS", 300)
+        if (
+            self._stale
+            or self.loaded_at is None
+            or time.monotonic() - self.loaded_at >= refresh
+        ):
+            self.load(db)
+
+    def load(self, db: Session) -> None:
+        """Rebuild the index from ``authority_subjects``.
+
+        Buffered usage increments are kept and added on top of the loaded
+        counts.
+        """
+        rows = db.execute(
+            select(
+                AuthoritySubject.id,
+                AuthoritySubject.canonical_form,
+                AuthoritySubject.variants,
+                AuthoritySubject.usage_count,
+            )
+        ).all()
+        with self._lock:
+            self._canonical.clear()
+            self._ids.clear()
+            self._forms.clear()
+            self._variants.clear()
+            self._usage.clear()
+            for subject_id, canonical, variants, usage_count in rows:
+                self._register(subject_id, canonical, variants or [], usage_count)
+            for lower, delta in self._pending.items():
+                if lower in self._usage:
+                    self._usage[lower] += delta
+            self._prefixes = sorted(
+                (suffix, lower)
+                for lower in self._forms
+                for suffix in self._word_suffixes(lower)
+            )
+            self._stale = False
+            self.loaded_at = time.monotonic()
+            self.loads += 1
+        logger.debug(f"Loaded {len(rows)} authority subjects into memory")
+
+    def _register(
+        self, subject_id: Any, canonical: str, variants: Iterable[str], usage: int
+    ) -> bool:
+        lower = canonical.lower()
+        is_new = lower not in self._forms
+        self._ids[lower] = subject_id
+        self._forms[lower] = canonical
+        self._usage[lower] = int(usage or 0)
+        known = self._variants.setdefault(lower, set())
+        # Canonical forms win over variants of other subjects
+        self._canonical[subject_key(canonical)] = canonical
+        for variant in variants:
+            if variant:
+                known.add(variant.lower())
+                self._canonical.setdefault(subject_key(variant), canonical)
+        return is_new
+
+    @staticmethod
+    def _word_suffixes(lower: str) -> List[str]:
+        return [lower[m.start():] for m in _WORD_RE.finditer(lower)] or [lower]
+
+    def add_subject(
+        self,
+        subject_id: Any,
+        canonical: str,
+        variants: Iterable[str],
+        usage_count: int = 0,
+    ) -> None:
+        """Add or update one subject after it was written to the database."""
+        with self._lock:
+            lower = canonical.lower()
+            usage = max(int(usage_count or 0), self._usage.get(lower, 0))
+            if self._register(subject_id, canonical, variants, usage):
+                for suffix in self._word_suffixes(lower):
+                    bisect.insort(self._prefixes, (suffix, lower))
+
+    # ------------- Lookups -------------
+    def lookup(self, key: str) -> Optional[str]:
+        """Canonical form for a normalized key (see ``subject_key``)."""
+        return self._canonical.get(key)
+
+    def is_known(self, canonical: str, variant: Optional[str] = None) -> bool:
+        """Whether the subject (and the variant, if given) is stored."""
+        lower = canonical.lower()
+        if lower not in self._ids:
+            return False
+        return variant is None or variant.lower() in self._variants[lower]
+
+    def suggest(self, partial: str, limit: int = 10) -> List[str]:
+        """Canonical forms with a word starting with ``partial``.
+
+        Ordered by usage count (descending), then canonical form.
+        """
+        query = subject_key(partial)
+        if not query:
+            return []
+        with self._lock:
+            position = bisect.bisect_left(self._prefixes, (query,))
+            matches = set()
+            while position < len(self._prefixes):
+                suffix, lower = self._prefixes[position]
+                if not suffix.startswith(query):
+                    break
+                matches.add(lower)
+                position += 1
+            ranked = sorted(
+                matches, key=lambda lower: (-self._usage[lower], self._forms[lower])
+            )
+            return [self._forms[lower] for lower in ranked[:limit]]
+
+    # ------------- Usage counts -------------
+    def record_usage(self, canonical: str, count: int = 1) -> bool:
+        """Buffer a usage increment.
+
+        Returns:
+            False if the subject is not in the index (nothing buffered)
+        """
+        lower = canonical.lower()
+        with self._lock:
+            if lower not in self._ids:
+                return False
+            self._pending[lower] += count
+            self._usage[lower] += count
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+            return True
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered usage increments."""
+        return sum(self._pending.values())
+
+    def should_flush(self) -> bool:
+        """Whether the buffer reached its size or age limit."""
+        if self._pending_since is None:
+            return False
+        max_size = _setting("AUTHORITY_USAGE_FLUSH_SIZE", 500)
+        max_age = _setting("AUTHORITY_USAGE_FLUSH_SECONDS", 30.0)
+        return (
+            self.pending >= max_size
+            or time.monotonic() - self._pending_since >= max_age
+        )
+
+    def flush(self, db: Session) -> int:
+        """Write buffered usage increments in one bulk UPDATE and commit.
+
+        On failure the increments are kept for the next flush.
+
+        Returns:
+            Number of subjects updated
+        """
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            self._pending_since = None
+            params = [
+                {"subject_id": self._ids[lower], "delta": delta}
+                for lower, delta in pending.items()
+                if lower in self._ids
+            ]
+        if not params:
+            return 0
+
+        table = AuthoritySubject.__table__
+        stmt = (
+            table.update()
+            .where(table.c.id == bindparam("subject_id"))
+            .values(usage_count=table.c.usage_count + bindparam("delta"))
+        )
+        try:
+            db.execute(stmt, params)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Failed to flush authority usage counts: {e}")
+            with self._lock:
+                self._pending.update(pending)
+                if self._pending_since is None:
+                    self._pending_since = time.monotonic()
+            return 0
+        self.flushes += 1
+        return len(params)
+
+    def stats(self) -> Dict[str, Any]:
+        """Size, freshness and buffer statistics."""
+        with self._lock:
+            return {
+                "subjects": len(self._forms),
+                "keys": len(self._canonical),
+                "prefix_entries": len(self._prefixes),
+                "pending_usage": self.pending,
+                "loads": self.loads,
+                "flushes": self.flushes,
+                "seconds_since_load": (
+                    round(time.monotonic() - self.loaded_at, 1)
+                    if self.loaded_at is not None
+                    else None
+                ),
+            }
+
+
+# ============================================================================
+# Per-engine registry
+# ============================================================================
+
+_registry: "weakref.WeakKeyDictionary[Any, SubjectAuthorityIndex]" = (
+    weakref.WeakKeyDictionary()
+)
+_registry_lock = threading.Lock()
+
+
+def get_subject_index(bind: Any) -> SubjectAuthorityIndex:
+    """Get (or create) the process-wide subject index for an engine."""
+    engine = getattr(bind, "engine", bind)
+    with _registry_lock:
+        index = _registry.get(engine)
+        if index is None:
+            index = SubjectAuthorityIndex()
+            _registry[engine] = index
+        return index
+
+
+def get_all_subject_indexes() -> List[SubjectAuthorityIndex]:
+    """Return every subject index currently held by this process."""
+    with _registry_lock:
+        return list(_registry.values())
+
+
+def flush_all_usage() -> int:
+    """Flush the buffered usage increments of every index (e.g. at shutdown).
+
+    Returns:
+        Number of subjects updated
+    """
+    with _registry_lock:
+        items = list(_registry.items())
+    updated = 0
+    for engine, index in items:
+        if not index.pending:
+            continue
+        with Session(bind=engine) as db:
+            updated += index.flush(db)
+    return updated
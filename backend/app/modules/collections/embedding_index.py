@@ -0,0 +1,167 @@
+"""
+Collection Embedding Index
+
+Keeps a shared ANN vector index ("collections") in sync with
+``Collection.embedding`` for similar-collection lookups.
+
+Synchronization happens on three paths:
+- CollectionService removes deleted collections from the index
+- Each query runs a delta sync over collections whose ``updated_at`` moved
+  past the index watermark (every embedding change bumps ``updated_at``)
+- ``rebuild_collection_index`` performs a full rebuild on first use
+
+Retraining and persistence run on a background thread
+(``schedule_maintenance``), never on the query path.
+
+See app/modules/search/dense_index.py for the resource-level counterpart.
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ...shared.vector_index import (
+    VectorIndex,
+    get_vector_index,
+    parse_embedding,
+    schedule_maintenance,
+)
+from ..search.dense_index import (
+    _WATERMARK_MARGIN,
+    _changed_rows,
+    _forget_before,
+    _note_row,
+)
+from .model import Collection
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_INDEX_NAME = "collections"
+
+# Persist after this many unsaved mutations (file-backed indexes only)
+_SAVE_EVERY = 500
+
+
+def get_collection_index(db: Session) -> VectorIndex:
+    """Return the process-wide collection index for the session's engine."""
+    return get_vector_index(db.get_bind(), COLLECTION_INDEX_NAME)
+
+
+def _maybe_persist(index: VectorIndex) -> None:
+    schedule_maintenance(index, _SAVE_EVERY)
+
+
+def rebuild_collection_index(
+    db: Session, batch_size: int = 2000, save: bool = True
+) -> VectorIndex:
+    """Rebuild the collection index from the database.
+
+    Args:
+        db: Database session
+        batch_size: Rows fetched per round trip
+        save: Persist the index afterwards (file-backed indexes only)
+
+    Returns:
+        The rebuilt index
+    """
+    index = get_collection_index(db)
+    start = time.time()
+
+    # Build into a fresh index so queries keep using the old one meanwhile
+    fresh = VectorIndex(
+        index.name, nprobe=index.nprobe, train_threshold=index.train_threshold
+    )
+    watermark = None
+    stmt = (
+        select(Collection.id, Collection.embedding, Collection.updated_at)
+        .where(Collection.embedding.isnot(None))
+        .execution_options(yield_per=batch_size)
+    )
+    keys, vectors = [], []
+    for cid, raw, updated_at in db.execute(stmt):
+        vec = parse_embedding(raw)
+        if vec:
+            keys.append(str(cid))
+            vectors.append(vec)
+        _note_row(fresh, str(cid), raw, updated_at)
+        if updated_at is not None and (watermark is None or updated_at > watermark):
+            watermark = updated_at
+        if len(keys) >= batch_size:
+            fresh.upsert_many(keys, vectors)
+            keys, vectors = [], []
+            _forget_before(fresh, watermark)
+    if keys:
+        fresh.upsert_many(keys, vectors)
+    _forget_before(fresh, watermark)
+
+    fresh.train()
+    fresh.watermark = watermark.isoformat() if watermark else None
+    fresh.built_at = fresh.synced_at = time.time()
+    index.adopt(fresh)
+
+    logger.info(
+        f"Rebuilt collection vector index: {len(index)} vectors in "
+        f"{(time.time() - start) * 1000:.0f}ms"
+    )
+    if save:
+        index.save()
+    return index
+
+
+def sync_collection_index(
+    db: Session, index: Optional[VectorIndex] = None
+) -> VectorIndex:
+    """Bring the collection index up to date with the database.
+
+    Builds the index on first use, otherwise applies collections changed
+    since the last watermark (an indexed range scan on ``updated_at``).
+    Rows re-read inside the margin window are skipped unless their
+    embedding changed.
+
+    Args:
+        db: Database session
+        index: Optional index (defaults to the engine's collection index)
+
+    Returns:
+        The synchronized index
+    """
+    index = index or get_collection_index(db)
+    if index.built_at is None:
+        return rebuild_collection_index(db)
+
+    stmt = select(Collection.id, Collection.embedding, Collection.updated_at)
+    if index.watermark:
+        since = datetime.fromisoformat(index.watermark) - _WATERMARK_MARGIN
+        stmt = stmt.where(Collection.updated_at >= since)
+
+    for cid, raw in _changed_rows(index, db.execute(stmt)):
+        vec = parse_embedding(raw)
+        if vec:
+            index.upsert(cid, vec)
+        else:
+            index.remove(cid)
+    index.synced_at = time.time()
+
+    _maybe_persist(index)
+    return index
+
+
+def remove_collection(db: Session, collection_id: str) -> bool:
+    """Remove a collection from the index.
+
+    Args:
+        db: Database session
+        collection_id: Collection ID
+
+    Returns:
+        True if the collection was indexed
+    """
+    index = get_collection_index(db)
+    removed = index.remove(str(collection_id))
+    if removed:
+        _maybe_persist(index)
+    return removed
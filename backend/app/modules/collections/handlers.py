@@ -24,41 +24,48 @@ def handle_resource_deleted(event):
     """
     Handle resource.deleted event to remove resource from collections.
 
-    When a resource is deleted, we:
-    1. Find all collections containing that resource
-    2. Remove the resource from each collection
-    3. Emit collection.resource_removed events
+    Resource deletion detaches the resource from its collections before the
+    row is deleted (CollectionService.detach_resource), subtracting its
+    embedding from each collection's running sum, and lists the affected
+    collections in the payload. This handler:
+    1. Emits collection.resource_removed for each listed collection
+    2. Removes any memberships left by a deletion path that did not detach,
+       rebuilding those collections' embeddings (the vector is gone)
 
     Args:
         event: Event object containing resource deletion details
             - resource_id: UUID of the deleted resource
+            - collection_ids: Collections the resource was detached from
     """
     try:
         payload = event.data
         resource_id = UUID(payload.get("resource_id"))
+        collection_ids = list(payload.get("collection_ids") or [])
 
         # Get database session
         db = next(get_sync_db())
 
         try:
             from .model import CollectionResource
+            from .service import CollectionService
             from sqlalchemy import select
 
-            # Find all collection associations for this resource
-            stmt = select(CollectionResource).where(
+            # Find collection associations left behind for this resource
+            stmt = select(CollectionResource.collection_id).where(
                 CollectionResource.resource_id == resource_id
             )
-            result = db.execute(stmt)
-            associations = result.scalars().all()
-
-            # Delete each association and emit events
-            for association in associations:
-                collection_id = str(association.collection_id)
-
-                # Delete association
-                db.delete(association)
-
-                # Emit collection.resource_removed event
+            leftover_ids = list(db.execute(stmt).scalars().all())
+
+            if leftover_ids:
+                db.query(CollectionResource).filter(
+                    CollectionResource.resource_id == resource_id
+                ).delete(synchronize_session=False)
+                db.commit()
+                CollectionService(db).rebuild_collection_embeddings(leftover_ids)
+                collection_ids.extend(str(cid) for cid in leftover_ids)
+
+            # Emit collection.resource_removed events
+            for collection_id in dict.fromkeys(collection_ids):
                 event_bus.emit(
                     "collection.resource_removed",
                     {
@@ -69,10 +76,9 @@ def handle_resource_deleted(event):
                     priority=EventPriority.NORMAL,
                 )
 
-            db.commit()
-
             logger.info(
-                f"Removed resource {resource_id} from {len(associations)} collections"
+                f"Removed resource {resource_id} from "
+                f"{len(set(collection_ids))} collections"
             )
 
         finally:
@@ -14,20 +14,23 @@ Related files:
 Key Features:
 - Create and manage user collections
 - Add/remove resources from collections
-- Compute collection embeddings (average of member resource embeddings)
-- Find similar resources based on collection embedding
+- Compute collection embeddings (average of member resource embeddings),
+  maintained incrementally from a running sum of member embeddings
+- Find similar resources and collections through vector indexes
 - Support hierarchical collections (parent/subcollections)
 """
 
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import numpy as np
-from sqlalchemy import or_
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session, joinedload
 
+from ...shared.vector_index import VectorIndex, parse_embedding
+
 logger = logging.getLogger(__name__)
 
 # Import from local model file to avoid circular dependencies
@@ -35,6 +38,32 @@ from .model import Collection, CollectionResource
 from .schema import CollectionUpdate
 
 
+def _as_vector(raw: Any) -> Optional[np.ndarray]:
+    """Decode a stored embedding (JSON text or list) into a float64 array."""
+    vector = parse_embedding(raw)
+    return np.asarray(vector, dtype=np.float64) if vector else None
+
+
+def _store_embedding(
+    collection: Collection, total: Optional[np.ndarray], count: int
+) -> None:
+    """Set running sum, count and the normalized mean embedding."""
+    if total is None or count <= 0:
+        collection.embedding_sum = None
+        collection.embedding_count = 0
+        collection.embedding = None
+        return
+
+    collection.embedding_sum = total.tolist()
+    collection.embedding_count = count
+
+    # Normalize to unit length for cosine similarity (the mean and the sum
+    # have the same direction)
+    norm = np.linalg.norm(total)
+    embedding = total / norm if norm > 0 else total / count
+    collection.embedding = embedding.tolist()
+
+
 class CollectionService:
     """Service for collection management operations."""
 
@@ -281,6 +310,11 @@ class CollectionService:
         self.db.delete(collection)
         self.db.commit()
 
+        # Subcollections removed by the cascade are evicted when a search hits them
+        from .embedding_index import remove_collection
+
+        remove_collection(self.db, str(collection_id))
+
     def add_resources_to_collection(
         self,
         collection_id: uuid.UUID,
@@ -335,23 +369,26 @@ class CollectionService:
         existing_resource_ids = {r.id for r in existing_resources}
 
         # Add associations
-        added_count = 0
+        added_ids = []
         for resource_id in new_resource_ids:
             if resource_id in existing_resource_ids:
                 association = CollectionResource(
                     collection_id=collection_id, resource_id=resource_id
                 )
                 self.db.add(association)
-                added_count += 1
+                added_ids.append(resource_id)
+        added_count = len(added_ids)
 
         if added_count > 0:
             # Update collection timestamp
             collection.updated_at = datetime.now(timezone.utc)
 
-            self.db.commit()
+            # Add new members to the running embedding sum
+            self._apply_embedding_delta(
+                collection, added=self._member_vectors(added_ids)
+            )
 
-            # Recompute collection embedding
-            self.compute_collection_embedding(collection_id)
+            self.db.commit()
 
             # Emit collection.resource_added events
             from .handlers import emit_collection_resource_added
@@ -428,25 +465,11 @@ class CollectionService:
         if not collection:
             raise ValueError("Collection not found or access denied")
 
-        # Delete associations
-        removed_count = (
-            self.db.query(CollectionResource)
-            .filter(
-                CollectionResource.collection_id == collection_id,
-                CollectionResource.resource_id.in_(resource_ids),
-            )
-            .delete(synchronize_session=False)
-        )
+        removed_count = self._remove_members(collection, resource_ids)
 
         if removed_count > 0:
-            # Update collection timestamp
-            collection.updated_at = datetime.now(timezone.utc)
-
             self.db.commit()
 
-            # Recompute collection embedding
-            self.compute_collection_embedding(collection_id)
-
             # Emit collection.resource_removed events
             from .handlers import emit_collection_resource_removed
 
@@ -532,11 +555,13 @@ class CollectionService:
         self, collection_id: uuid.UUID
     ) -> Optional[List[float]]:
         """
-        Compute collection embedding as average of member resource embeddings.
+        Recompute a collection embedding from all member resource embeddings.
 
         This enables collection-level semantic similarity and recommendations.
-        The embedding is computed by averaging the dense embeddings of all
-        resources in the collection that have embeddings.
+        The embedding is the normalized average of the dense embeddings of
+        all resources in the collection that have embeddings. It also resets
+        the running sum and member count that membership changes maintain
+        incrementally, so it doubles as a repair for a single collection.
 
         Args:
             collection_id: Collection UUID
@@ -544,61 +569,307 @@ class CollectionService:
         Returns:
             Computed embedding vector or None if no resources have embeddings
         """
-        # Import Resource from database.models
+        collection = (
+            self.db.query(Collection).filter(Collection.id == collection_id).first()
+        )
+        if not collection:
+            return None
+
+        self._rebuild_embedding(collection)
+        collection.updated_at = datetime.now(timezone.utc)
+        self.db.commit()
+
+        return collection.embedding
+
+    def rebuild_collection_embeddings(
+        self,
+        collection_ids: Optional[List[uuid.UUID]] = None,
+        batch_size: int = 100,
+    ) -> int:
+        """
+        Rebuild running sums and embeddings from scratch (repair).
+
+        Args:
+            collection_ids: Collections to rebuild (None = all collections)
+            batch_size: Collections rebuilt per commit
+
+        Returns:
+            Number of collections rebuilt
+        """
+        if collection_ids is None:
+            collection_ids = [cid for (cid,) in self.db.query(Collection.id).all()]
+
+        rebuilt = 0
+        for start in range(0, len(collection_ids), batch_size):
+            batch_ids = collection_ids[start : start + batch_size]
+            collections = (
+                self.db.query(Collection).filter(Collection.id.in_(batch_ids)).all()
+            )
+            for collection in collections:
+                self._rebuild_embedding(collection)
+            self.db.commit()
+            rebuilt += len(collections)
+
+        logger.info(f"Rebuilt embeddings for {rebuilt} collections")
+        return rebuilt
+
+    def detach_resource(self, resource_id: uuid.UUID) -> List[uuid.UUID]:
+        """
+        Remove a resource from every collection before it is deleted.
+
+        Must run before the resource row is deleted: memberships are found
+        through the collection_resources resource index and the resource's
+        embedding is subtracted from each affected collection. Does not
+        commit, so it shares the caller's deletion transaction.
+
+        Args:
+            resource_id: Resource UUID
+
+        Returns:
+            IDs of the collections the resource was removed from
+        """
         from ...database.models import Resource
 
-        # Get all resources in collection with embeddings
-        resources = (
-            self.db.query(Resource)
+        collection_ids = [
+            cid
+            for (cid,) in self.db.query(CollectionResource.collection_id)
+            .filter(CollectionResource.resource_id == resource_id)
+            .all()
+        ]
+        if not collection_ids:
+            return []
+
+        raw = (
+            self.db.query(Resource.embedding).filter(Resource.id == resource_id).scalar()
+        )
+        vector = _as_vector(raw)
+
+        now = datetime.now(timezone.utc)
+        for collection in (
+            self.db.query(Collection).filter(Collection.id.in_(collection_ids)).all()
+        ):
+            if vector is not None:
+                self._apply_embedding_delta(collection, removed=[vector])
+            collection.updated_at = now
+
+        self.db.query(CollectionResource).filter(
+            CollectionResource.resource_id == resource_id
+        ).delete(synchronize_session=False)
+
+        return collection_ids
+
+    def apply_member_reembeddings(
+        self, changes: Dict[uuid.UUID, Tuple[Any, Any]]
+    ) -> int:
+        """
+        Update running sums after member resources were re-embedded.
+
+        Affected collections are found through the collection_resources
+        resource index; each swaps the old vector of a changed member for
+        the new one. Does not commit.
+
+        Args:
+            changes: Resource ID -> (old embedding, new embedding)
+
+        Returns:
+            Number of collections updated
+        """
+        if not changes:
+            return 0
+
+        # Called mid-transaction by embedding writers: do not flush their
+        # half-built rows just to look up memberships
+        with self.db.no_autoflush:
+            memberships = (
+                self.db.query(
+                    CollectionResource.collection_id, CollectionResource.resource_id
+                )
+                .filter(CollectionResource.resource_id.in_(list(changes)))
+                .all()
+            )
+            if not memberships:
+                return 0
+
+            members_by_collection: Dict[uuid.UUID, List[uuid.UUID]] = {}
+            for collection_id, resource_id in memberships:
+                members_by_collection.setdefault(collection_id, []).append(resource_id)
+
+            collections = (
+                self.db.query(Collection)
+                .filter(Collection.id.in_(list(members_by_collection)))
+                .all()
+            )
+        for collection in collections:
+            added, removed = [], []
+            for resource_id in members_by_collection[collection.id]:
+                old, new = changes[resource_id]
+                old_vector, new_vector = _as_vector(old), _as_vector(new)
+                if old_vector is not None:
+                    removed.append(old_vector)
+                if new_vector is not None:
+                    added.append(new_vector)
+            self._apply_embedding_delta(collection, added=added, removed=removed)
+
+        return len(collections)
+
+    def _remove_members(
+        self, collection: Collection, resource_ids: List[uuid.UUID]
+    ) -> int:
+        """
+        Delete memberships and subtract their embeddings (no commit).
+
+        Args:
+            collection: Collection to remove resources from
+            resource_ids: Resource UUIDs to remove
+
+        Returns:
+            Number of memberships removed
+        """
+        removed_ids = [
+            rid
+            for (rid,) in self.db.query(CollectionResource.resource_id)
+            .filter(
+                CollectionResource.collection_id == collection.id,
+                CollectionResource.resource_id.in_(resource_ids),
+            )
+            .all()
+        ]
+        if not removed_ids:
+            return 0
+
+        self.db.query(CollectionResource).filter(
+            CollectionResource.collection_id == collection.id,
+            CollectionResource.resource_id.in_(removed_ids),
+        ).delete(synchronize_session=False)
+
+        # Update collection timestamp
+        collection.updated_at = datetime.now(timezone.utc)
+
+        # Subtract removed members from the running embedding sum
+        self._apply_embedding_delta(
+            collection, removed=self._member_vectors(removed_ids)
+        )
+
+        return len(removed_ids)
+
+    def _member_vectors(self, resource_ids: List[uuid.UUID]) -> List[np.ndarray]:
+        """Load embeddings of the given resources (embedding column only)."""
+        if not resource_ids:
+            return []
+
+        from ...database.models import Resource
+
+        rows = (
+            self.db.query(Resource.embedding)
+            .filter(Resource.id.in_(list(resource_ids)), Resource.embedding.isnot(None))
+            .all()
+        )
+        vectors = (_as_vector(raw) for (raw,) in rows)
+        return [vector for vector in vectors if vector is not None]
+
+    def _rebuild_embedding(self, collection: Collection) -> None:
+        """Recompute running sum, count and embedding from all members (no commit)."""
+        from ...database.models import Resource
+
+        # Pending membership changes must be visible (sessions may not autoflush)
+        self.db.flush()
+        rows = (
+            self.db.query(Resource.embedding)
             .join(CollectionResource, Resource.id == CollectionResource.resource_id)
             .filter(
-                CollectionResource.collection_id == collection_id,
+                CollectionResource.collection_id == collection.id,
                 Resource.embedding.isnot(None),
             )
             .all()
         )
+        total = None
+        count = 0
+        for (raw,) in rows:
+            vector = _as_vector(raw)
+            if vector is None or (total is not None and vector.shape != total.shape):
+                continue
+            total = vector.copy() if total is None else total + vector
+            count += 1
 
-        if not resources:
-            # No resources with embeddings - clear collection embedding
-            collection = (
-                self.db.query(Collection).filter(Collection.id == collection_id).first()
-            )
+        _store_embedding(collection, total, count)
 
-            if collection:
-                collection.embedding = None
-                self.db.commit()
+    def _lock_running_sum(self, collection: Collection) -> None:
+        """Lock a collection row and load its committed running sum (no flush).
 
-            return None
+        Values already modified in this session are kept; they were derived
+        inside the current transaction.
+        """
+        from sqlalchemy import inspect, select
+        from sqlalchemy.orm.attributes import set_committed_value
+
+        names = ("embedding", "embedding_sum", "embedding_count")
+        with self.db.no_autoflush:
+            row = self.db.execute(
+                select(
+                    Collection.embedding,
+                    Collection.embedding_sum,
+                    Collection.embedding_count,
+                )
+                .where(Collection.id == collection.id)
+                .with_for_update()
+            ).one_or_none()
+        if row is None:
+            return
+        state = inspect(collection)
+        if any(state.attrs[name].history.has_changes() for name in names):
+            return
+        for name, value in zip(names, row):
+            set_committed_value(collection, name, value)
+
+    def _apply_embedding_delta(
+        self,
+        collection: Collection,
+        added: List[np.ndarray] = (),
+        removed: List[np.ndarray] = (),
+    ) -> None:
+        """
+        Add and subtract member vectors from a collection's running sum (no commit).
 
-        # Extract embeddings
-        embeddings = []
-        for resource in resources:
-            if resource.embedding and isinstance(resource.embedding, list):
-                embeddings.append(resource.embedding)
+        Collections without a running sum (created before it existed) and
+        dimension mismatches fall back to a rebuild from all members.
 
-        if not embeddings:
-            return None
+        The sum is re-read under a row lock (SELECT ... FOR UPDATE), so
+        concurrent membership changes to the same collection serialize
+        instead of overwriting each other's updates.
+        """
+        if not added and not removed:
+            return
 
-        # Compute average embedding
-        embeddings_array = np.array(embeddings)
-        avg_embedding = np.mean(embeddings_array, axis=0)
+        self._lock_running_sum(collection)
 
-        # Normalize to unit length for cosine similarity
-        norm = np.linalg.norm(avg_embedding)
-        if norm > 0:
-            avg_embedding = avg_embedding / norm
+        if collection.embedding_sum is None and collection.embedding is not None:
+            self._rebuild_embedding(collection)
+            return
 
-        # Store in collection
-        collection = (
-            self.db.query(Collection).filter(Collection.id == collection_id).first()
+        total = (
+            np.asarray(collection.embedding_sum, dtype=np.float64)
+            if collection.embedding_sum
+            else None
         )
+        count = collection.embedding_count or 0
+        try:
+            for vector in added:
+                total = vector.copy() if total is None else total + vector
+                count += 1
+            for vector in removed:
+                if total is None:
+                    raise ValueError("removing from an empty running sum")
+                total = total - vector
+                count -= 1
+        except ValueError as e:
+            logger.warning(
+                f"Rebuilding embedding of collection {collection.id} "
+                f"(running sum inconsistent: {e})"
+            )
+            self._rebuild_embedding(collection)
+            return
 
-        if collection:
-            collection.embedding = avg_embedding.tolist()
-            collection.updated_at = datetime.now(timezone.utc)
-            self.db.commit()
-
-        return avg_embedding.tolist()
+        _store_embedding(collection, total, count)
 
     def find_similar_resources(
         self,
@@ -611,8 +882,8 @@ class CollectionService:
         """
         Find resources similar to a collection based on collection embedding.
 
-        Uses cosine similarity between collection embedding and resource embeddings
-        to find semantically related resources.
+        Searches the shared resource vector index with the collection
+        embedding; member resources are excluded inside the index search.
 
         Args:
             collection_id: Collection UUID
@@ -635,57 +906,51 @@ class CollectionService:
         if not collection.embedding:
             raise ValueError("Collection has no embedding - add resources first")
 
-        collection_embedding = np.array(collection.embedding)
-
-        # Get resources to exclude if requested
+        # Resources already in the collection are masked out inside the
+        # index search, so they never displace a top-k hit
         excluded_ids = set()
         if exclude_collection_resources:
             excluded_ids = {
-                cr.resource_id
-                for cr in self.db.query(CollectionResource.resource_id)
+                str(resource_id)
+                for (resource_id,) in self.db.query(CollectionResource.resource_id)
                 .filter(CollectionResource.collection_id == collection_id)
                 .all()
             }
 
-        # Import Resource from database.models
+        from ...database.load_profiles import resource_profile
         from ...database.models import Resource
+        from ..search.dense_index import sync_resource_index
 
-        # Get all resources with embeddings
-        query = self.db.query(Resource).filter(Resource.embedding.isnot(None))
-
-        if excluded_ids:
-            query = query.filter(~Resource.id.in_(excluded_ids))
-
-        resources = query.all()
-
-        # Compute similarities
-        similarities = []
-        for resource in resources:
-            if not resource.embedding or not isinstance(resource.embedding, list):
-                continue
-
-            resource_embedding = np.array(resource.embedding)
-
-            # Cosine similarity
-            similarity = float(np.dot(collection_embedding, resource_embedding))
-
-            if similarity >= min_similarity:
-                similarities.append(
-                    {
-                        "resource_id": resource.id,
-                        "title": resource.title,
-                        "description": resource.description,
-                        "similarity_score": similarity,
-                        "quality_score": resource.quality_score,
-                        "type": resource.type,
-                        "creator": resource.creator,
-                    }
-                )
-
-        # Sort by similarity and limit
-        similarities.sort(key=lambda x: x["similarity_score"], reverse=True)
+        def fetch(ids: List[uuid.UUID]) -> Dict[str, Any]:
+            rows = (
+                self.db.query(Resource)
+                .options(*resource_profile("card"))
+                .filter(Resource.id.in_(ids))
+                .all()
+            )
+            return {str(resource.id): resource for resource in rows}
+
+        ranked = self._top_k_from_index(
+            sync_resource_index(self.db),
+            collection.embedding,
+            limit=limit,
+            min_similarity=min_similarity,
+            exclude=excluded_ids,
+            fetch=fetch,
+        )
 
-        return similarities[:limit]
+        return [
+            {
+                "resource_id": resource.id,
+                "title": resource.title,
+                "description": resource.description,
+                "similarity_score": similarity,
+                "quality_score": resource.quality_score,
+                "type": resource.type,
+                "creator": resource.creator,
+            }
+            for resource, similarity in ranked
+        ]
 
     def find_collections_with_resource(
         self, resource_id: uuid.UUID
@@ -721,8 +986,9 @@ class CollectionService:
         """
         Find collections similar to a given collection based on embeddings.
 
-        Uses cosine similarity between collection embeddings to find
-        semantically related collections.
+        Searches the collection vector index (see embedding_index.py), keeps
+        public collections and the caller's own, and counts members of all
+        matches with one grouped query.
 
         Args:
             collection_id: Source collection UUID
@@ -744,61 +1010,115 @@ class CollectionService:
         if not collection.embedding:
             raise ValueError("Collection has no embedding - add resources first")
 
-        collection_embedding = np.array(collection.embedding)
+        from .embedding_index import sync_collection_index
+
+        index = sync_collection_index(self.db)
+
+        def fetch(ids: List[uuid.UUID]) -> Dict[str, Any]:
+            rows = self.db.query(Collection).filter(Collection.id.in_(ids)).all()
+            found = {str(other.id): other for other in rows}
+            # Evict collections deleted since the index last saw them
+            for missing in {str(i) for i in ids} - found.keys():
+                index.remove(missing)
+            # Include public collections and the user's own collections
+            return {
+                key: other
+                for key, other in found.items()
+                if other.visibility == "public"
+                or (owner_id is not None and other.owner_id == owner_id)
+            }
 
-        # Get all other collections with embeddings
-        query = self.db.query(Collection).filter(
-            Collection.embedding.isnot(None), Collection.id != collection_id
+        ranked = self._top_k_from_index(
+            index,
+            collection.embedding,
+            limit=limit,
+            min_similarity=min_similarity,
+            exclude={str(collection_id)},
+            fetch=fetch,
         )
 
-        # Filter by visibility - include public collections and user's own collections
-        if owner_id:
-            query = query.filter(
-                or_(Collection.owner_id == owner_id, Collection.visibility == "public")
+        # Member counts of all matches in one grouped query
+        counts: Dict[uuid.UUID, int] = {}
+        if ranked:
+            counts = dict(
+                self.db.query(
+                    CollectionResource.collection_id,
+                    func.count(CollectionResource.resource_id),
+                )
+                .filter(
+                    CollectionResource.collection_id.in_(
+                        [other.id for other, _ in ranked]
+                    )
+                )
+                .group_by(CollectionResource.collection_id)
+                .all()
             )
-        else:
-            # No owner specified - only public collections
-            query = query.filter(Collection.visibility == "public")
-
-        collections = query.all()
-
-        # Compute similarities
-        similarities = []
-        for other_collection in collections:
-            if not other_collection.embedding or not isinstance(
-                other_collection.embedding, list
-            ):
-                continue
-
-            other_embedding = np.array(other_collection.embedding)
-
-            # Cosine similarity
-            similarity = float(np.dot(collection_embedding, other_embedding))
 
-            if similarity >= min_similarity:
-                # Get resource count
-                resource_count = (
-                    self.db.query(CollectionResource)
-                    .filter(CollectionResource.collection_id == other_collection.id)
-                    .count()
-                )
+        return [
+            {
+                "collection_id": other.id,
+                "name": other.name,
+                "description": other.description,
+                "similarity_score": similarity,
+                "resource_count": counts.get(other.id, 0),
+                "visibility": other.visibility,
+                "owner_id": other.owner_id,
+            }
+            for other, similarity in ranked
+        ]
 
-                similarities.append(
-                    {
-                        "collection_id": other_collection.id,
-                        "name": other_collection.name,
-                        "description": other_collection.description,
-                        "similarity_score": similarity,
-                        "resource_count": resource_count,
-                        "visibility": other_collection.visibility,
-                        "owner_id": other_collection.owner_id,
-                    }
+    def _top_k_from_index(
+        self,
+        index: VectorIndex,
+        query: List[float],
+        limit: int,
+        min_similarity: float,
+        exclude: Set[str],
+        fetch: Callable[[List[uuid.UUID]], Dict[str, Any]],
+    ) -> List[Tuple[Any, float]]:
+        """
+        Top-k rows by similarity from a vector index, filtered by the database.
+
+        Hits are loaded with ``fetch`` (key -> row for hits that exist and are
+        accessible). Keys already seen are excluded from the next index
+        search, and the search widens until ``limit`` rows pass, hits drop
+        below ``min_similarity``, or the index itself runs out. A short
+        result from a trained index only means the probed IVF lists ran
+        out, so ``nprobe`` is widened until every list is probed.
+        """
+        seen = set(exclude)
+        ranked: List[Tuple[Any, float]] = []
+        k = limit
+        nprobe = index.nprobe
+        while len(ranked) < limit:
+            hits = index.search(query, k=k, exclude=seen, nprobe=nprobe)
+            passing = [(key, score) for key, score in hits if score >= min_similarity]
+            if passing:
+                seen.update(key for key, _ in passing)
+
+                ids = []
+                for key, _ in passing:
+                    try:
+                        ids.append(uuid.UUID(key))
+                    except (ValueError, TypeError):
+                        continue
+                rows = fetch(ids)
+                ranked.extend(
+                    (rows[key], score) for key, score in passing if key in rows
                 )
 
-        # Sort by similarity and limit
-        similarities.sort(key=lambda x: x["similarity_score"], reverse=True)
+            if len(passing) < len(hits):
+                # Remaining hits are below min_similarity
+                break
+            if len(hits) < k:
+                if nprobe >= index.nlist:
+                    # Every list probed (or exact search): the index is exhausted
+                    break
+                nprobe = min(nprobe * 2, index.nlist)
+            else:
+                k *= 2
 
-        return similarities[:limit]
+        return ranked[:limit]
 
     def validate_parent_hierarchy(
         self, collection_id: uuid.UUID, new_parent_id: uuid.UUID
@@ -862,9 +1182,9 @@ class CollectionService:
         """
         Add multiple resources to a collection in a single batch operation.
 
-        This is more efficient than adding resources one at a time and
-        triggers embedding recomputation only once after all resources
-        are added.
+        This is more efficient than adding resources one at a time: the new
+        members' embeddings are added to the collection's running sum in one
+        step, without re-reading existing members.
 
         Args:
             collection_id: Collection UUID
@@ -917,22 +1237,22 @@ class CollectionService:
         invalid_count = len(new_resource_ids) - len(valid_ids)
 
         # Batch insert associations
-        added_count = 0
-        for resource_id in valid_ids:
-            association = CollectionResource(
-                collection_id=collection_id, resource_id=resource_id
-            )
-            self.db.add(association)
-            added_count += 1
+        self.db.add_all(
+            CollectionResource(collection_id=collection_id, resource_id=resource_id)
+            for resource_id in valid_ids
+        )
+        added_count = len(valid_ids)
 
         if added_count > 0:
             # Update collection timestamp
             collection.updated_at = datetime.now(timezone.utc)
 
-            self.db.commit()
+            # Add the new members to the running embedding sum in one step
+            self._apply_embedding_delta(
+                collection, added=self._member_vectors(valid_ids)
+            )
 
-            # Recompute collection embedding once for all added resources
-            self.compute_collection_embedding(collection_id)
+            self.db.commit()
 
         return {
             "added": added_count,
@@ -946,9 +1266,9 @@ class CollectionService:
         """
         Remove multiple resources from a collection in a single batch operation.
 
-        This is more efficient than removing resources one at a time and
-        triggers embedding recomputation only once after all resources
-        are removed.
+        This is more efficient than removing resources one at a time: the
+        removed members' embeddings are subtracted from the collection's
+        running sum in one step, without re-reading remaining members.
 
         Args:
             collection_id: Collection UUID
@@ -972,25 +1292,11 @@ class CollectionService:
         if not collection:
             raise ValueError("Collection not found or access denied")
 
-        # Delete associations
-        removed_count = (
-            self.db.query(CollectionResource)
-            .filter(
-                CollectionResource.collection_id == collection_id,
-                CollectionResource.resource_id.in_(resource_ids),
-            )
-            .delete(synchronize_session=False)
-        )
+        removed_count = self._remove_members(collection, resource_ids)
 
         not_found_count = len(resource_ids) - removed_count
 
         if removed_count > 0:
-            # Update collection timestamp
-            collection.updated_at = datetime.now(timezone.utc)
-
             self.db.commit()
 
-            # Recompute collection embedding once for all removed resources
-            self.compute_collection_embedding(collection_id)
-
         return {"removed": removed_count, "not_found": not_found_count}
@@ -0,0 +1,363 @@
+"""
+Graph Centrality Engine
+
+Whole-graph centrality metrics computed on SciPy sparse matrices built from
+the graph snapshot, and persisted to ``graph_centrality_cache``:
+- PageRank: power iteration on the CSR transition matrix
+- Degree: row and column sums of the directed adjacency matrix
+- Betweenness: Brandes' algorithm from a sample of k pivot nodes (exact when
+  k >= number of nodes), run as level-synchronous sparse BFS over batches of
+  pivots
+
+Betweenness counts hops over the undirected graph (edge weights are
+similarities, not distances) and is normalized like
+``networkx.betweenness_centrality``, so scores stay in [0, 1].
+
+Persistence:
+- ``refresh_centrality_cache`` recomputes every metric and replaces the table
+  contents in one transaction (scheduled as refresh_graph_centrality_task)
+- ``get_cached_centrality`` reads the stored rows, so endpoints never run
+  the algorithms per request
+
+Related files:
+- app/modules/graph/snapshot.py: Source of the node index and edge arrays
+- app/tasks/celery_tasks.py: refresh_graph_centrality_task
+"""
+
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from ...config.settings import get_settings
+from ...database.models import GraphCentralityCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DAMPING = 0.85
+INSERT_BATCH_SIZE = 1000
+
+# Upper bound on the dense (nodes x pivots) work arrays of one BFS batch
+_BETWEENNESS_BATCH_CELLS = 4_000_000
+_MAX_PIVOT_BATCH = 64
+
+
+# ============================================================================
+# Sparse algorithms
+# ============================================================================
+
+
+def directed_matrix(
+    src: np.ndarray, dst: np.ndarray, weights: np.ndarray, n: int
+) -> sp.csr_matrix:
+    """CSR adjacency with ``A[i, j]`` = summed weight of edges i -> j."""
+    return sp.csr_matrix(
+        (weights.astype(np.float64), (src, dst)), shape=(n, n), dtype=np.float64
+    )
+
+
+def undirected_pattern(src: np.ndarray, dst: np.ndarray, n: int) -> sp.csr_matrix:
+    """Symmetric 0/1 CSR adjacency without self-loops."""
+    keep = src != dst
+    rows = np.concatenate([src[keep], dst[keep]])
+    cols = np.concatenate([dst[keep], src[keep]])
+    matrix = sp.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(n, n), dtype=np.float64
+    )
+    matrix.data[:] = 1.0  # Collapse parallel edges summed by the constructor
+    return matrix
+
+
+def degrees(pattern: sp.csr_matrix) -> Tuple[np.ndarray, np.ndarray]:
+    """In- and out-degree per node as column and row sums of a 0/1 matrix.
+
+    Returns:
+        Tuple of (in_degree, out_degree) integer arrays
+    """
+    in_degree = np.asarray(pattern.sum(axis=0)).ravel().astype(np.int64)
+    out_degree = np.asarray(pattern.sum(axis=1)).ravel().astype(np.int64)
+    return in_degree, out_degree
+
+
+def pagerank(
+    matrix: sp.csr_matrix,
+    alpha: float = DEFAULT_DAMPING,
+    max_iter: int = 100,
+    tol: float = 1.0e-6,
+) -> np.ndarray:
+    """Weighted PageRank by power iteration on a CSR adjacency matrix.
+
+    Follows ``networkx.pagerank`` semantics over the given nodes: dangling
+    mass is spread uniformly and convergence is reached when the L1 change
+    drops below ``n * tol``.
+
+    Args:
+        matrix: Square adjacency matrix (row = source, column = target)
+        alpha: Damping factor
+        max_iter: Maximum number of iterations
+        tol: Per-node convergence tolerance
+
+    Returns:
+        Score per row of ``matrix`` (empty for an empty matrix)
+    """
+    n = matrix.shape[0]
+    if n == 0:
+        return np.zeros(0)
+    out_weight = np.asarray(matrix.sum(axis=1)).ravel()
+    dangling = out_weight <= 0
+    inverse_out = np.where(dangling, 0.0, 1.0 / np.where(dangling, 1.0, out_weight))
+    # Column-stochastic transition matrix, transposed once for x <- P^T x
+    transition = (sp.diags(inverse_out) @ matrix).T.tocsr()
+
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        previous = x
+        x = alpha * (transition @ previous + previous[dangling].sum() / n)
+        x += (1.0 - alpha) / n
+        if np.abs(x - previous).sum() < n * tol:
+            break
+    else:
+        logger.warning(f"PageRank did not converge in {max_iter} iterations")
+    return x
+
+
+def approximate_betweenness(
+    adjacency: sp.csr_matrix,
+    nodes: np.ndarray,
+    k: Optional[int] = None,
+    seed: Optional[int] = 0,
+) -> np.ndarray:
+    """Unweighted betweenness centrality from k sampled pivots.
+
+    Brandes' dependency accumulation runs for a batch of pivots at once:
+    each BFS level is one sparse-times-dense product that counts shortest
+    paths, and the backward pass is one product per level.
+
+    Args:
+        adjacency: Symmetric 0/1 adjacency over all node slots
+        nodes: Node slots that belong to the graph (pivot candidates and
+            the ``n`` used for normalization)
+        k: Number of pivots (all nodes when None or >= len(nodes))
+        seed: Random seed for pivot sampling
+
+    Returns:
+        Normalized betweenness per node slot (0 outside ``nodes``)
+    """
+    size = adjacency.shape[0]
+    scores = np.zeros(size)
+    n = len(nodes)
+    if n <= 2 or adjacency.nnz == 0:
+        return scores
+
+    if k is None or k >= n:
+        pivots, k = np.asarray(nodes), None
+    else:
+        pivots = np.random.default_rng(seed).choice(nodes, size=k, replace=False)
+
+    batch = max(1, min(_MAX_PIVOT_BATCH, _BETWEENNESS_BATCH_CELLS // size))
+    for start in range(0, len(pivots), batch):
+        scores += _brandes_batch(adjacency, pivots[start : start + batch])
+
+    # Same rescaling as networkx (normalized, undirected, optional sampling)
+    scale = 1.0 / ((n - 1) * (n - 2))
+    if k is not None:
+        scale *= n / k
+    return scores * scale
+
+
+def _brandes_batch(adjacency: sp.csr_matrix, pivots: np.ndarray) -> np.ndarray:
+    """Summed dependencies of all nodes on shortest paths from ``pivots``."""
+    size, width = adjacency.shape[0], len(pivots)
+    columns = np.arange(width)
+    dist = np.full((size, width), -1, dtype=np.int32)
+    sigma = np.zeros((size, width))
+    dist[pivots, columns] = 0
+    sigma[pivots, columns] = 1.0
+
+    frontier = sigma.copy()
+    depth = 0
+    while True:
+        paths = adjacency @ frontier
+        reached = (paths > 0) & (dist < 0)
+        if not reached.any():
+            break
+        depth += 1
+        dist[reached] = depth
+        sigma[reached] = paths[reached]
+        frontier = np.where(reached, sigma, 0.0)
+
+    delta = np.zeros((size, width))
+    safe_sigma = np.where(sigma > 0, sigma, 1.0)
+    for level in range(depth, 0, -1):
+        coefficient = np.where(dist == level, (1.0 + delta) / safe_sigma, 0.0)
+        delta += np.where(dist == level - 1, sigma * (adjacency @ coefficient), 0.0)
+
+    delta[pivots, columns] = 0.0  # A pivot does not lie on its own paths
+    return delta.sum(axis=1)
+
+
+# ============================================================================
+# Snapshot metrics
+# ============================================================================
+
+
+def compute_centrality(
+    snapshot: Any,
+    damping_factor: float = DEFAULT_DAMPING,
+    betweenness_samples: Optional[int] = None,
+    seed: Optional[int] = 0,
+) -> Dict[str, Dict[str, float]]:
+    """Compute degree, PageRank and betweenness for every node of a snapshot.
+
+    Args:
+        snapshot: GraphSnapshot to analyze
+        damping_factor: PageRank damping factor
+        betweenness_samples: Betweenness pivots (default
+            CENTRALITY_BETWEENNESS_SAMPLES; 0 = exact)
+        seed: Random seed for pivot sampling
+
+    Returns:
+        Mapping of resource id to {in_degree, out_degree, pagerank,
+        betweenness} for every live node
+    """
+    if betweenness_samples is None:
+        betweenness_samples = get_settings().CENTRALITY_BETWEENNESS_SAMPLES
+    size = snapshot.num_nodes
+    src, dst, weights = snapshot.directed_pairs()
+    nodes = np.flatnonzero(snapshot.alive)
+
+    # directed_pairs() is unique per (source, target), so a 0/1 matrix counts
+    # distinct neighbors
+    in_degree, out_degree = degrees(
+        directed_matrix(src, dst, np.ones(len(src)), size)
+    )
+    ranks = snapshot_pagerank(snapshot, damping_factor)
+    betweenness = approximate_betweenness(
+        undirected_pattern(src, dst, size),
+        nodes,
+        k=betweenness_samples or None,
+        seed=seed,
+    )
+
+    results = {}
+    for i in nodes.tolist():
+        resource_id = snapshot.id_of(i)
+        results[resource_id] = {
+            "in_degree": int(in_degree[i]),
+            "out_degree": int(out_degree[i]),
+            "pagerank": ranks.get(resource_id, 0.0),
+            "betweenness": float(betweenness[i]),
+        }
+    return results
+
+
+def snapshot_pagerank(
+    snapshot: Any,
+    alpha: float = DEFAULT_DAMPING,
+    max_iter: int = 100,
+    tol: float = 1.0e-6,
+) -> Dict[str, float]:
+    """PageRank over the nodes of a snapshot that have edges.
+
+    Weights of edges of different types between the same ordered pair are
+    summed.
+
+    Returns:
+        Mapping of resource id to PageRank score
+    """
+    src, dst, weights = snapshot.directed_pairs()
+    if not len(src):
+        return {}
+    nodes, remapped = np.unique(np.concatenate([src, dst]), return_inverse=True)
+    matrix = directed_matrix(
+        remapped[: len(src)], remapped[len(src) :], weights, len(nodes)
+    )
+    scores = pagerank(matrix, alpha=alpha, max_iter=max_iter, tol=tol)
+    return {snapshot.id_of(node): float(score) for node, score in zip(nodes, scores)}
+
+
+# ============================================================================
+# Persistence
+# ============================================================================
+
+
+def refresh_centrality_cache(db: Session) -> int:
+    """Recompute centrality for the whole graph and persist it.
+
+    Replaces the contents of ``graph_centrality_cache`` in one transaction,
+    so readers see either the previous or the new scores.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of rows written
+    """
+    from .snapshot import sync_graph_snapshot
+
+    start = time.time()
+    snapshot = sync_graph_snapshot(db, force=True)
+    metrics = compute_centrality(snapshot)
+    computed_at = datetime.now(timezone.utc)
+    rows = [
+        {
+            "resource_id": _to_uuid(resource_id),
+            "in_degree": values["in_degree"],
+            "out_degree": values["out_degree"],
+            "betweenness": values["betweenness"],
+            "pagerank": values["pagerank"],
+            "computed_at": computed_at,
+        }
+        for resource_id, values in metrics.items()
+    ]
+
+    try:
+        db.execute(delete(GraphCentralityCache))
+        for offset in range(0, len(rows), INSERT_BATCH_SIZE):
+            db.execute(
+                insert(GraphCentralityCache),
+                rows[offset : offset + INSERT_BATCH_SIZE],
+            )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    logger.info(
+        f"Refreshed centrality for {len(rows)} nodes "
+        f"(snapshot v{snapshot.version}) in {(time.time() - start) * 1000:.0f}ms"
+    )
+    return len(rows)
+
+
+def get_cached_centrality(
+    db: Session, resource_ids: Iterable[Any]
+) -> Dict[Any, GraphCentralityCache]:
+    """Read persisted centrality rows for the given resources.
+
+    Returns:
+        Mapping of resource UUID to its most recent cache row (resources
+        without a row are omitted)
+    """
+    ids = [_to_uuid(rid) for rid in resource_ids]
+    if not ids:
+        return {}
+    rows = db.execute(
+        select(GraphCentralityCache)
+        .where(GraphCentralityCache.resource_id.in_(ids))
+        .order_by(GraphCentralityCache.computed_at)
+    ).scalars()
+    return {row.resource_id: row for row in rows}
+
+
+def _to_uuid(resource_id: Any) -> uuid.UUID:
+    if isinstance(resource_id, uuid.UUID):
+        return resource_id
+    return uuid.UUID(str(resource_id))
+
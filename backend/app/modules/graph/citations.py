@@ -26,13 +26,19 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from urllib.parse import urlparse, urlunparse
 
+import numpy as np
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, select, update
 
-from app.database.models import Citation, Resource
-from app.shared.base_model import Base
+from app.database.models import Citation, Resource, url_key
 from app.shared.event_bus import event_bus, EventPriority
 from app.events.event_types import SystemEvent
+from app.modules.graph.centrality import directed_matrix, pagerank
+from app.modules.graph.handlers import emit_graph_edges_added
+
+
+# Citations resolved (and URL keys backfilled) per bulk statement
+RESOLVE_BATCH_SIZE = 1000
 
 
 class CitationService:
@@ -54,12 +60,6 @@ class CitationService:
         self.db = db
         self._parser = None  # Lazy load parser if needed
 
-        # Ensure tables exist
-        try:
-            Base.metadata.create_all(bind=db.get_bind())
-        except Exception:
-            pass
-
     def extract_citations(self, resource_id: str) -> List[Dict[str, Any]]:
         """
         Extract citations from resource content.
@@ -391,12 +391,13 @@ class CitationService:
         Match citation target URLs to existing resources.
 
         Algorithm:
-        1. Query citations where target_resource_id IS NULL
-        2. For each citation:
-           - Normalize target_url (strip fragments, trailing slashes)
-           - Query Resource table: WHERE url = normalized_target_url OR alternate_url = normalized_target_url
-           - If match found → update citation.target_resource_id
-        3. Return count of resolved citations
+        1. Backfill missing URL keys (rows written before the key columns
+           existed or through Core inserts)
+        2. Per batch of unresolved citations, join citations to resources on
+           the indexed normalized URL keys
+           (citations.target_url_key = resources.source_url_key)
+        3. Set target_resource_id for the whole batch in one bulk UPDATE
+        4. Return count of resolved citations
 
         Args:
             citation_ids: Optional list of specific citation IDs to resolve. If None, resolves all unresolved.
@@ -404,57 +405,110 @@ class CitationService:
         Returns:
             Count of resolved citations
         """
-        # Query unresolved citations
-        query = select(Citation).filter(Citation.target_resource_id.is_(None))
+        self._backfill_url_keys()
 
-        if citation_ids:
-            # Convert string IDs to UUIDs
-            uuid_ids = []
-            for cid in citation_ids:
-                try:
-                    uuid_ids.append(uuid.UUID(cid))
-                except (ValueError, TypeError):
-                    continue
+        uuid_ids = []
+        for cid in citation_ids or []:
+            try:
+                uuid_ids.append(uuid.UUID(cid))
+            except (ValueError, TypeError):
+                continue
 
-            if uuid_ids:
-                query = query.filter(Citation.id.in_(uuid_ids))
+        query = (
+            select(Citation.id, Citation.source_resource_id, Resource.id)
+            .join(Resource, Resource.source_url_key == Citation.target_url_key)
+            .filter(Citation.target_resource_id.is_(None))
+            .order_by(Citation.id)
+        )
 
-        result = self.db.execute(query)
-        unresolved_citations = result.scalars().all()
+        def batches():
+            if uuid_ids:
+                for i in range(0, len(uuid_ids), RESOLVE_BATCH_SIZE):
+                    chunk = uuid_ids[i : i + RESOLVE_BATCH_SIZE]
+                    yield self.db.execute(
+                        query.filter(Citation.id.in_(chunk))
+                    ).all()
+                return
+            last_id = None
+            while True:
+                stmt = query.limit(RESOLVE_BATCH_SIZE)
+                if last_id is not None:
+                    stmt = stmt.filter(Citation.id > last_id)
+                rows = self.db.execute(stmt).all()
+                if not rows:
+                    return
+                last_id = rows[-1][0]
+                yield rows
 
         resolved_count = 0
+        for rows in batches():
+            # First matching resource wins when several share a URL
+            matches: Dict[Any, tuple] = {}
+            for citation_id, source_id, target_id in rows:
+                matches.setdefault(citation_id, (source_id, target_id))
 
-        # Process in batches of 100
-        batch_size = 100
-        for i in range(0, len(unresolved_citations), batch_size):
-            batch = unresolved_citations[i : i + batch_size]
-
-            for citation in batch:
-                # Normalize URL
-                normalized_url = self._normalize_url(citation.target_url)
-
-                # Try to find matching resource
-                resource_result = self.db.execute(
-                    select(Resource).filter(
-                        func.lower(Resource.source) == normalized_url.lower()
-                    )
-                )
-                matching_resource = resource_result.scalar_one_or_none()
-
-                if matching_resource:
-                    citation.target_resource_id = matching_resource.id
-                    self.db.add(citation)
-                    resolved_count += 1
-
-            # Commit batch
             try:
+                self.db.execute(
+                    update(Citation),
+                    [
+                        {"id": citation_id, "target_resource_id": target_id}
+                        for citation_id, (_, target_id) in matches.items()
+                    ],
+                )
                 self.db.commit()
             except Exception as e:
                 self.db.rollback()
                 print(f"Warning: Failed to commit citation resolution batch: {e}")
+                continue
+
+            resolved_count += len(matches)
+            emit_graph_edges_added(
+                [
+                    {
+                        "source_id": str(source_id),
+                        "target_id": str(target_id),
+                        "edge_type": "citation",
+                        "weight": 1.0,
+                    }
+                    for source_id, target_id in matches.values()
+                ]
+            )
 
         return resolved_count
 
+    def _backfill_url_keys(self) -> None:
+        """Compute URL keys missing on resources and citations.
+
+        Resource ``updated_at`` is left untouched so the backfill does not
+        look like a content change to delta-syncing indexes.
+        """
+        targets = [
+            (Resource.__table__, "source", "source_url_key"),
+            (Citation.__table__, "target_url", "target_url_key"),
+        ]
+        for table, url_column, key_column in targets:
+            url_col, key_col = table.c[url_column], table.c[key_column]
+            stmt = (
+                table.update()
+                .where(table.c.id == bindparam("row_id"))
+                .values(
+                    {key_col: bindparam("key"), table.c.updated_at: table.c.updated_at}
+                )
+            )
+            while True:
+                rows = self.db.execute(
+                    select(table.c.id, url_col)
+                    .where(key_col.is_(None), url_col.isnot(None))
+                    .limit(RESOLVE_BATCH_SIZE)
+                ).all()
+                if not rows:
+                    break
+                self.db.execute(
+                    stmt,
+                    [{"row_id": row_id, "key": url_key(url)} for row_id, url in rows],
+                )
+                self.db.commit()
+
     def _normalize_url(self, url: str) -> str:
         """
         Normalize URL for comparison.
@@ -498,7 +552,7 @@ class CitationService:
         1. Start with focal resource (depth 0)
         2. Get outbound citations (resources this one cites)
         3. Get inbound citations (resources that cite this one)
-        4. If depth > 1, recursively expand neighbors
+        4. If depth > 1, expand the next level (one batch of queries per level)
         5. Build nodes list (deduplicated resources)
         6. Build edges list (citation relationships)
 
@@ -526,7 +580,7 @@ class CitationService:
             raise ValueError(f"Resource not found: {resource_id}")
 
         # Track visited nodes and edges
-        nodes_dict = {}
+        nodes_dict: Dict[str, Dict[str, Any]] = {}
         edges_list = []
         visited = set()
 
@@ -537,94 +591,93 @@ class CitationService:
             "type": "source",
         }
 
-        # BFS traversal
-        queue = [(resource_uuid, 0)]
-
-        while queue and len(nodes_dict) < 100:  # Limit to 100 nodes
-            current_id, current_depth = queue.pop(0)
-
-            if current_id in visited:
-                continue
-
-            visited.add(current_id)
-
-            if current_depth >= depth:
-                continue
-
-            # Get outbound citations
-            outbound_result = self.db.execute(
-                select(Citation).filter(
-                    Citation.source_resource_id == current_id,
+        # BFS traversal, one level at a time: one query each for outbound
+        # and inbound citations of the whole frontier, one for neighbor titles
+        frontier = [resource_uuid]
+
+        for current_depth in range(depth):
+            frontier = [node for node in frontier if node not in visited]
+            if not frontier or len(nodes_dict) >= 100:
+                break
+            visited.update(frontier)
+
+            outbound: Dict[Any, List[tuple]] = {}
+            for source_id, target_id, citation_type in self.db.execute(
+                select(
+                    Citation.source_resource_id,
+                    Citation.target_resource_id,
+                    Citation.citation_type,
+                ).filter(
+                    Citation.source_resource_id.in_(frontier),
                     Citation.target_resource_id.isnot(None),
                 )
-            )
-            outbound_citations = outbound_result.scalars().all()
-
-            for citation in outbound_citations:
-                target_id = citation.target_resource_id
-
-                # Add edge
-                edges_list.append(
-                    {
-                        "source": str(current_id),
-                        "target": str(target_id),
-                        "type": citation.citation_type,
-                    }
+            ):
+                outbound.setdefault(source_id, []).append((target_id, citation_type))
+
+            inbound: Dict[Any, List[tuple]] = {}
+            for source_id, target_id, citation_type in self.db.execute(
+                select(
+                    Citation.source_resource_id,
+                    Citation.target_resource_id,
+                    Citation.citation_type,
+                ).filter(Citation.target_resource_id.in_(frontier))
+            ):
+                inbound.setdefault(target_id, []).append((source_id, citation_type))
+
+            neighbor_ids = {
+                neighbor
+                for links in (*outbound.values(), *inbound.values())
+                for neighbor, _ in links
+                if str(neighbor) not in nodes_dict
+            }
+            titles = {}
+            if neighbor_ids:
+                titles = dict(
+                    self.db.execute(
+                        select(Resource.id, Resource.title).filter(
+                            Resource.id.in_(neighbor_ids)
+                        )
+                    ).all()
                 )
 
-                # Add target node if not already present
-                if str(target_id) not in nodes_dict:
-                    target_result = self.db.execute(
-                        select(Resource).filter(Resource.id == target_id)
+            next_frontier = []
+            for current_id in frontier:
+                if len(nodes_dict) >= 100:  # Limit to 100 nodes
+                    break
+
+                for target_id, citation_type in outbound.get(current_id, []):
+                    edges_list.append(
+                        {
+                            "source": str(current_id),
+                            "target": str(target_id),
+                            "type": citation_type,
+                        }
                     )
-                    target_resource = target_result.scalar_one_or_none()
-
-                    if target_resource:
+                    if str(target_id) not in nodes_dict and target_id in titles:
                         nodes_dict[str(target_id)] = {
                             "id": str(target_id),
-                            "title": target_resource.title,
+                            "title": titles[target_id],
                             "type": "cited",
                         }
-
-                        # Add to queue for next depth
-                        if current_depth + 1 < depth:
-                            queue.append((target_id, current_depth + 1))
-
-            # Get inbound citations
-            inbound_result = self.db.execute(
-                select(Citation).filter(Citation.target_resource_id == current_id)
-            )
-            inbound_citations = inbound_result.scalars().all()
-
-            for citation in inbound_citations:
-                source_id = citation.source_resource_id
-
-                # Add edge
-                edges_list.append(
-                    {
-                        "source": str(source_id),
-                        "target": str(current_id),
-                        "type": citation.citation_type,
-                    }
-                )
-
-                # Add source node if not already present
-                if str(source_id) not in nodes_dict:
-                    source_result = self.db.execute(
-                        select(Resource).filter(Resource.id == source_id)
+                        next_frontier.append(target_id)
+
+                for source_id, citation_type in inbound.get(current_id, []):
+                    edges_list.append(
+                        {
+                            "source": str(source_id),
+                            "target": str(current_id),
+                            "type": citation_type,
+                        }
                     )
-                    source_resource = source_result.scalar_one_or_none()
-
-                    if source_resource:
+                    if str(source_id) not in nodes_dict and source_id in titles:
                         nodes_dict[str(source_id)] = {
                             "id": str(source_id),
-                            "title": source_resource.title,
+                            "title": titles[source_id],
                             "type": "citing",
                         }
+                        next_frontier.append(source_id)
 
-                        # Add to queue for next depth
-                        if current_depth + 1 < depth:
-                            queue.append((source_id, current_depth + 1))
+            frontier = next_frontier
 
         return {"nodes": list(nodes_dict.values()), "edges": edges_list}
 
@@ -650,17 +703,10 @@ class CitationService:
         Returns:
             Dictionary mapping resource_id to importance score
         """
-        try:
-            import networkx as nx
-        except ImportError:
-            print("Warning: networkx not installed, skipping PageRank computation")
-            return {}
-
-        # Build citation graph
-        G = nx.DiGraph()
-
-        # Query all citations with resolved targets
-        query = select(Citation).filter(Citation.target_resource_id.isnot(None))
+        # Query resolved citation edges (ids only)
+        query = select(
+            Citation.id, Citation.source_resource_id, Citation.target_resource_id
+        ).where(Citation.target_resource_id.isnot(None))
 
         if resource_ids:
             # Convert string IDs to UUIDs
@@ -672,55 +718,51 @@ class CitationService:
                     continue
 
             if uuid_ids:
-                query = query.filter(
+                query = query.where(
                     (Citation.source_resource_id.in_(uuid_ids))
                     | (Citation.target_resource_id.in_(uuid_ids))
                 )
 
-        result = self.db.execute(query)
-        citations = result.scalars().all()
-
-        # Add edges to graph
-        for citation in citations:
-            G.add_edge(
-                str(citation.source_resource_id), str(citation.target_resource_id)
-            )
-
-        if len(G.nodes()) == 0:
+        rows = self.db.execute(query).all()
+        if not rows:
             return {}
 
+        # Index nodes and build the citation adjacency matrix (sparse)
+        endpoints = [str(row.source_resource_id) for row in rows]
+        endpoints += [str(row.target_resource_id) for row in rows]
+        nodes, remapped = np.unique(np.array(endpoints), return_inverse=True)
+        sources, targets = remapped[: len(rows)], remapped[len(rows) :]
+        matrix = directed_matrix(sources, targets, np.ones(len(rows)), len(nodes))
+        matrix.data[:] = 1.0  # Repeated citations count once
+
         # Compute PageRank
         try:
-            pagerank_scores = nx.pagerank(G, alpha=0.85, max_iter=100, tol=1e-6)
+            scores = pagerank(matrix, alpha=0.85, max_iter=100, tol=1e-6)
         except Exception as e:
             print(f"Warning: PageRank computation failed: {e}")
             return {}
 
         # Normalize scores to [0, 1]
-        if pagerank_scores:
-            max_score = max(pagerank_scores.values())
-            min_score = min(pagerank_scores.values())
-            score_range = max_score - min_score
-
-            if score_range > 0:
-                normalized_scores = {
-                    k: (v - min_score) / score_range for k, v in pagerank_scores.items()
-                }
-            else:
-                normalized_scores = {k: 0.5 for k in pagerank_scores.keys()}
+        score_range = scores.max() - scores.min()
+        if score_range > 0:
+            normalized = (scores - scores.min()) / score_range
         else:
-            normalized_scores = {}
-
-        # Update citation importance scores
-        for citation in citations:
-            target_id = str(citation.target_resource_id)
-
-            # Use target's PageRank as citation importance
-            if target_id in normalized_scores:
-                citation.importance_score = normalized_scores[target_id]
-                self.db.add(citation)
-
+            normalized = np.full(len(nodes), 0.5)
+        normalized_scores = dict(zip(nodes.tolist(), normalized.tolist()))
+
+        # Use target's PageRank as citation importance (one bulk UPDATE)
+        table = Citation.__table__
+        stmt = (
+            table.update()
+            .where(table.c.id == bindparam("citation_id"))
+            .values(importance_score=bindparam("score"))
+        )
+        params = [
+            {"citation_id": row.id, "score": float(normalized[target])}
+            for row, target in zip(rows, targets)
+        ]
         try:
+            self.db.execute(stmt, params)
             self.db.commit()
         except Exception as e:
             self.db.rollback()
@@ -764,6 +806,18 @@ class CitationService:
         self.db.commit()
         self.db.refresh(citation)
 
+        if target_uuid:
+            emit_graph_edges_added(
+                [
+                    {
+                        "source_id": str(source_uuid),
+                        "target_id": str(target_uuid),
+                        "edge_type": "citation",
+                        "weight": 1.0,
+                    }
+                ]
+            )
+
         return citation
 
     def get_citations_for_resource(
@@ -364,7 +364,7 @@ async def compute_importance_scores(db: Session = Depends(get_db)):
     except ImportError:
         # Celery not available, run synchronously
         try:
-            service.compute_importance_scores()
+            service.compute_citation_importance()
             return ImportanceComputationResponse(status="completed")
         except Exception:
             return ImportanceComputationResponse(status="completed")
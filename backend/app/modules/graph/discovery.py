@@ -25,6 +25,7 @@ from uuid import UUID
 from sqlalchemy import and_, or_, func
 from sqlalchemy.orm import Session
 
+from app.database.load_profiles import resource_profile
 from app.database.models import Resource
 
 logger = logging.getLogger(__name__)
@@ -145,7 +146,7 @@ class LBDService:
         concept_lower = concept.lower()
 
         # Search in title, description (content), and abstract
-        query = self.db.query(Resource).filter(
+        query = self.db.query(Resource).options(*resource_profile("card")).filter(
             or_(
                 func.lower(Resource.title).contains(concept_lower),
                 func.lower(Resource.description).contains(concept_lower),
@@ -432,6 +433,7 @@ class LBDService:
         # Subtask 12.5: Find example A-B resources
         ab_resources = (
             self.db.query(Resource)
+            .options(*resource_profile("card"))
             .filter(
                 and_(
                     or_(
@@ -461,6 +463,7 @@ class LBDService:
         # Subtask 12.5: Find example B-C resources
         bc_resources = (
             self.db.query(Resource)
+            .options(*resource_profile("card"))
             .filter(
                 and_(
                     or_(
@@ -587,6 +590,7 @@ class LBDService:
         # Find all other concepts in the database
         all_resources = (
             self.db.query(Resource)
+            .options(*resource_profile("card"))
             .filter(Resource.id != UUID(a_resource_id))
             .limit(1000)
             .all()
@@ -45,6 +45,7 @@ from app.modules.graph.schema import (
     ResourceSummary,
 )
 from app.modules.graph.discovery import LBDService
+from app.modules.graph.handlers import emit_graph_edges_added
 from app.modules.graph.service import GraphService
 
 logger = logging.getLogger(__name__)
@@ -416,6 +417,7 @@ def validate_hypothesis(
 
         hypothesis.is_validated = 1 if validation.is_valid else 0
         hypothesis.validation_notes = validation.notes
+        updated_edges = []
 
         if validation.is_valid:
             try:
@@ -446,6 +448,14 @@ def validate_hypothesis(
                     for edge in edges:
                         new_weight = min(1.0, edge.weight * 1.1)
                         edge.weight = new_weight
+                        updated_edges.append(
+                            {
+                                "source_id": source_id,
+                                "target_id": target_id,
+                                "edge_type": edge.edge_type,
+                                "weight": new_weight,
+                            }
+                        )
 
                 logger.info(
                     f"Increased edge weights along path for validated hypothesis {hypothesis_id}"
@@ -457,6 +467,7 @@ def validate_hypothesis(
                 )
 
         db.commit()
+        emit_graph_edges_added(updated_edges)
 
         logger.info(
             f"Hypothesis {hypothesis_id} validated: is_valid={validation.is_valid}"
@@ -49,7 +49,7 @@ class GraphEmbeddingsService:
                 )
 
         # Add isolated nodes (resources without citations)
-        resources = self.db.query(Resource).all()
+        resources = self.db.query(Resource.id).all()
         for resource in resources:
             node_id = str(resource.id)
             if node_id not in G:
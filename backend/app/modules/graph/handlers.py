@@ -10,16 +10,23 @@ Events Emitted:
 - hypothesis.discovered: When a new hypothesis is discovered via LBD
 - graph.entity_extracted: When entities are extracted from a chunk
 - graph.relationship_extracted: When relationships are extracted
+- graph.edge_added / graph.edge_removed: When graph edges or resolved
+  citations are written or deleted
 
 Events Subscribed:
-- resource.chunked: Triggers automatic graph extraction if enabled
+- resource.chunked: Triggers automatic graph extraction if enabled (async)
+- graph.edge_added / graph.edge_removed: Update the shared graph snapshot
+- resource.deleted: Drop the resource and its edges from the graph snapshot
+- resource.created / resource.updated / resource.deleted: Invalidate the
+  cached global overview graph
 """
 
 import logging
 from typing import Dict, Any, List
 
-from app.shared.event_bus import event_bus, EventPriority, Event
+from app.shared.event_bus import event_bus, DeliveryMode, EventPriority, Event
 from app.config.settings import get_settings
+from app.events.event_types import SystemEvent
 
 logger = logging.getLogger(__name__)
 
@@ -253,13 +260,122 @@ def handle_resource_chunked(event: Event) -> None:
         )
 
 
+def _edge_payloads(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Edges in a graph.edge_* payload (single edge or an "edges" list)."""
+    if "edges" in payload:
+        return list(payload.get("edges") or [])
+    return [payload]
+
+
+def emit_graph_edges_added(edges: List[Dict[str, Any]]) -> None:
+    """
+    Emit graph.edge_added for edges written to the database.
+
+    Args:
+        edges: Dicts with source_id, target_id, edge_type and weight
+    """
+    if not edges:
+        return
+    try:
+        event_bus.emit(
+            SystemEvent.GRAPH_EDGE_ADDED.value,
+            {"edges": edges, "count": len(edges)},
+            priority=EventPriority.NORMAL,
+        )
+    except Exception as e:
+        logger.error(f"Error emitting graph.edge_added event: {str(e)}", exc_info=True)
+
+
+def emit_graph_edges_removed(edges: List[Dict[str, Any]]) -> None:
+    """
+    Emit graph.edge_removed for edges deleted from the database.
+
+    Args:
+        edges: Dicts with source_id, target_id and edge_type
+    """
+    if not edges:
+        return
+    try:
+        event_bus.emit(
+            SystemEvent.GRAPH_EDGE_REMOVED.value,
+            {"edges": edges, "count": len(edges)},
+            priority=EventPriority.NORMAL,
+        )
+    except Exception as e:
+        logger.error(
+            f"Error emitting graph.edge_removed event: {str(e)}", exc_info=True
+        )
+
+
+def handle_graph_edge_added(payload: Dict[str, Any]) -> None:
+    """Upsert added edges into every graph snapshot held by this process."""
+    from app.modules.graph.snapshot import CITATION_EDGE_TYPE, get_all_graph_stores
+
+    edges = [
+        (
+            str(edge["source_id"]),
+            str(edge["target_id"]),
+            edge.get("edge_type") or CITATION_EDGE_TYPE,
+            edge.get("weight", 1.0),
+        )
+        for edge in _edge_payloads(payload)
+        if edge.get("source_id") and edge.get("target_id")
+    ]
+    for store in get_all_graph_stores():
+        store.add_edges(edges)
+
+
+def handle_graph_edge_removed(payload: Dict[str, Any]) -> None:
+    """Remove deleted edges from every graph snapshot held by this process."""
+    from app.modules.graph.snapshot import CITATION_EDGE_TYPE, get_all_graph_stores
+
+    edges = [
+        (
+            str(edge["source_id"]),
+            str(edge["target_id"]),
+            edge.get("edge_type") or CITATION_EDGE_TYPE,
+        )
+        for edge in _edge_payloads(payload)
+        if edge.get("source_id") and edge.get("target_id")
+    ]
+    for store in get_all_graph_stores():
+        store.remove_edges(edges)
+
+
+def handle_resource_deleted(payload: Dict[str, Any]) -> None:
+    """Drop a deleted resource and its edges from the graph snapshots."""
+    from app.modules.graph.snapshot import get_all_graph_stores
+
+    handle_resource_changed(payload)
+    resource_id = payload.get("resource_id")
+    if not resource_id:
+        return
+    for store in get_all_graph_stores():
+        store.remove_nodes([str(resource_id)])
+
+
+def handle_resource_changed(payload: Dict[str, Any]) -> None:
+    """Invalidate the cached global overview when resources change."""
+    from app.modules.graph.service import invalidate_global_overview_cache
+
+    invalidate_global_overview_cache()
+
+
 def register_handlers():
     """
     Register all event handlers for the graph module.
 
     This function should be called during application startup.
     """
-    # Subscribe to resource.chunked for automatic graph extraction
-    event_bus.subscribe("resource.chunked", handle_resource_chunked)
+    # Subscribe to resource.chunked for automatic graph extraction (slow,
+    # so it runs on the event dispatcher rather than the emitting request)
+    event_bus.subscribe(
+        "resource.chunked", handle_resource_chunked, mode=DeliveryMode.ASYNC
+    )
+    event_bus.subscribe(SystemEvent.GRAPH_EDGE_ADDED.value, handle_graph_edge_added)
+    event_bus.subscribe(SystemEvent.GRAPH_EDGE_REMOVED.value, handle_graph_edge_removed)
+    event_bus.subscribe(SystemEvent.RESOURCE_DELETED.value, handle_resource_deleted)
+    event_bus.subscribe(SystemEvent.RESOURCE_CREATED.value, handle_resource_changed)
+    event_bus.subscribe(SystemEvent.RESOURCE_UPDATED.value, handle_resource_changed)
 
     logger.info("Graph module event handlers registered")
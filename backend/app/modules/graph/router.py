@@ -1692,11 +1692,11 @@ def _get_hover_information_impl(
 
 @router.get(
     "/centrality",
-    summary="Compute graph centrality metrics",
+    summary="Get graph centrality metrics",
     description=(
-        "Compute centrality metrics for specified resources. "
-        "Returns degree centrality, betweenness centrality, and PageRank scores. "
-        "Results are cached for 10 minutes. Target response time: <2s for 1000 nodes."
+        "Get centrality metrics for specified resources. "
+        "Returns degree centrality, betweenness centrality, and PageRank scores "
+        "precomputed for the whole graph by the scheduled centrality refresh."
     ),
 )
 async def get_centrality_metrics(
@@ -1714,15 +1714,17 @@ async def get_centrality_metrics(
     db: Session = Depends(get_sync_db),
 ) -> dict:
     """
-    Compute centrality metrics for specified resources.
+    Get centrality metrics for specified resources.
 
-    This endpoint computes multiple centrality measures:
+    This endpoint returns multiple centrality measures:
     - Degree centrality: Number of direct connections (in-degree and out-degree)
     - Betweenness centrality: How often a node appears on shortest paths
     - PageRank: Importance based on incoming link structure
 
-    Results are cached for 10 minutes to improve performance. The cache is
-    invalidated when the graph structure changes.
+    Scores are read from graph_centrality_cache, which
+    refresh_graph_centrality_task recomputes for the whole graph. Only a
+    non-default damping factor triggers a live (sparse) PageRank run.
+    Resources not covered by the last refresh get zero scores.
 
     Args:
         resource_ids: Comma-separated list of resource UUIDs
@@ -1733,14 +1735,12 @@ async def get_centrality_metrics(
         CentralityResponse: Centrality metrics for requested resources
 
     Raises:
-        HTTPException: If resource IDs are invalid or computation fails
+        HTTPException: If resource IDs are invalid or retrieval fails
     """
     import time
-    from datetime import datetime, timedelta, timezone
+    from app.modules.graph.centrality import DEFAULT_DAMPING, get_cached_centrality
     from app.modules.graph.schema import CentralityMetrics, CentralityResponse
     from app.modules.graph.service import GraphService
-    from app.database.models import GraphCentralityCache
-    from app.shared.cache import CacheService
 
     start_time = time.time()
 
@@ -1760,95 +1760,21 @@ async def get_centrality_metrics(
                 detail="At least one resource ID must be provided",
             )
 
-        # Check cache first (10-minute TTL)
-        cache_service = CacheService()
-        cache_key = f"centrality:{','.join(str(rid) for rid in resource_id_list)}:{damping_factor}"
-        
-        cached_result = cache_service.get(cache_key)
-        if cached_result:
-            logger.debug(f"Cache hit for centrality metrics: {cache_key}")
-            elapsed_time = time.time() - start_time
-            cached_result["computation_time_ms"] = elapsed_time * 1000
-            cached_result["cached"] = True
-            return cached_result
+        cached_by_id = get_cached_centrality(db, resource_id_list)
 
-        # Check database cache (10-minute TTL)
-        cache_cutoff = datetime.now(timezone.utc) - timedelta(minutes=10)
-        db_cached_metrics = (
-            db.query(GraphCentralityCache)
-            .filter(
-                GraphCentralityCache.resource_id.in_(resource_id_list),
-                GraphCentralityCache.computed_at >= cache_cutoff,
-            )
-            .all()
-        )
-
-        # Build map of cached metrics
-        cached_by_id = {
-            cache.resource_id: cache for cache in db_cached_metrics
-        }
-
-        # Identify resources that need computation
-        needs_computation = [
-            rid for rid in resource_id_list if rid not in cached_by_id
-        ]
-
-        # Compute metrics for uncached resources
-        computed_metrics = {}
-        if needs_computation:
-            graph_service = GraphService(db)
-
-            # Compute all centrality metrics
-            degree_metrics = await graph_service.compute_degree_centrality(
-                [int(rid) for rid in needs_computation]
-            )
-            betweenness_metrics = await graph_service.compute_betweenness_centrality(
-                [int(rid) for rid in needs_computation]
-            )
-            pagerank_metrics = await graph_service.compute_pagerank(
-                [int(rid) for rid in needs_computation],
-                damping_factor=damping_factor,
+        # Persisted PageRank uses the default damping factor
+        pagerank_override = None
+        if abs(damping_factor - DEFAULT_DAMPING) > 1e-9:
+            pagerank_override = await GraphService(db).compute_pagerank(
+                resource_id_list, damping_factor=damping_factor
             )
 
-            # Store computed metrics in database cache
-            for resource_id in needs_computation:
-                resource_id_int = int(resource_id)
-                degree = degree_metrics.get(resource_id_int, {})
-                betweenness = betweenness_metrics.get(resource_id_int, 0.0)
-                pagerank = pagerank_metrics.get(resource_id_int, 0.0)
-
-                # Create cache entry
-                cache_entry = GraphCentralityCache(
-                    resource_id=resource_id,
-                    in_degree=degree.get("in_degree", 0),
-                    out_degree=degree.get("out_degree", 0),
-                    betweenness=betweenness,
-                    pagerank=pagerank,
-                    computed_at=datetime.now(timezone.utc),
-                )
-                db.add(cache_entry)
-
-                computed_metrics[resource_id] = cache_entry
-
-            db.commit()
-
-        # Build response combining cached and computed metrics
+        # Build response from persisted metrics
         metrics_dict = {}
         for resource_id in resource_id_list:
-            if resource_id in cached_by_id:
-                cache = cached_by_id[resource_id]
-                metrics_dict[resource_id] = CentralityMetrics(
-                    resource_id=resource_id,
-                    in_degree=cache.in_degree,
-                    out_degree=cache.out_degree,
-                    total_degree=cache.in_degree + cache.out_degree,
-                    betweenness=cache.betweenness,
-                    pagerank=cache.pagerank,
-                    computed_at=cache.computed_at.isoformat(),
-                )
-            elif resource_id in computed_metrics:
-                cache = computed_metrics[resource_id]
-                metrics_dict[resource_id] = CentralityMetrics(
+            cache = cached_by_id.get(resource_id)
+            if cache is not None:
+                metrics = CentralityMetrics(
                     resource_id=resource_id,
                     in_degree=cache.in_degree,
                     out_degree=cache.out_degree,
@@ -1858,53 +1784,46 @@ async def get_centrality_metrics(
                     computed_at=cache.computed_at.isoformat(),
                 )
             else:
-                # Resource not found in graph
-                metrics_dict[resource_id] = CentralityMetrics(
+                # Resource not in the graph at the last refresh
+                metrics = CentralityMetrics(
                     resource_id=resource_id,
                     in_degree=0,
                     out_degree=0,
                     total_degree=0,
                     betweenness=0.0,
                     pagerank=0.0,
-                    computed_at=datetime.now(timezone.utc).isoformat(),
+                    computed_at=None,
                 )
+            if pagerank_override is not None:
+                metrics.pagerank = pagerank_override.get(resource_id, 0.0)
+            metrics_dict[resource_id] = metrics
 
         # Build response
         elapsed_time = time.time() - start_time
         response = CentralityResponse(
             metrics=metrics_dict,
             computation_time_ms=elapsed_time * 1000,
-            cached=len(needs_computation) == 0,
+            cached=pagerank_override is None,
         )
 
-        # Cache the result for 10 minutes
-        result_dict = response.model_dump()
-        cache_service.set(cache_key, result_dict, ttl=600)
-
-        # Check performance target
-        if elapsed_time > 2.0:
-            logger.warning(
-                f"Centrality computation exceeded 2s target: {elapsed_time:.2f}s "
-                f"({len(resource_id_list)} resources)"
-            )
-        else:
+        if len(cached_by_id) < len(resource_id_list):
             logger.debug(
-                f"Centrality computation completed in {elapsed_time:.2f}s "
-                f"({len(resource_id_list)} resources)"
+                f"{len(resource_id_list) - len(cached_by_id)} of "
+                f"{len(resource_id_list)} resources have no persisted centrality"
             )
 
-        return result_dict
+        return response.model_dump()
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
-            f"Error computing centrality metrics: {e}",
+            f"Error getting centrality metrics: {e}",
             exc_info=True
         )
         raise HTTPException(
             status_code=500,
-            detail="Internal server error while computing centrality metrics",
+            detail="Internal server error while retrieving centrality metrics",
         )
 
 
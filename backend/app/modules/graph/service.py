@@ -15,7 +15,9 @@ Related files:
 from __future__ import annotations
 
 import logging
-from typing import List, Optional, Set, Tuple
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
 # Import numpy with fallback for vector operations
@@ -23,11 +25,16 @@ try:
     import numpy as np
 except ImportError:  # pragma: no cover
     np = None
+try:
+    import scipy.sparse as sp
+except ImportError:  # pragma: no cover
+    sp = None
 from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
 from app.config.settings import get_settings
 from app.database import models as db_models
+from app.database.load_profiles import resource_profile
 from app.modules.graph.schema import (
     GraphEdge,
     GraphEdgeDetails,
@@ -360,7 +367,7 @@ def _gather_vector_candidates(
 
     if source_resource.embedding:
         vector_candidates = (
-            db.query(db_models.Resource)
+            db.query(db_models.Resource.id)
             .filter(
                 db_models.Resource.id != source_resource.id,
                 db_models.Resource.embedding.isnot(None),
@@ -371,8 +378,7 @@ def _gather_vector_candidates(
         )
 
         for candidate in vector_candidates:
-            if candidate.embedding:
-                candidate_ids.add(candidate.id)
+            candidate_ids.add(candidate.id)
 
     return candidate_ids
 
@@ -404,7 +410,7 @@ def _gather_subject_candidates(
 
         if subject_conditions:
             shared_subject_candidates = (
-                db.query(db_models.Resource)
+                db.query(db_models.Resource.id)
                 .filter(
                     db_models.Resource.id != source_resource.id,
                     or_(*subject_conditions),
@@ -436,7 +442,7 @@ def _gather_classification_candidates(
 
     if source_resource.classification_code:
         classification_candidates = (
-            db.query(db_models.Resource)
+            db.query(db_models.Resource.id)
             .filter(
                 db_models.Resource.id != source_resource.id,
                 db_models.Resource.classification_code
@@ -574,6 +580,7 @@ def find_hybrid_neighbors(
     # Load source resource
     source_resource = (
         db.query(db_models.Resource)
+        .options(*resource_profile("vectors"))
         .filter(db_models.Resource.id == source_resource_id)
         .first()
     )
@@ -600,6 +607,7 @@ def find_hybrid_neighbors(
     # Load all candidates
     candidates = (
         db.query(db_models.Resource)
+        .options(*resource_profile("vectors"))
         .filter(db_models.Resource.id.in_(candidate_ids))
         .all()
     )
@@ -620,85 +628,199 @@ def find_hybrid_neighbors(
     )
 
 
+def _ordered_pair(id_a: UUID, id_b: UUID) -> Tuple[UUID, UUID]:
+    return (id_a, id_b) if id_a < id_b else (id_b, id_a)
+
+
+def _embedding_matrix(
+    resources: List[db_models.Resource],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack resource embeddings into an L2-normalized float32 matrix.
+
+    Resources without a usable embedding, or whose dimension differs from
+    the most common one, are left out (their cosine similarity would be 0).
+
+    Args:
+        resources: Resources to embed
+
+    Returns:
+        Tuple of (matrix with one row per embedded resource, positions of
+        those resources in ``resources``)
+    """
+    from app.shared.vector_index import parse_embedding
+
+    vectors = [parse_embedding(res.embedding) for res in resources]
+    dims = [len(v) for v in vectors if v]
+    if not dims:
+        return np.zeros((0, 0), dtype=np.float32), np.zeros(0, dtype=np.int64)
+
+    dim = max(set(dims), key=dims.count)
+    positions = np.array(
+        [i for i, v in enumerate(vectors) if v and len(v) == dim], dtype=np.int64
+    )
+    matrix = np.asarray([vectors[i] for i in positions], dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.where(norms > 0, norms, 1.0)
+    return matrix, positions
+
+
+def _top_k_similarity_join(
+    matrix: np.ndarray,
+    threshold: float,
+    top_k: int,
+    max_block_cells: int = 1 << 24,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Blocked self-join of a normalized matrix keeping each row's top-k matches.
+
+    Rows are multiplied against the full matrix one block at a time so that
+    at most ``max_block_cells`` similarities are materialized at once. A pair
+    is kept when it is among the ``top_k`` most similar rows of either side
+    and its similarity reaches ``threshold``.
+
+    Args:
+        matrix: L2-normalized float32 matrix (n x d)
+        threshold: Minimum cosine similarity
+        top_k: Matches kept per row
+        max_block_cells: Upper bound on block rows x n
+
+    Returns:
+        Tuple of (row indices, column indices, similarities) with row < column
+    """
+    n = len(matrix)
+    k = min(top_k, n - 1)
+    if n < 2 or k < 1:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, np.zeros(0, dtype=np.float32)
+
+    block_size = max(1, max_block_cells // n)
+    rows, cols, sims = [], [], []
+    for start in range(0, n, block_size):
+        block = matrix[start : start + block_size] @ matrix.T
+        block_rows = np.arange(start, start + len(block))
+        block[np.arange(len(block)), block_rows] = -np.inf
+
+        top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        top_sims = np.take_along_axis(block, top, axis=1)
+        keep = top_sims >= threshold
+        rows.append(np.broadcast_to(block_rows[:, None], top.shape)[keep])
+        cols.append(top[keep])
+        sims.append(top_sims[keep])
+
+    rows, cols, sims = np.concatenate(rows), np.concatenate(cols), np.concatenate(sims)
+    lo, hi = np.minimum(rows, cols), np.maximum(rows, cols)
+    _, first = np.unique(lo * n + hi, return_index=True)
+    return lo[first], hi[first], sims[first]
+
+
 def _find_high_vector_similarity_pairs(
     resources: List[db_models.Resource],
     vector_threshold: float,
+    top_k: Optional[int] = None,
 ) -> Set[Tuple[UUID, UUID]]:
     """
     Find resource pairs with high vector similarity.
 
+    Uses a blocked matrix-multiply top-k join instead of comparing every
+    pair, so each resource contributes at most ``top_k`` neighbors.
+
     Args:
         resources: List of resources to compare
         vector_threshold: Minimum similarity threshold
+        top_k: Neighbors kept per resource (uses setting default if None)
 
     Returns:
         Set of resource ID pairs (ordered with smaller UUID first)
     """
-    candidate_pairs: Set[Tuple[UUID, UUID]] = set()
-
-    for i, res_a in enumerate(resources):
-        if not res_a.embedding:
-            continue
+    if top_k is None:
+        top_k = settings.GRAPH_OVERVIEW_TOP_K
 
-        for j, res_b in enumerate(resources[i + 1 :], i + 1):
-            if not res_b.embedding:
-                continue
+    matrix, positions = _embedding_matrix(resources)
+    return _similar_pairs_from_matrix(
+        resources, matrix, positions, vector_threshold, top_k
+    )
 
-            vector_sim = cosine_similarity(res_a.embedding, res_b.embedding)
-            if vector_sim >= vector_threshold:
-                pair = (
-                    (res_a.id, res_b.id)
-                    if res_a.id < res_b.id
-                    else (res_b.id, res_a.id)
-                )
-                candidate_pairs.add(pair)
 
-    return candidate_pairs
+def _similar_pairs_from_matrix(
+    resources: List[db_models.Resource],
+    matrix: np.ndarray,
+    positions: np.ndarray,
+    vector_threshold: float,
+    top_k: int,
+) -> Set[Tuple[UUID, UUID]]:
+    """Map the top-k join over an embedding matrix back to resource ID pairs."""
+    rows, cols, _ = _top_k_similarity_join(matrix, vector_threshold, top_k)
+    return {
+        _ordered_pair(resources[i].id, resources[j].id)
+        for i, j in zip(positions[rows], positions[cols])
+    }
 
 
 def _find_high_tag_overlap_pairs(
     resources: List[db_models.Resource],
     limit: int,
+    max_subject_size: Optional[int] = None,
 ) -> Set[Tuple[UUID, UUID]]:
     """
     Find resource pairs with high tag overlap.
 
+    Shared-subject counts come from a sparse co-occurrence product
+    (M @ M.T over the CSR resource x subject incidence matrix), so only
+    pairs that share at least one subject are ever materialized. Subjects
+    carried by more than ``max_subject_size`` resources are skipped: they
+    would add O(m^2) pairs while saying little about any one of them.
+
     Args:
         resources: List of resources to compare
         limit: Maximum number of pairs to return
+        max_subject_size: Largest subject counted (uses setting default if None)
 
     Returns:
         Set of resource ID pairs (ordered with smaller UUID first)
     """
-    tag_pairs: List[Tuple[Tuple[UUID, UUID], int]] = []
-
-    for i, res_a in enumerate(resources):
-        if not res_a.subject:
-            continue
-
-        for j, res_b in enumerate(resources[i + 1 :], i + 1):
-            if not res_b.subject:
-                continue
+    if max_subject_size is None:
+        max_subject_size = settings.GRAPH_OVERVIEW_MAX_SUBJECT_SIZE
+
+    columns: Dict[str, int] = {}
+    rows, cols = [], []
+    for i, res in enumerate(resources):
+        for subject in set(res.subject or []):
+            rows.append(i)
+            cols.append(columns.setdefault(subject, len(columns)))
+    if not rows:
+        return set()
+
+    n = len(resources)
+    incidence = sp.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(n, len(columns)),
+    )
+    subject_sizes = np.diff(incidence.tocsc().indptr)
+    keep = np.flatnonzero((subject_sizes >= 2) & (subject_sizes <= max_subject_size))
+    if len(keep) == 0:
+        return set()
+    incidence = incidence[:, keep]
 
-            _, shared_subjects = compute_tag_overlap_score(res_a.subject, res_b.subject)
-            if shared_subjects:
-                pair = (
-                    (res_a.id, res_b.id)
-                    if res_a.id < res_b.id
-                    else (res_b.id, res_a.id)
-                )
-                tag_pairs.append((pair, len(shared_subjects)))
+    shared = sp.triu(incidence @ incidence.T, k=1).tocoo()
+    if shared.nnz == 0:
+        return set()
+    codes = shared.row.astype(np.int64) * n + shared.col
+    shared_counts = shared.data
 
-    # Sort by shared count and take top limit
-    tag_pairs.sort(key=lambda x: x[1], reverse=True)
-    top_tag_pairs = tag_pairs[:limit]
+    # Most shared subjects first; ties keep resource order
+    top = np.lexsort((codes, -shared_counts))[:limit]
 
-    return {pair for pair, _ in top_tag_pairs}
+    return {
+        _ordered_pair(resources[code // n].id, resources[code % n].id)
+        for code in codes[top]
+    }
 
 
 def _score_resource_pair(
     res_a: db_models.Resource,
     res_b: db_models.Resource,
+    vector_score: Optional[float] = None,
 ) -> Tuple[float, GraphEdgeDetails]:
     """
     Score a pair of resources for global overview.
@@ -706,14 +828,16 @@ def _score_resource_pair(
     Args:
         res_a: First resource
         res_b: Second resource
+        vector_score: Precomputed cosine similarity (computed if None)
 
     Returns:
         Tuple of (hybrid_weight, edge_details)
     """
     # Vector similarity score
-    vector_score = 0.0
-    if res_a.embedding and res_b.embedding:
-        vector_score = cosine_similarity(res_a.embedding, res_b.embedding)
+    if vector_score is None:
+        vector_score = 0.0
+        if res_a.embedding and res_b.embedding:
+            vector_score = cosine_similarity(res_a.embedding, res_b.embedding)
 
     # Tag overlap score
     tag_score, shared_subjects = compute_tag_overlap_score(
@@ -792,33 +916,37 @@ def _build_global_graph_from_pairs(
     return KnowledgeGraph(nodes=nodes, edges=edges)
 
 
-def generate_global_overview(
-    db: Session,
-    limit: Optional[int] = None,
-    vector_threshold: Optional[float] = None,
-) -> KnowledgeGraph:
-    """
-    Generate global overview of strongest connections across the library.
+# Global overview cache: engine -> {(limit, threshold): (fingerprint, graph)}
+_overview_cache: "weakref.WeakKeyDictionary[Any, Dict[Tuple, Tuple]]" = (
+    weakref.WeakKeyDictionary()
+)
+_overview_cache_lock = threading.Lock()
 
-    Finds the most significant relationships by combining high vector similarity
-    pairs and high tag overlap pairs, then selecting the top hybrid-weighted edges.
 
-    Args:
-        db: Database session
-        limit: Maximum number of edges to return (uses setting default if None)
-        vector_threshold: Minimum vector similarity for candidate pairs
+def _resource_fingerprint(db: Session) -> Tuple:
+    """Cheap summary of the resources table that changes on any write."""
+    count, newest = db.query(
+        func.count(db_models.Resource.id), func.max(db_models.Resource.updated_at)
+    ).one()
+    return count, str(newest)
 
-    Returns:
-        KnowledgeGraph: Graph with strongest global connections
-    """
-    if limit is None:
-        limit = settings.GRAPH_OVERVIEW_MAX_EDGES
-    if vector_threshold is None:
-        vector_threshold = settings.GRAPH_VECTOR_MIN_SIM_THRESHOLD
 
+def invalidate_global_overview_cache() -> None:
+    """Drop all cached global overview graphs held by this process."""
+    with _overview_cache_lock:
+        _overview_cache.clear()
+
+
+def _compute_global_overview(
+    db: Session,
+    limit: int,
+    vector_threshold: float,
+) -> KnowledgeGraph:
+    """Build the global overview graph from the database."""
     # Load all resources with embeddings and subjects
     resources = (
         db.query(db_models.Resource)
+        .options(*resource_profile("vectors"))
         .filter(
             or_(
                 db_models.Resource.embedding.isnot(None),
@@ -831,26 +959,50 @@ def generate_global_overview(
     if len(resources) < 2:
         return KnowledgeGraph(nodes=[], edges=[])
 
+    matrix, positions = _embedding_matrix(resources)
+    row_of = {resources[p].id: row for row, p in enumerate(positions)}
+
     # Gather candidate pairs from multiple sources
     candidate_pairs: Set[Tuple[UUID, UUID]] = set()
     candidate_pairs.update(
-        _find_high_vector_similarity_pairs(resources, vector_threshold)
+        _similar_pairs_from_matrix(
+            resources,
+            matrix,
+            positions,
+            vector_threshold,
+            settings.GRAPH_OVERVIEW_TOP_K,
+        )
     )
     candidate_pairs.update(_find_high_tag_overlap_pairs(resources, limit))
+    candidate_pairs = sorted(candidate_pairs)
+
+    # Vector similarity of all candidate pairs in one pass
+    vector_scores = np.zeros(len(candidate_pairs), dtype=np.float32)
+    embedded = [
+        (k, row_of[a], row_of[b])
+        for k, (a, b) in enumerate(candidate_pairs)
+        if a in row_of and b in row_of
+    ]
+    if embedded:
+        k, rows_a, rows_b = (np.asarray(column) for column in zip(*embedded))
+        vector_scores[k] = np.clip(
+            np.einsum("ij,ij->i", matrix[rows_a], matrix[rows_b]), -1.0, 1.0
+        )
 
     # Score all candidate pairs
     resources_by_id = {res.id: res for res in resources}
     scored_pairs: List[Tuple[Tuple[UUID, UUID], float, GraphEdgeDetails]] = []
 
-    for pair in candidate_pairs:
-        res_a_id, res_b_id = pair
-        res_a = resources_by_id.get(res_a_id)
-        res_b = resources_by_id.get(res_b_id)
+    for pair, vector_score in zip(candidate_pairs, vector_scores):
+        res_a = resources_by_id.get(pair[0])
+        res_b = resources_by_id.get(pair[1])
 
         if not res_a or not res_b:
             continue
 
-        hybrid_weight, edge_details = _score_resource_pair(res_a, res_b)
+        hybrid_weight, edge_details = _score_resource_pair(
+            res_a, res_b, vector_score=float(vector_score)
+        )
 
         # Skip pairs with very low weights
         if hybrid_weight < 0.1:
@@ -866,6 +1018,53 @@ def generate_global_overview(
     return _build_global_graph_from_pairs(top_pairs, resources_by_id)
 
 
+def generate_global_overview(
+    db: Session,
+    limit: Optional[int] = None,
+    vector_threshold: Optional[float] = None,
+    use_cache: bool = True,
+) -> KnowledgeGraph:
+    """
+    Generate global overview of strongest connections across the library.
+
+    Finds the most significant relationships by combining high vector similarity
+    pairs and high tag overlap pairs, then selecting the top hybrid-weighted edges.
+
+    Results are cached per (limit, threshold) and reused until the resources
+    table changes (row count or newest ``updated_at``) or a resource event
+    invalidates the cache.
+
+    Args:
+        db: Database session
+        limit: Maximum number of edges to return (uses setting default if None)
+        vector_threshold: Minimum vector similarity for candidate pairs
+        use_cache: If False, always recompute
+
+    Returns:
+        KnowledgeGraph: Graph with strongest global connections
+    """
+    if limit is None:
+        limit = settings.GRAPH_OVERVIEW_MAX_EDGES
+    if vector_threshold is None:
+        vector_threshold = settings.GRAPH_VECTOR_MIN_SIM_THRESHOLD
+
+    engine = db.get_bind().engine
+    key = (limit, float(vector_threshold))
+    fingerprint = _resource_fingerprint(db)
+
+    if use_cache:
+        with _overview_cache_lock:
+            cached = _overview_cache.get(engine, {}).get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+    graph = _compute_global_overview(db, limit, vector_threshold)
+
+    with _overview_cache_lock:
+        _overview_cache.setdefault(engine, {})[key] = (fingerprint, graph)
+    return graph
+
+
 # Phase 10: Multi-layer Graph Construction
 class GraphService:
     """Service for Phase 10 multi-layer graph construction and neighbor discovery."""
@@ -874,6 +1073,7 @@ class GraphService:
         self.db = db
         self._graph_cache = None
         self._cache_timestamp = None
+        self._cache_version = None
 
     def _has_cached_graph(self) -> bool:
         """
@@ -916,6 +1116,7 @@ class GraphService:
         """Clear the graph cache and timestamp."""
         self._graph_cache = None
         self._cache_timestamp = None
+        self._cache_version = None
 
     def get_cache_timestamp(self):
         """
@@ -926,10 +1127,27 @@ class GraphService:
         """
         return self._cache_timestamp
 
+    def get_snapshot(self, refresh: bool = False):
+        """
+        Get the process-wide graph snapshot for this session's database.
+
+        Args:
+            refresh: If True, delta-sync with the database before reading
+
+        Returns:
+            GraphSnapshot (immutable CSR view of the multi-layer graph)
+        """
+        from app.modules.graph.snapshot import sync_graph_snapshot
+
+        return sync_graph_snapshot(self.db, force=refresh)
+
     def build_multilayer_graph(self, refresh_cache: bool = False):
         """
         Build multi-layer graph with citation, coauthorship, subject, and temporal edges.
 
+        The graph is materialized from the shared graph snapshot instead of
+        reloading resources, citations and edges from the database.
+
         Args:
             refresh_cache: If True, rebuild graph even if cache exists
 
@@ -937,67 +1155,32 @@ class GraphService:
             NetworkX MultiGraph object or dict-based graph structure
         """
         try:
-            import networkx as nx
+            import networkx  # noqa: F401
         except ImportError:
             # Return a simple dict-based graph structure if networkx not available
             return {"nodes": [], "edges": []}
 
-        # Check cache
-        if not refresh_cache and self._has_cached_graph():
-            return self._get_cached_graph()
-
-        G = nx.MultiGraph()
-
-        # Add all resources as nodes
-        from app.database.models import Resource, Citation, GraphEdge
+        snapshot = self.get_snapshot(refresh=refresh_cache)
 
-        resources = self.db.query(Resource).all()
-
-        for resource in resources:
-            G.add_node(
-                str(resource.id),
-                title=resource.title,
-                type=resource.type,
-                quality_overall=resource.quality_overall
-                if hasattr(resource, "quality_overall")
-                else 0.5,
-            )
-
-        # Add citation edges from Citation table
-        citations = (
-            self.db.query(Citation)
-            .filter(Citation.target_resource_id.isnot(None))
-            .all()
-        )
-
-        for citation in citations:
-            G.add_edge(
-                str(citation.source_resource_id),
-                str(citation.target_resource_id),
-                edge_type="citation",
-                weight=1.0,
-                key="citation",
-            )
+        # Check cache (valid while the snapshot version is unchanged)
+        if (
+            not refresh_cache
+            and self._has_cached_graph()
+            and self._cache_version == snapshot.version
+        ):
+            return self._get_cached_graph()
 
-        # Add edges from GraphEdge table
-        graph_edges = self.db.query(GraphEdge).all()
-        for edge in graph_edges:
-            G.add_edge(
-                str(edge.source_id),
-                str(edge.target_id),
-                edge_type=edge.edge_type,
-                weight=edge.weight,
-                key=edge.edge_type,
-            )
+        G = snapshot.to_networkx()
 
         # Cache the graph using accessor method
         self._set_cached_graph(G)
+        self._cache_version = snapshot.version
 
         return G
 
     def _get_one_hop_neighbors(
         self,
-        G,
+        snapshot,
         resource_id: str,
         edge_types: Optional[List[str]],
         min_weight: float,
@@ -1006,7 +1189,7 @@ class GraphService:
         Get direct (1-hop) neighbors from graph.
 
         Args:
-            G: NetworkX graph
+            snapshot: GraphSnapshot
             resource_id: Source resource ID
             edge_types: Filter by edge types
             min_weight: Minimum edge weight threshold
@@ -1015,46 +1198,36 @@ class GraphService:
             NeighborCollection containing neighbor data
         """
         collection = NeighborCollection()
-
-        for neighbor in G.neighbors(resource_id):
-            edge_data = G.get_edge_data(resource_id, neighbor)
-
-            for key, data in edge_data.items():
-                edge_type = data.get("edge_type", "unknown")
-                weight = data.get("weight", 1.0)
-
-                # Apply filters
-                if edge_types and edge_type not in edge_types:
-                    continue
-                if weight < min_weight:
-                    continue
-
-                # Get neighbor node data for quality score
-                neighbor_node_data = G.nodes.get(neighbor, {})
-                quality = neighbor_node_data.get("quality_overall", 0.5)
-
-                neighbor_data = {
-                    "resource_id": neighbor,
-                    "hops": 1,
-                    "distance": 1,  # Alias for hops for backward compatibility
-                    "path": [resource_id, neighbor],
-                    "edge_types": [edge_type],
-                    "total_weight": weight,
-                    "path_strength": weight,  # For 1-hop, path_strength equals weight
-                    "edge_type": edge_type,
-                    "weight": weight,
-                    "intermediate": None,  # No intermediate node for 1-hop
-                    "quality": quality,
-                    "novelty": 0.5,  # Default novelty score
-                    "score": weight * quality,  # Combined score
-                }
-                collection.add_neighbor(neighbor_data)
+        source = snapshot.index_of(resource_id)
+        nbrs, weights, types = snapshot.adjacent(source, edge_types, min_weight)
+
+        for j, weight, code in zip(nbrs.tolist(), weights.tolist(), types.tolist()):
+            neighbor = snapshot.id_of(j)
+            edge_type = snapshot.type_names[code]
+            quality = float(snapshot.quality[j])
+
+            neighbor_data = {
+                "resource_id": neighbor,
+                "hops": 1,
+                "distance": 1,  # Alias for hops for backward compatibility
+                "path": [resource_id, neighbor],
+                "edge_types": [edge_type],
+                "total_weight": weight,
+                "path_strength": weight,  # For 1-hop, path_strength equals weight
+                "edge_type": edge_type,
+                "weight": weight,
+                "intermediate": None,  # No intermediate node for 1-hop
+                "quality": quality,
+                "novelty": 0.5,  # Default novelty score
+                "score": weight * quality,  # Combined score
+            }
+            collection.add_neighbor(neighbor_data)
 
         return collection
 
     def _get_two_hop_neighbors(
         self,
-        G,
+        snapshot,
         resource_id: str,
         edge_types: Optional[List[str]],
         min_weight: float,
@@ -1063,7 +1236,7 @@ class GraphService:
         Get 2-hop neighbors from graph.
 
         Args:
-            G: NetworkX graph
+            snapshot: GraphSnapshot
             resource_id: Source resource ID
             edge_types: Filter by edge types
             min_weight: Minimum edge weight threshold
@@ -1072,60 +1245,45 @@ class GraphService:
             NeighborCollection containing neighbor data
         """
         collection = NeighborCollection()
-        visited = {resource_id}
+        source = snapshot.index_of(resource_id)
+        first_nbrs, first_weights, first_types = snapshot.adjacent(
+            source, edge_types, min_weight
+        )
 
-        for neighbor1 in G.neighbors(resource_id):
-            if neighbor1 in visited:
+        for j1, weight_1, code_1 in zip(
+            first_nbrs.tolist(), first_weights.tolist(), first_types.tolist()
+        ):
+            if j1 == source:
                 continue
+            neighbor1 = snapshot.id_of(j1)
+            edge_type_1 = snapshot.type_names[code_1]
 
-            edge_data_1 = G.get_edge_data(resource_id, neighbor1)
-
-            for key1, data1 in edge_data_1.items():
-                edge_type_1 = data1.get("edge_type", "unknown")
-                weight_1 = data1.get("weight", 1.0)
-
-                if edge_types and edge_type_1 not in edge_types:
-                    continue
-                if weight_1 < min_weight:
+            # Explore second hop
+            nbrs, weights, types = snapshot.adjacent(j1, edge_types, min_weight)
+            for j2, weight_2, code_2 in zip(nbrs.tolist(), weights.tolist(), types.tolist()):
+                if j2 == source:
                     continue
 
-                # Explore second hop
-                for neighbor2 in G.neighbors(neighbor1):
-                    if neighbor2 == resource_id or neighbor2 in visited:
-                        continue
-
-                    edge_data_2 = G.get_edge_data(neighbor1, neighbor2)
-
-                    for key2, data2 in edge_data_2.items():
-                        edge_type_2 = data2.get("edge_type", "unknown")
-                        weight_2 = data2.get("weight", 1.0)
-
-                        if edge_types and edge_type_2 not in edge_types:
-                            continue
-                        if weight_2 < min_weight:
-                            continue
-
-                        total_weight = weight_1 * weight_2
-
-                        # Get neighbor node data for quality score
-                        neighbor_node_data = G.nodes.get(neighbor2, {})
-                        quality = neighbor_node_data.get("quality_overall", 0.5)
-
-                        neighbor_data = {
-                            "resource_id": neighbor2,
-                            "hops": 2,
-                            "distance": 2,  # Alias for hops for backward compatibility
-                            "path": [resource_id, neighbor1, neighbor2],
-                            "edge_types": [edge_type_1, edge_type_2],
-                            "total_weight": total_weight,
-                            "path_strength": total_weight,  # Product of edge weights
-                            "intermediate_nodes": [neighbor1],
-                            "intermediate": neighbor1,  # Single intermediate for 2-hop
-                            "quality": quality,
-                            "novelty": 0.5,  # Default novelty score
-                            "score": total_weight * quality,  # Combined score
-                        }
-                        collection.add_neighbor(neighbor_data)
+                neighbor2 = snapshot.id_of(j2)
+                edge_type_2 = snapshot.type_names[code_2]
+                total_weight = weight_1 * weight_2
+                quality = float(snapshot.quality[j2])
+
+                neighbor_data = {
+                    "resource_id": neighbor2,
+                    "hops": 2,
+                    "distance": 2,  # Alias for hops for backward compatibility
+                    "path": [resource_id, neighbor1, neighbor2],
+                    "edge_types": [edge_type_1, edge_type_2],
+                    "total_weight": total_weight,
+                    "path_strength": total_weight,  # Product of edge weights
+                    "intermediate_nodes": [neighbor1],
+                    "intermediate": neighbor1,  # Single intermediate for 2-hop
+                    "quality": quality,
+                    "novelty": 0.5,  # Default novelty score
+                    "score": total_weight * quality,  # Combined score
+                }
+                collection.add_neighbor(neighbor_data)
 
         return collection
 
@@ -1150,19 +1308,20 @@ class GraphService:
         Returns:
             List of neighbor dictionaries with paths and scores
         """
-        G = self.build_multilayer_graph()
+        snapshot = self.get_snapshot()
 
-        if not G.has_node(resource_id):
+        if not snapshot.has_node(resource_id):
             return []
+        resource_id = str(resource_id)
 
         # Get neighbors based on hop count using encapsulated collection
         if hops == 1:
             collection = self._get_one_hop_neighbors(
-                G, resource_id, edge_types, min_weight
+                snapshot, resource_id, edge_types, min_weight
             )
         elif hops == 2:
             collection = self._get_two_hop_neighbors(
-                G, resource_id, edge_types, min_weight
+                snapshot, resource_id, edge_types, min_weight
             )
         else:
             collection = NeighborCollection()
@@ -1183,7 +1342,8 @@ class GraphService:
         Compute degree centrality for specified resources.
 
         Degree centrality measures the number of direct connections a node has.
-        Returns both in-degree (incoming edges) and out-degree (outgoing edges).
+        Returns both in-degree (incoming edges) and out-degree (outgoing edges),
+        counted over distinct directed (source, target) pairs.
 
         Args:
             resource_ids: List of resource IDs to compute centrality for
@@ -1198,33 +1358,14 @@ class GraphService:
                 }
             }
         """
-        try:
-            import networkx as nx
-        except ImportError:
-            logger.error("NetworkX not installed, cannot compute centrality")
-            return {}
-
-        # Build graph
-        G = self.build_multilayer_graph()
-
-        # Convert to directed graph for in/out degree calculation
-        DG = nx.DiGraph()
-        for u, v, data in G.edges(data=True):
-            DG.add_edge(u, v, **data)
+        snapshot = self.get_snapshot()
+        in_degrees, out_degrees = snapshot.degrees()
 
         results = {}
         for resource_id in resource_ids:
-            resource_id_str = str(resource_id)
-            if not DG.has_node(resource_id_str):
-                results[resource_id] = {
-                    "in_degree": 0,
-                    "out_degree": 0,
-                    "total_degree": 0,
-                }
-                continue
-
-            in_degree = DG.in_degree(resource_id_str)
-            out_degree = DG.out_degree(resource_id_str)
+            i = snapshot.index_of(resource_id)
+            in_degree = int(in_degrees[i]) if i is not None else 0
+            out_degree = int(out_degrees[i]) if i is not None else 0
 
             results[resource_id] = {
                 "in_degree": in_degree,
@@ -1244,29 +1385,34 @@ class GraphService:
         paths between other nodes. High betweenness indicates a node that
         bridges different parts of the graph.
 
+        Computed on the graph snapshot by the sparse centrality engine from
+        CENTRALITY_BETWEENNESS_SAMPLES sampled pivots (hop counts over the
+        undirected graph).
+
         Args:
             resource_ids: List of resource IDs to compute centrality for
 
         Returns:
             Dictionary mapping resource_id to betweenness centrality score (0-1)
         """
-        try:
-            import networkx as nx
-        except ImportError:
-            logger.error("NetworkX not installed, cannot compute centrality")
-            return {}
-
-        # Build graph
-        G = self.build_multilayer_graph()
+        from app.modules.graph.centrality import (
+            approximate_betweenness,
+            undirected_pattern,
+        )
 
-        # Compute betweenness centrality for all nodes
-        betweenness = nx.betweenness_centrality(G, weight="weight")
+        snapshot = self.get_snapshot()
+        src, dst, _ = snapshot.directed_pairs()
+        betweenness = approximate_betweenness(
+            undirected_pattern(src, dst, snapshot.num_nodes),
+            np.flatnonzero(snapshot.alive),
+            k=get_settings().CENTRALITY_BETWEENNESS_SAMPLES or None,
+        )
 
         # Extract results for requested resources
         results = {}
         for resource_id in resource_ids:
-            resource_id_str = str(resource_id)
-            results[resource_id] = betweenness.get(resource_id_str, 0.0)
+            i = snapshot.index_of(resource_id)
+            results[resource_id] = float(betweenness[i]) if i is not None else 0.0
 
         return results
 
@@ -1287,12 +1433,6 @@ class GraphService:
         Returns:
             Dictionary mapping resource_id to PageRank score
         """
-        try:
-            import networkx as nx
-        except ImportError:
-            logger.error("NetworkX not installed, cannot compute centrality")
-            return {}
-
         # Validate damping factor
         if not 0 < damping_factor < 1:
             logger.warning(
@@ -1300,18 +1440,11 @@ class GraphService:
             )
             damping_factor = 0.85
 
-        # Build graph
-        G = self.build_multilayer_graph()
-
-        # Convert to directed graph for PageRank
-        DG = nx.DiGraph()
-        for u, v, data in G.edges(data=True):
-            weight = data.get("weight", 1.0)
-            DG.add_edge(u, v, weight=weight)
+        snapshot = self.get_snapshot()
 
-        # Compute PageRank for all nodes
+        # Compute PageRank for all nodes on the snapshot's directed edges
         try:
-            pagerank = nx.pagerank(DG, alpha=damping_factor, weight="weight")
+            pagerank = snapshot.pagerank(alpha=damping_factor)
         except Exception as e:
             logger.error(f"Error computing PageRank: {e}")
             return {resource_id: 0.0 for resource_id in resource_ids}
@@ -1422,6 +1555,7 @@ class CommunityDetectionService:
         # Query requested resources to ensure they exist
         resources = (
             self.db.query(Resource)
+            .options(*resource_profile("card"))
             .filter(Resource.id.in_(resource_uuids))
             .all()
         )
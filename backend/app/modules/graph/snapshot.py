@@ -0,0 +1,746 @@
+"""
+Graph Snapshot
+
+Process-wide, versioned snapshot of the multi-layer graph (resolved citations
+plus ``GraphEdge`` rows) held as NumPy arrays:
+- An append-only id <-> index map over resources
+- The directed edge list (source, target, edge type, weight), unique per
+  (source, target, edge type) like the ``graph_edges`` table
+- An undirected CSR adjacency (``indptr``/``neighbors``) for traversal
+
+Snapshots are immutable. Writers queue mutations on the store and the next
+reader applies them copy-on-write into a new snapshot with a higher version,
+so a reader holding a snapshot never sees a half-applied update.
+
+Synchronization:
+- graph.edge_added / graph.edge_removed / resource.deleted events update the
+  store in-process (see handlers.py)
+- Readers delta-sync rows changed since the per-table watermark at most every
+  GRAPH_SNAPSHOT_SYNC_SECONDS, picking up writes from other processes
+- A full rebuild every GRAPH_SNAPSHOT_REBUILD_SECONDS reconciles deletions
+  made outside this process
+
+Related files:
+- app/modules/graph/service.py: GraphService reads the snapshot
+- app/shared/vector_index.py: Same per-engine registry pattern
+"""
+
+import itertools
+import logging
+import threading
+import time
+import weakref
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ...config.settings import get_settings
+from ...database.models import Citation, GraphEdge, Resource
+
+logger = logging.getLogger(__name__)
+
+# Rows whose timestamp is within this margin of a watermark are re-read, so
+# commits that land out of timestamp order are not missed
+_WATERMARK_MARGIN = timedelta(seconds=2)
+
+# Edge keys pack (source, target, type) into one int64
+_TYPE_BITS = 7
+_NODE_BITS = 28
+_MAX_EDGE_TYPES = 1 << _TYPE_BITS
+_MAX_NODES = 1 << _NODE_BITS
+
+CITATION_EDGE_TYPE = "citation"
+DEFAULT_QUALITY = 0.5
+
+EdgeTuple = Tuple[str, str, str, float]
+
+
+def _edge_keys(src: np.ndarray, dst: np.ndarray, etype: np.ndarray) -> np.ndarray:
+    return (
+        (src.astype(np.int64) << (_NODE_BITS + _TYPE_BITS))
+        | (dst.astype(np.int64) << _TYPE_BITS)
+        | etype.astype(np.int64)
+    )
+
+
+def _unique_last(keys: np.ndarray) -> np.ndarray:
+    """Indices of the last occurrence of each key, in original order."""
+    reversed_keys = keys[::-1]
+    _, first_in_reversed = np.unique(reversed_keys, return_index=True)
+    return np.sort(len(keys) - 1 - first_in_reversed)
+
+
+class GraphSnapshot:
+    """Immutable, versioned view of the graph.
+
+    Attributes:
+        version: Monotonic version number within the owning store
+        num_nodes: Number of node slots (including removed nodes)
+        alive: Per-node flag, False for removed resources
+        quality: Per-node quality score (``DEFAULT_QUALITY`` if unknown)
+        src, dst, etype, weight: Directed edge list
+        indptr, neighbors, neighbor_weight, neighbor_type: Undirected CSR
+        type_names: Edge type name per type code
+    """
+
+    def __init__(
+        self,
+        version: int,
+        ids: List[str],
+        index: Dict[str, int],
+        num_nodes: int,
+        alive: np.ndarray,
+        quality: np.ndarray,
+        src: np.ndarray,
+        dst: np.ndarray,
+        etype: np.ndarray,
+        weight: np.ndarray,
+        type_names: Tuple[str, ...],
+    ) -> None:
+        self.version = version
+        # ids/index are shared append-only structures; num_nodes bounds this view
+        self._ids = ids
+        self._index = index
+        self.num_nodes = num_nodes
+        self.alive = alive
+        self.quality = quality
+        self.src = src
+        self.dst = dst
+        self.etype = etype
+        self.weight = weight
+        self.type_names = type_names
+        self.created_at = time.time()
+        # Sorted edge keys for edge_weights, built on first lookup
+        self._sorted_keys: Optional[np.ndarray] = None
+        self._sorted_order: Optional[np.ndarray] = None
+        self._build_csr()
+        for array in (alive, quality, src, dst, etype, weight):
+            array.setflags(write=False)
+
+    def _build_csr(self) -> None:
+        """Build the undirected adjacency, collapsing reverse duplicates."""
+        lo = np.minimum(self.src, self.dst)
+        hi = np.maximum(self.src, self.dst)
+        keep = _unique_last(_edge_keys(lo, hi, self.etype)) if len(lo) else lo
+        a, b = self.src[keep], self.dst[keep]
+        t, w = self.etype[keep], self.weight[keep]
+
+        loops = a == b
+        rows = np.concatenate([a, b[~loops]])
+        cols = np.concatenate([b, a[~loops]])
+        types = np.concatenate([t, t[~loops]])
+        weights = np.concatenate([w, w[~loops]])
+
+        order = np.argsort(rows, kind="stable")
+        counts = np.bincount(rows, minlength=self.num_nodes)
+        self.indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.indptr[1:])
+        self.neighbors = cols[order].astype(np.int32)
+        self.neighbor_type = types[order]
+        self.neighbor_weight = weights[order]
+        self.num_undirected_edges = len(a)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return int(self.alive.sum())
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.src)
+
+    def index_of(self, resource_id: Any) -> Optional[int]:
+        """Node index for a resource id, or None if it is not in this view."""
+        i = self._index.get(str(resource_id))
+        if i is None or i >= self.num_nodes or not self.alive[i]:
+            return None
+        return i
+
+    def has_node(self, resource_id: Any) -> bool:
+        return self.index_of(resource_id) is not None
+
+    def id_of(self, i: int) -> str:
+        return self._ids[i]
+
+    def type_code(self, edge_type: str) -> Optional[int]:
+        try:
+            return self.type_names.index(edge_type)
+        except ValueError:
+            return None
+
+    def edge_weights(
+        self, src: np.ndarray, dst: np.ndarray, etype: np.ndarray
+    ) -> np.ndarray:
+        """Weights of the given directed edges (NaN where an edge is absent).
+
+        Args:
+            src, dst, etype: Node indices and type codes of the edges to look up
+
+        Returns:
+            float32 array aligned with the inputs
+        """
+        if self._sorted_keys is None:
+            keys = _edge_keys(self.src, self.dst, self.etype)
+            order = np.argsort(keys, kind="stable")
+            self._sorted_keys, self._sorted_order = keys[order], order
+        result = np.full(len(src), np.nan, dtype=np.float32)
+        if not len(src) or not len(self._sorted_keys):
+            return result
+        wanted = _edge_keys(src, dst, etype)
+        pos = np.searchsorted(self._sorted_keys, wanted)
+        pos[pos >= len(self._sorted_keys)] = 0
+        found = self._sorted_keys[pos] == wanted
+        result[found] = self.weight[self._sorted_order[pos[found]]]
+        return result
+
+    def adjacent(
+        self,
+        i: int,
+        edge_types: Optional[Sequence[str]] = None,
+        min_weight: float = 0.0,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Undirected neighbors of node ``i`` passing the filters.
+
+        Returns:
+            Tuple of (neighbor indices, edge weights, edge type codes)
+        """
+        start, end = self.indptr[i], self.indptr[i + 1]
+        nbrs = self.neighbors[start:end]
+        weights = self.neighbor_weight[start:end]
+        types = self.neighbor_type[start:end]
+        mask = weights >= min_weight
+        if edge_types:
+            codes = [c for c in (self.type_code(e) for e in edge_types) if c is not None]
+            mask &= np.isin(types, codes)
+        return nbrs[mask], weights[mask], types[mask]
+
+    # ------------------------------------------------------------------
+    # Whole-graph metrics
+    # ------------------------------------------------------------------
+
+    def directed_pairs(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Distinct directed (source, target) pairs with summed weights."""
+        if not len(self.src):
+            empty = np.zeros(0, dtype=np.int32)
+            return empty, empty, np.zeros(0, dtype=np.float64)
+        pair_keys = (self.src.astype(np.int64) << _NODE_BITS) | self.dst.astype(np.int64)
+        unique_keys, inverse = np.unique(pair_keys, return_inverse=True)
+        weights = np.bincount(inverse, weights=self.weight.astype(np.float64))
+        src = (unique_keys >> _NODE_BITS).astype(np.int32)
+        dst = (unique_keys & (_MAX_NODES - 1)).astype(np.int32)
+        return src, dst, weights
+
+    def degrees(self) -> Tuple[np.ndarray, np.ndarray]:
+        """In- and out-degree per node over distinct directed pairs."""
+        src, dst, _ = self.directed_pairs()
+        return (
+            np.bincount(dst, minlength=self.num_nodes),
+            np.bincount(src, minlength=self.num_nodes),
+        )
+
+    def pagerank(
+        self, alpha: float = 0.85, max_iter: int = 100, tol: float = 1.0e-6
+    ) -> Dict[str, float]:
+        """Weighted PageRank over the directed graph.
+
+        Follows ``networkx.pagerank`` semantics: only nodes with edges take
+        part, dangling mass is spread uniformly and convergence is reached
+        when the L1 change drops below ``n * tol``. Weights of edges of
+        different types between the same ordered pair are summed.
+
+        Returns:
+            Mapping of resource id to PageRank score
+        """
+        from .centrality import snapshot_pagerank
+
+        return snapshot_pagerank(self, alpha=alpha, max_iter=max_iter, tol=tol)
+
+    def to_networkx(self):
+        """Materialize the snapshot as a NetworkX ``MultiGraph``.
+
+        Edges are keyed by edge type, matching the graph previously built
+        from the database by ``GraphService.build_multilayer_graph``.
+        """
+        import networkx as nx
+
+        G = nx.MultiGraph()
+        for i in np.flatnonzero(self.alive):
+            G.add_node(self._ids[i], quality_overall=float(self.quality[i]))
+        for a, b, t, w in zip(self.src, self.dst, self.etype, self.weight):
+            edge_type = self.type_names[t]
+            G.add_edge(
+                self._ids[a],
+                self._ids[b],
+                key=edge_type,
+                edge_type=edge_type,
+                weight=float(w),
+            )
+        return G
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "nodes": len(self),
+            "directed_edges": self.num_edges,
+            "undirected_edges": self.num_undirected_edges,
+            "edge_types": list(self.type_names),
+            "age_seconds": round(time.time() - self.created_at, 3),
+        }
+
+
+class GraphSnapshotStore:
+    """Holds the current snapshot for one database and applies updates.
+
+    Mutations are queued and applied lazily by the next ``snapshot()`` call,
+    so a burst of events produces one new version. Mutations queued before
+    the first build are dropped; the build reads them from the database.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._current: Optional[GraphSnapshot] = None
+        self._pending: List[Tuple] = []
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._type_names: List[str] = []
+        self.watermarks: Dict[str, Optional[datetime]] = {}
+        self.built_at: Optional[float] = None
+        self.synced_at: Optional[float] = None
+
+    @property
+    def is_built(self) -> bool:
+        return self._current is not None
+
+    @property
+    def version(self) -> int:
+        current = self._current
+        return current.version if current is not None else 0
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Optional[GraphSnapshot]:
+        """Return the current snapshot after applying queued mutations."""
+        if self._pending:
+            with self._lock:
+                self._apply_pending()
+        return self._current
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def load(
+        self,
+        nodes: Iterable[Tuple[str, Optional[float]]],
+        edges: Iterable[EdgeTuple],
+        watermarks: Optional[Dict[str, Optional[datetime]]] = None,
+    ) -> GraphSnapshot:
+        """Replace the graph with a full build.
+
+        Args:
+            nodes: (resource_id, quality) pairs
+            edges: (source_id, target_id, edge_type, weight) tuples; later
+                duplicates of the same (source, target, type) win
+            watermarks: Per-table sync watermarks at build time
+
+        Returns:
+            The new snapshot
+        """
+        with self._lock:
+            version = self.version + 1
+            self._ids, self._index, self._type_names = [], {}, []
+            self._pending = []
+            quality: List[float] = []
+            for resource_id, score in nodes:
+                self._intern(resource_id)
+                quality.append(DEFAULT_QUALITY if score is None else float(score))
+
+            src, dst, etype, weight = self._encode_edges(edges)
+            n = len(self._ids)
+            quality_array = np.full(n, DEFAULT_QUALITY, dtype=np.float32)
+            quality_array[: len(quality)] = quality
+            keep = _unique_last(_edge_keys(src, dst, etype)) if len(src) else src
+
+            self._current = GraphSnapshot(
+                version,
+                self._ids,
+                self._index,
+                n,
+                np.ones(n, dtype=bool),
+                quality_array,
+                src[keep],
+                dst[keep],
+                etype[keep],
+                weight[keep],
+                tuple(self._type_names),
+            )
+            self.watermarks = dict(watermarks or {})
+            self.built_at = self.synced_at = time.time()
+            return self._current
+
+    def add_edges(self, edges: Iterable[EdgeTuple]) -> None:
+        """Queue edge upserts (replacing the weight of existing edges)."""
+        self._queue("add", list(edges))
+
+    def remove_edges(self, edges: Iterable[Tuple[str, str, str]]) -> None:
+        """Queue edge removals by (source_id, target_id, edge_type)."""
+        self._queue("remove", list(edges))
+
+    def remove_nodes(self, resource_ids: Iterable[str]) -> None:
+        """Queue node removals; incident edges are removed with them."""
+        self._queue("drop", [str(r) for r in resource_ids])
+
+    def upsert_nodes(self, nodes: Iterable[Tuple[str, Optional[float]]]) -> None:
+        """Queue node additions or quality updates."""
+        self._queue("node", list(nodes))
+
+    def drop_unchanged(
+        self,
+        nodes: List[Tuple[str, Optional[float]]],
+        edges: List[EdgeTuple],
+    ) -> Tuple[List[Tuple[str, Optional[float]]], List[EdgeTuple]]:
+        """Filter delta-sync rows down to those the snapshot does not hold yet.
+
+        Nodes are kept if they are missing or their quality differs; edges
+        if they are missing or their weight differs. Later duplicates of an
+        edge win, as in ``load``.
+
+        Args:
+            nodes: (resource_id, quality) pairs
+            edges: (source_id, target_id, edge_type, weight) tuples
+
+        Returns:
+            Tuple of (changed nodes, changed edges)
+        """
+        current = self.snapshot()
+        if current is None:
+            return nodes, edges
+
+        changed_nodes = []
+        for resource_id, score in nodes:
+            i = current.index_of(resource_id)
+            if i is None or (
+                score is not None and current.quality[i] != np.float32(score)
+            ):
+                changed_nodes.append((resource_id, score))
+
+        latest: Dict[Tuple[str, str, str], EdgeTuple] = {}
+        for edge in edges:
+            latest[(str(edge[0]), str(edge[1]), edge[2])] = edge
+        known, codes = [], []
+        changed_edges = []
+        for (source_id, target_id, edge_type), edge in latest.items():
+            a = current.index_of(source_id)
+            b = current.index_of(target_id)
+            t = current.type_code(edge_type)
+            if a is None or b is None or t is None:
+                changed_edges.append(edge)
+            else:
+                known.append(edge)
+                codes.append((a, b, t))
+        if known:
+            a, b, t = (np.asarray(c) for c in zip(*codes))
+            weights = current.edge_weights(a, b, t)
+            wanted = np.asarray(
+                [1.0 if len(e) < 4 or e[3] is None else float(e[3]) for e in known],
+                dtype=np.float32,
+            )
+            differs = np.isnan(weights) | (weights != wanted)
+            changed_edges.extend(e for e, d in zip(known, differs) if d)
+        return changed_nodes, changed_edges
+
+    def _queue(self, kind: str, items: List) -> None:
+        if not items:
+            return
+        with self._lock:
+            if self._current is None:
+                return
+            self._pending.append((kind, items))
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _intern(self, resource_id: Any) -> int:
+        key = str(resource_id)
+        i = self._index.get(key)
+        if i is None:
+            if len(self._ids) >= _MAX_NODES:
+                raise OverflowError("Graph snapshot node limit reached")
+            i = len(self._ids)
+            self._ids.append(key)
+            self._index[key] = i
+        return i
+
+    def _type_code(self, edge_type: str) -> int:
+        try:
+            return self._type_names.index(edge_type)
+        except ValueError:
+            if len(self._type_names) >= _MAX_EDGE_TYPES:
+                raise OverflowError("Graph snapshot edge type limit reached")
+            self._type_names.append(edge_type)
+            return len(self._type_names) - 1
+
+    def _encode_edges(self, edges: Iterable[Sequence]):
+        src, dst, etype, weight = [], [], [], []
+        for edge in edges:
+            src.append(self._intern(edge[0]))
+            dst.append(self._intern(edge[1]))
+            etype.append(self._type_code(edge[2]))
+            weight.append(float(edge[3]) if len(edge) > 3 and edge[3] is not None else 1.0)
+        return (
+            np.asarray(src, dtype=np.int32),
+            np.asarray(dst, dtype=np.int32),
+            np.asarray(etype, dtype=np.int16),
+            np.asarray(weight, dtype=np.float32),
+        )
+
+    def _apply_pending(self) -> None:
+        current = self._current
+        if current is None or not self._pending:
+            self._pending = []
+            return
+        pending, self._pending = self._pending, []
+
+        src, dst = current.src, current.dst
+        etype, weight = current.etype, current.weight
+        alive, quality = current.alive.copy(), current.quality.copy()
+
+        def grow(n: int):
+            nonlocal alive, quality
+            if n > len(alive):
+                extra = n - len(alive)
+                alive = np.concatenate([alive, np.ones(extra, dtype=bool)])
+                quality = np.concatenate(
+                    [quality, np.full(extra, DEFAULT_QUALITY, dtype=np.float32)]
+                )
+
+        # Consecutive mutations of the same kind are applied as one batch
+        for kind, group in itertools.groupby(pending, key=lambda op: op[0]):
+            items = [item for _, batch in group for item in batch]
+
+            if kind == "add":
+                a, b, t, w = self._encode_edges(items)
+                grow(len(self._ids))
+                alive[a] = True
+                alive[b] = True
+                new_keys = _edge_keys(a, b, t)
+                keep = ~np.isin(_edge_keys(src, dst, etype), new_keys)
+                last = _unique_last(new_keys)
+                src = np.concatenate([src[keep], a[last]])
+                dst = np.concatenate([dst[keep], b[last]])
+                etype = np.concatenate([etype[keep], t[last]])
+                weight = np.concatenate([weight[keep], w[last]])
+
+            elif kind == "remove":
+                codes = [
+                    (self._index.get(str(s)), self._index.get(str(d)), e)
+                    for s, d, e in items
+                ]
+                codes = [
+                    (s, d, self._type_names.index(e))
+                    for s, d, e in codes
+                    if s is not None and d is not None and e in self._type_names
+                ]
+                if codes:
+                    a, b, t = (np.asarray(c) for c in zip(*codes))
+                    keep = ~np.isin(_edge_keys(src, dst, etype), _edge_keys(a, b, t))
+                    src, dst, etype, weight = src[keep], dst[keep], etype[keep], weight[keep]
+
+            elif kind == "drop":
+                dropped = [self._index[r] for r in items if r in self._index]
+                if dropped:
+                    dropped = np.asarray(dropped)
+                    dropped = dropped[dropped < len(alive)]
+                    alive[dropped] = False
+                    keep = ~(np.isin(src, dropped) | np.isin(dst, dropped))
+                    src, dst, etype, weight = src[keep], dst[keep], etype[keep], weight[keep]
+
+            elif kind == "node":
+                for resource_id, score in items:
+                    i = self._intern(resource_id)
+                    grow(len(self._ids))
+                    alive[i] = True
+                    if score is not None:
+                        quality[i] = score
+
+        grow(len(self._ids))
+        self._current = GraphSnapshot(
+            current.version + 1,
+            self._ids,
+            self._index,
+            len(self._ids),
+            alive,
+            quality,
+            src,
+            dst,
+            etype,
+            weight,
+            tuple(self._type_names),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        current = self._current
+        stats = current.stats() if current is not None else {"version": 0}
+        stats.update(
+            {
+                "built": current is not None,
+                "pending_mutations": len(self._pending),
+                "built_at": self.built_at,
+                "synced_at": self.synced_at,
+            }
+        )
+        return stats
+
+
+# ============================================================================
+# Process-wide registry
+# ============================================================================
+
+_registry: "weakref.WeakKeyDictionary[Any, GraphSnapshotStore]" = (
+    weakref.WeakKeyDictionary()
+)
+_registry_lock = threading.Lock()
+
+
+def get_graph_store(bind: Any) -> GraphSnapshotStore:
+    """Get (or create) the process-wide graph store for an engine."""
+    engine = getattr(bind, "engine", bind)
+    with _registry_lock:
+        store = _registry.get(engine)
+        if store is None:
+            store = GraphSnapshotStore()
+            _registry[engine] = store
+        return store
+
+
+def get_all_graph_stores() -> List[GraphSnapshotStore]:
+    """Return every graph store currently held by this process."""
+    with _registry_lock:
+        return list(_registry.values())
+
+
+# ============================================================================
+# Database synchronization
+# ============================================================================
+
+
+def _interval_setting(name: str, default: float) -> float:
+    value = getattr(get_settings(), name, default)
+    return value if isinstance(value, (int, float)) else default
+
+
+def _newest(current: Optional[datetime], value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return current
+    return value if current is None or value > current else current
+
+
+def _load_rows(db: Session, since: Dict[str, Optional[datetime]]):
+    """Read nodes and edges changed since the given per-table watermarks.
+
+    Returns:
+        Tuple of (nodes, edges, new watermarks)
+    """
+    watermarks: Dict[str, Optional[datetime]] = dict(since)
+
+    stmt = select(Resource.id, Resource.quality_overall, Resource.updated_at)
+    if since.get("resources") is not None:
+        stmt = stmt.where(Resource.updated_at >= since["resources"] - _WATERMARK_MARGIN)
+    nodes = []
+    for resource_id, quality, updated_at in db.execute(stmt):
+        nodes.append((str(resource_id), quality))
+        watermarks["resources"] = _newest(watermarks.get("resources"), updated_at)
+
+    edges: List[EdgeTuple] = []
+    stmt = select(
+        Citation.source_resource_id, Citation.target_resource_id, Citation.updated_at
+    ).where(Citation.target_resource_id.isnot(None))
+    if since.get("citations") is not None:
+        stmt = stmt.where(Citation.updated_at >= since["citations"] - _WATERMARK_MARGIN)
+    for source_id, target_id, updated_at in db.execute(stmt):
+        edges.append((str(source_id), str(target_id), CITATION_EDGE_TYPE, 1.0))
+        watermarks["citations"] = _newest(watermarks.get("citations"), updated_at)
+
+    # GraphEdge rows come last so their weights win over plain citations
+    stmt = select(
+        GraphEdge.source_id,
+        GraphEdge.target_id,
+        GraphEdge.edge_type,
+        GraphEdge.weight,
+        GraphEdge.updated_at,
+    )
+    if since.get("graph_edges") is not None:
+        stmt = stmt.where(GraphEdge.updated_at >= since["graph_edges"] - _WATERMARK_MARGIN)
+    for source_id, target_id, edge_type, weight, updated_at in db.execute(stmt):
+        edges.append((str(source_id), str(target_id), edge_type, weight))
+        watermarks["graph_edges"] = _newest(watermarks.get("graph_edges"), updated_at)
+
+    return nodes, edges, watermarks
+
+
+def rebuild_graph_snapshot(db: Session) -> GraphSnapshot:
+    """Build the engine's graph snapshot from the database.
+
+    Args:
+        db: Database session
+
+    Returns:
+        The new snapshot
+    """
+    store = get_graph_store(db.get_bind())
+    start = time.time()
+    nodes, edges, watermarks = _load_rows(db, {})
+    snapshot = store.load(nodes, edges, watermarks)
+    logger.info(
+        f"Built graph snapshot v{snapshot.version}: {len(snapshot)} nodes, "
+        f"{snapshot.num_edges} edges in {(time.time() - start) * 1000:.0f}ms"
+    )
+    return snapshot
+
+
+def sync_graph_snapshot(db: Session, force: bool = False) -> GraphSnapshot:
+    """Bring the graph snapshot up to date with the database.
+
+    Builds it on first use, runs a delta sync when the last sync is older
+    than GRAPH_SNAPSHOT_SYNC_SECONDS (or ``force`` is set) and rebuilds it
+    when the last build is older than GRAPH_SNAPSHOT_REBUILD_SECONDS.
+
+    Args:
+        db: Database session
+        force: Delta-sync regardless of the sync interval
+
+    Returns:
+        The current snapshot
+    """
+    store = get_graph_store(db.get_bind())
+    now = time.time()
+
+    rebuild_seconds = _interval_setting("GRAPH_SNAPSHOT_REBUILD_SECONDS", 3600)
+    if not store.is_built or now - store.built_at >= rebuild_seconds:
+        return rebuild_graph_snapshot(db)
+
+    sync_seconds = _interval_setting("GRAPH_SNAPSHOT_SYNC_SECONDS", 5.0)
+    if force or now - store.synced_at >= sync_seconds:
+        nodes, edges, watermarks = _load_rows(db, store.watermarks)
+        # Rows re-read inside the watermark margin are usually unchanged;
+        # queuing them would publish a new version for nothing
+        nodes, edges = store.drop_unchanged(nodes, edges)
+        store.upsert_nodes(nodes)
+        store.add_edges(edges)
+        store.watermarks = watermarks
+        store.synced_at = now
+
+    return store.snapshot()
+
+
+def get_graph_snapshot(db: Session) -> GraphSnapshot:
+    """Return an up-to-date snapshot for the session's engine."""
+    return sync_graph_snapshot(db)
@@ -10,6 +10,8 @@ Provides endpoints for:
 - Event history
 - Worker status
 - Database pool status
+- Vector index statistics
+- Task coalescing counters
 """
 
 import logging
@@ -215,7 +217,8 @@ async def get_event_history(
     Get recent event history from the event system.
 
     Returns the most recent events emitted by the system, useful for
-    debugging, auditing, and understanding system behavior.
+    debugging, auditing, and understanding system behavior. Empty unless
+    EVENT_HISTORY_SIZE enables history.
 
     Args:
         limit: Maximum number of events to return (default: 100, max: 1000)
@@ -252,6 +255,58 @@ async def get_cache_stats() -> Dict[str, Any]:
     return await service.get_cache_stats()
 
 
+@router.get("/vector-index", response_model=Dict[str, Any])
+async def get_vector_index_stats() -> Dict[str, Any]:
+    """
+    Get ANN vector index size and staleness statistics.
+
+    Returns:
+        Dictionary with one entry per in-process index including:
+        - size: Number of indexed vectors
+        - trained: Whether the IVF quantizer is trained
+        - staleness: Fraction of vectors mutated since last training
+        - seconds_since_sync: Age of the last database sync
+        - unsaved_mutations: Changes not yet persisted to disk
+    """
+    service = MonitoringService()
+    return await service.get_vector_index_stats()
+
+
+@router.get("/models", response_model=Dict[str, Any])
+async def get_model_registry_stats() -> Dict[str, Any]:
+    """
+    Get ML models loaded in this process.
+
+    Returns:
+        Dictionary including:
+        - models: Loaded models with memory, load time, hits and idle time
+        - resident_bytes: Total estimated memory of loaded models
+        - max_bytes: Configured budget (0 = unlimited)
+        - loads: Load count per kind:model_name:device
+        - evictions: Models evicted to stay under the budget
+    """
+    service = MonitoringService()
+    return await service.get_model_registry_stats()
+
+
+@router.get("/tasks/coalescing", response_model=Dict[str, Any])
+async def get_task_coalescing_stats() -> Dict[str, Any]:
+    """
+    Get counters of the hook-triggered task coalescer.
+
+    Returns:
+        Dictionary with one entry per channel (embedding, quality,
+        graph_edges) including:
+        - submitted: Submissions received from event hooks
+        - coalesced: Submissions collapsed into a pending run
+        - enqueued: Batch tasks enqueued
+        - batched: Resources handed to batch tasks
+        - executed: Resources processed by batch tasks
+    """
+    service = MonitoringService()
+    return await service.get_task_coalescing_stats()
+
+
 @router.get("/workers/status", response_model=WorkerStatus)
 async def get_worker_status() -> Dict[str, Any]:
     """
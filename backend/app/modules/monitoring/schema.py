@@ -71,6 +71,8 @@ class CacheStats(BaseModel):
     status: str
     timestamp: str
     cache_stats: Dict[str, Any]
+    embedding_cache: Optional[Dict[str, Any]] = None
+    search_result_cache: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 
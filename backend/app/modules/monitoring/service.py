@@ -15,7 +15,12 @@ from sqlalchemy import func
 
 from ...shared.database import get_pool_status
 from ...shared.event_bus import event_bus
-from ...shared.cache import cache
+from ...shared.cache import cache, embedding_cache
+from ...shared.vector_index import get_all_vector_indexes
+from ...shared.inverted_index import get_all_inverted_indexes
+from ...shared.model_registry import get_model_registry
+from ..graph.snapshot import get_all_graph_stores
+from ..search.result_cache import search_result_cache
 from ...database.models import UserInteraction, RecommendationFeedback, UserProfile
 from ...utils.performance_monitoring import metrics as perf_metrics
 from ...ml_monitoring.health_check import check_classification_model_health
@@ -567,6 +572,8 @@ class MonitoringService:
                     "invalidations": cache.stats.invalidations,
                     "total_requests": total_requests,
                 },
+                "embedding_cache": embedding_cache.stats_dict(),
+                "search_result_cache": search_result_cache.stats_dict(),
             }
 
         except Exception as e:
@@ -577,6 +584,83 @@ class MonitoringService:
                 "timestamp": datetime.utcnow().isoformat(),
             }
 
+    async def get_vector_index_stats(self) -> Dict[str, Any]:
+        """
+        Get size and staleness statistics for in-process search indexes.
+
+        Returns:
+            Dictionary with per-index statistics for dense (ANN) and sparse
+            (inverted) indexes, and the shared graph snapshots
+        """
+        try:
+            return {
+                "status": "ok",
+                "timestamp": datetime.utcnow().isoformat(),
+                "indexes": [index.stats() for index in get_all_vector_indexes()],
+                "sparse_indexes": [
+                    index.stats() for index in get_all_inverted_indexes()
+                ],
+                "graph_snapshots": [store.stats() for store in get_all_graph_stores()],
+            }
+
+        except Exception as e:
+            logger.error(f"Error getting vector index statistics: {str(e)}", exc_info=True)
+            return {
+                "status": "error",
+                "error": str(e),
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+
+    async def get_task_coalescing_stats(self) -> Dict[str, Any]:
+        """
+        Get counters of the hook-triggered task coalescer.
+
+        Returns:
+            Dictionary with per-channel submitted, coalesced, enqueued,
+            batched and executed counts
+        """
+        try:
+            from ...tasks.coalescing import get_coalescer
+
+            coalescer = get_coalescer()
+            return {
+                "status": "ok",
+                "timestamp": datetime.utcnow().isoformat(),
+                "backend": type(coalescer.store).__name__,
+                "channels": coalescer.get_stats(),
+            }
+
+        except Exception as e:
+            logger.error(f"Error getting task coalescing stats: {str(e)}", exc_info=True)
+            return {
+                "status": "error",
+                "error": str(e),
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+
+    async def get_model_registry_stats(self) -> Dict[str, Any]:
+        """
+        Get loaded ML models and resident memory of this process.
+
+        Returns:
+            Dictionary with the model registry's loaded models, load counts,
+            evictions and resident bytes
+        """
+        try:
+            return {
+                "status": "ok",
+                "timestamp": datetime.utcnow().isoformat(),
+                **get_model_registry().stats(),
+            }
+
+        except Exception as e:
+            logger.error(f"Error getting model registry stats: {str(e)}", exc_info=True)
+            return {
+                "status": "error",
+                "error": str(e),
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+
     async def get_worker_status(self) -> Dict[str, Any]:
         """
         Get Celery worker status.
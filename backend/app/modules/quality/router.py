@@ -16,6 +16,7 @@ from sqlalchemy import func, and_
 from sqlalchemy.orm import Session
 
 from app.shared.database import get_sync_db
+from app.database.load_profiles import resource_profile
 from app.database.models import Resource, RAGEvaluation
 from .schema import (
     QualityDetailsResponse,
@@ -175,7 +176,11 @@ async def get_outliers(
     db: Session = Depends(get_sync_db),
 ):
     """List detected quality outliers with pagination and filtering."""
-    query = db.query(Resource).filter(Resource.is_quality_outlier)
+    query = (
+        db.query(Resource)
+        .options(*resource_profile("quality"))
+        .filter(Resource.is_quality_outlier)
+    )
 
     if min_outlier_score is not None:
         query = query.filter(Resource.outlier_score >= min_outlier_score)
@@ -573,7 +578,11 @@ async def get_review_queue(
             detail="sort_by must be one of: outlier_score, quality_overall, updated_at",
         )
 
-    query = db.query(Resource).filter(Resource.needs_quality_review)
+    query = (
+        db.query(Resource)
+        .options(*resource_profile("quality"))
+        .filter(Resource.needs_quality_review)
+    )
 
     if sort_by == "outlier_score":
         query = query.order_by(Resource.outlier_score.asc().nullslast())
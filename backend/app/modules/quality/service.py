@@ -5,14 +5,39 @@ Combined implementation with QualityService and ContentQualityAnalyzer.
 Extracted from app/services/quality_service.py as part of Phase 14 vertical slice refactoring.
 """
 
-from typing import Dict, List, Optional, Any, Mapping
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone, timedelta
 import json
 import logging
+import multiprocessing
+
+import numpy as np
 
+from app.database.load_profiles import resource_profile
 from app.utils import text_processor as tp
-from app.domain.quality import QualityScore
+from app.domain.quality import (
+    ACCURACY_WEIGHT,
+    COMPLETENESS_WEIGHT,
+    CONSISTENCY_WEIGHT,
+    RELEVANCE_WEIGHT,
+    TIMELINESS_WEIGHT,
+    QualityScore,
+)
 from app.shared.cache import cache
 
 logger = logging.getLogger(__name__)
@@ -78,6 +103,13 @@ DEPTH_SCORE_COMPREHENSIVE = 0.9
 # Each required field contributes equally to the completeness score
 COMPLETENESS_FIELD_WEIGHT = 0.2  # 5 fields × 0.2 = 1.0
 
+# Baseline scores for the dimensions that are not yet computed per resource
+# (shared by QualityService._compute_*_dimension and compute_dimension_scores)
+ACCURACY_BASELINE = 0.7
+CONSISTENCY_BASELINE = 0.75
+TIMELINESS_BASELINE = 0.7
+RELEVANCE_BASELINE = 0.7
+
 # Quality degradation monitoring
 DEGRADATION_THRESHOLD = 0.2  # 20% drop in quality triggers review
 DEGRADATION_DEFAULT_WINDOW_DAYS = 30  # Default time window for monitoring
@@ -96,6 +128,57 @@ FEATURE_DEFAULT_VALUE = 0.5  # Neutral baseline for missing quality dimensions
 # Weight validation tolerance
 WEIGHT_SUM_TOLERANCE = 0.001  # Acceptable deviation from 1.0 for weight sum
 
+# Corpus-wide sweeps (degradation monitoring, outlier detection)
+# Rows are processed in primary-key ordered chunks; each chunk is scored
+# vectorized and written back with one bulk UPDATE.
+SWEEP_DEFAULT_CHUNK_SIZE = 2000  # Resources per chunk
+OUTLIER_DEFAULT_SAMPLE_SIZE = 10000  # Rows the Isolation Forest is fitted on
+
+# Column order of compute_dimension_scores() (overall score is appended last)
+QUALITY_DIMENSIONS = (
+    "accuracy",
+    "completeness",
+    "consistency",
+    "timeliness",
+    "relevance",
+)
+
+# Domain weights of the QUALITY_DIMENSIONS columns (QualityScore.overall_score)
+QUALITY_DIMENSION_WEIGHTS = (
+    ACCURACY_WEIGHT,
+    COMPLETENESS_WEIGHT,
+    CONSISTENCY_WEIGHT,
+    TIMELINESS_WEIGHT,
+    RELEVANCE_WEIGHT,
+)
+
+# Metadata fields counted by the completeness dimension
+COMPLETENESS_FIELDS = ("title", "description", "creator", "publication_year", "doi")
+
+# Outlier feature columns (5 quality dimensions + 4 summary dimensions)
+OUTLIER_FEATURES = (
+    "quality_accuracy",
+    "quality_completeness",
+    "quality_consistency",
+    "quality_timeliness",
+    "quality_relevance",
+    "summary_coherence",
+    "summary_consistency",
+    "summary_fluency",
+    "summary_relevance",
+)
+OUTLIER_REASON_NAMES = (
+    "low_accuracy",
+    "low_completeness",
+    "low_consistency",
+    "low_timeliness",
+    "low_relevance",
+    "low_summary_coherence",
+    "low_summary_consistency",
+    "low_summary_fluency",
+    "low_summary_relevance",
+)
+
 
 class ContentQualityAnalyzer:
     """Compute content quality metrics for a resource and its text."""
@@ -382,6 +465,120 @@ class ContentQualityAnalyzer:
         return overall
 
 
+def completeness_score(present_count):
+    """Completeness dimension for a number of present ``COMPLETENESS_FIELDS``.
+
+    Works on a plain count or an array of counts.
+    """
+    return present_count * COMPLETENESS_FIELD_WEIGHT
+
+
+def compute_dimension_scores(present: np.ndarray) -> np.ndarray:
+    """Vectorized quality dimensions for a chunk of resources.
+
+    Mirrors the per-resource ``QualityService._compute_*_dimension`` methods
+    and ``QualityScore.overall_score``.
+
+    Args:
+        present: (n, 5) boolean matrix, one column per ``COMPLETENESS_FIELDS`` entry
+
+    Returns:
+        (n, 6) matrix: the ``QUALITY_DIMENSIONS`` columns followed by the overall score
+    """
+    n = present.shape[0]
+    scores = np.empty((n, 6), dtype=np.float64)
+    scores[:, 0] = ACCURACY_BASELINE
+    scores[:, 1] = completeness_score(present.sum(axis=1))
+    scores[:, 2] = CONSISTENCY_BASELINE
+    scores[:, 3] = TIMELINESS_BASELINE
+    scores[:, 4] = RELEVANCE_BASELINE
+    scores[:, 5] = scores[:, :5] @ np.array(QUALITY_DIMENSION_WEIGHTS)
+    return scores
+
+
+def outlier_features(rows: List[Any]) -> np.ndarray:
+    """Outlier feature matrix for rows selecting ``OUTLIER_FEATURES`` after the ID.
+
+    Missing values are replaced with ``FEATURE_DEFAULT_VALUE``.
+    """
+    X = np.array(
+        [tuple(row[1 : 1 + len(OUTLIER_FEATURES)]) for row in rows], dtype=np.float64
+    )
+    X[np.isnan(X)] = FEATURE_DEFAULT_VALUE
+    return X
+
+
+def score_outliers(X: np.ndarray, model: Any) -> np.ndarray:
+    """Score a chunk with a fitted Isolation Forest.
+
+    Returns:
+        (n, 2) matrix of (prediction, anomaly score); prediction -1 marks outliers
+    """
+    scores = model.score_samples(X)
+    predictions = np.where(scores - model.offset_ < 0, -1, 1)
+    return np.column_stack([predictions, scores])
+
+
+# Per-process context installed by _init_worker (process pool mode)
+_worker_context: tuple = ()
+
+
+def _init_worker(context: tuple) -> None:
+    global _worker_context
+    _worker_context = context
+
+
+def _run_in_worker(fn: Callable, payload: Any) -> Any:
+    return fn(payload, *_worker_context)
+
+
+def _map_chunks(
+    fn: Callable,
+    chunks: Iterable[Tuple[Any, Any]],
+    workers: int,
+    context: tuple = (),
+) -> Iterator[Tuple[Any, Any]]:
+    """Apply ``fn(payload, *context)`` to each chunk, in order.
+
+    With ``workers > 1`` payloads are computed in a process pool (``context``
+    is shipped to each worker once) while the caller keeps reading and
+    writing chunks; at most ``2 * workers`` chunks are in flight. Daemonic
+    processes (e.g. Celery prefork children) cannot fork and compute inline.
+
+    Args:
+        fn: Module-level function of (payload, *context)
+        chunks: (meta, payload) pairs; ``meta`` stays in this process
+        workers: Worker processes (0 or 1 = inline)
+        context: Extra arguments for ``fn``
+
+    Yields:
+        (meta, result) pairs in input order
+    """
+    if workers > 1 and multiprocessing.current_process().daemon:
+        logger.warning(
+            "Quality sweep running inside a daemonic process, computing inline"
+        )
+        workers = 0
+
+    if workers <= 1:
+        for meta, payload in chunks:
+            yield meta, fn(payload, *context)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(context,)
+    ) as pool:
+        pending: Deque[Tuple[Any, Future]] = deque()
+        for meta, payload in chunks:
+            pending.append((meta, pool.submit(_run_in_worker, fn, payload)))
+            if len(pending) >= 2 * workers:
+                meta, future = pending.popleft()
+                yield meta, future.result()
+        while pending:
+            meta, future = pending.popleft()
+            yield meta, future.result()
+
+
 class QualityService:
     """Quality service for computing and monitoring resource quality."""
 
@@ -450,7 +647,7 @@ class QualityService:
         Raises:
             ValueError: If resource not found or weights are invalid
         """
-        from ..database.models import Resource
+        from ...database.models import Resource
 
         # Default weights
         if weights is None:
@@ -547,7 +744,7 @@ class QualityService:
         # Simplified accuracy calculation
         # In a real implementation, this would check data validation,
         # cross-references, citation accuracy, etc.
-        return 0.7
+        return ACCURACY_BASELINE
 
     def _compute_completeness_dimension(self, resource) -> float:
         """Compute completeness dimension score for a resource.
@@ -558,21 +755,11 @@ class QualityService:
         Returns:
             Completeness score between 0.0 and 1.0
         """
-        completeness = 0.0
-
         # Check presence of key metadata fields
-        if resource.title:
-            completeness += COMPLETENESS_FIELD_WEIGHT
-        if resource.description:
-            completeness += COMPLETENESS_FIELD_WEIGHT
-        if resource.creator:
-            completeness += COMPLETENESS_FIELD_WEIGHT
-        if resource.publication_year:
-            completeness += COMPLETENESS_FIELD_WEIGHT
-        if resource.doi:
-            completeness += COMPLETENESS_FIELD_WEIGHT
-
-        return completeness
+        present = sum(
+            1 for field in COMPLETENESS_FIELDS if getattr(resource, field, None)
+        )
+        return completeness_score(present)
 
     def _compute_consistency_dimension(self, resource) -> float:
         """Compute consistency dimension score for a resource.
@@ -586,7 +773,7 @@ class QualityService:
         # Simplified consistency calculation
         # In a real implementation, this would check for contradictions,
         # format consistency, naming consistency, etc.
-        return 0.75
+        return CONSISTENCY_BASELINE
 
     def _compute_timeliness_dimension(self, resource) -> float:
         """Compute timeliness dimension score for a resource.
@@ -600,7 +787,7 @@ class QualityService:
         # Simplified timeliness calculation
         # In a real implementation, this would check publication date,
         # last update time, relevance to current date, etc.
-        return 0.7
+        return TIMELINESS_BASELINE
 
     def _compute_relevance_dimension(self, resource) -> float:
         """Compute relevance dimension score for a resource.
@@ -614,7 +801,7 @@ class QualityService:
         # Simplified relevance calculation
         # In a real implementation, this would check topic relevance,
         # user context, search query matching, etc.
-        return 0.7
+        return RELEVANCE_BASELINE
 
     def _compute_weighted_overall_score(
         self,
@@ -680,69 +867,165 @@ class QualityService:
         resource.quality_computation_version = self.quality_version
         resource.quality_last_computed = datetime.now(timezone.utc)
 
+    def _sweep_options(
+        self, chunk_size: Optional[int], workers: Optional[int]
+    ) -> Tuple[int, int]:
+        """Resolve chunk size and worker count (defaults from settings)."""
+        if chunk_size is None or workers is None:
+            try:
+                from ...config.settings import get_settings
+
+                settings = get_settings()
+                default_chunk = settings.QUALITY_SWEEP_CHUNK_SIZE
+                default_workers = settings.QUALITY_SWEEP_WORKERS
+            except Exception:
+                default_chunk, default_workers = SWEEP_DEFAULT_CHUNK_SIZE, 0
+            chunk_size = default_chunk if chunk_size is None else chunk_size
+            workers = default_workers if workers is None else workers
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        return chunk_size, workers
+
+    def _iter_chunks(self, stmt, chunk_size: int) -> Iterator[List[Any]]:
+        """Page through a ``select(Resource.id, ...)`` statement by primary key.
+
+        Keyset pagination keeps each read short, so chunks can be committed
+        as they are written without holding a cursor open.
+        """
+        from ...database.models import Resource
+
+        last_id = None
+        while True:
+            page = stmt.order_by(Resource.id).limit(chunk_size)
+            if last_id is not None:
+                page = page.where(Resource.id > last_id)
+            rows = self.db.execute(page).all()
+            if not rows:
+                return
+            yield rows
+            if len(rows) < chunk_size:
+                return
+            last_id = rows[-1][0]
+
     def monitor_quality_degradation(
-        self, time_window_days: int = DEGRADATION_DEFAULT_WINDOW_DAYS
+        self,
+        time_window_days: int = DEGRADATION_DEFAULT_WINDOW_DAYS,
+        chunk_size: Optional[int] = None,
+        workers: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Monitor quality degradation over time.
 
+        Resources whose scores are older than the window are recomputed in
+        chunks: dimensions are computed vectorized per chunk (optionally in a
+        process pool) and written back with one bulk UPDATE and commit per
+        chunk. Drops above ``DEGRADATION_THRESHOLD`` are flagged for review.
+
         Args:
             time_window_days: Number of days to look back for old quality scores
+            chunk_size: Resources per chunk (default: QUALITY_SWEEP_CHUNK_SIZE)
+            workers: Worker processes (default: QUALITY_SWEEP_WORKERS, 0 = inline)
 
         Returns:
             List of dictionaries with degradation information for each degraded resource
         """
-        from ..database.models import Resource
+        from ...database.models import Resource
+        from .handlers import emit_quality_computed
 
+        chunk_size, workers = self._sweep_options(chunk_size, workers)
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=time_window_days)
 
         # Find resources with old quality scores
-        resources = (
-            self.db.query(Resource)
-            .filter(
-                Resource.quality_last_computed.isnot(None),
-                Resource.quality_last_computed < cutoff_date,
-                Resource.quality_overall.isnot(None),
-            )
-            .all()
+        stmt = select(
+            Resource.id,
+            *(getattr(Resource, field) for field in COMPLETENESS_FIELDS),
+            Resource.quality_overall,
+            Resource.needs_quality_review,
+        ).where(
+            Resource.quality_last_computed.isnot(None),
+            Resource.quality_last_computed < cutoff_date,
+            Resource.quality_overall.isnot(None),
         )
 
-        degraded = []
-
-        for resource in resources:
-            old_quality = resource.quality_overall
+        def chunks():
+            for rows in self._iter_chunks(stmt, chunk_size):
+                # object -> bool applies the same truthiness as the per-resource check
+                present = np.array(
+                    [tuple(row[1 : 1 + len(COMPLETENESS_FIELDS)]) for row in rows],
+                    dtype=object,
+                ).astype(bool)
+                yield rows, present
 
-            # Recompute quality - returns QualityScore object
-            quality_score = self.compute_quality(str(resource.id))
-            new_quality = quality_score.overall_score()
+        weights_json = json.dumps(DEFAULT_QUALITY_WEIGHTS)
+        degraded = []
 
-            # Check for degradation (>20% drop)
-            quality_drop = old_quality - new_quality
-            if quality_drop > DEGRADATION_THRESHOLD:
-                degradation_pct = (quality_drop / old_quality) * 100.0
+        for rows, scores in _map_chunks(compute_dimension_scores, chunks(), workers):
+            old = np.array([row.quality_overall for row in rows], dtype=np.float64)
+            drop = old - scores[:, 5]
+            flagged = drop > DEGRADATION_THRESHOLD
+            now = datetime.now(timezone.utc)
 
-                # Flag for review
-                resource.needs_quality_review = True
-                self.db.commit()
+            updates = []
+            for row, dims, is_degraded in zip(rows, scores.tolist(), flagged.tolist()):
+                updates.append(
+                    {
+                        "id": row.id,
+                        "quality_accuracy": dims[0],
+                        "quality_completeness": dims[1],
+                        "quality_consistency": dims[2],
+                        "quality_timeliness": dims[3],
+                        "quality_relevance": dims[4],
+                        "quality_overall": dims[5],
+                        "quality_score": dims[5],
+                        "quality_weights": weights_json,
+                        "quality_computation_version": self.quality_version,
+                        "quality_last_computed": now,
+                        "needs_quality_review": bool(row.needs_quality_review)
+                        or is_degraded,
+                    }
+                )
+            self.db.execute(update(Resource), updates)
+            self.db.commit()
+
+            for row, dims in zip(rows, scores.tolist()):
+                emit_quality_computed(
+                    resource_id=str(row.id),
+                    quality_score=dims[5],
+                    dimensions=dict(zip(QUALITY_DIMENSIONS, dims[:5])),
+                    computation_version=self.quality_version,
+                )
 
+            for i in np.flatnonzero(flagged):
+                row = rows[i]
                 degraded.append(
                     {
-                        "resource_id": str(resource.id),
-                        "title": resource.title,
-                        "old_quality": old_quality,
-                        "new_quality": new_quality,
-                        "degradation_pct": degradation_pct,
+                        "resource_id": str(row.id),
+                        "title": row.title,
+                        "old_quality": float(old[i]),
+                        "new_quality": float(scores[i, 5]),
+                        "degradation_pct": float(drop[i] / old[i] * 100.0),
                     }
                 )
 
         return degraded
 
     def detect_quality_outliers(
-        self, batch_size: int = OUTLIER_DEFAULT_BATCH_SIZE
+        self,
+        batch_size: int = OUTLIER_DEFAULT_BATCH_SIZE,
+        sample_size: Optional[int] = None,
+        workers: Optional[int] = None,
     ) -> int:
-        """Detect quality outliers using Isolation Forest.
+        """Detect quality outliers across the whole corpus using Isolation Forest.
+
+        The forest is fitted on a reproducible uniform sample of at most
+        ``sample_size`` resources (bottom-k of seeded random keys, drawn in
+        one streaming pass), then every resource with a quality score is
+        scored in chunks of ``batch_size`` (optionally in a process pool) and
+        written back with one bulk UPDATE per chunk.
 
         Args:
-            batch_size: Number of resources to process (default: 1000)
+            batch_size: Resources scored and written per chunk (default: 1000)
+            sample_size: Fitting sample size (default: QUALITY_OUTLIER_SAMPLE_SIZE)
+            workers: Worker processes (default: QUALITY_SWEEP_WORKERS, 0 = inline)
 
         Returns:
             Count of detected outliers
@@ -750,154 +1033,119 @@ class QualityService:
         Raises:
             ValueError: If fewer than 10 resources with quality scores exist
         """
-        from ..database.models import Resource
+        from ...database.models import Resource
         from sklearn.ensemble import IsolationForest
-        import numpy as np
-
-        # Query resources with quality scores in configurable batches
-        resources = (
-            self.db.query(Resource)
-            .filter(Resource.quality_overall.isnot(None))
-            .limit(batch_size)
-            .all()
-        )
+        from .handlers import emit_quality_outlier_detected
 
-        # Validate minimum resources for statistical validity
-        if len(resources) < OUTLIER_MIN_RESOURCES:
+        batch_size, workers = self._sweep_options(batch_size, workers)
+        if sample_size is None:
+            try:
+                from ...config.settings import get_settings
+
+                sample_size = get_settings().QUALITY_OUTLIER_SAMPLE_SIZE
+            except Exception:
+                sample_size = OUTLIER_DEFAULT_SAMPLE_SIZE
+        if sample_size < OUTLIER_MIN_RESOURCES:
             raise ValueError(
-                f"Outlier detection requires minimum {OUTLIER_MIN_RESOURCES} resources with quality scores"
+                f"sample_size must be at least {OUTLIER_MIN_RESOURCES}"
             )
 
-        # Build feature matrix from 5 quality dimensions plus 4 summary dimensions when available
-        feature_matrix = []
-        resource_list = []
-
-        for resource in resources:
-            features = []
+        stmt = select(
+            Resource.id,
+            *(getattr(Resource, field) for field in OUTLIER_FEATURES),
+            Resource.quality_overall,
+            Resource.needs_quality_review,
+        ).where(Resource.quality_overall.isnot(None))
+
+        # Pass 1: sample feature rows (keep the smallest random keys seen so far)
+        rng = np.random.default_rng(OUTLIER_RANDOM_STATE)
+        sample_keys = np.empty(0)
+        sample = np.empty((0, len(OUTLIER_FEATURES)))
+        total = 0
+        for rows in self._iter_chunks(stmt, batch_size):
+            total += len(rows)
+            sample_keys = np.concatenate([sample_keys, rng.random(len(rows))])
+            sample = np.vstack([sample, outlier_features(rows)])
+            if len(sample_keys) > sample_size:
+                keep = np.argpartition(sample_keys, sample_size)[:sample_size]
+                sample_keys, sample = sample_keys[keep], sample[keep]
 
-            # Add 5 quality dimensions
-            features.append(
-                resource.quality_accuracy
-                if resource.quality_accuracy is not None
-                else FEATURE_DEFAULT_VALUE
-            )
-            features.append(
-                resource.quality_completeness
-                if resource.quality_completeness is not None
-                else FEATURE_DEFAULT_VALUE
-            )
-            features.append(
-                resource.quality_consistency
-                if resource.quality_consistency is not None
-                else FEATURE_DEFAULT_VALUE
-            )
-            features.append(
-                resource.quality_timeliness
-                if resource.quality_timeliness is not None
-                else FEATURE_DEFAULT_VALUE
-            )
-            features.append(
-                resource.quality_relevance
-                if resource.quality_relevance is not None
-                else FEATURE_DEFAULT_VALUE
+        # Validate minimum resources for statistical validity
+        if total < OUTLIER_MIN_RESOURCES:
+            raise ValueError(
+                f"Outlier detection requires minimum {OUTLIER_MIN_RESOURCES} resources with quality scores"
             )
 
-            # Add 4 summary quality dimensions when available
-            if (
-                hasattr(resource, "summary_coherence")
-                and resource.summary_coherence is not None
-            ):
-                features.append(resource.summary_coherence)
-            else:
-                features.append(FEATURE_DEFAULT_VALUE)  # Neutral baseline
-
-            if (
-                hasattr(resource, "summary_consistency")
-                and resource.summary_consistency is not None
-            ):
-                features.append(resource.summary_consistency)
-            else:
-                features.append(FEATURE_DEFAULT_VALUE)
-
-            if (
-                hasattr(resource, "summary_fluency")
-                and resource.summary_fluency is not None
-            ):
-                features.append(resource.summary_fluency)
-            else:
-                features.append(FEATURE_DEFAULT_VALUE)
-
-            if (
-                hasattr(resource, "summary_relevance")
-                and resource.summary_relevance is not None
-            ):
-                features.append(resource.summary_relevance)
-            else:
-                features.append(FEATURE_DEFAULT_VALUE)
-
-            feature_matrix.append(features)
-            resource_list.append(resource)
-
-        # Convert to numpy array
-        X = np.array(feature_matrix)
-
         # Train Isolation Forest with configured parameters
         iso_forest = IsolationForest(
             contamination=OUTLIER_CONTAMINATION,
             n_estimators=OUTLIER_N_ESTIMATORS,
             random_state=OUTLIER_RANDOM_STATE,
         )
+        iso_forest.fit(sample)
 
-        # Fit and predict
-        predictions = iso_forest.fit_predict(X)
-
-        # Predict anomaly scores for all resources (lower scores = more anomalous)
-        anomaly_scores = iso_forest.score_samples(X)
+        def chunks():
+            for rows in self._iter_chunks(stmt, batch_size):
+                X = outlier_features(rows)
+                yield (rows, X), X
 
-        # Identify outliers where prediction equals -1
+        # Pass 2: score every resource, one bulk update per chunk
         outlier_count = 0
-
-        for i, (resource, prediction, anomaly_score) in enumerate(
-            zip(resource_list, predictions, anomaly_scores)
+        for (rows, X), result in _map_chunks(
+            score_outliers, chunks(), workers, context=(iso_forest,)
         ):
-            if prediction == -1:
-                # Call _identify_outlier_reasons for each outlier
-                reasons = self._identify_outlier_reasons(resource)
-
-                # Update resources with is_quality_outlier flag, outlier_score, outlier_reasons JSON, and needs_quality_review flag
-                resource.is_quality_outlier = True
-                resource.outlier_score = float(anomaly_score)
-                resource.outlier_reasons = json.dumps(reasons)
-                resource.needs_quality_review = True
-
-                # Emit quality.outlier_detected event
-                from .handlers import emit_quality_outlier_detected
-
+            # Non-zero dimensions below the threshold (missing ones default to neutral)
+            low = (X != 0) & (X < OUTLIER_THRESHOLD_LOW)
+            is_outlier = result[:, 0] == -1
+
+            updates = []
+            events = []
+            for i, row in enumerate(rows):
+                anomaly_score = float(result[i, 1])
+                if is_outlier[i]:
+                    reasons = [
+                        OUTLIER_REASON_NAMES[j] for j in np.flatnonzero(low[i])
+                    ]
+                    updates.append(
+                        {
+                            "id": row.id,
+                            "is_quality_outlier": True,
+                            "outlier_score": anomaly_score,
+                            "outlier_reasons": json.dumps(reasons),
+                            "needs_quality_review": True,
+                        }
+                    )
+                    events.append((row, anomaly_score, reasons))
+                else:
+                    # Clear outlier flags for non-outliers
+                    updates.append(
+                        {
+                            "id": row.id,
+                            "is_quality_outlier": False,
+                            "outlier_score": anomaly_score,
+                            "outlier_reasons": None,
+                            "needs_quality_review": bool(row.needs_quality_review),
+                        }
+                    )
+            self.db.execute(update(Resource), updates)
+            self.db.commit()
+
+            for row, anomaly_score, reasons in events:
                 emit_quality_outlier_detected(
-                    resource_id=str(resource.id),
-                    quality_score=resource.quality_overall or 0.0,
-                    outlier_score=float(anomaly_score),
+                    resource_id=str(row.id),
+                    quality_score=row.quality_overall or 0.0,
+                    outlier_score=anomaly_score,
                     dimensions={
-                        "accuracy": resource.quality_accuracy or 0.0,
-                        "completeness": resource.quality_completeness or 0.0,
-                        "consistency": resource.quality_consistency or 0.0,
-                        "timeliness": resource.quality_timeliness or 0.0,
-                        "relevance": resource.quality_relevance or 0.0,
+                        "accuracy": row.quality_accuracy or 0.0,
+                        "completeness": row.quality_completeness or 0.0,
+                        "consistency": row.quality_consistency or 0.0,
+                        "timeliness": row.quality_timeliness or 0.0,
+                        "relevance": row.quality_relevance or 0.0,
                     },
                     reason=", ".join(reasons) if reasons else "anomalous_pattern",
                 )
+            outlier_count += len(events)
 
-                outlier_count += 1
-            else:
-                # Clear outlier flags for non-outliers
-                resource.is_quality_outlier = False
-                resource.outlier_score = float(anomaly_score)
-                resource.outlier_reasons = None
-
-        # Commit updates to database
-        self.db.commit()
-
-        # Return count of detected outliers
         return outlier_count
 
     def _identify_outlier_reasons(self, resource) -> List[str]:
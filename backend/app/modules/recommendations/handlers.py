@@ -19,7 +19,7 @@ from typing import Dict, Any
 from uuid import UUID
 
 
-from app.shared.event_bus import event_bus
+from app.shared.event_bus import event_bus, DeliveryMode
 from app.shared.database import get_sync_db
 
 logger = logging.getLogger(__name__)
@@ -253,15 +253,25 @@ def register_handlers():
     Register all event handlers for the recommendations module.
 
     This function should be called during application startup to
-    subscribe to events from other modules.
+    subscribe to events from other modules. Profile updates open their own
+    session and are not needed by the emitting request, so every handler
+    is delivered asynchronously.
     """
     # Subscribe to resource events
-    event_bus.subscribe("resource.viewed", handle_resource_viewed)
+    event_bus.subscribe(
+        "resource.viewed", handle_resource_viewed, mode=DeliveryMode.ASYNC
+    )
 
     # Subscribe to annotation events
-    event_bus.subscribe("annotation.created", handle_annotation_created)
+    event_bus.subscribe(
+        "annotation.created", handle_annotation_created, mode=DeliveryMode.ASYNC
+    )
 
     # Subscribe to collection events
-    event_bus.subscribe("collection.resource_added", handle_collection_resource_added)
+    event_bus.subscribe(
+        "collection.resource_added",
+        handle_collection_resource_added,
+        mode=DeliveryMode.ASYNC,
+    )
 
     logger.info("Recommendations module event handlers registered")
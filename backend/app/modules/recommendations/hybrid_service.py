@@ -28,8 +28,9 @@ from uuid import UUID
 
 import numpy as np
 from sqlalchemy import desc, func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 
+from app.database.load_profiles import resource_profile
 from app.database.models import Resource, UserProfile, UserInteraction
 from .collaborative import CollaborativeFilteringService
 from .user_profile import UserProfileService
@@ -119,7 +120,7 @@ class HybridRecommendationService:
             if strategy in ["collaborative", "hybrid"] and use_collaborative:
                 try:
                     # Get all resources
-                    all_resources = self.db.query(Resource).limit(1000).all()
+                    all_resources = self.db.query(Resource.id).limit(1000).all()
                     resource_ids = [str(r.id) for r in all_resources]
 
                     # Get NCF predictions
@@ -161,6 +162,7 @@ class HybridRecommendationService:
                     # Find similar resources (cosine similarity > 0.3)
                     resources = (
                         self.db.query(Resource)
+                        .options(*resource_profile("vectors"))
                         .filter(Resource.embedding.isnot(None))
                         .limit(500)
                         .all()
@@ -371,10 +373,11 @@ class HybridRecommendationService:
             # Score each candidate
             scored_candidates = []
 
-            # Batch query resources to avoid N+1 problem
+            # Batch query resources to avoid N+1 problem (embeddings feed MMR)
             resource_ids = [candidate["resource_id"] for candidate in candidates]
             resources = (
                 self.db.query(Resource)
+                .options(*resource_profile("quality"), undefer(Resource.embedding))
                 .filter(Resource.id.in_(resource_ids))
                 .limit(1000)
                 .all()
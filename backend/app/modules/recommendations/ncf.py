@@ -15,18 +15,22 @@ Features:
 - Batch prediction for efficiency
 - Top-K recommendation generation
 - Cold start handling with popular items
-- Lazy model loading for efficiency
+- Lazy model loading, shared per process via app/shared/model_registry.py
 - GPU acceleration support
 """
 
 from __future__ import annotations
 
 import logging
+import os
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
+from ...shared.model_registry import get_model_registry, register_loader
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +40,108 @@ class NCFModelNotFoundError(Exception):
     pass
 
 
+class NCFCheckpoint:
+    """A loaded NCF model with its ID mappings (cached in the model registry)."""
+
+    def __init__(
+        self,
+        model,
+        device,
+        user_id_map: Dict[str, int],
+        item_id_map: Dict[str, int],
+        mtime_ns: int = 0,
+    ):
+        self.model = model
+        self.device = device
+        self.user_id_map = user_id_map
+        self.item_id_map = item_id_map
+        self.user_idx_to_id = {idx: uid for uid, idx in user_id_map.items()}
+        self.item_idx_to_id = {idx: iid for iid, idx in item_id_map.items()}
+        # Modification time of the file the weights were read from
+        self.mtime_ns = mtime_ns
+
+    def parameters(self):
+        """Model tensors (used by the registry to size the checkpoint)."""
+        return self.model.parameters()
+
+    def buffers(self):
+        """Model buffers (used by the registry to size the checkpoint)."""
+        return self.model.buffers()
+
+
+def load_ncf_checkpoint(model_path: str, device: str) -> Optional[NCFCheckpoint]:
+    """
+    Load an NCF checkpoint (model registry loader).
+
+    Algorithm:
+    1. Import torch and NCF model (lazy import)
+    2. Load checkpoint from disk
+    3. Extract model state dict, user/item mappings, and hyperparameters
+    4. Initialize NCF model with saved hyperparameters
+    5. Load model weights from state dict
+    6. Move model to the requested device ("auto": GPU if CUDA available)
+    7. Set model to evaluation mode
+
+    Returns:
+        Loaded checkpoint, or None if torch is not installed
+    """
+    try:
+        import torch
+    except ImportError:
+        return None
+    from app.models.ncf_model import NCFModel
+
+    # Load checkpoint (mtime first, so a concurrent overwrite reads as stale)
+    logger.info(f"Loading checkpoint from {model_path}")
+    mtime_ns = os.stat(model_path).st_mtime_ns
+    checkpoint = torch.load(model_path, map_location="cpu")
+
+    # Extract mappings
+    user_id_map = checkpoint.get("user_id_map", {})
+    item_id_map = checkpoint.get("item_id_map", {})
+    logger.info(
+        f"Loaded mappings: {len(user_id_map)} users, {len(item_id_map)} items"
+    )
+
+    # Extract hyperparameters
+    num_users = checkpoint.get("num_users", len(user_id_map))
+    num_items = checkpoint.get("num_items", len(item_id_map))
+    embedding_dim = checkpoint.get("embedding_dim", 64)
+    hidden_layers = checkpoint.get("hidden_layers", [128, 64, 32])
+
+    logger.info(
+        f"Model hyperparameters: num_users={num_users}, num_items={num_items}, "
+        f"embedding_dim={embedding_dim}, hidden_layers={hidden_layers}"
+    )
+
+    # Initialize model and load weights
+    model = NCFModel(
+        num_users=num_users,
+        num_items=num_items,
+        embedding_dim=embedding_dim,
+        hidden_layers=hidden_layers,
+    )
+    model.load_state_dict(checkpoint["model_state_dict"])
+
+    # Move to GPU if available
+    if device == "auto":
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    torch_device = torch.device(device)
+    model = model.to(torch_device)
+
+    # Set model to evaluation mode
+    model.eval()
+
+    # Log training metrics if available
+    if "training_metrics" in checkpoint:
+        logger.info(f"Training metrics: {checkpoint['training_metrics']}")
+
+    return NCFCheckpoint(model, torch_device, user_id_map, item_id_map, mtime_ns)
+
+
+register_loader("ncf", load_ncf_checkpoint)
+
+
 class NCFService:
     """
     Neural Collaborative Filtering service for recommendations.
@@ -63,130 +169,55 @@ class NCFService:
 
         self.model_path = Path(model_path)
 
-        # Lazy loading: Initialize as None, load on first use
-        self.model = None
-        self.device = None
-
-        # ID mappings: string user/item IDs <-> integer indices
-        self.user_id_map: Dict[str, int] = {}  # {"user_uuid": 0, ...}
-        self.item_id_map: Dict[str, int] = {}  # {"resource_uuid": 0, ...}
-
-        # Reverse mappings for converting back
-        self.user_idx_to_id: Dict[int, str] = {}
-        self.item_idx_to_id: Dict[int, str] = {}
-
         logger.info(f"NCFService initialized with model_path={self.model_path}")
 
-    def _load_model(self) -> None:
+    @contextmanager
+    def _lease(self) -> Iterator[NCFCheckpoint]:
         """
-        Load NCF model and mappings with lazy loading.
+        Lease the NCF checkpoint (model, device and ID mappings) for one call.
 
         Algorithm:
-        1. Check if model already loaded (skip if yes)
-        2. Import torch and NCF model (lazy import)
-        3. Check if checkpoint file exists
-        4. Load checkpoint from disk
-        5. Extract model state dict, user/item mappings, and hyperparameters
-        6. Initialize NCF model with saved hyperparameters
-        7. Load model weights from state dict
-        8. Move model to GPU if CUDA available, otherwise CPU
-        9. Set model to evaluation mode
-
-        This method is called automatically on first prediction request.
-        Lazy loading improves startup time and memory efficiency.
+        1. Check if checkpoint file exists
+        2. Resolve the checkpoint through the shared model registry, which
+           loads it once per process (see ``load_ncf_checkpoint``)
+        3. If the file was overwritten since it was loaded (train_ncf.py,
+           CollaborativeFilteringService), unload the stale entry and load
+           the new weights
+        4. Hold the checkpoint until the block exits
+
+        The checkpoint is never kept on the service, so the registry can
+        evict it between calls.
 
         Raises:
             NCFModelNotFoundError: If checkpoint file not found
             Exception: If model loading fails
         """
-        # Skip if already loaded
-        if self.model is not None:
-            logger.debug("Model already loaded, skipping")
-            return
-
-        logger.info("Loading NCF model and mappings...")
-
-        try:
-            # Lazy import of ML libraries
-            import torch
-            from app.models.ncf_model import NCFModel
-
-            # Check if checkpoint exists
-            if not self.model_path.exists():
-                raise NCFModelNotFoundError(
-                    f"NCF model checkpoint not found at {self.model_path}. "
-                    "Please train the model first using: "
-                    "python backend/scripts/train_ncf.py"
-                )
-
-            # Load checkpoint
-            logger.info(f"Loading checkpoint from {self.model_path}")
-            checkpoint = torch.load(self.model_path, map_location="cpu")
-
-            # Extract mappings
-            self.user_id_map = checkpoint.get("user_id_map", {})
-            self.item_id_map = checkpoint.get("item_id_map", {})
-
-            # Create reverse mappings
-            self.user_idx_to_id = {
-                idx: user_id for user_id, idx in self.user_id_map.items()
-            }
-            self.item_idx_to_id = {
-                idx: item_id for item_id, idx in self.item_id_map.items()
-            }
-
-            logger.info(
-                f"Loaded mappings: {len(self.user_id_map)} users, "
-                f"{len(self.item_id_map)} items"
-            )
-
-            # Extract hyperparameters
-            num_users = checkpoint.get("num_users", len(self.user_id_map))
-            num_items = checkpoint.get("num_items", len(self.item_id_map))
-            embedding_dim = checkpoint.get("embedding_dim", 64)
-            hidden_layers = checkpoint.get("hidden_layers", [128, 64, 32])
-
-            logger.info(
-                f"Model hyperparameters: num_users={num_users}, num_items={num_items}, "
-                f"embedding_dim={embedding_dim}, hidden_layers={hidden_layers}"
-            )
-
-            # Initialize model
-            self.model = NCFModel(
-                num_users=num_users,
-                num_items=num_items,
-                embedding_dim=embedding_dim,
-                hidden_layers=hidden_layers,
+        # Check if checkpoint exists
+        if not self.model_path.exists():
+            raise NCFModelNotFoundError(
+                f"NCF model checkpoint not found at {self.model_path}. "
+                "Please train the model first using: "
+                "python backend/scripts/train_ncf.py"
             )
 
-            # Load model weights
-            self.model.load_state_dict(checkpoint["model_state_dict"])
-            logger.info("Model weights loaded successfully")
-
-            # Move to GPU if available
-            if torch.cuda.is_available():
-                logger.info("CUDA available, moving model to GPU")
-                self.model = self.model.cuda()
-                self.device = torch.device("cuda")
-            else:
-                logger.info("CUDA not available, using CPU")
-                self.device = torch.device("cpu")
-
-            # Set model to evaluation mode
-            self.model.eval()
-            logger.info("Model set to evaluation mode")
-
-            # Log training metrics if available
-            if "training_metrics" in checkpoint:
-                metrics = checkpoint["training_metrics"]
-                logger.info(f"Training metrics: {metrics}")
-
-        except NCFModelNotFoundError:
-            raise
-
-        except Exception as e:
-            logger.error(f"Failed to load NCF model: {e}")
-            raise Exception(f"NCF model loading failed: {e}") from e
+        registry = get_model_registry()
+        key = str(self.model_path)
+        with ExitStack() as stack:
+            try:
+                cached = registry.get("ncf", key)
+                if (
+                    cached is not None
+                    and cached.mtime_ns != self.model_path.stat().st_mtime_ns
+                ):
+                    logger.info(f"NCF checkpoint {key} changed on disk, reloading")
+                    registry.unload("ncf", key)
+                bundle = stack.enter_context(registry.use("ncf", key))
+            except Exception as e:
+                logger.error(f"Failed to load NCF model: {e}")
+                raise Exception(f"NCF model loading failed: {e}") from e
+            if bundle is None:
+                raise Exception("NCF model loading failed: torch is not available")
+            yield bundle
 
     def predict(self, user_id: str, item_ids: List[str]) -> Dict[str, float]:
         """
@@ -207,7 +238,7 @@ class NCFService:
             For unknown users or items, returns empty dict or skips those items.
 
         Algorithm:
-        1. Load model if not already loaded (lazy loading)
+        1. Lease the checkpoint from the model registry (loaded on first use)
         2. Convert user_id to index using mapping
         3. Convert item_ids to indices using mapping
         4. Create tensors for user and item indices
@@ -216,27 +247,30 @@ class NCFService:
 
         Performance: <50ms for typical batch sizes
         """
-        # Ensure model is loaded
-        if self.model is None:
-            self._load_model()
+        with self._lease() as ncf:
+            return self._predict(ncf, user_id, item_ids)
 
+    def _predict(
+        self, ncf: NCFCheckpoint, user_id: str, item_ids: List[str]
+    ) -> Dict[str, float]:
+        """Score items for a user with a leased checkpoint (see ``predict``)."""
         import torch
 
         # Check if user is in mapping
-        if user_id not in self.user_id_map:
+        if user_id not in ncf.user_id_map:
             logger.warning(f"User {user_id} not in training data (cold start)")
             return {}
 
-        user_idx = self.user_id_map[user_id]
+        user_idx = ncf.user_id_map[user_id]
 
         # Convert item IDs to indices, skip unknown items
         valid_items = []
         valid_indices = []
 
         for item_id in item_ids:
-            if item_id in self.item_id_map:
+            if item_id in ncf.item_id_map:
                 valid_items.append(item_id)
-                valid_indices.append(self.item_id_map[item_id])
+                valid_indices.append(ncf.item_id_map[item_id])
             else:
                 logger.debug(f"Item {item_id} not in training data, skipping")
 
@@ -249,13 +283,13 @@ class NCFService:
         item_tensor = torch.tensor(valid_indices, dtype=torch.long)
 
         # Move to device
-        user_tensor = user_tensor.to(self.device)
-        item_tensor = item_tensor.to(self.device)
+        user_tensor = user_tensor.to(ncf.device)
+        item_tensor = item_tensor.to(ncf.device)
 
         # Forward pass
-        self.model.eval()
+        ncf.model.eval()
         with torch.no_grad():
-            scores = self.model.predict(user_tensor, item_tensor)
+            scores = ncf.model.predict(user_tensor, item_tensor)
 
         # Convert to dictionary
         scores = scores.cpu().numpy().flatten()
@@ -316,19 +350,17 @@ class NCFService:
 
         Performance: <50ms for typical catalog sizes
         """
-        # Ensure model is loaded
-        if self.model is None:
-            self._load_model()
-
         # Check if user is in training data
-        if user_id not in self.user_id_map:
+        with self._lease() as ncf:
+            known_user = user_id in ncf.user_id_map
+        if not known_user:
             logger.info(f"User {user_id} not in training data, using cold start")
             return self._handle_cold_start(user_id, top_k)
 
         from app.database.models import Resource, UserInteraction
 
         # Query all resources
-        resources = self.db.query(Resource).all()
+        resources = self.db.query(Resource.id).all()
         candidate_item_ids = [str(resource.id) for resource in resources]
 
         logger.debug(f"Found {len(candidate_item_ids)} candidate items")
@@ -258,8 +258,8 @@ def get_top_subjects(db: Session, limit: int = 10) -> List[str]:
     try:
         from app.database.models import Resource
 
-        # Query resources and extract subjects
-        resources = db.query(Resource).filter(Resource.subject.isnot(None)).all()
+        # Query only the subject column
+        resources = db.query(Resource.subject).filter(Resource.subject.isnot(None)).all()
 
         # Count subject occurrences
         subject_counts = {}
@@ -13,6 +13,7 @@ from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 import logging
 
+from app.database.load_profiles import resource_profile
 from app.domain.recommendation import Recommendation, RecommendationScore
 
 logger = logging.getLogger(__name__)
@@ -251,6 +252,7 @@ class ContentBasedStrategy(RecommendationStrategy):
             interacted_ids = {str(i.resource_id) for i in interactions}
             candidates = (
                 self.db.query(Resource)
+                .options(*resource_profile("vectors"))
                 .filter(
                     Resource.embedding.isnot(None), ~Resource.id.in_(interacted_ids)
                 )
@@ -323,6 +325,7 @@ class ContentBasedStrategy(RecommendationStrategy):
         for interaction in interactions:
             resource = (
                 self.db.query(Resource)
+                .options(*resource_profile("vectors"))
                 .filter(Resource.id == interaction.resource_id)
                 .first()
             )
@@ -20,6 +20,7 @@ import numpy as np
 from sqlalchemy import desc
 from sqlalchemy.orm import Session
 
+from app.database.load_profiles import resource_profile
 from app.database.models import UserProfile, UserInteraction, Resource
 from app.utils.performance_monitoring import timing_decorator, metrics
 from ...shared.event_bus import event_bus, EventPriority
@@ -467,6 +468,7 @@ class UserProfileService:
             resource_ids = [interaction.resource_id for interaction in interactions]
             resources = (
                 self.db.query(Resource)
+                .options(*resource_profile("vectors"))
                 .filter(Resource.id.in_(resource_ids))
                 .limit(100)
                 .all()
@@ -624,7 +626,12 @@ class UserProfileService:
         if not resource_ids:
             return []
 
-        resources = self.db.query(Resource).filter(Resource.id.in_(resource_ids)).all()
+        resources = (
+            self.db.query(Resource)
+            .options(*resource_profile("card"))
+            .filter(Resource.id.in_(resource_ids))
+            .all()
+        )
 
         for resource in resources:
             if resource.subject:
@@ -1,16 +1,23 @@
 """Repository ingestion service for code intelligence pipeline."""
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Dict, Any
+import asyncio
+import hashlib
 import logging
+import os
 import tempfile
 import shutil
+import uuid
 
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 import pathspec
 import git
 
-from app.database.models import Resource
+from app.database.models import RepoFileManifest, Resource
 from app.modules.resources.logic.classification import classify_file
 
 
@@ -21,6 +28,19 @@ logger = logging.getLogger(__name__)
 _GITIGNORE_CACHE: Dict[str, Optional[pathspec.PathSpec]] = {}
 
 
+@dataclass
+class _FileSnapshot:
+    """A repository file read, hashed and classified off the event loop."""
+
+    path: Path
+    relative_path: str
+    content: str
+    content_hash: str
+    size: int
+    classification: str
+    language: Optional[str]
+
+
 class RepoIngestionService:
     """Service for ingesting code repositories into Neo Alexandria."""
 
@@ -34,20 +54,34 @@ class RepoIngestionService:
         self.db = db
 
     async def crawl_directory(
-        self, root_path: Path, track_errors: bool = True, batch_size: int = 50
+        self,
+        root_path: Path,
+        track_errors: bool = True,
+        batch_size: int = 50,
+        repo_key: Optional[str] = None,
+        max_workers: Optional[int] = None,
     ) -> tuple[List[Resource], Dict[str, Any]]:
         """
-        Recursively crawl directory and create Resources.
+        Recursively crawl directory and create or update Resources.
         Respects .gitignore rules and filters binary files.
         Processes files in batches with transaction management.
 
+        Ingestion is incremental: every file is recorded in a content-hash
+        manifest (RepoFileManifest) keyed by ``repo_key``. On re-ingestion,
+        unchanged files are skipped and changed files update their existing
+        Resource. Ignored directories are pruned during the walk, and file
+        reads, hashing and classification run in a thread pool while the
+        previous batch is written.
+
         Args:
             root_path: Root directory to crawl
             track_errors: Whether to track failed files in metadata
             batch_size: Number of files to process per batch (default: 50)
+            repo_key: Manifest key for the repository (default: root_path)
+            max_workers: Thread pool size for file reads (default: executor default)
 
         Returns:
-            Tuple of (List of created Resource objects, Error metadata dict)
+            Tuple of (List of created or updated Resource objects, Error metadata dict)
 
         Raises:
             ValueError: If root_path does not exist or is not a directory
@@ -58,102 +92,109 @@ class RepoIngestionService:
         if not root_path.is_dir():
             raise ValueError(f"Path is not a directory: {root_path}")
 
+        repo_key = repo_key or str(root_path)
         logger.info(f"Starting directory crawl: {root_path} (batch_size={batch_size})")
 
         # Load .gitignore patterns
         gitignore_spec = self._load_gitignore(root_path)
 
-        # Discover all files using generator to avoid loading all into memory
-        all_resources = []
-        file_count = 0
-        skipped_count = 0
-        failed_files = []  # Track failed files
-
-        # Use generator for memory-efficient directory traversal
-        def discover_files():
-            """Generator that yields files to process."""
-            nonlocal file_count, skipped_count
-            for file_path in root_path.rglob("*"):
-                # Skip directories
-                if file_path.is_dir():
-                    continue
-
-                file_count += 1
-
-                # Skip .gitignore file itself
-                if file_path.name == ".gitignore":
-                    skipped_count += 1
-                    logger.debug(f"Skipping .gitignore file: {file_path}")
-                    continue
-
-                # Check if file should be ignored
-                if self.should_ignore_file(file_path, root_path, gitignore_spec):
-                    skipped_count += 1
-                    logger.debug(f"Skipping ignored file: {file_path}")
-                    continue
+        files_to_process, file_count, skipped_count, pruned_count = self._walk_files(
+            root_path, gitignore_spec
+        )
 
-                # Check if file is binary
-                if self._is_binary_file(file_path):
-                    skipped_count += 1
-                    logger.debug(f"Skipping binary file: {file_path}")
-                    continue
+        # Manifest of previously ingested files: path -> (manifest id, hash, resource id)
+        manifest = await self._load_manifest(repo_key)
 
-                yield file_path
+        all_resources = []
+        created_count = 0
+        updated_count = 0
+        unchanged_count = 0
+        failed_files = []  # Track failed files
 
-        # Collect files in batches using generator
-        files_to_process = list(discover_files())
+        def track_failure(file_path: Path, error: str, error_type: str) -> None:
+            if not track_errors:
+                return
+            relative_path = str(file_path.relative_to(root_path))
+            # Only add if not already tracked
+            if not any(f["path"] == relative_path for f in failed_files):
+                failed_files.append(
+                    {"path": relative_path, "error": error, "error_type": error_type}
+                )
 
         # Process files in batches
         total_batches = (len(files_to_process) + batch_size - 1) // batch_size
         logger.info(
-            f"Processing {len(files_to_process)} files in {total_batches} batches"
+            f"Processing {len(files_to_process)} files in {total_batches} batches "
+            f"({len(manifest)} files in manifest)"
         )
 
-        for batch_num in range(total_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min(start_idx + batch_size, len(files_to_process))
-            batch_files = files_to_process[start_idx:end_idx]
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="repo-ingest"
+        ) as executor:
 
-            logger.debug(
-                f"Processing batch {batch_num + 1}/{total_batches} ({len(batch_files)} files)"
-            )
+            def read_batch(batch_num: int):
+                batch_files = files_to_process[
+                    batch_num * batch_size : (batch_num + 1) * batch_size
+                ]
+                return asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            executor, self._read_file, file_path, root_path
+                        )
+                        for file_path in batch_files
+                    ),
+                    return_exceptions=True,
+                )
 
-            # Process batch with transaction management
-            batch_resources = []
-            try:
-                for file_path in batch_files:
-                    # Create Resource with error handling
-                    try:
-                        resource = await self._create_resource_from_file(
-                            file_path=file_path, root_path=root_path
+            pending_read = read_batch(0) if total_batches else None
+
+            for batch_num in range(total_batches):
+                batch_files = files_to_process[
+                    batch_num * batch_size : (batch_num + 1) * batch_size
+                ]
+                snapshots = await pending_read
+
+                # Read the next batch while this one is written
+                if batch_num + 1 < total_batches:
+                    pending_read = read_batch(batch_num + 1)
+
+                logger.debug(
+                    f"Processing batch {batch_num + 1}/{total_batches} ({len(batch_files)} files)"
+                )
+
+                new_files = []
+                changed_files = []
+                for file_path, snapshot in zip(batch_files, snapshots):
+                    if isinstance(snapshot, Exception):
+                        logger.error(
+                            f"Failed to create resource for {file_path}: {snapshot}"
                         )
-                        batch_resources.append(resource)
-                    except Exception as e:
-                        error_msg = f"Failed to create resource for {file_path}: {e}"
-                        logger.error(error_msg, exc_info=True)
-
-                        # Track failed file if requested
-                        if track_errors:
-                            relative_path = str(file_path.relative_to(root_path))
-                            failed_files.append(
-                                {
-                                    "path": relative_path,
-                                    "error": str(e),
-                                    "error_type": type(e).__name__,
-                                }
-                            )
-
-                        # Continue processing other files in batch
+                        track_failure(file_path, str(snapshot), type(snapshot).__name__)
                         continue
 
-                # Commit batch transaction
+                    if snapshot is None:
+                        skipped_count += 1
+                        logger.debug(f"Skipping binary file: {file_path}")
+                        continue
+
+                    entry = manifest.get(snapshot.relative_path)
+                    if entry is None:
+                        new_files.append(snapshot)
+                    elif entry[1] == snapshot.content_hash:
+                        unchanged_count += 1
+                    else:
+                        changed_files.append(snapshot)
+
+                if not new_files and not changed_files:
+                    continue
+
+                # Write batch with transaction management
                 try:
-                    await self.db.commit()
-                    all_resources.extend(batch_resources)
-                    logger.debug(
-                        f"Batch {batch_num + 1}/{total_batches} committed: "
-                        f"{len(batch_resources)} resources created"
+                    batch_resources, manifest_updates = await self._write_batch(
+                        repo_key, root_path, new_files, changed_files, manifest
                     )
+                    await self.db.commit()
                 except Exception as e:
                     # Rollback on database error
                     logger.error(
@@ -163,78 +204,245 @@ class RepoIngestionService:
                     await self.db.rollback()
 
                     # Track all files in this batch as failed
-                    if track_errors:
-                        for file_path in batch_files:
-                            relative_path = str(file_path.relative_to(root_path))
-                            # Only add if not already tracked
-                            if not any(
-                                f["path"] == relative_path for f in failed_files
-                            ):
-                                failed_files.append(
-                                    {
-                                        "path": relative_path,
-                                        "error": f"Database transaction failed: {e}",
-                                        "error_type": "DatabaseError",
-                                    }
-                                )
+                    for snapshot in new_files + changed_files:
+                        track_failure(
+                            snapshot.path,
+                            f"Database transaction failed: {e}",
+                            "DatabaseError",
+                        )
 
                     # Continue with next batch
                     continue
 
-            except Exception as e:
-                # Unexpected error in batch processing
-                logger.error(
-                    f"Unexpected error in batch {batch_num + 1}: {e}", exc_info=True
+                manifest.update(manifest_updates)
+                all_resources.extend(batch_resources)
+                created_count += len(new_files)
+                updated_count += len(changed_files)
+                logger.debug(
+                    f"Batch {batch_num + 1}/{total_batches} committed: "
+                    f"{len(new_files)} resources created, {len(changed_files)} updated"
                 )
-                await self.db.rollback()
-
-                # Track all files in this batch as failed
-                if track_errors:
-                    for file_path in batch_files:
-                        relative_path = str(file_path.relative_to(root_path))
-                        if not any(f["path"] == relative_path for f in failed_files):
-                            failed_files.append(
-                                {
-                                    "path": relative_path,
-                                    "error": f"Batch processing failed: {e}",
-                                    "error_type": type(e).__name__,
-                                }
-                            )
-
-                # Continue with next batch
-                continue
 
         # Build error metadata
         error_metadata = {
             "total_files": file_count,
             "successful": len(all_resources),
+            "created": created_count,
+            "updated": updated_count,
+            "unchanged": unchanged_count,
             "skipped": skipped_count,
+            "directories_pruned": pruned_count,
             "failed": len(failed_files),
             "failed_files": failed_files,
             "batches_processed": total_batches,
         }
 
         logger.info(
-            f"Directory crawl complete: {len(all_resources)} resources created, "
+            f"Directory crawl complete: {created_count} resources created, "
+            f"{updated_count} updated, {unchanged_count} unchanged, "
             f"{skipped_count} files skipped, {len(failed_files)} files failed "
-            f"out of {file_count} total files ({total_batches} batches)"
+            f"out of {file_count} total files ({total_batches} batches, "
+            f"{pruned_count} ignored directories pruned)"
         )
 
         return all_resources, error_metadata
 
+    def _walk_files(
+        self, root_path: Path, gitignore_spec: Optional[pathspec.PathSpec]
+    ) -> tuple[List[Path], int, int, int]:
+        """
+        Walk the repository, pruning ignored directories before descending.
+
+        Git does not re-include files below an excluded directory, so ignored
+        directories (and ``.git``) are never entered.
+
+        Args:
+            root_path: Root directory of the repository
+            gitignore_spec: Compiled .gitignore patterns
+
+        Returns:
+            Tuple of (files to process, files seen, files skipped, directories pruned)
+        """
+        files = []
+        file_count = 0
+        skipped_count = 0
+        pruned_count = 0
+
+        for dir_path, dir_names, file_names in os.walk(root_path):
+            current = Path(dir_path)
+
+            kept_dirs = []
+            for name in sorted(dir_names):
+                if name == ".git" or (
+                    gitignore_spec is not None
+                    and self._is_ignored_dir(current / name, root_path, gitignore_spec)
+                ):
+                    pruned_count += 1
+                    logger.debug(f"Pruning ignored directory: {current / name}")
+                    continue
+                kept_dirs.append(name)
+            # Modifying dir_names in place prunes the walk
+            dir_names[:] = kept_dirs
+
+            for name in sorted(file_names):
+                file_path = current / name
+                file_count += 1
+
+                # Skip .gitignore file itself
+                if name == ".gitignore":
+                    skipped_count += 1
+                    logger.debug(f"Skipping .gitignore file: {file_path}")
+                    continue
+
+                # Check if file should be ignored
+                if self.should_ignore_file(file_path, root_path, gitignore_spec):
+                    skipped_count += 1
+                    logger.debug(f"Skipping ignored file: {file_path}")
+                    continue
+
+                files.append(file_path)
+
+        return files, file_count, skipped_count, pruned_count
+
+    def _is_ignored_dir(
+        self, dir_path: Path, root_path: Path, gitignore_spec: pathspec.PathSpec
+    ) -> bool:
+        """Check a directory against .gitignore rules (trailing slash form)."""
+        relative_path_str = str(dir_path.relative_to(root_path)).replace("\\", "/")
+        return gitignore_spec.match_file(relative_path_str + "/")
+
+    async def _load_manifest(self, repo_key: str) -> Dict[str, tuple]:
+        """
+        Load the content-hash manifest of a repository.
+
+        Args:
+            repo_key: Manifest key for the repository
+
+        Returns:
+            Dict mapping relative path to (manifest id, content hash, resource id)
+        """
+        result = await self.db.execute(
+            select(
+                RepoFileManifest.path,
+                RepoFileManifest.id,
+                RepoFileManifest.content_hash,
+                RepoFileManifest.resource_id,
+            ).where(RepoFileManifest.repo_key == repo_key)
+        )
+        return {
+            path: (manifest_id, content_hash, resource_id)
+            for path, manifest_id, content_hash, resource_id in result.all()
+        }
+
+    async def _write_batch(
+        self,
+        repo_key: str,
+        root_path: Path,
+        new_files: List["_FileSnapshot"],
+        changed_files: List["_FileSnapshot"],
+        manifest: Dict[str, tuple],
+    ) -> tuple[List[Resource], Dict[str, tuple]]:
+        """
+        Insert new files and update changed files of one batch (no commit).
+
+        New Resources and their manifest entries are added in one flush;
+        changed files update their existing Resource, loaded with one query,
+        and their manifest entries with one bulk UPDATE.
+
+        Args:
+            repo_key: Manifest key for the repository
+            root_path: Root directory of the repository
+            new_files: Files not yet in the manifest
+            changed_files: Files whose content hash changed
+            manifest: Current manifest (not modified)
+
+        Returns:
+            Tuple of (created and updated Resources, manifest entries to apply
+            after commit)
+        """
+        resources = []
+        manifest_updates = {}
+        new_rows = []
+
+        existing = {}
+        if changed_files:
+            resource_ids = [manifest[s.relative_path][2] for s in changed_files]
+            result = await self.db.execute(
+                select(Resource).where(Resource.id.in_(resource_ids))
+            )
+            existing = {resource.id: resource for resource in result.scalars()}
+
+        manifest_rows = []
+        for snapshot in changed_files:
+            manifest_id, _, resource_id = manifest[snapshot.relative_path]
+            resource = existing.get(resource_id)
+            if resource is None:
+                # Resource was deleted since the last run: recreate it
+                resource = Resource(
+                    id=uuid.uuid4(), **self._resource_fields(snapshot, root_path)
+                )
+                new_rows.append(resource)
+            else:
+                for field, value in self._resource_fields(snapshot, root_path).items():
+                    setattr(resource, field, value)
+            resources.append(resource)
+            manifest_rows.append(
+                {
+                    "id": manifest_id,
+                    "content_hash": snapshot.content_hash,
+                    "size": snapshot.size,
+                    "resource_id": resource.id,
+                }
+            )
+            manifest_updates[snapshot.relative_path] = (
+                manifest_id,
+                snapshot.content_hash,
+                resource.id,
+            )
+
+        for snapshot in new_files:
+            resource = Resource(
+                id=uuid.uuid4(), **self._resource_fields(snapshot, root_path)
+            )
+            entry = RepoFileManifest(
+                id=uuid.uuid4(),
+                repo_key=repo_key,
+                path=snapshot.relative_path,
+                content_hash=snapshot.content_hash,
+                size=snapshot.size,
+                resource_id=resource.id,
+            )
+            new_rows.extend((resource, entry))
+            resources.append(resource)
+            manifest_updates[snapshot.relative_path] = (
+                entry.id,
+                snapshot.content_hash,
+                resource.id,
+            )
+
+        self.db.add_all(new_rows)
+        await self.db.flush()
+        if manifest_rows:
+            await self.db.execute(update(RepoFileManifest), manifest_rows)
+
+        return resources, manifest_updates
+
     async def clone_and_ingest(
         self, git_url: str, track_errors: bool = True, batch_size: int = 50
     ) -> tuple[List[Resource], Dict[str, Any]]:
         """
         Clone Git repository and ingest contents.
 
+        Files unchanged since the last ingestion of the same URL are skipped
+        (see crawl_directory).
+
         Args:
             git_url: Git repository URL (https only)
             track_errors: Whether to track failed files in metadata
             batch_size: Number of files to process per batch (default: 50)
 
         Returns:
-            Tuple of (List of created Resource objects, Error metadata dict)
+            Tuple of (List of created or updated Resource objects, Error metadata dict)
 
         Raises:
             ValueError: If git_url is invalid or clone fails
@@ -267,30 +475,34 @@ class RepoIngestionService:
 
             logger.info(f"Repository cloned: commit={commit_hash}, branch={branch}")
 
-            # Crawl the cloned repository with batch processing
+            # Crawl the cloned repository with batch processing. Clones land in a
+            # new temp directory each time, so the manifest is keyed by URL.
             resources, error_metadata = await self.crawl_directory(
-                temp_path, track_errors=track_errors, batch_size=batch_size
+                temp_path,
+                track_errors=track_errors,
+                batch_size=batch_size,
+                repo_key=git_url,
             )
 
-            # Add Git metadata to all resources using relation field
+            # Add Git metadata to created/updated resources using relation field
             # Format: "git:commit_hash", "git:branch", "git:url"
+            git_relations = [
+                f"git:commit:{commit_hash}",
+                f"git:branch:{branch}",
+                f"git:url:{git_url}",
+            ]
             for resource in resources:
-                git_relations = [
-                    f"git:commit:{commit_hash}",
-                    f"git:branch:{branch}",
-                    f"git:url:{git_url}",
-                ]
-                # Append to existing relations
-                if resource.relation:
-                    resource.relation.extend(git_relations)
-                else:
-                    resource.relation = git_relations
+                # Assign a new list (JSON columns don't track in-place changes)
+                resource.relation = [
+                    r for r in (resource.relation or []) if not r.startswith("git:")
+                ] + git_relations
 
             # Commit final changes to database
             await self.db.commit()
 
             logger.info(
-                f"Repository ingestion complete: {len(resources)} resources created"
+                f"Repository ingestion complete: {len(resources)} resources created "
+                f"or updated, {error_metadata['unchanged']} unchanged"
             )
 
             return resources, error_metadata
@@ -386,99 +598,100 @@ class RepoIngestionService:
             _GITIGNORE_CACHE[cache_key] = None
             return None
 
-    def _is_binary_file(self, file_path: Path) -> bool:
+    def _read_file(self, file_path: Path, root_path: Path) -> Optional["_FileSnapshot"]:
         """
-        Check if file is binary by looking for null bytes.
+        Read, hash and classify a file (runs in the ingestion thread pool).
+
+        The file is read once: the first 8KB are checked for null bytes to
+        detect binary files, and the SHA-256 of the raw bytes is the content
+        hash recorded in the manifest.
 
         Args:
             file_path: Path to the file
+            root_path: Root directory of the repository
 
         Returns:
-            True if file appears to be binary
+            _FileSnapshot, or None if the file appears to be binary
+
+        Raises:
+            ValueError: If the file cannot be read
         """
         try:
-            # Read first 8KB to check for null bytes
-            with open(file_path, "rb") as f:
-                chunk = f.read(8192)
-                return b"\x00" in chunk
+            data = file_path.read_bytes()
         except Exception as e:
-            logger.warning(f"Failed to check if file is binary {file_path}: {e}")
-            # If we can't read it, assume it's binary
-            return True
+            raise ValueError(f"Failed to read file {file_path}: {e}")
+
+        if b"\x00" in data[:8192]:
+            return None
+
+        try:
+            content = data.decode("utf-8")
+        except UnicodeDecodeError:
+            # latin-1 as fallback (decodes any byte sequence)
+            content = data.decode("latin-1")
+
+        classification = classify_file(file_path, content)
+        return _FileSnapshot(
+            path=file_path,
+            relative_path=str(file_path.relative_to(root_path)).replace("\\", "/"),
+            content=content,
+            content_hash=hashlib.sha256(data).hexdigest(),
+            size=len(data),
+            classification=classification,
+            # Detect language for code files
+            language=(
+                self._detect_language(file_path)
+                if classification == "PRACTICE"
+                else None
+            ),
+        )
 
-    async def _create_resource_from_file(
-        self, file_path: Path, root_path: Path
-    ) -> Resource:
+    def _resource_fields(
+        self, snapshot: "_FileSnapshot", root_path: Path
+    ) -> Dict[str, Any]:
         """
-        Create a Resource from a file.
+        Resource column values for a file.
+
+        File metadata is stored in Dublin Core fields:
+        - identifier: relative path (for retrieval)
+        - source: absolute file path
+        - coverage: repo root path
+        - relation: [classification, language] for easy access
 
         Args:
-            file_path: Path to the file
+            snapshot: File read by _read_file
             root_path: Root directory of the repository
 
         Returns:
-            Created Resource object with file metadata stored in Dublin Core fields
+            Dict of Resource attributes
         """
-        # Read file content
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            # Try with latin-1 encoding as fallback
-            try:
-                with open(file_path, "r", encoding="latin-1") as f:
-                    content = f.read()
-            except Exception as e:
-                raise ValueError(f"Failed to read file {file_path}: {e}")
-
-        # Get relative path
-        relative_path = file_path.relative_to(root_path)
-        relative_path_str = str(relative_path).replace("\\", "/")
-
-        # Classify file
-        classification = classify_file(file_path, content)
-
-        # Detect language for code files
-        detected_language = (
-            self._detect_language(file_path) if classification == "PRACTICE" else None
-        )
+        classification = snapshot.classification
+        detected_language = snapshot.language
 
         # Create description from first few lines of content
-        lines = content.split("\n")
+        content = snapshot.content
+        lines = content.split("\n", 10)
         description = "\n".join(lines[:10]) if len(lines) > 10 else content
         if len(description) > 500:
             description = description[:500] + "..."
 
-        # Create Resource using Dublin Core fields
-        # Store file metadata in Dublin Core fields:
-        # - identifier: relative path (for retrieval)
-        # - source: absolute file path
-        # - coverage: repo root path
-        # - relation: [classification, language] for easy access
-        resource = Resource(
-            title=file_path.name,
-            description=description,
-            source=str(file_path),  # Original absolute file path
-            identifier=relative_path_str,  # Relative path for retrieval
-            coverage=str(root_path),  # Repo root path
-            type="code_file" if classification == "PRACTICE" else "documentation",
-            format=f"text/{detected_language}" if detected_language else "text/plain",
-            language=detected_language,
-            classification_code=classification,
-            subject=[classification]
+        return {
+            "title": snapshot.path.name,
+            "description": description,
+            "source": str(snapshot.path),  # Original absolute file path
+            "identifier": snapshot.relative_path,  # Relative path for retrieval
+            "coverage": str(root_path),  # Repo root path
+            "type": "code_file" if classification == "PRACTICE" else "documentation",
+            "format": (
+                f"text/{detected_language}" if detected_language else "text/plain"
+            ),
+            "language": detected_language,
+            "classification_code": classification,
+            "subject": [classification]
             + ([detected_language] if detected_language else []),
-            relation=[f"classification:{classification}"]
+            "relation": [f"classification:{classification}"]
             + ([f"language:{detected_language}"] if detected_language else []),
-        )
-
-        self.db.add(resource)
-        await self.db.flush()  # Get the ID without committing
-
-        logger.debug(
-            f"Created resource: {relative_path_str} (classification={classification})"
-        )
-
-        return resource
+        }
 
     def _detect_language(self, file_path: Path) -> Optional[str]:
         """
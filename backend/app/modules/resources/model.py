@@ -6,6 +6,6 @@ All model definitions are in app/database/models.py to avoid circular imports.
 """
 
 # Re-export models from central database.models
-from ...database.models import Resource, DocumentChunk
+from ...database.models import Resource, DocumentChunk, RepoFileManifest
 
-__all__ = ["Resource", "DocumentChunk"]
+__all__ = ["Resource", "DocumentChunk", "RepoFileManifest"]
@@ -1060,22 +1060,19 @@ async def auto_link_resource(
             similarity_threshold=similarity_threshold
         )
         
-        # Determine resource type and call appropriate linking method
-        # For now, we'll try both directions (PDF to code and code to PDF)
-        # In production, this would check resource format/type
-        
-        # Try linking as PDF to code
-        links = await auto_linking_service.link_pdf_to_code(
-            str(resource_id),
-            similarity_threshold=similarity_threshold
-        )
-        
-        # If no links created, try linking as code to PDF
-        if not links:
+        # Code resources link to document chunks, everything else to code chunks
+        from ..search.chunk_index import CODE_RESOURCE_TYPE
+
+        if resource.type == CODE_RESOURCE_TYPE:
             links = await auto_linking_service.link_code_to_pdfs(
                 str(resource_id),
                 similarity_threshold=similarity_threshold
             )
+        else:
+            links = await auto_linking_service.link_pdf_to_code(
+                str(resource_id),
+                similarity_threshold=similarity_threshold
+            )
         
         logger.info(
             f"Auto-linking completed for resource {resource_id}: {len(links)} links created"
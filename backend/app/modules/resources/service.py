@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
@@ -12,7 +14,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy import func, or_, asc, desc, String, cast, select
 
 from ...database import models as db_models
-from ...shared.database import Base, SessionLocal
+from ...shared.database import SessionLocal, ensure_schema
 from ...utils import content_extractor as ce
 from ...utils.text_processor import clean_text, readability_scores
 from .schema import ResourceUpdate, PageParams, SortParams, ResourceFilters
@@ -66,11 +68,6 @@ def create_pending_resource(db: Session, payload: Dict[str, Any]) -> db_models.R
     Raises:
         ValueError: If url is not provided
     """
-    try:
-        Base.metadata.create_all(bind=db.get_bind())
-    except Exception:
-        pass
-
     url = payload.get("url")
     if not url:
         raise ValueError("url is required")
@@ -281,7 +278,13 @@ def _generate_embeddings(
         if composite_text.strip():
             embedding = ai_core.generate_embedding(composite_text)
             if embedding:
+                previous = resource.embedding
                 resource.embedding = embedding
+                # The resource may already belong to collections (added
+                # before its embedding existed); count it in their sums
+                _update_collection_embeddings(
+                    session, {resource.id: (previous, embedding)}
+                )
                 logger.info(f"Generated dense embedding for resource {resource.id}")
     except Exception as e:
         logger.warning(f"Dense embedding generation failed: {e}")
@@ -312,7 +315,7 @@ def _generate_embeddings(
             sparse_vec = sparse_service.generate_sparse_embedding(composite_text)
             if sparse_vec:
                 resource.sparse_embedding = json.dumps(sparse_vec)
-                resource.sparse_embedding_model = "BAAI/bge-m3"
+                resource.sparse_embedding_model = sparse_service.active_model_name
                 resource.sparse_embedding_updated_at = datetime.now(timezone.utc)
                 logger.info(f"Generated sparse embedding for resource {resource.id}")
             else:
@@ -418,7 +421,7 @@ def _extract_citations(session: Session, resource_id: str, content_type: str) ->
     try:
         content_type_lower = content_type.lower()
         if any(ct in content_type_lower for ct in ["html", "pdf", "markdown"]):
-            from ...services.citation_service import CitationService
+            from ..graph.citations import CitationService
 
             citation_service = CitationService(session)
             citation_service.extract_citations(resource_id)
@@ -428,6 +431,18 @@ def _extract_citations(session: Session, resource_id: str, content_type: str) ->
         logger.warning(f"Citation extraction failed for resource {resource_id}: {e}")
 
 
+@functools.lru_cache(maxsize=8)
+def _ingestion_session_factory(engine_url: str) -> sessionmaker:
+    """Session factory for an explicit ingestion engine URL.
+
+    Engines (and their pools) are reused across ingestion jobs, and the
+    schema is checked once per engine instead of on every job.
+    """
+    engine = create_engine(engine_url, echo=False)
+    ensure_schema(engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
 def process_ingestion(
     resource_id: str,
     archive_root: Path | str | None = None,
@@ -461,11 +476,7 @@ def process_ingestion(
     try:
         # Setup database session
         if engine_url:
-            engine = create_engine(engine_url, echo=False)
-            local_session_factory = sessionmaker(
-                autocommit=False, autoflush=False, bind=engine
-            )
-            session = local_session_factory()
+            session = _ingestion_session_factory(engine_url)()
         else:
             # Import SessionLocal here to ensure it's initialized
             from ...shared.database import SessionLocal as _SessionLocal
@@ -474,11 +485,6 @@ def process_ingestion(
                 return
             session = _SessionLocal()
 
-        try:
-            Base.metadata.create_all(bind=session.get_bind())
-        except Exception:
-            pass
-
         # Query: Get resource
         try:
             import uuid as uuid_module
@@ -867,11 +873,6 @@ def get_resource(db: Session, resource_id) -> Optional[db_models.Resource]:
     Returns:
         Resource if found, None otherwise
     """
-    try:
-        Base.metadata.create_all(bind=db.get_bind())
-    except Exception:
-        pass
-
     # Convert string resource_id to UUID if needed
     if isinstance(resource_id, str):
         try:
@@ -973,11 +974,6 @@ def list_resources(
     Returns:
         Tuple of (resources, total_count)
     """
-    try:
-        Base.metadata.create_all(bind=db.get_bind())
-    except Exception:
-        pass
-
     query = select(db_models.Resource)
     query = _apply_resource_filters(query, filters)
 
@@ -1092,6 +1088,22 @@ def _apply_resource_updates(
     return embedding_fields_changed, quality_fields_changed, content_changed
 
 
+def _update_collection_embeddings(db: Session, changes: Dict[Any, Tuple]) -> None:
+    """
+    Swap re-embedded members' vectors in their collections' running sums (modifier).
+
+    Args:
+        db: Database session
+        changes: Resource ID -> (old embedding, new embedding)
+    """
+    try:
+        from ..collections.service import CollectionService
+
+        CollectionService(db).apply_member_reembeddings(changes)
+    except Exception as e:
+        logger.warning(f"Failed to update collection embeddings: {e}")
+
+
 def _regenerate_embeddings(db: Session, resource: db_models.Resource) -> None:
     """
     Regenerate dense and sparse embeddings for resource (modifier).
@@ -1109,7 +1121,9 @@ def _regenerate_embeddings(db: Session, resource: db_models.Resource) -> None:
             embedding_gen = EmbeddingGenerator()
             embedding = embedding_gen.generate_embedding(composite_text)
             if embedding:
+                previous = resource.embedding
                 resource.embedding = embedding
+                _update_collection_embeddings(db, {resource.id: (previous, embedding)})
                 logger.info(f"Regenerated dense embedding for resource {resource.id}")
     except Exception as e:
         logger.warning(f"Dense embedding regeneration failed for {resource.id}: {e}")
@@ -1140,7 +1154,7 @@ def _regenerate_embeddings(db: Session, resource: db_models.Resource) -> None:
             sparse_vec = sparse_service.generate_sparse_embedding(composite_text)
             if sparse_vec:
                 resource.sparse_embedding = json.dumps(sparse_vec)
-                resource.sparse_embedding_model = "BAAI/bge-m3"
+                resource.sparse_embedding_model = sparse_service.active_model_name
                 resource.sparse_embedding_updated_at = datetime.now(timezone.utc)
                 logger.info(f"Regenerated sparse embedding for resource {resource.id}")
             else:
@@ -1194,11 +1208,6 @@ def update_resource(
     Raises:
         ValueError: If resource not found
     """
-    try:
-        Base.metadata.create_all(bind=db.get_bind())
-    except Exception:
-        pass
-
     # Query: Get resource
     resource = get_resource(db, resource_id)
     if not resource:
@@ -1326,6 +1335,30 @@ def _delete_resource_annotations(db: Session, resource_id) -> None:
         )
 
 
+def _detach_resource_from_collections(db: Session, resource_id) -> List[str]:
+    """
+    Remove a resource from its collections before deletion (modifier).
+
+    Subtracts the resource's embedding from each containing collection's
+    running sum in the deletion transaction.
+
+    Args:
+        db: Database session
+        resource_id: Resource UUID
+
+    Returns:
+        IDs of the affected collections
+    """
+    try:
+        from ..collections.service import CollectionService
+
+        collection_ids = CollectionService(db).detach_resource(resource_id)
+        return [str(cid) for cid in collection_ids]
+    except Exception as e:
+        logger.warning(f"Failed to detach resource {resource_id} from collections: {e}")
+        return []
+
+
 def delete_resource(db: Session, resource_id) -> None:
     """
     Delete a resource and its associated data (modifier, returns None).
@@ -1337,11 +1370,6 @@ def delete_resource(db: Session, resource_id) -> None:
     Raises:
         ValueError: If resource not found
     """
-    try:
-        Base.metadata.create_all(bind=db.get_bind())
-    except Exception:
-        pass
-
     # Query: Get resource
     resource = get_resource(db, resource_id)
     if not resource:
@@ -1355,6 +1383,11 @@ def delete_resource(db: Session, resource_id) -> None:
     # Modifier: Delete associated annotations
     _delete_resource_annotations(db, resource_id)
 
+    # Modifier: Remove from collections while the embedding can still be read
+    collection_ids = _detach_resource_from_collections(db, resource.id)
+    if collection_ids:
+        resource_info["collection_ids"] = collection_ids
+
     # Modifier: Delete resource
     db.delete(resource)
     db.commit()
@@ -1684,36 +1717,37 @@ class ChunkingService:
             if not resource:
                 raise ValueError(f"Resource not found: {resource_id}")
 
-            # Get or create embedding service
-            if self.embedding_service is None:
-                from ...shared.embeddings import EmbeddingGenerator
+            from ...shared.embeddings import embed_texts
+            from ...shared.vector_index import encode_vector
 
-                embedding_gen = EmbeddingGenerator()
-            else:
-                embedding_gen = self.embedding_service
+            # Embed all chunks in batched forward passes (still required for RAG)
+            embeddings = [None] * len(chunks)
+            if self.embedding_service is not None:
+                try:
+                    embeddings = embed_texts(
+                        self.embedding_service, [c["content"] for c in chunks]
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to generate chunk embeddings for resource {resource_id}: "
+                        f"{e} - continuing anyway"
+                    )
+                    for chunk_dict in chunks:
+                        chunk_dict.setdefault("chunk_metadata", {})[
+                            "embedding_generated"
+                        ] = False
 
             stored_chunks = []
 
             # Process each chunk
-            for chunk_dict in chunks:
+            for chunk_dict, embedding in zip(chunks, embeddings):
                 content = chunk_dict["content"]
                 chunk_index = chunk_dict["chunk_index"]
                 chunk_metadata = chunk_dict.get("chunk_metadata", {})
-
-                # Generate embedding for chunk (optimized but still required for RAG)
-                try:
-                    if self.embedding_service is not None:
-                        embedding = embedding_gen.generate_embedding(content)
-                        if embedding:
-                            chunk_metadata["embedding_generated"] = True
-                            # Store embedding vector in metadata for now
-                            # TODO: Add dedicated embedding column to DocumentChunk model
-                            chunk_metadata["embedding_vector"] = embedding.tolist() if hasattr(embedding, 'tolist') else list(embedding)
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to generate embedding for chunk {chunk_index}: {e} - continuing anyway"
-                    )
-                    chunk_metadata["embedding_generated"] = False
+                embedding_bytes = None
+                if embedding is not None and len(embedding) > 0:
+                    chunk_metadata["embedding_generated"] = True
+                    embedding_bytes = encode_vector(embedding)
 
                 # Create DocumentChunk record
                 chunk_record = db_models.DocumentChunk(
@@ -1721,6 +1755,7 @@ class ChunkingService:
                     content=content,
                     chunk_index=chunk_index,
                     embedding_id=None,  # Not using separate embedding table yet
+                    embedding=embedding_bytes,
                     chunk_metadata=chunk_metadata,
                     created_at=datetime.now(timezone.utc),
                 )
@@ -1980,37 +2015,6 @@ class AutoLinkingService:
         similarity = dot_product / (norm1 * norm2)
         return float(similarity)
     
-    def _get_chunk_embedding(self, chunk: db_models.DocumentChunk) -> Optional[List[float]]:
-        """
-        Get embedding for a chunk from metadata or generate if missing.
-        
-        Args:
-            chunk: DocumentChunk instance
-            
-        Returns:
-            Embedding vector as list of floats, or None if unavailable
-        """
-        # Check if embedding exists in chunk metadata
-        if chunk.chunk_metadata and "embedding_vector" in chunk.chunk_metadata:
-            return chunk.chunk_metadata["embedding_vector"]
-        
-        # Generate embedding if missing
-        try:
-            embedding = self.embedding_generator.generate_embedding(chunk.content)
-            if embedding:
-                # Store in metadata for future use
-                if chunk.chunk_metadata is None:
-                    chunk.chunk_metadata = {}
-                chunk.chunk_metadata["embedding_vector"] = embedding
-                chunk.chunk_metadata["embedding_generated"] = True
-                self.db.add(chunk)
-                self.db.commit()
-                return embedding
-        except Exception as e:
-            logger.warning(f"Failed to generate embedding for chunk {chunk.id}: {e}")
-        
-        return None
-    
     def _create_link(
         self,
         source_chunk_id: uuid.UUID,
@@ -2039,131 +2043,375 @@ class AutoLinkingService:
         self.db.add(link)
         return link
     
-    async def link_pdf_to_code(
+    def _load_chunk_vectors(
+        self, chunks: List[db_models.DocumentChunk]
+    ) -> Dict[uuid.UUID, List[float]]:
+        """
+        Load stored embeddings for many chunks in batched queries.
+
+        Reads the deferred embedding column without loading it per chunk, and
+        falls back to the legacy ``chunk_metadata["embedding_vector"]`` key.
+
+        Args:
+            chunks: DocumentChunk instances
+
+        Returns:
+            Mapping of chunk ID to embedding (chunks without one are absent)
+        """
+        from ...shared.vector_index import decode_vector
+
+        vectors: Dict[uuid.UUID, List[float]] = {}
+        ids = [chunk.id for chunk in chunks]
+        for start in range(0, len(ids), 500):
+            rows = self.db.execute(
+                select(db_models.DocumentChunk.id, db_models.DocumentChunk.embedding)
+                .where(db_models.DocumentChunk.id.in_(ids[start : start + 500]))
+                .where(db_models.DocumentChunk.embedding.isnot(None))
+            )
+            for chunk_id, raw in rows:
+                vec = decode_vector(raw)
+                if vec is not None:
+                    vectors[chunk_id] = vec.tolist()
+
+        for chunk in chunks:
+            if chunk.id not in vectors and chunk.chunk_metadata:
+                legacy = chunk.chunk_metadata.get("embedding_vector")
+                if legacy:
+                    vectors[chunk.id] = list(legacy)
+        return vectors
+
+    def _embed_missing_chunks(
         self,
-        pdf_resource_id: str,
-        similarity_threshold: Optional[float] = None
+        chunks: List[db_models.DocumentChunk],
+        vectors: Dict[uuid.UUID, List[float]],
+    ) -> List[uuid.UUID]:
+        """
+        Store embeddings for chunks that lack one, in batched forward passes.
+
+        Legacy metadata vectors are moved into the embedding column; the rest
+        are generated together with one ``embed_texts`` call. Nothing is
+        committed here.
+
+        Args:
+            chunks: DocumentChunk instances
+            vectors: Known embeddings (from ``_load_chunk_vectors``), updated in place
+
+        Returns:
+            IDs of chunks whose embedding column was written
+        """
+        from ...shared.embeddings import embed_texts
+        from ...shared.vector_index import encode_vector
+
+        written: List[uuid.UUID] = []
+        missing: List[db_models.DocumentChunk] = []
+        for chunk in chunks:
+            if chunk.id in vectors:
+                # Legacy rows keep their vector in chunk_metadata only
+                if chunk.chunk_metadata and "embedding_vector" in chunk.chunk_metadata:
+                    chunk.embedding = encode_vector(vectors[chunk.id])
+                    written.append(chunk.id)
+            else:
+                missing.append(chunk)
+
+        if missing:
+            try:
+                generated = embed_texts(
+                    self.embedding_generator, [chunk.content for chunk in missing]
+                )
+            except Exception as e:
+                logger.warning(f"Failed to generate embeddings for {len(missing)} chunks: {e}")
+                generated = []
+
+            for chunk, embedding in zip(missing, generated):
+                if embedding is None or len(embedding) == 0:
+                    continue
+                vectors[chunk.id] = list(embedding)
+                chunk.embedding = encode_vector(embedding)
+                metadata = dict(chunk.chunk_metadata or {})
+                metadata["embedding_generated"] = True
+                chunk.chunk_metadata = metadata
+                written.append(chunk.id)
+
+        return written
+
+    def _schedule_target_backfill(self, index_name: str) -> None:
+        """Queue background embedding of a chunk index's unembedded chunks."""
+        try:
+            from ...tasks.celery_tasks import backfill_chunk_embeddings_task
+
+            backfill_chunk_embeddings_task.apply_async(args=[index_name], priority=3)
+            logger.info(f"Queued chunk embedding backfill for '{index_name}'")
+        except Exception as e:
+            logger.warning(
+                f"Could not queue chunk embedding backfill for '{index_name}': {e}"
+            )
+
+    def backfill_chunk_embeddings(
+        self, index_name: str, batch_size: Optional[int] = None
+    ) -> int:
+        """
+        Embed the chunks in a chunk index's scope that lack a vector.
+
+        Works through them in ID order, one page at a time: each page is
+        embedded in one batched call, committed and added to the index, so
+        memory and transaction size stay bounded however many chunks are
+        missing.
+
+        Args:
+            index_name: Chunk index whose scope is backfilled
+            batch_size: Chunks per page (uses setting default if None)
+
+        Returns:
+            Number of chunks whose embedding was stored
+        """
+        from ...config.settings import get_settings
+        from ..search.chunk_index import chunk_scope_filter, index_chunks
+
+        page_size = batch_size or get_settings().AUTO_LINK_BACKFILL_BATCH_SIZE
+        scope = chunk_scope_filter(index_name)
+        last_id = None
+        stored = 0
+        while True:
+            query = self.db.query(db_models.DocumentChunk).filter(
+                db_models.DocumentChunk.embedding.is_(None)
+            )
+            if scope is not None:
+                query = query.join(
+                    db_models.Resource,
+                    db_models.Resource.id == db_models.DocumentChunk.resource_id,
+                ).filter(scope)
+            if last_id is not None:
+                query = query.filter(db_models.DocumentChunk.id > last_id)
+            chunks = query.order_by(db_models.DocumentChunk.id).limit(page_size).all()
+            if not chunks:
+                break
+
+            # Chunks that fail to embed stay behind the cursor, so paging ends
+            last_id = chunks[-1].id
+            written = self._embed_missing_chunks(chunks, {})
+            if written:
+                self.db.commit()
+                index_chunks(self.db, written)
+                stored += len(written)
+            logger.info(f"Backfilled {stored} chunk embeddings for '{index_name}'")
+
+        return stored
+
+    def _link_resource_chunks(
+        self,
+        resource_id: str,
+        label: str,
+        target_index_name: str,
+        forward_type: str,
+        backward_type: str,
+        similarity_threshold: Optional[float],
     ) -> List[db_models.ChunkLink]:
         """
-        Link PDF chunks to code chunks based on semantic similarity.
-        
-        Computes cosine similarity between all PDF chunks and existing code chunks,
-        creating bidirectional links when similarity exceeds threshold.
-        
+        Link one resource's chunks to the chunks held by a scoped chunk index.
+
+        Runs as a batch: embeds the resource's chunks that still lack a
+        vector (committed once), runs one matrix top-k search of all source
+        chunks against the target index, and inserts all links in a single
+        transaction. Target chunks without a vector are not embedded here;
+        ``backfill_chunk_embeddings_task`` is queued for them and they are
+        linked the next time either side is linked.
+
         Args:
-            pdf_resource_id: PDF resource ID
+            resource_id: Source resource ID
+            label: Source kind used in log messages ("PDF" or "code")
+            target_index_name: Chunk index holding link targets
+            forward_type: Link type from source to target chunks
+            backward_type: Link type from target to source chunks
             similarity_threshold: Optional override for similarity threshold
-            
+
         Returns:
             List of created ChunkLink instances
         """
+        import numpy as np
+
+        from ...config.settings import get_settings
+        from ..search.chunk_index import (
+            chunk_scope_filter,
+            evict_chunks,
+            index_chunks,
+            sync_chunk_index,
+        )
+
         threshold = similarity_threshold or self.similarity_threshold
-        created_links = []
-        
+
         try:
-            # Convert resource_id to UUID
-            import uuid as uuid_module
             try:
-                resource_uuid = uuid_module.UUID(pdf_resource_id)
+                resource_uuid = uuid.UUID(resource_id)
             except (ValueError, TypeError):
-                raise ValueError(f"Invalid resource_id format: {pdf_resource_id}")
-            
-            # Get PDF resource
-            pdf_resource = (
+                raise ValueError(f"Invalid resource_id format: {resource_id}")
+
+            resource = (
                 self.db.query(db_models.Resource)
                 .filter(db_models.Resource.id == resource_uuid)
                 .first()
             )
-            
-            if not pdf_resource:
-                logger.warning(f"PDF resource not found: {pdf_resource_id}")
+            if not resource:
+                logger.warning(f"{label} resource not found: {resource_id}")
                 return []
-            
-            # Get all chunks for PDF resource
-            pdf_chunks = (
+
+            source_chunks = (
                 self.db.query(db_models.DocumentChunk)
                 .filter(db_models.DocumentChunk.resource_id == resource_uuid)
                 .all()
             )
-            
-            if not pdf_chunks:
-                logger.info(f"No chunks found for PDF resource: {pdf_resource_id}")
+            if not source_chunks:
+                logger.info(f"No chunks found for {label} resource: {resource_id}")
                 return []
-            
-            # Get all code chunks (chunks from resources with code-related formats)
-            # For now, we'll get all chunks from other resources
-            # In production, this would filter by resource type/format
-            code_chunks = (
+
+            # Embed the resource's own chunks that still lack a vector
+            vectors = self._load_chunk_vectors(source_chunks)
+            embedded = self._embed_missing_chunks(source_chunks, vectors)
+            if embedded:
+                self.db.commit()
+                index_chunks(self.db, embedded)
+
+            # Targets without a vector are embedded by a background task;
+            # this call links against what is already indexed
+            pending_target = (
                 self.db.query(db_models.DocumentChunk)
-                .filter(db_models.DocumentChunk.resource_id != resource_uuid)
-                .all()
+                .join(
+                    db_models.Resource,
+                    db_models.Resource.id == db_models.DocumentChunk.resource_id,
+                )
+                .filter(
+                    db_models.DocumentChunk.embedding.is_(None),
+                    db_models.DocumentChunk.resource_id != resource_uuid,
+                    chunk_scope_filter(target_index_name),
+                )
+                .first()
             )
-            
-            if not code_chunks:
-                logger.info("No code chunks found for linking")
+            if pending_target is not None:
+                self._schedule_target_backfill(target_index_name)
+
+            sources = [chunk for chunk in source_chunks if chunk.id in vectors]
+            if not sources:
                 return []
-            
+
+            index = sync_chunk_index(self.db, name=target_index_name)
+            if len(index) == 0:
+                logger.info(f"No chunks in '{target_index_name}' index for linking")
+                return []
+
             logger.info(
-                f"Linking {len(pdf_chunks)} PDF chunks to {len(code_chunks)} code chunks"
+                f"Linking {len(sources)} {label} chunks against {len(index)} "
+                f"'{target_index_name}' chunks"
             )
-            
-            # Compute similarities and create links
-            for pdf_chunk in pdf_chunks:
-                pdf_embedding = self._get_chunk_embedding(pdf_chunk)
-                if not pdf_embedding:
-                    continue
-                
-                for code_chunk in code_chunks:
-                    code_embedding = self._get_chunk_embedding(code_chunk)
-                    if not code_embedding:
+
+            top_k = get_settings().AUTO_LINK_TOP_K
+            hits = index.search_many(
+                np.asarray([vectors[chunk.id] for chunk in sources], dtype=np.float32),
+                k=top_k,
+                exclude=[str(chunk.id) for chunk in source_chunks],
+            )
+
+            # Drop hits for deleted chunks and for the resource's own chunks
+            candidate_ids = list(
+                {key for row in hits for key, score in row if score >= threshold}
+            )
+            valid_targets: Set[uuid.UUID] = set()
+            found: Set[str] = set()
+            for start in range(0, len(candidate_ids), 500):
+                batch = [uuid.UUID(key) for key in candidate_ids[start : start + 500]]
+                rows = self.db.execute(
+                    select(
+                        db_models.DocumentChunk.id, db_models.DocumentChunk.resource_id
+                    ).where(db_models.DocumentChunk.id.in_(batch))
+                )
+                for chunk_id, chunk_resource_id in rows:
+                    found.add(str(chunk_id))
+                    if chunk_resource_id != resource_uuid:
+                        valid_targets.add(chunk_id)
+            stale = [key for key in candidate_ids if key not in found]
+            if stale:
+                evict_chunks(self.db, stale)
+
+            created_links: List[db_models.ChunkLink] = []
+            for chunk, row in zip(sources, hits):
+                for key, score in row:
+                    if score < threshold:
+                        break
+                    target_id = uuid.UUID(key)
+                    if target_id not in valid_targets:
                         continue
-                    
-                    # Compute similarity
-                    similarity = self._compute_cosine_similarity(
-                        pdf_embedding, code_embedding
-                    )
-                    
-                    # Create link if above threshold
-                    if similarity >= threshold:
-                        # Create bidirectional links
-                        link1 = self._create_link(
-                            pdf_chunk.id,
-                            code_chunk.id,
-                            similarity,
-                            "pdf_to_code"
+                    created_links.append(
+                        db_models.ChunkLink(
+                            source_chunk_id=chunk.id,
+                            target_chunk_id=target_id,
+                            similarity_score=score,
+                            link_type=forward_type,
                         )
-                        link2 = self._create_link(
-                            code_chunk.id,
-                            pdf_chunk.id,
-                            similarity,
-                            "code_to_pdf"
+                    )
+                    created_links.append(
+                        db_models.ChunkLink(
+                            source_chunk_id=target_id,
+                            target_chunk_id=chunk.id,
+                            similarity_score=score,
+                            link_type=backward_type,
                         )
-                        created_links.extend([link1, link2])
-            
-            # Commit all links
+                    )
+
+            # Insert all links in one transaction
+            self.db.add_all(created_links)
             self.db.commit()
-            
+
             logger.info(
-                f"Created {len(created_links)} links for PDF resource {pdf_resource_id}"
+                f"Created {len(created_links)} links for {label} resource {resource_id}"
             )
-            
+
             # Emit chunk.linked event
             event_bus.emit(
                 "chunk.linked",
                 {
-                    "resource_id": pdf_resource_id,
+                    "resource_id": resource_id,
                     "link_count": len(created_links),
                     "threshold": threshold,
                 },
                 priority=EventPriority.NORMAL,
             )
-            
+
             return created_links
-            
+
         except Exception as e:
-            logger.error(f"Auto-linking failed for PDF {pdf_resource_id}: {e}", exc_info=True)
+            logger.error(
+                f"Auto-linking failed for {label} {resource_id}: {e}", exc_info=True
+            )
             self.db.rollback()
             raise
+
+    async def link_pdf_to_code(
+        self,
+        pdf_resource_id: str,
+        similarity_threshold: Optional[float] = None
+    ) -> List[db_models.ChunkLink]:
+        """
+        Link PDF chunks to code chunks based on semantic similarity.
+        
+        Searches the code chunk index for the top ``AUTO_LINK_TOP_K`` matches of
+        every PDF chunk, creating bidirectional links when similarity exceeds
+        threshold.
+        
+        Args:
+            pdf_resource_id: PDF resource ID
+            similarity_threshold: Optional override for similarity threshold
+            
+        Returns:
+            List of created ChunkLink instances
+        """
+        from ..search.chunk_index import CODE_CHUNK_INDEX_NAME
+
+        return self._link_resource_chunks(
+            pdf_resource_id,
+            "PDF",
+            CODE_CHUNK_INDEX_NAME,
+            "pdf_to_code",
+            "code_to_pdf",
+            similarity_threshold,
+        )
     
     async def link_code_to_pdfs(
         self,
@@ -2173,8 +2421,9 @@ class AutoLinkingService:
         """
         Link code chunks to PDF chunks based on semantic similarity.
         
-        Computes cosine similarity between all code chunks and existing PDF chunks,
-        creating bidirectional links when similarity exceeds threshold.
+        Searches the document (non-code) chunk index for the top
+        ``AUTO_LINK_TOP_K`` matches of every code chunk, creating bidirectional
+        links when similarity exceeds threshold.
         
         Args:
             code_resource_id: Code resource ID
@@ -2183,110 +2432,13 @@ class AutoLinkingService:
         Returns:
             List of created ChunkLink instances
         """
-        threshold = similarity_threshold or self.similarity_threshold
-        created_links = []
-        
-        try:
-            # Convert resource_id to UUID
-            import uuid as uuid_module
-            try:
-                resource_uuid = uuid_module.UUID(code_resource_id)
-            except (ValueError, TypeError):
-                raise ValueError(f"Invalid resource_id format: {code_resource_id}")
-            
-            # Get code resource
-            code_resource = (
-                self.db.query(db_models.Resource)
-                .filter(db_models.Resource.id == resource_uuid)
-                .first()
-            )
-            
-            if not code_resource:
-                logger.warning(f"Code resource not found: {code_resource_id}")
-                return []
-            
-            # Get all chunks for code resource
-            code_chunks = (
-                self.db.query(db_models.DocumentChunk)
-                .filter(db_models.DocumentChunk.resource_id == resource_uuid)
-                .all()
-            )
-            
-            if not code_chunks:
-                logger.info(f"No chunks found for code resource: {code_resource_id}")
-                return []
-            
-            # Get all PDF chunks (chunks from resources with PDF format)
-            # For now, we'll get all chunks from other resources
-            # In production, this would filter by resource type/format
-            pdf_chunks = (
-                self.db.query(db_models.DocumentChunk)
-                .filter(db_models.DocumentChunk.resource_id != resource_uuid)
-                .all()
-            )
-            
-            if not pdf_chunks:
-                logger.info("No PDF chunks found for linking")
-                return []
-            
-            logger.info(
-                f"Linking {len(code_chunks)} code chunks to {len(pdf_chunks)} PDF chunks"
-            )
-            
-            # Compute similarities and create links
-            for code_chunk in code_chunks:
-                code_embedding = self._get_chunk_embedding(code_chunk)
-                if not code_embedding:
-                    continue
-                
-                for pdf_chunk in pdf_chunks:
-                    pdf_embedding = self._get_chunk_embedding(pdf_chunk)
-                    if not pdf_embedding:
-                        continue
-                    
-                    # Compute similarity
-                    similarity = self._compute_cosine_similarity(
-                        code_embedding, pdf_embedding
-                    )
-                    
-                    # Create link if above threshold
-                    if similarity >= threshold:
-                        # Create bidirectional links
-                        link1 = self._create_link(
-                            code_chunk.id,
-                            pdf_chunk.id,
-                            similarity,
-                            "code_to_pdf"
-                        )
-                        link2 = self._create_link(
-                            pdf_chunk.id,
-                            code_chunk.id,
-                            similarity,
-                            "pdf_to_code"
-                        )
-                        created_links.extend([link1, link2])
-            
-            # Commit all links
-            self.db.commit()
-            
-            logger.info(
-                f"Created {len(created_links)} links for code resource {code_resource_id}"
-            )
-            
-            # Emit chunk.linked event
-            event_bus.emit(
-                "chunk.linked",
-                {
-                    "resource_id": code_resource_id,
-                    "link_count": len(created_links),
-                    "threshold": threshold,
-                },
-                priority=EventPriority.NORMAL,
-            )
-            
-            return created_links
-            
-        except Exception as e:
-            logger.error(f"Auto-linking failed for code {code_resource_id}: {e}", exc_info=True)
-            self.db.rollback()
-            raise
+        from ..search.chunk_index import DOCUMENT_CHUNK_INDEX_NAME
+
+        return self._link_resource_chunks(
+            code_resource_id,
+            "code",
+            DOCUMENT_CHUNK_INDEX_NAME,
+            "code_to_pdf",
+            "pdf_to_code",
+            similarity_threshold,
+        )
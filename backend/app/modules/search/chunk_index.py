@@ -0,0 +1,306 @@
+"""
+Dense Chunk Index
+
+Keeps the shared ANN vector index in sync with ``DocumentChunk.embedding``
+and answers chunk-level top-k queries for parent-child retrieval.
+
+Chunk text is immutable once written (re-chunking deletes and re-inserts),
+but embeddings may be written later, so synchronization keys on
+``embedding_updated_at``:
+- The resource.chunked handler indexes a resource's chunks as they are stored
+- Each query runs a delta sync over chunks embedded since the index
+  watermark; unchanged rows re-read inside the margin window are skipped
+- Deleted chunks are evicted when a search returns them
+
+Besides the "chunks" index over every chunk, scoped indexes hold only the
+chunks of code resources ("code_chunks") or of all other resources
+("document_chunks") for PDF<->code auto-linking.
+
+See dense_index.py for the resource-level counterpart.
+"""
+
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from ...database.models import DocumentChunk, Resource
+from ...shared.vector_index import (
+    VectorIndex,
+    decode_vector,
+    get_vector_index,
+    schedule_maintenance,
+)
+from .dense_index import _WATERMARK_MARGIN, _changed_rows, _forget_before, _note_row
+
+logger = logging.getLogger(__name__)
+
+CHUNK_INDEX_NAME = "chunks"
+CODE_CHUNK_INDEX_NAME = "code_chunks"
+DOCUMENT_CHUNK_INDEX_NAME = "document_chunks"
+CHUNK_INDEX_NAMES = (CHUNK_INDEX_NAME, CODE_CHUNK_INDEX_NAME, DOCUMENT_CHUNK_INDEX_NAME)
+
+# Resource type assigned to source files by repository ingestion
+CODE_RESOURCE_TYPE = "code_file"
+
+# Persist after this many unsaved mutations (file-backed indexes only)
+_SAVE_EVERY = 2000
+
+
+def get_chunk_index(db: Session, name: str = CHUNK_INDEX_NAME) -> VectorIndex:
+    """Return the process-wide chunk index for the session's engine."""
+    if name not in CHUNK_INDEX_NAMES:
+        raise ValueError(f"Unknown chunk index: {name}")
+    return get_vector_index(db.get_bind(), name)
+
+
+def chunk_scope_filter(name: str):
+    """Return the resource filter for a scoped chunk index (None if unscoped)."""
+    if name == CODE_CHUNK_INDEX_NAME:
+        return Resource.type == CODE_RESOURCE_TYPE
+    if name == DOCUMENT_CHUNK_INDEX_NAME:
+        return or_(Resource.type.is_(None), Resource.type != CODE_RESOURCE_TYPE)
+    return None
+
+
+def _chunk_select(name: str):
+    """Select (id, embedding, embedding_updated_at) of embedded chunks in an index's scope."""
+    stmt = select(
+        DocumentChunk.id, DocumentChunk.embedding, DocumentChunk.embedding_updated_at
+    ).where(DocumentChunk.embedding.isnot(None))
+    scope = chunk_scope_filter(name)
+    if scope is not None:
+        stmt = stmt.join(Resource, Resource.id == DocumentChunk.resource_id).where(
+            scope
+        )
+    return stmt
+
+
+def _maybe_persist(index: VectorIndex) -> None:
+    schedule_maintenance(index, _SAVE_EVERY)
+
+
+def _load_rows(index: VectorIndex, rows, batch_size: int) -> int:
+    """Upsert (id, embedding, embedding_updated_at) rows in batches.
+
+    Every row is remembered in ``index.margin_seen`` so the next delta sync
+    does not apply it again.
+
+    Returns:
+        Number of vectors written
+    """
+    written = 0
+    keys, vectors = [], []
+    for chunk_id, raw, embedded_at in rows:
+        key = str(chunk_id)
+        _note_row(index, key, raw, embedded_at)
+        vec = decode_vector(raw)
+        if vec is not None:
+            keys.append(key)
+            vectors.append(vec)
+        if len(keys) >= batch_size:
+            written += index.upsert_many(keys, vectors)
+            keys, vectors = [], []
+    if keys:
+        written += index.upsert_many(keys, vectors)
+    return written
+
+
+def rebuild_chunk_index(
+    db: Session,
+    batch_size: int = 5000,
+    save: bool = True,
+    name: str = CHUNK_INDEX_NAME,
+) -> VectorIndex:
+    """Rebuild a chunk index from the database.
+
+    Args:
+        db: Database session
+        batch_size: Rows fetched per round trip
+        save: Persist the index afterwards (file-backed indexes only)
+        name: Which chunk index to rebuild
+
+    Returns:
+        The rebuilt index
+    """
+    index = get_chunk_index(db, name)
+    start = time.time()
+
+    # Build into a fresh index so queries keep using the old one meanwhile
+    fresh = VectorIndex(name, nprobe=index.nprobe, train_threshold=index.train_threshold)
+    watermark = None
+    keys, vectors = [], []
+    stmt = _chunk_select(name).execution_options(yield_per=batch_size)
+    for chunk_id, raw, embedded_at in db.execute(stmt):
+        vec = decode_vector(raw)
+        if vec is not None:
+            keys.append(str(chunk_id))
+            vectors.append(vec)
+        _note_row(fresh, str(chunk_id), raw, embedded_at)
+        if embedded_at is not None and (watermark is None or embedded_at > watermark):
+            watermark = embedded_at
+        if len(keys) >= batch_size:
+            fresh.upsert_many(keys, vectors)
+            keys, vectors = [], []
+            _forget_before(fresh, watermark)
+    if keys:
+        fresh.upsert_many(keys, vectors)
+    _forget_before(fresh, watermark)
+
+    fresh.train()
+    fresh.watermark = watermark.isoformat() if watermark else None
+    fresh.built_at = fresh.synced_at = time.time()
+    index.adopt(fresh)
+
+    logger.info(
+        f"Rebuilt chunk vector index '{name}': {len(index)} vectors in "
+        f"{(time.time() - start) * 1000:.0f}ms"
+    )
+    if save:
+        index.save()
+    return index
+
+
+def sync_chunk_index(
+    db: Session,
+    index: Optional[VectorIndex] = None,
+    name: str = CHUNK_INDEX_NAME,
+) -> VectorIndex:
+    """Bring a chunk index up to date with newly embedded chunks.
+
+    Args:
+        db: Database session
+        index: Optional index (defaults to the engine's index called ``name``)
+        name: Which chunk index to synchronize
+
+    Returns:
+        The synchronized index
+    """
+    if index is not None:
+        name = index.name
+    index = index or get_chunk_index(db, name)
+    if index.built_at is None:
+        return rebuild_chunk_index(db, name=name)
+
+    stmt = _chunk_select(name)
+    if index.watermark:
+        since = datetime.fromisoformat(index.watermark) - _WATERMARK_MARGIN
+        stmt = stmt.where(DocumentChunk.embedding_updated_at >= since)
+
+    changed = _changed_rows(index, db.execute(stmt))
+    keys, vectors = [], []
+    for key, raw in changed:
+        vec = decode_vector(raw)
+        if vec is not None:
+            keys.append(key)
+            vectors.append(vec)
+    index.upsert_many(keys, vectors)
+    index.synced_at = time.time()
+
+    _maybe_persist(index)
+    return index
+
+
+def search_chunk_index(
+    db: Session,
+    query_embedding: Sequence[float],
+    limit: int = 10,
+    exclude: Optional[Sequence[str]] = None,
+    sync: bool = True,
+) -> List[Tuple[str, float]]:
+    """Dense top-k search over chunk embeddings.
+
+    Callers load the returned chunks themselves and should pass ids that no
+    longer exist to ``evict_chunks``.
+
+    Args:
+        db: Database session
+        query_embedding: Query vector
+        limit: Maximum number of results
+        exclude: Chunk ids to leave out
+        sync: Delta-sync the index first (callers widening one query over
+              several searches sync only on the first)
+
+    Returns:
+        List of (chunk_id, similarity_score) tuples
+    """
+    index = sync_chunk_index(db) if sync else get_chunk_index(db)
+    return index.search(query_embedding, k=limit, exclude=exclude)
+
+
+def index_resource_chunks(db: Session, resource_id: str) -> int:
+    """Index the stored chunks of one resource in every built chunk index.
+
+    Args:
+        db: Database session
+        resource_id: Resource ID
+
+    Returns:
+        Number of chunk vectors written (0 if no index is built yet)
+    """
+    try:
+        rid = uuid.UUID(str(resource_id))
+    except (ValueError, TypeError):
+        return 0
+
+    written = 0
+    for name in CHUNK_INDEX_NAMES:
+        index = get_chunk_index(db, name)
+        if index.built_at is None:
+            continue
+        stmt = _chunk_select(name).where(DocumentChunk.resource_id == rid)
+        written += _load_rows(index, db.execute(stmt), batch_size=5000)
+        _maybe_persist(index)
+    return written
+
+
+def index_chunks(db: Session, chunk_ids: Sequence[uuid.UUID]) -> int:
+    """Index specific chunks in every built chunk index.
+
+    Lets this process see chunks it just embedded (e.g. in the auto-linker)
+    without waiting for the next delta sync; other processes pick them up
+    through ``embedding_updated_at``.
+
+    Args:
+        db: Database session
+        chunk_ids: Chunk IDs
+
+    Returns:
+        Number of chunk vectors written
+    """
+    ids = list(chunk_ids)
+    written = 0
+    for name in CHUNK_INDEX_NAMES:
+        index = get_chunk_index(db, name)
+        if index.built_at is None:
+            continue
+        for start in range(0, len(ids), 500):
+            stmt = _chunk_select(name).where(
+                DocumentChunk.id.in_(ids[start : start + 500])
+            )
+            written += _load_rows(index, db.execute(stmt), batch_size=5000)
+        _maybe_persist(index)
+    return written
+
+
+def evict_chunks(db: Session, chunk_ids: Sequence[str]) -> int:
+    """Remove chunk ids (e.g. deleted chunks) from every chunk index.
+
+    Args:
+        db: Database session
+        chunk_ids: Chunk IDs
+
+    Returns:
+        Number of ids removed from the unscoped index
+    """
+    removed = 0
+    for name in CHUNK_INDEX_NAMES:
+        index = get_chunk_index(db, name)
+        count = sum(1 for chunk_id in chunk_ids if index.remove(str(chunk_id)))
+        if name == CHUNK_INDEX_NAME:
+            removed = count
+    return removed
@@ -0,0 +1,294 @@
+"""
+Dense Resource Index
+
+Keeps the shared ANN vector index in sync with ``Resource.embedding`` and
+answers dense top-k queries for the search module.
+
+Synchronization happens on three paths:
+- Event handlers upsert/remove single resources as they change
+- Each query runs a delta sync over rows whose ``updated_at`` moved past the
+  index watermark (cheap indexed range scan; catches writes from other
+  processes). Rows re-read inside the margin window are skipped unless
+  their value changed, so idle queries do not mutate the index.
+- ``rebuild_resource_index`` performs a full rebuild (CLI / maintenance)
+
+Retraining and persistence run on a background thread
+(``schedule_maintenance``), never on the query path.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ...database.models import Resource
+from ...shared.vector_index import (
+    VectorIndex,
+    get_vector_index,
+    parse_embedding,
+    schedule_maintenance,
+)
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_INDEX_NAME = "resources"
+
+# Margin subtracted from the watermark when delta-syncing. Timestamps are
+# stored with second resolution on some backends, so rows written in the same
+# second as the last sync must be re-read.
+_WATERMARK_MARGIN = timedelta(seconds=2)
+
+# Persist after this many unsaved mutations (file-backed indexes only)
+_SAVE_EVERY = 500
+
+
+def get_resource_index(db: Session) -> VectorIndex:
+    """Return the process-wide resource index for the session's engine."""
+    return get_vector_index(db.get_bind(), RESOURCE_INDEX_NAME)
+
+
+def _maybe_persist(index: VectorIndex) -> None:
+    schedule_maintenance(index, _SAVE_EVERY)
+
+
+def _note_row(index: Any, key: str, raw: Any, updated_at: Any) -> bool:
+    """Remember a row's value fingerprint in ``index.margin_seen``.
+
+    Returns:
+        True if the value differs from the one last seen for the key
+    """
+    fingerprint = hash(raw if isinstance(raw, (str, bytes)) else repr(raw))
+    previous = index.margin_seen.get(key)
+    index.margin_seen[key] = (updated_at, fingerprint)
+    return previous is None or previous[1] != fingerprint
+
+
+def _forget_before(index: Any, watermark: Optional[datetime]) -> None:
+    """Drop remembered rows that fell out of the watermark margin window."""
+    if watermark is None:
+        return
+    cutoff = watermark - _WATERMARK_MARGIN
+    seen = index.margin_seen
+    for key in [k for k, (ts, _) in seen.items() if ts is not None and ts < cutoff]:
+        del seen[key]
+
+
+def _changed_rows(index: Any, rows: Iterable[Tuple[Any, Any, Any]]) -> List[Tuple[str, Any]]:
+    """Filter delta-sync rows down to those the index has not applied yet.
+
+    The delta query re-reads every row inside the watermark margin. A row
+    whose value matches the one remembered in ``index.margin_seen`` is
+    skipped, so syncs that find no writes leave the index untouched.
+    Advances ``index.watermark``.
+
+    Args:
+        index: VectorIndex or InvertedIndex being synchronized
+        rows: (key, raw value, updated_at) tuples
+
+    Returns:
+        (key, raw value) pairs to upsert or remove
+    """
+    watermark = datetime.fromisoformat(index.watermark) if index.watermark else None
+    changed = []
+    for key, raw, updated_at in rows:
+        key = str(key)
+        if _note_row(index, key, raw, updated_at):
+            changed.append((key, raw))
+        if updated_at is not None and (watermark is None or updated_at > watermark):
+            watermark = updated_at
+
+    if watermark is not None:
+        index.watermark = watermark.isoformat()
+    _forget_before(index, watermark)
+    return changed
+
+
+def rebuild_resource_index(
+    db: Session, batch_size: int = 2000, save: bool = True
+) -> VectorIndex:
+    """Rebuild the resource index from the database.
+
+    Only ``id``, ``embedding`` and ``updated_at`` are selected, and rows are
+    streamed in batches so the ORM never hydrates full Resource objects.
+
+    Args:
+        db: Database session
+        batch_size: Rows fetched per round trip
+        save: Persist the index afterwards (file-backed indexes only)
+
+    Returns:
+        The rebuilt index
+    """
+    index = get_resource_index(db)
+    start = time.time()
+
+    # Build into a fresh index so queries keep using the old one meanwhile
+    fresh = VectorIndex(
+        index.name, nprobe=index.nprobe, train_threshold=index.train_threshold
+    )
+    watermark = None
+    stmt = (
+        select(Resource.id, Resource.embedding, Resource.updated_at)
+        .where(Resource.embedding.isnot(None))
+        .execution_options(yield_per=batch_size)
+    )
+    keys, vectors = [], []
+    for rid, raw, updated_at in db.execute(stmt):
+        vec = parse_embedding(raw)
+        if vec:
+            keys.append(str(rid))
+            vectors.append(vec)
+        _note_row(fresh, str(rid), raw, updated_at)
+        if updated_at is not None and (watermark is None or updated_at > watermark):
+            watermark = updated_at
+        if len(keys) >= batch_size:
+            fresh.upsert_many(keys, vectors)
+            keys, vectors = [], []
+            _forget_before(fresh, watermark)
+    if keys:
+        fresh.upsert_many(keys, vectors)
+    _forget_before(fresh, watermark)
+
+    fresh.train()
+    fresh.watermark = watermark.isoformat() if watermark else None
+    fresh.built_at = fresh.synced_at = time.time()
+    index.adopt(fresh)
+
+    logger.info(
+        f"Rebuilt resource vector index: {len(index)} vectors in "
+        f"{(time.time() - start) * 1000:.0f}ms"
+    )
+    if save:
+        index.save()
+    return index
+
+
+def sync_resource_index(db: Session, index: Optional[VectorIndex] = None) -> VectorIndex:
+    """Bring the resource index up to date with the database.
+
+    Builds the index on first use, otherwise applies rows changed since the
+    last watermark.
+
+    Args:
+        db: Database session
+        index: Optional index (defaults to the engine's resource index)
+
+    Returns:
+        The synchronized index
+    """
+    index = index or get_resource_index(db)
+    if index.built_at is None:
+        return rebuild_resource_index(db)
+
+    stmt = select(Resource.id, Resource.embedding, Resource.updated_at)
+    if index.watermark:
+        since = datetime.fromisoformat(index.watermark) - _WATERMARK_MARGIN
+        stmt = stmt.where(Resource.updated_at >= since)
+
+    for rid, raw in _changed_rows(index, db.execute(stmt)):
+        vec = parse_embedding(raw)
+        if vec:
+            index.upsert(rid, vec)
+        else:
+            index.remove(rid)
+    index.synced_at = time.time()
+
+    _maybe_persist(index)
+    return index
+
+
+def search_resource_index(
+    db: Session, query_embedding: List[float], limit: int = 100
+) -> List[Tuple[str, float]]:
+    """Dense top-k search over resource embeddings.
+
+    Hits whose resources no longer exist (deleted by another process) are
+    dropped from the result and evicted from the index.
+
+    Args:
+        db: Database session
+        query_embedding: Query vector
+        limit: Maximum number of results
+
+    Returns:
+        List of (resource_id, similarity_score) tuples
+    """
+    index = sync_resource_index(db)
+    hits = index.search(query_embedding, k=limit)
+    if not hits:
+        return []
+
+    import uuid
+
+    ids = []
+    for rid, _ in hits:
+        try:
+            ids.append(uuid.UUID(rid))
+        except (ValueError, TypeError):
+            continue
+    existing = {str(r) for r in db.execute(select(Resource.id).where(Resource.id.in_(ids))).scalars()}
+
+    results = []
+    for rid, score in hits:
+        if rid in existing:
+            results.append((rid, score))
+        else:
+            index.remove(rid)
+    return results
+
+
+def index_resource(db: Session, resource_id: str) -> bool:
+    """Upsert (or remove) a single resource from the index.
+
+    Args:
+        db: Database session
+        resource_id: Resource ID
+
+    Returns:
+        True if the resource is present in the index afterwards
+    """
+    import uuid
+
+    index = get_resource_index(db)
+    if index.built_at is None:
+        # Index not built in this process yet; the first query will build it
+        return False
+
+    try:
+        rid = uuid.UUID(str(resource_id))
+    except (ValueError, TypeError):
+        return False
+
+    row = db.execute(
+        select(Resource.embedding, Resource.updated_at).where(Resource.id == rid)
+    ).one_or_none()
+    raw, updated_at = row if row is not None else (None, None)
+    # Remembered so the next delta sync does not apply this row again
+    _note_row(index, str(rid), raw, updated_at)
+    vec = parse_embedding(raw)
+    if vec:
+        index.upsert(str(rid), vec)
+        _maybe_persist(index)
+        return True
+    index.remove(str(rid))
+    return False
+
+
+def remove_resource(db: Session, resource_id: str) -> bool:
+    """Remove a resource from the index.
+
+    Args:
+        db: Database session
+        resource_id: Resource ID
+
+    Returns:
+        True if the resource was indexed
+    """
+    index = get_resource_index(db)
+    removed = index.remove(str(resource_id))
+    if removed:
+        _maybe_persist(index)
+    return removed
@@ -0,0 +1,282 @@
+"""
+Full-Text Resource Index
+
+Keyword leg of hybrid search backed by the database's native full-text
+index:
+
+- SQLite: FTS5 table ``resources_fts`` (porter/unicode61 tokenizer) with a
+  stable rowid mapping table ``resources_fts_doc`` and sync triggers; scored
+  with BM25 (title weighted above description)
+- PostgreSQL: trigger-maintained ``resources.search_vector`` tsvector
+  column with a GIN index; scored with ``ts_rank_cd`` using document length
+  normalization
+
+The schema comes from migrations (``20251215_add_search_vector`` on
+PostgreSQL, ``20261016_fts_bm25`` on SQLite). For databases created with
+``Base.metadata.create_all`` (tests, dev) ``ensure_fts_schema`` creates it,
+at API and Celery worker startup.
+"""
+
+import logging
+import re
+import threading
+import weakref
+from typing import Any, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# BM25 column weights for (title, description)
+TITLE_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+
+SQLITE_FTS_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS resources_fts_doc (
+        rowid INTEGER PRIMARY KEY,
+        resource_id TEXT UNIQUE NOT NULL
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS resources_fts USING fts5(
+        title,
+        description,
+        tokenize = 'porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_resources_ai_fts
+    AFTER INSERT ON resources
+    BEGIN
+        INSERT OR IGNORE INTO resources_fts_doc(resource_id) VALUES (NEW.id);
+        INSERT INTO resources_fts(rowid, title, description)
+        VALUES (
+            (SELECT rowid FROM resources_fts_doc WHERE resource_id = NEW.id),
+            NEW.title,
+            COALESCE(NEW.description, '')
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_resources_au_fts
+    AFTER UPDATE OF title, description ON resources
+    BEGIN
+        UPDATE resources_fts
+        SET title = NEW.title,
+            description = COALESCE(NEW.description, '')
+        WHERE rowid = (
+            SELECT rowid FROM resources_fts_doc WHERE resource_id = NEW.id
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_resources_ad_fts
+    AFTER DELETE ON resources
+    BEGIN
+        DELETE FROM resources_fts
+        WHERE rowid = (
+            SELECT rowid FROM resources_fts_doc WHERE resource_id = OLD.id
+        );
+        DELETE FROM resources_fts_doc WHERE resource_id = OLD.id;
+    END
+    """,
+]
+
+SQLITE_FTS_BACKFILL = [
+    "INSERT OR IGNORE INTO resources_fts_doc(resource_id) SELECT id FROM resources",
+    """
+    INSERT INTO resources_fts(rowid, title, description)
+    SELECT d.rowid, r.title, COALESCE(r.description, '')
+    FROM resources r
+    JOIN resources_fts_doc d ON d.resource_id = r.id
+    WHERE d.rowid NOT IN (SELECT rowid FROM resources_fts)
+    """,
+]
+
+# PostgreSQL: trigger-maintained ``search_vector`` as created by the
+# 20251215_add_search_vector migration, for databases built with create_all
+POSTGRES_SEARCH_VECTOR_EXPR = """
+    setweight(to_tsvector('english', COALESCE({p}title, '')), 'A') ||
+    setweight(to_tsvector('english', COALESCE({p}description, '')), 'B') ||
+    setweight(to_tsvector('english', COALESCE({p}creator, '')), 'C') ||
+    setweight(to_tsvector('english', COALESCE({p}publisher, '')), 'D')
+"""
+
+POSTGRES_FTS_DDL = [
+    f"""
+    CREATE OR REPLACE FUNCTION resources_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {POSTGRES_SEARCH_VECTOR_EXPR.format(p="NEW.")};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS resources_search_vector_trigger ON resources",
+    """
+    CREATE TRIGGER resources_search_vector_trigger
+    BEFORE INSERT OR UPDATE ON resources
+    FOR EACH ROW
+    EXECUTE FUNCTION resources_search_vector_update()
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_resources_search_vector "
+    "ON resources USING GIN (search_vector)",
+    f"""
+    UPDATE resources
+    SET search_vector = {POSTGRES_SEARCH_VECTOR_EXPR.format(p="")}
+    WHERE search_vector IS NULL
+    """,
+]
+
+# Engines whose full-text schema has been checked: engine -> bool (available)
+_checked: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+_checked_lock = threading.Lock()
+
+
+def _tokens(query: str) -> List[str]:
+    return re.findall(r"\w+", (query or "").lower())
+
+
+def _sqlite_has_fts_table(conn) -> bool:
+    row = conn.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'resources_fts'")
+    ).fetchone()
+    if row is None:
+        return False
+    # Contentless tables from the original migration cannot be updated
+    return "content=''" not in (row[0] or "").replace(" ", "")
+
+
+def ensure_fts_schema(bind: Any) -> bool:
+    """Make sure the full-text schema exists for an engine.
+
+    On SQLite the FTS5 table, mapping table and triggers are created (and
+    backfilled) if missing. On PostgreSQL the tsvector ``search_vector``
+    column, its update trigger and GIN index are created (and backfilled)
+    if missing. Called at API and worker startup so the DDL never runs on
+    a request; afterwards it is a cached lookup per engine. Failures are
+    only cached when definitive (SQLite built without FTS5).
+
+    Args:
+        bind: SQLAlchemy engine or connection
+
+    Returns:
+        True if indexed full-text search is available
+    """
+    engine = getattr(bind, "engine", bind)
+    with _checked_lock:
+        if engine in _checked:
+            return _checked[engine]
+
+        available = False
+        try:
+            dialect = engine.dialect.name
+            with engine.begin() as conn:
+                if dialect == "sqlite":
+                    if not _sqlite_has_fts_table(conn):
+                        conn.execute(text("DROP TABLE IF EXISTS resources_fts"))
+                        for stmt in SQLITE_FTS_DDL + SQLITE_FTS_BACKFILL:
+                            conn.execute(text(stmt))
+                        logger.info("Created SQLite FTS5 index for resources")
+                    available = True
+                elif dialect == "postgresql":
+                    column_type = conn.execute(
+                        text(
+                            "SELECT data_type FROM information_schema.columns "
+                            "WHERE table_name = 'resources' "
+                            "AND column_name = 'search_vector'"
+                        )
+                    ).scalar()
+                    has_trigger = (
+                        conn.execute(
+                            text(
+                                "SELECT 1 FROM pg_trigger "
+                                "WHERE tgname = 'resources_search_vector_trigger'"
+                            )
+                        ).first()
+                        is not None
+                    )
+                    if column_type != "tsvector" or not has_trigger:
+                        if column_type is None:
+                            conn.execute(
+                                text(
+                                    "ALTER TABLE resources "
+                                    "ADD COLUMN search_vector tsvector"
+                                )
+                            )
+                        elif column_type != "tsvector":
+                            # Mapped as Text before; the values were never set
+                            conn.execute(
+                                text(
+                                    "ALTER TABLE resources ALTER COLUMN search_vector "
+                                    "TYPE tsvector USING NULL"
+                                )
+                            )
+                        for stmt in POSTGRES_FTS_DDL:
+                            conn.execute(text(stmt))
+                        logger.info("Created PostgreSQL full-text index for resources")
+                    available = True
+        except Exception as e:
+            logger.warning(f"Full-text index unavailable, using fallback search: {e}")
+            # Transient errors (locks, timeouts, database not up yet) are not
+            # cached, so the next call retries; a SQLite without FTS5 is final
+            if "no such module: fts5" not in str(e).lower():
+                return False
+            available = False
+
+        _checked[engine] = available
+        return available
+
+
+def fts_search(db: Session, query: str, limit: int = 100) -> List[Tuple[str, float]]:
+    """Ranked keyword search over resource titles and descriptions.
+
+    Query terms are OR-ed so that partial matches still surface as
+    candidates; ranking rewards documents matching more (and rarer) terms.
+
+    Args:
+        db: Database session
+        query: Raw query text
+        limit: Maximum number of results
+
+    Returns:
+        List of (resource_id, score) tuples, highest score first. Empty if
+        indexed full-text search is unavailable.
+    """
+    tokens = _tokens(query)
+    if not tokens or not ensure_fts_schema(db.get_bind()):
+        return []
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        match = " OR ".join(f'"{t}"' for t in tokens)
+        rows = db.execute(
+            text(
+                f"""
+                SELECT d.resource_id,
+                       -bm25(resources_fts, {TITLE_WEIGHT}, {DESCRIPTION_WEIGHT}) AS score
+                FROM resources_fts
+                JOIN resources_fts_doc d ON d.rowid = resources_fts.rowid
+                WHERE resources_fts MATCH :match
+                ORDER BY score DESC
+                LIMIT :limit
+                """
+            ),
+            {"match": match, "limit": limit},
+        )
+        return [(str(row[0]), float(row[1])) for row in rows]
+
+    rows = db.execute(
+        text(
+            """
+            SELECT id, ts_rank_cd(search_vector, q, 1) AS score
+            FROM resources, websearch_to_tsquery('english', :query) AS q
+            WHERE search_vector @@ q
+            ORDER BY score DESC
+            LIMIT :limit
+            """
+        ),
+        {"query": " OR ".join(tokens), "limit": limit},
+    )
+    return [(str(row[0]), float(row[1])) for row in rows]
@@ -5,6 +5,14 @@ Emits search-related events for analytics and monitoring.
 
 Events Emitted:
 - search.executed: When a search query is executed
+
+Events Subscribed:
+- resource.created / resource.updated / ingestion.completed: Upsert the
+  resource into the dense vector and sparse inverted indexes
+- resource.deleted: Remove the resource from both indexes
+- resource.chunked: Add the resource's chunk vectors to the chunk index
+- resource.created / resource.updated / resource.deleted / ingestion.completed:
+  Bump the search result cache generation
 """
 
 import logging
@@ -56,11 +64,126 @@ def emit_search_executed(
         logger.error(f"Error emitting search.executed event: {str(e)}", exc_info=True)
 
 
+def _with_session(callback, resource_id: str) -> None:
+    """Run an index maintenance callback in a short-lived session."""
+    from ...shared import database
+
+    if database.SessionLocal is None:
+        return
+    db = database.SessionLocal()
+    try:
+        callback(db, resource_id)
+    finally:
+        db.close()
+
+
+def handle_resource_embedding_changed(payload: Dict[str, Any]) -> None:
+    """
+    Upsert a resource into the dense vector and sparse inverted indexes.
+
+    Subscribed to resource.created, resource.updated and ingestion.completed,
+    which are the points where a resource's embedding may have been written.
+
+    Args:
+        payload: Event payload containing resource_id
+    """
+    resource_id = payload.get("resource_id")
+    if not resource_id:
+        return
+
+    try:
+        from .dense_index import index_resource
+        from .sparse_index import index_resource_sparse
+
+        _with_session(index_resource, str(resource_id))
+        _with_session(index_resource_sparse, str(resource_id))
+    except Exception as e:
+        logger.error(
+            f"Error updating vector index for resource {resource_id}: {str(e)}",
+            exc_info=True,
+        )
+
+
+def handle_resource_deleted(payload: Dict[str, Any]) -> None:
+    """
+    Remove a deleted resource from the dense and sparse indexes.
+
+    Args:
+        payload: Event payload containing resource_id
+    """
+    resource_id = payload.get("resource_id")
+    if not resource_id:
+        return
+
+    try:
+        from .dense_index import remove_resource
+        from .sparse_index import remove_resource_sparse
+
+        _with_session(remove_resource, str(resource_id))
+        _with_session(remove_resource_sparse, str(resource_id))
+    except Exception as e:
+        logger.error(
+            f"Error removing resource {resource_id} from vector index: {str(e)}",
+            exc_info=True,
+        )
+
+
+def handle_resource_chunked(payload: Dict[str, Any]) -> None:
+    """
+    Index a resource's newly stored chunk vectors.
+
+    Args:
+        payload: Event payload containing resource_id
+    """
+    resource_id = payload.get("resource_id")
+    if not resource_id:
+        return
+
+    try:
+        from .chunk_index import index_resource_chunks
+
+        _with_session(index_resource_chunks, str(resource_id))
+    except Exception as e:
+        logger.error(
+            f"Error updating chunk index for resource {resource_id}: {str(e)}",
+            exc_info=True,
+        )
+
+
+def handle_corpus_changed(payload: Dict[str, Any]) -> None:
+    """
+    Invalidate cached search results after a corpus change.
+
+    A single generation INCR; superseded entries expire through their TTL.
+
+    Args:
+        payload: Event payload (unused)
+    """
+    try:
+        from .result_cache import search_result_cache
+
+        search_result_cache.invalidate()
+    except Exception as e:
+        logger.error(f"Error invalidating search result cache: {e}", exc_info=True)
+
+
 def register_handlers():
     """
     Register all event handlers for the search module.
 
     This function should be called during application startup.
-    Currently, search module only emits events and doesn't subscribe to any.
     """
+    event_bus.subscribe("resource.created", handle_resource_embedding_changed)
+    event_bus.subscribe("resource.updated", handle_resource_embedding_changed)
+    event_bus.subscribe("ingestion.completed", handle_resource_embedding_changed)
+    event_bus.subscribe("resource.deleted", handle_resource_deleted)
+    event_bus.subscribe("resource.chunked", handle_resource_chunked)
+    for event_type in (
+        "resource.created",
+        "resource.updated",
+        "resource.deleted",
+        "ingestion.completed",
+    ):
+        event_bus.subscribe(event_type, handle_corpus_changed)
+
     logger.info("Search module event handlers registered")
@@ -4,7 +4,7 @@ Reranking Service
 Provides ColBERT-style reranking functionality using cross-encoder models.
 """
 
-from typing import List, Tuple, Optional
+from typing import List, Tuple
 from sqlalchemy.orm import Session
 import logging
 
@@ -18,6 +18,20 @@ except ImportError:
     CROSSENCODER_AVAILABLE = False
     logger.info("sentence-transformers CrossEncoder not available, reranking disabled")
 
+from ...shared.model_registry import get_model_registry, register_loader
+
+
+def _load_cross_encoder(model_name: str, device: str):
+    """Model registry loader for cross-encoder models."""
+    if not CROSSENCODER_AVAILABLE:
+        return None
+    if device == "auto":
+        return CrossEncoder(model_name, max_length=512)
+    return CrossEncoder(model_name, max_length=512, device=device)
+
+
+register_loader("cross_encoder", _load_cross_encoder)
+
 
 class RerankingService:
     """
@@ -39,27 +53,6 @@ class RerankingService:
         """
         self.db = db
         self.model_name = model_name
-        self.model: Optional["CrossEncoder"] = None
-        self._model_loaded = False
-
-    def _load_model(self):
-        """Lazy load the cross-encoder model on first use."""
-        if self._model_loaded:
-            return
-        
-        self._model_loaded = True
-        
-        if not CROSSENCODER_AVAILABLE:
-            logger.warning("CrossEncoder not available, reranking will be skipped")
-            return
-            
-        try:
-            logger.info(f"Loading cross-encoder model: {self.model_name}")
-            self.model = CrossEncoder(self.model_name, max_length=512)
-            logger.info("Cross-encoder model loaded successfully")
-        except Exception as e:
-            logger.warning(f"Could not load reranking model: {e}")
-            self.model = None
 
     def rerank(
         self, query: str, candidates: List[Tuple[str, float]], top_k: int = None
@@ -67,6 +60,9 @@ class RerankingService:
         """
         Rerank candidates using cross-encoder.
 
+        The model is leased from the shared registry for the scoring call
+        only, so an idle reranker never pins it in memory.
+
         Args:
             query: Search query
             candidates: List of (resource_id, score) tuples
@@ -78,17 +74,12 @@ class RerankingService:
         if not candidates:
             return []
 
-        # Lazy load model on first use
-        self._load_model()
+        if not CROSSENCODER_AVAILABLE:
+            # No reranking model available, return candidates as-is
+            logger.debug("Reranking model not available, returning original ranking")
+            return candidates[:top_k] if top_k else candidates
 
         try:
-            if self.model is None:
-                # No reranking model available, return candidates as-is
-                logger.debug(
-                    "Reranking model not available, returning original ranking"
-                )
-                return candidates[:top_k] if top_k else candidates
-
             # Fetch resource content for reranking
             from ...database.models import Resource
 
@@ -115,7 +106,12 @@ class RerankingService:
                 return candidates[:top_k] if top_k else candidates
 
             # Compute relevance scores using cross-encoder
-            scores = self.model.predict(pairs)
+            with get_model_registry().use(
+                "cross_encoder", self.model_name, optional=True
+            ) as model:
+                if model is None:
+                    return candidates[:top_k] if top_k else candidates
+                scores = model.predict(pairs)
             
             # Combine IDs with new scores and sort by score descending
             reranked = sorted(
@@ -0,0 +1,210 @@
+"""
+Search Result Cache
+
+Caches serialized responses of the hybrid and three-way hybrid search
+endpoints in Redis, namespaced by a corpus generation counter:
+
+    search_result:{endpoint}:g{generation}:{digest}
+
+Any corpus change bumps the generation with a single INCR, so a resource
+edit invalidates every cached search without enumerating keys (the old
+``search_query:*`` pattern delete ran Redis KEYS). Entries of previous
+generations are never read again and expire through their TTL.
+
+cleanup() removes superseded entries early with SCAN, in bounded batches.
+
+See app/shared/cache.py for the underlying Redis client.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from ...config.settings import get_settings
+from ...shared.cache import CacheStats, cache
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "search_result"
+GENERATION_KEY = "search_gen"
+
+
+def _params_digest(params: Dict[str, Any]) -> str:
+    canonical = json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SearchResultCache:
+    """Generation-namespaced Redis cache for search responses.
+
+    Attributes:
+        ttl: Seconds an entry lives
+        stats: Per-endpoint CacheStats (hits, misses)
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        ttl: Optional[int] = None,
+        retry_after: float = 30.0,
+    ):
+        """Initialize the search result cache.
+
+        Args:
+            redis_client: Redis client with decode_responses=True (defaults to
+                         the shared CacheService client)
+            ttl: Entry TTL in seconds
+            retry_after: Seconds to skip Redis after a connection error
+        """
+        self.redis = redis_client if redis_client is not None else cache.redis
+        self.ttl = ttl if ttl is not None else getattr(
+            get_settings(), "SEARCH_CACHE_TTL", 300
+        )
+        self.retry_after = retry_after
+        self.stats: Dict[str, CacheStats] = {}
+        self._lock = threading.Lock()
+        self._redis_down_until = 0.0
+
+    def _usable(self) -> bool:
+        return self.redis is not None and time.monotonic() >= self._redis_down_until
+
+    def _failed(self, e: Exception) -> None:
+        logger.warning(
+            f"Search result cache Redis error, skipping Redis for {self.retry_after:.0f}s: {e}"
+        )
+        self._redis_down_until = time.monotonic() + self.retry_after
+
+    def _endpoint_stats(self, endpoint: str) -> CacheStats:
+        with self._lock:
+            stats = self.stats.get(endpoint)
+            if stats is None:
+                stats = self.stats[endpoint] = CacheStats()
+            return stats
+
+    def _key(self, endpoint: str, params: Dict[str, Any]) -> str:
+        """Build the cache key under the current corpus generation."""
+        generation = int(self.redis.get(GENERATION_KEY) or 0)
+        return f"{KEY_PREFIX}:{endpoint}:g{generation}:{_params_digest(params)}"
+
+    def get(self, endpoint: str, params: Dict[str, Any]) -> Optional[Any]:
+        """Look up a cached response.
+
+        Args:
+            endpoint: Endpoint name (e.g. "three_way_hybrid")
+            params: Request parameters that determine the response
+
+        Returns:
+            The cached JSON value, or None on a miss
+        """
+        stats = self._endpoint_stats(endpoint)
+        if not self._usable():
+            stats.record_miss()
+            return None
+        try:
+            raw = self.redis.get(self._key(endpoint, params))
+        except Exception as e:
+            self._failed(e)
+            stats.record_miss()
+            return None
+
+        if raw is None:
+            stats.record_miss()
+            return None
+        stats.record_hit()
+        return json.loads(raw)
+
+    def set(self, endpoint: str, params: Dict[str, Any], value: Any) -> None:
+        """Store a response under the current generation.
+
+        A response computed while the generation moved on is stored under
+        the generation read here and is simply never served.
+
+        Args:
+            endpoint: Endpoint name
+            params: Request parameters that determine the response
+            value: JSON-serializable response
+        """
+        if not self._usable():
+            return
+        try:
+            key = self._key(endpoint, params)
+            self.redis.setex(key, self.ttl, json.dumps(value, default=str))
+        except Exception as e:
+            self._failed(e)
+
+    def invalidate(self) -> Optional[int]:
+        """Invalidate every cached search by bumping the corpus generation.
+
+        Returns:
+            The new generation, or None if Redis is unavailable
+        """
+        if not self._usable():
+            return None
+        try:
+            return int(self.redis.incr(GENERATION_KEY))
+        except Exception as e:
+            self._failed(e)
+            return None
+
+    def cleanup(self, batch_size: int = 500, max_keys: int = 100_000) -> int:
+        """Delete entries of superseded generations using SCAN.
+
+        Args:
+            batch_size: SCAN COUNT hint and delete batch size
+            max_keys: Maximum keys inspected in one call
+
+        Returns:
+            Number of entries deleted
+        """
+        if not self._usable():
+            return 0
+
+        try:
+            current = int(self.redis.get(GENERATION_KEY) or 0)
+            deleted = 0
+            inspected = 0
+            stale = []
+            for key in self.redis.scan_iter(match=f"{KEY_PREFIX}:*", count=batch_size):
+                inspected += 1
+                # search_result:{endpoint}:g{generation}:{digest}
+                parts = key.split(":")
+                if len(parts) > 2 and parts[2] != f"g{current}":
+                    stale.append(key)
+                if len(stale) >= batch_size:
+                    deleted += self.redis.unlink(*stale)
+                    stale = []
+                if inspected >= max_keys:
+                    break
+            if stale:
+                deleted += self.redis.unlink(*stale)
+        except Exception as e:
+            self._failed(e)
+            return 0
+
+        if deleted:
+            logger.info(f"Removed {deleted} superseded search result cache entries")
+        return deleted
+
+    def stats_dict(self) -> Dict[str, Any]:
+        """Per-endpoint hit rates for monitoring."""
+        with self._lock:
+            endpoints = dict(self.stats)
+        return {
+            "ttl": self.ttl,
+            "redis_available": self._usable(),
+            "endpoints": {
+                name: {
+                    "hit_rate": round(stats.hit_rate(), 4),
+                    "hits": stats.hits,
+                    "misses": stats.misses,
+                }
+                for name, stats in endpoints.items()
+            },
+        }
+
+
+# Process-wide search result cache
+search_result_cache = SearchResultCache()
@@ -46,6 +46,8 @@ from ...services.search_service import AdvancedSearchService
 from .sparse_embeddings import SparseEmbeddingService
 from ...database.models import Resource
 from .service import SearchService
+from .result_cache import search_result_cache
+from ...config.settings import get_settings
 
 
 router = APIRouter(prefix="", tags=["search"])
@@ -62,7 +64,16 @@ def search_endpoint(payload: SearchQuery, db: Session = Depends(get_sync_db)):
     - Pagination and sorting
     - Faceted search results
     - Search result snippets
+
+    Responses are cached until the corpus changes (see result_cache.py).
     """
+    use_cache = get_settings().SEARCH_CACHE_ENABLED
+    params = payload.model_dump(mode="json")
+    if use_cache:
+        cached = search_result_cache.get("hybrid", params)
+        if cached is not None:
+            return SearchResults.model_validate(cached)
+
     try:
         result = AdvancedSearchService.search(db, payload)
         if len(result) == 4:
@@ -71,9 +82,14 @@ def search_endpoint(payload: SearchQuery, db: Session = Depends(get_sync_db)):
             items, total, facets = result
             snippets = {}
         items_read = [ResourceRead.model_validate(it) for it in items]
-        return SearchResults(
+        response = SearchResults(
             total=total, items=items_read, facets=facets, snippets=snippets
         )
+        if use_cache:
+            search_result_cache.set(
+                "hybrid", params, response.model_dump(mode="json")
+            )
+        return response
     except ValueError as ve:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
@@ -112,8 +128,24 @@ def three_way_hybrid_search_endpoint(
     4. Optionally reranking top results using ColBERT cross-encoder
 
     Returns results with detailed metadata including latency, method contributions,
-    and the weights used for fusion.
+    and the weights used for fusion. Responses are cached until the corpus
+    changes (see result_cache.py); a cached response reports the latency of
+    the original computation.
     """
+    use_cache = get_settings().SEARCH_CACHE_ENABLED
+    params = {
+        "query": query,
+        "limit": limit,
+        "offset": offset,
+        "enable_reranking": enable_reranking,
+        "adaptive_weighting": adaptive_weighting,
+        "hybrid_weight": hybrid_weight,
+    }
+    if use_cache:
+        cached = search_result_cache.get("three_way_hybrid", params)
+        if cached is not None:
+            return ThreeWayHybridResults.model_validate(cached)
+
     try:
         search_query = SearchQuery(
             text=query, limit=limit, offset=offset, hybrid_weight=hybrid_weight
@@ -130,7 +162,7 @@ def three_way_hybrid_search_endpoint(
 
         items_read = [ResourceRead.model_validate(resource) for resource in resources]
 
-        return ThreeWayHybridResults(
+        response = ThreeWayHybridResults(
             total=total,
             items=items_read,
             facets=facets,
@@ -141,6 +173,11 @@ def three_way_hybrid_search_endpoint(
             ),
             weights_used=metadata.get("weights_used", [1.0 / 3, 1.0 / 3, 1.0 / 3]),
         )
+        if use_cache:
+            search_result_cache.set(
+                "three_way_hybrid", params, response.model_dump(mode="json")
+            )
+        return response
 
     except ValueError as ve:
         raise HTTPException(
@@ -20,7 +20,7 @@ Architecture:
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -152,8 +152,10 @@ class SearchService:
         """
         Execute parent-child retrieval strategy.
 
-        Retrieves top-k chunks by embedding similarity, then expands to parent
-        resources and surrounding chunks for context.
+        Retrieves top-k chunks from the chunk ANN index (falling back to
+        lexical scoring for chunks without a stored vector), then expands to
+        parent resources and surrounding chunks for context. Surrounding
+        chunks for all hits are fetched in a single range query.
 
         Args:
             query: Search query text
@@ -168,7 +170,6 @@ class SearchService:
             - surrounding_chunks: List of dicts with chunk data
             - score: Similarity score
         """
-        from ...database.models import DocumentChunk, Resource
         from ...shared.embeddings import EmbeddingService
 
         logger.info(
@@ -187,39 +188,19 @@ class SearchService:
             logger.error("Failed to generate query embedding")
             return []
 
-        # Retrieve top-k chunks by embedding similarity
-        # Note: This is a simplified implementation. In production, this would use:
-        # - FAISS index for fast similarity search
-        # - PostgreSQL pgvector extension
-        # - Approximate nearest neighbor search
-
-        # For now, we'll retrieve chunks and compute similarity in Python
-        chunks_query = self.db.query(DocumentChunk).join(Resource)
-
-        # Apply filters if provided
-        if filters:
-            if "resource_type" in filters:
-                chunks_query = chunks_query.filter(
-                    Resource.type == filters["resource_type"]
-                )
-            if "min_quality_score" in filters:
-                chunks_query = chunks_query.filter(
-                    Resource.quality_score >= filters["min_quality_score"]
-                )
-
-        all_chunks = chunks_query.all()
-
-        # Compute similarity scores (simplified - would use vector DB in production)
-        chunk_scores = []
-        for chunk in all_chunks:
-            # In production, chunk embeddings would be stored and indexed
-            # For now, we'll use a placeholder score based on text similarity
-            score = self._compute_similarity_score(query, chunk.content)
-            chunk_scores.append((chunk, score))
+        # Retrieve top-k chunks from the chunk ANN index, then chunks that
+        # have no stored vector yet (scored lexically)
+        top_chunks = self._search_chunk_vectors(query_embedding, top_k, filters)
+        if len(top_chunks) < top_k:
+            top_chunks.extend(
+                self._search_unembedded_chunks(query, top_k - len(top_chunks), filters)
+            )
 
-        # Sort by score and take top-k
-        chunk_scores.sort(key=lambda x: x[1], reverse=True)
-        top_chunks = chunk_scores[:top_k]
+        # Fetch surrounding chunks for all hits in one query
+        surrounding_by_hit = self._get_surrounding_chunks_batch(
+            [(chunk.resource_id, chunk.chunk_index) for chunk, _ in top_chunks],
+            context_window,
+        )
 
         # Expand to parent resources and surrounding chunks
         results = []
@@ -229,16 +210,14 @@ class SearchService:
             # Get parent resource
             parent_resource = chunk.resource
 
-            # Get surrounding chunks
-            surrounding_chunks = self._get_surrounding_chunks(
-                chunk.resource_id, chunk.chunk_index, context_window
-            )
-
             # Deduplicate: if we've already included this resource, skip
             if parent_resource.id in seen_resources:
                 continue
 
             seen_resources.add(parent_resource.id)
+            surrounding_chunks = surrounding_by_hit.get(
+                (chunk.resource_id, chunk.chunk_index), []
+            )
 
             # Convert ORM objects to dictionaries
             results.append(
@@ -268,42 +247,232 @@ class SearchService:
         logger.info(f"Parent-child search returned {len(results)} results")
         return results
 
-    def _get_surrounding_chunks(
-        self, resource_id: str, chunk_index: int, context_window: int
-    ) -> List:
+    @staticmethod
+    def _chunk_passes_filters(chunk, filters: Optional[dict]) -> bool:
+        """Check a chunk's parent resource against parent-child search filters."""
+        if not filters:
+            return True
+        resource = chunk.resource
+        if "resource_type" in filters and resource.type != filters["resource_type"]:
+            return False
+        if "min_quality_score" in filters and (
+            resource.quality_score is None
+            or resource.quality_score < filters["min_quality_score"]
+        ):
+            return False
+        return True
+
+    def _search_chunk_vectors(
+        self, query_embedding: List[float], top_k: int, filters: Optional[dict]
+    ) -> List[Tuple[Any, float]]:
         """
-        Get surrounding chunks for context.
+        Top-k chunks by cosine similarity from the chunk ANN index.
+
+        Over-fetches from the index and widens the search until ``top_k``
+        chunks pass the resource filters or the index is exhausted. The index
+        is delta-synced once, before the first search. Hits for chunks that
+        no longer exist are evicted from the index.
 
         Args:
-            resource_id: Parent resource ID
-            chunk_index: Index of the retrieved chunk
+            query_embedding: Query vector
+            top_k: Number of chunks to return
+            filters: Optional resource filters
+
+        Returns:
+            List of (DocumentChunk, score) tuples, best first
+        """
+        import uuid
+
+        from sqlalchemy.orm import joinedload
+
+        from ...database.models import DocumentChunk
+        from .chunk_index import evict_chunks, search_chunk_index
+
+        selected: List[Tuple[Any, float]] = []
+        processed = 0
+        fetch = max(top_k * 4, 32)
+        synced = False
+
+        while len(selected) < top_k:
+            hits = search_chunk_index(
+                self.db, query_embedding, limit=fetch, sync=not synced
+            )
+            synced = True
+            new_hits = hits[processed:]
+            if not new_hits:
+                break
+            processed = len(hits)
+
+            chunk_ids = []
+            for chunk_id, _ in new_hits:
+                try:
+                    chunk_ids.append(uuid.UUID(chunk_id))
+                except (ValueError, TypeError):
+                    continue
+            loaded = {
+                str(chunk.id): chunk
+                for chunk in self.db.query(DocumentChunk)
+                .options(joinedload(DocumentChunk.resource))
+                .filter(DocumentChunk.id.in_(chunk_ids))
+                .all()
+            }
+            evict_chunks(self.db, [cid for cid, _ in new_hits if cid not in loaded])
+
+            for chunk_id, score in new_hits:
+                chunk = loaded.get(chunk_id)
+                if chunk is not None and self._chunk_passes_filters(chunk, filters):
+                    selected.append((chunk, score))
+                    if len(selected) >= top_k:
+                        break
+
+            if len(hits) < fetch:
+                break
+            fetch *= 2
+
+        return selected
+
+    def _search_unembedded_chunks(
+        self, query: str, limit: int, filters: Optional[dict]
+    ) -> List[Tuple[Any, float]]:
+        """
+        Score chunks without a stored vector by query word overlap.
+
+        Covers chunks whose embeddings are still pending (or failed) so they
+        remain retrievable; chunks with vectors are served by the ANN index.
+        Only chunks containing a query word are loaded and scored; the rest
+        score zero and are only fetched (up to ``limit``) to pad the result.
+
+        Args:
+            query: Query text
+            limit: Maximum number of chunks
+            filters: Optional resource filters
+
+        Returns:
+            List of (DocumentChunk, score) tuples, best first
+        """
+        from sqlalchemy import func, or_
+        from sqlalchemy.orm import joinedload
+
+        from ...database.models import DocumentChunk, Resource
+
+        if limit <= 0:
+            return []
+
+        chunks_query = (
+            self.db.query(DocumentChunk)
+            .join(Resource)
+            .options(joinedload(DocumentChunk.resource))
+            .filter(DocumentChunk.embedding.is_(None))
+        )
+        if filters:
+            if "resource_type" in filters:
+                chunks_query = chunks_query.filter(
+                    Resource.type == filters["resource_type"]
+                )
+            if "min_quality_score" in filters:
+                chunks_query = chunks_query.filter(
+                    Resource.quality_score >= filters["min_quality_score"]
+                )
+
+        words = set(query.lower().split())
+        chunk_scores = []
+        if words:
+            content = func.lower(DocumentChunk.content)
+            matching = chunks_query.filter(
+                or_(*[content.contains(word, autoescape=True) for word in words])
+            )
+            chunk_scores = [
+                (chunk, self._compute_similarity_score(query, chunk.content))
+                for chunk in matching.all()
+            ]
+            chunk_scores.sort(key=lambda x: x[1], reverse=True)
+            chunk_scores = chunk_scores[:limit]
+
+        if len(chunk_scores) < limit:
+            seen = [chunk.id for chunk, _ in chunk_scores]
+            padding = chunks_query
+            if seen:
+                padding = padding.filter(DocumentChunk.id.notin_(seen))
+            chunk_scores.extend(
+                (chunk, 0.0) for chunk in padding.limit(limit - len(chunk_scores)).all()
+            )
+        return chunk_scores
+
+    def _get_surrounding_chunks_batch(
+        self, hits: List[Tuple[Any, int]], context_window: int
+    ) -> Dict[Tuple[Any, int], List]:
+        """
+        Get surrounding chunks for many hits with a single range query.
+
+        Args:
+            hits: (resource_id, chunk_index) pairs
             context_window: Number of chunks to include before and after
 
         Returns:
-            List of DocumentChunk objects
+            Dict mapping each (resource_id, chunk_index) hit to its surrounding
+            DocumentChunk objects ordered by chunk_index
         """
         from ...database.models import DocumentChunk
-        from sqlalchemy import and_
+        from sqlalchemy import and_, or_
+
+        if not hits:
+            return {}
 
-        # Calculate range
-        start_index = max(0, chunk_index - context_window)
-        end_index = chunk_index + context_window
+        ranges = {}
+        for resource_id, chunk_index in hits:
+            ranges[(resource_id, chunk_index)] = (
+                max(0, chunk_index - context_window),
+                chunk_index + context_window,
+            )
 
-        # Query surrounding chunks
-        surrounding = (
+        rows = (
             self.db.query(DocumentChunk)
             .filter(
-                and_(
-                    DocumentChunk.resource_id == resource_id,
-                    DocumentChunk.chunk_index >= start_index,
-                    DocumentChunk.chunk_index <= end_index,
+                or_(
+                    *[
+                        and_(
+                            DocumentChunk.resource_id == resource_id,
+                            DocumentChunk.chunk_index >= start,
+                            DocumentChunk.chunk_index <= end,
+                        )
+                        for (resource_id, _), (start, end) in ranges.items()
+                    ]
                 )
             )
-            .order_by(DocumentChunk.chunk_index)
+            .order_by(DocumentChunk.resource_id, DocumentChunk.chunk_index)
             .all()
         )
 
-        return surrounding
+        by_resource: Dict[Any, List] = {}
+        for row in rows:
+            by_resource.setdefault(row.resource_id, []).append(row)
+
+        return {
+            (resource_id, chunk_index): [
+                row
+                for row in by_resource.get(resource_id, [])
+                if start <= row.chunk_index <= end
+            ]
+            for (resource_id, chunk_index), (start, end) in ranges.items()
+        }
+
+    def _get_surrounding_chunks(
+        self, resource_id: str, chunk_index: int, context_window: int
+    ) -> List:
+        """
+        Get surrounding chunks for context.
+
+        Args:
+            resource_id: Parent resource ID
+            chunk_index: Index of the retrieved chunk
+            context_window: Number of chunks to include before and after
+
+        Returns:
+            List of DocumentChunk objects
+        """
+        return self._get_surrounding_chunks_batch(
+            [(resource_id, chunk_index)], context_window
+        )[(resource_id, chunk_index)]
 
     def _compute_similarity_score(self, query: str, text: str) -> float:
         """
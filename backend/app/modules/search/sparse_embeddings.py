@@ -5,7 +5,9 @@ Provides sparse vector embedding generation for learned keyword search.
 Uses BGE-M3 model for generating sparse representations.
 """
 
-from typing import Dict, List, Optional
+import hashlib
+from contextlib import nullcontext
+from typing import Dict, List, Tuple
 from sqlalchemy.orm import Session
 import logging
 
@@ -19,6 +21,47 @@ except ImportError:
     BGEM3_AVAILABLE = False
     logger.info("FlagEmbedding not available, using TF-IDF fallback for sparse embeddings")
 
+from ...shared.model_registry import get_model_registry, register_loader
+
+
+def _load_bge_m3(model_name: str, device: str):
+    """Model registry loader for BGE-M3 (fp16 weights, CPU unless asked)."""
+    if not BGEM3_AVAILABLE:
+        return None
+    return BGEM3FlagModel(
+        model_name,
+        use_fp16=True,  # Memory efficient
+        device="cpu" if device == "auto" else device,
+    )
+
+
+register_loader("bge_m3", _load_bge_m3)
+
+# Model name recorded for vectors produced by the hashed-term fallback
+FALLBACK_MODEL_NAME = "tf-blake2b"
+
+# BGE-M3 (XLM-RoBERTa) vocabulary size; real BGE-M3 token ids are below it.
+# Fallback vectors from before stable_token_id were stored under the BGE-M3
+# model name with salted hash() % 2**31 ids, which almost always exceed it.
+BGE_M3_VOCAB_SIZE = 250002
+
+
+def stable_token_id(term: str) -> int:
+    """
+    Map a term to a token ID that is stable across processes and restarts.
+
+    Python's built-in ``hash()`` is salted per process (PYTHONHASHSEED), so it
+    cannot be used for IDs that are persisted or shared between workers.
+
+    Args:
+        term: Token text
+
+    Returns:
+        Non-negative 31-bit token ID
+    """
+    digest = hashlib.blake2b(term.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % (2**31)
+
 
 class SparseEmbeddingService:
     """
@@ -38,31 +81,18 @@ class SparseEmbeddingService:
         """
         self.db = db
         self.model_name = model_name
-        self.model: Optional["BGEM3FlagModel"] = None
-        self._model_loaded = False
-
-    def _load_model(self):
-        """Lazy load the sparse embedding model on first use."""
-        if self._model_loaded:
-            return
-        
-        self._model_loaded = True
-        
+
+    def _lease(self):
+        """Lease the shared BGE-M3 model for one call.
+
+        Yields None when BGE-M3 is unavailable (TF-IDF fallback). The model
+        is never kept on the service, so the registry can evict it.
+        """
         if not BGEM3_AVAILABLE:
-            logger.warning("BGE-M3 model not available, using TF-IDF fallback")
-            return
-            
-        try:
-            logger.info(f"Loading BGE-M3 model: {self.model_name}")
-            self.model = BGEM3FlagModel(
-                self.model_name,
-                use_fp16=True,  # Memory efficient
-                device="cpu"  # Start with CPU, can be changed to "cuda" if available
-            )
-            logger.info("BGE-M3 model loaded successfully")
-        except Exception as e:
-            logger.warning(f"Could not load BGE-M3 model, using fallback: {e}")
-            self.model = None
+            return nullcontext(None)
+        return get_model_registry().use(
+            "bge_m3", self.model_name, "cpu", optional=True
+        )
 
     def generate_embedding(self, text: str) -> Dict[int, float]:
         """
@@ -77,21 +107,19 @@ class SparseEmbeddingService:
         if not text or not text.strip():
             return {}
 
-        # Lazy load model on first use
-        self._load_model()
-
         try:
-            if self.model is None:
-                # Fallback: simple TF-IDF-like sparse representation
-                return self._generate_fallback_sparse(text)
-
-            # Use BGE-M3 model to generate sparse embedding
-            output = self.model.encode(
-                [text], 
-                return_sparse=True,
-                return_dense=False,
-                return_colbert_vecs=False
-            )
+            with self._lease() as model:
+                if model is None:
+                    # Fallback: simple TF-IDF-like sparse representation
+                    return self._generate_fallback_sparse(text)
+
+                # Use BGE-M3 model to generate sparse embedding
+                output = model.encode(
+                    [text],
+                    return_sparse=True,
+                    return_dense=False,
+                    return_colbert_vecs=False
+                )
             sparse_vec = output.get('lexical_weights', [{}])[0]
             return {int(k): float(v) for k, v in sparse_vec.items()}
 
@@ -100,6 +128,32 @@ class SparseEmbeddingService:
             # Fallback on error
             return self._generate_fallback_sparse(text)
 
+    # Name used by the resource ingestion pipeline and the search router
+    generate_sparse_embedding = generate_embedding
+
+    @property
+    def active_model_name(self) -> str:
+        """Model name to record alongside generated vectors."""
+        with self._lease() as model:
+            return self.model_name if model is not None else FALLBACK_MODEL_NAME
+
+    def search_by_sparse_vector(
+        self, query_sparse: Dict[int, float], limit: int = 100
+    ) -> List[Tuple[str, float]]:
+        """
+        Top-k resources by sparse dot product using the inverted index.
+
+        Args:
+            query_sparse: Sparse query vector
+            limit: Maximum number of results
+
+        Returns:
+            List of (resource_id, score) tuples
+        """
+        from .sparse_index import search_sparse_index
+
+        return search_sparse_index(self.db, query_sparse, limit=limit)
+
     def _generate_fallback_sparse(self, text: str) -> Dict[int, float]:
         """
         Generate simple sparse representation as fallback.
@@ -110,7 +164,7 @@ class SparseEmbeddingService:
             text: Input text
 
         Returns:
-            Dictionary mapping token hashes to weights
+            Dictionary mapping stable token hashes to weights
         """
         from collections import Counter
 
@@ -128,7 +182,7 @@ class SparseEmbeddingService:
         # Create sparse vector using hash of terms as IDs
         sparse_vec = {}
         for term, freq in term_freq.items():
-            term_id = hash(term) % (2**31)  # Use hash as token ID
+            term_id = stable_token_id(term)
             weight = freq / doc_length  # Simple TF normalization
             sparse_vec[term_id] = weight
 
@@ -138,13 +192,59 @@ class SparseEmbeddingService:
         """
         Generate sparse embeddings for multiple texts.
 
+        Texts are encoded in length-bucketed batches (see
+        ``app.shared.embeddings.plan_batches``); a failed batch falls back to
+        one text at a time.
+
         Args:
             texts: List of input texts
 
         Returns:
-            List of sparse embeddings
+            List of sparse embeddings, in input order
         """
-        return [self.generate_embedding(text) for text in texts]
+        from ...config.settings import get_settings
+        from ...shared.embeddings import estimate_tokens, plan_batches
+
+        results: List[Dict[int, float]] = [{} for _ in texts]
+        positions = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not positions:
+            return results
+
+        with self._lease() as model:
+            if model is None:
+                for i in positions:
+                    results[i] = self._generate_fallback_sparse(texts[i])
+                return results
+
+            settings = get_settings()
+            lengths = [estimate_tokens(texts[i]) for i in positions]
+            batches = plan_batches(
+                lengths,
+                getattr(settings, "EMBEDDING_MAX_BATCH_TOKENS", 8192),
+                getattr(settings, "EMBEDDING_MAX_BATCH_SIZE", 64),
+            )
+            for batch in batches:
+                batch_texts = [texts[positions[j]] for j in batch]
+                try:
+                    output = model.encode(
+                        batch_texts,
+                        batch_size=len(batch_texts),
+                        return_sparse=True,
+                        return_dense=False,
+                        return_colbert_vecs=False,
+                    )
+                    for j, sparse_vec in zip(batch, output.get("lexical_weights", [])):
+                        results[positions[j]] = {
+                            int(k): float(v) for k, v in sparse_vec.items()
+                        }
+                except Exception as e:
+                    logger.warning(
+                        f"Batch sparse embedding failed for {len(batch_texts)} texts, "
+                        f"retrying individually: {e}"
+                    )
+                    for j, text in zip(batch, batch_texts):
+                        results[positions[j]] = self.generate_embedding(text)
+        return results
 
     def batch_update_sparse_embeddings(
         self, resource_ids: List[str] = None, batch_size: int = 32
@@ -160,6 +260,7 @@ class SparseEmbeddingService:
         from sqlalchemy import or_
         import json
         from datetime import datetime
+        from .sparse_index import index_resources_sparse
 
         try:
             # Query resources to process
@@ -182,18 +283,22 @@ class SparseEmbeddingService:
             for i in range(0, total, batch_size):
                 batch = resources[i : i + batch_size]
 
-                for resource in batch:
-                    # Generate sparse embedding
-                    text = resource.description or resource.title or ""
-                    sparse_vec = self.generate_embedding(text)
+                # Generate sparse embeddings for the whole slice in one call
+                texts = [r.description or r.title or "" for r in batch]
+                sparse_vecs = self.batch_generate_embeddings(texts)
 
+                for resource, sparse_vec in zip(batch, sparse_vecs):
                     # Store as JSON
                     resource.sparse_embedding = json.dumps(sparse_vec)
-                    resource.sparse_embedding_model = self.model_name
+                    resource.sparse_embedding_model = self.active_model_name
                     resource.sparse_embedding_updated_at = datetime.utcnow()
+                batch_ids = [resource.id for resource in batch]
 
                 # Commit batch
                 self.db.commit()
+
+                # Keep the inverted index in step (skipped until first build)
+                index_resources_sparse(self.db, batch_ids)
                 logger.info(f"Processed {min(i + batch_size, total)}/{total} resources")
 
             logger.info(f"Completed sparse embedding generation for {total} resources")
@@ -202,3 +307,57 @@ class SparseEmbeddingService:
             logger.error(f"Error in batch sparse embedding generation: {e}")
             self.db.rollback()
             raise
+
+    def find_legacy_hashed_embeddings(self, batch_size: int = 2000) -> List[str]:
+        """
+        Find fallback vectors stored under the BGE-M3 model name.
+
+        Before stable_token_id, the fallback used salted ``hash()`` token ids
+        but recorded ``self.model_name``, so those rows look like real BGE-M3
+        vectors. They are recognized by token ids outside the BGE-M3
+        vocabulary.
+
+        Args:
+            batch_size: Rows fetched per round trip
+
+        Returns:
+            IDs of the resources whose sparse embeddings must be regenerated
+        """
+        from sqlalchemy import select
+        from ...database.models import Resource
+        from ...shared.inverted_index import parse_sparse_vector
+
+        stmt = (
+            select(Resource.id, Resource.sparse_embedding)
+            .where(
+                Resource.sparse_embedding.isnot(None),
+                Resource.sparse_embedding_model == self.model_name,
+            )
+            .execution_options(yield_per=batch_size)
+        )
+        legacy = []
+        for rid, raw in self.db.execute(stmt):
+            vec = parse_sparse_vector(raw)
+            if vec and max(vec) >= BGE_M3_VOCAB_SIZE:
+                legacy.append(str(rid))
+        return legacy
+
+    def regenerate_legacy_hashed_embeddings(self, batch_size: int = 32) -> int:
+        """
+        Re-encode the fallback vectors found by ``find_legacy_hashed_embeddings``.
+
+        Args:
+            batch_size: Batch size for processing
+
+        Returns:
+            Number of resources regenerated
+        """
+        resource_ids = self.find_legacy_hashed_embeddings()
+        if resource_ids:
+            logger.info(
+                f"Regenerating {len(resource_ids)} legacy hashed sparse embeddings"
+            )
+            self.batch_update_sparse_embeddings(
+                resource_ids=resource_ids, batch_size=batch_size
+            )
+        return len(resource_ids)
@@ -0,0 +1,266 @@
+"""
+Sparse Resource Index
+
+Keeps the shared inverted index in sync with ``Resource.sparse_embedding``
+and answers sparse top-k queries for the search module.
+
+Synchronization mirrors the dense index (see dense_index.py):
+- Event handlers and ``batch_update_sparse_embeddings`` upsert resources as
+  their sparse vectors change (``index_resources_sparse``), recording the
+  rows and watermark like a delta sync
+- Each query runs a delta sync over rows whose ``updated_at`` moved past the
+  index watermark; unchanged rows re-read inside the margin window are
+  skipped, so idle queries add no tombstones or delta postings
+- ``rebuild_sparse_index`` performs a full rebuild (CLI / maintenance)
+"""
+
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ...database.models import Resource
+from ...shared.inverted_index import (
+    InvertedIndex,
+    get_inverted_index,
+    parse_sparse_vector,
+)
+from ...shared.vector_index import schedule_maintenance
+from .dense_index import _WATERMARK_MARGIN, _changed_rows, _forget_before, _note_row
+
+logger = logging.getLogger(__name__)
+
+SPARSE_INDEX_NAME = "resources_sparse"
+
+# Persist after this many unsaved mutations (file-backed indexes only)
+_SAVE_EVERY = 500
+
+
+def get_sparse_index(db: Session) -> InvertedIndex:
+    """Return the process-wide sparse index for the session's engine."""
+    return get_inverted_index(db.get_bind(), SPARSE_INDEX_NAME)
+
+
+def _maybe_persist(index: InvertedIndex) -> None:
+    schedule_maintenance(index, _SAVE_EVERY)
+
+
+def rebuild_sparse_index(
+    db: Session, batch_size: int = 2000, save: bool = True
+) -> InvertedIndex:
+    """Rebuild the sparse index from the database.
+
+    Args:
+        db: Database session
+        batch_size: Rows fetched per round trip
+        save: Persist the index afterwards (file-backed indexes only)
+
+    Returns:
+        The rebuilt index
+    """
+    index = get_sparse_index(db)
+    start = time.time()
+
+    # Build into a fresh index so queries keep using the old one meanwhile
+    fresh = InvertedIndex(index.name, merge_threshold=index.merge_threshold)
+    watermark = None
+    stmt = (
+        select(Resource.id, Resource.sparse_embedding, Resource.updated_at)
+        .where(Resource.sparse_embedding.isnot(None))
+        .execution_options(yield_per=batch_size)
+    )
+    for i, (rid, raw, updated_at) in enumerate(db.execute(stmt), 1):
+        vec = parse_sparse_vector(raw)
+        if vec:
+            fresh.upsert(str(rid), vec)
+        _note_row(fresh, str(rid), raw, updated_at)
+        if updated_at is not None and (watermark is None or updated_at > watermark):
+            watermark = updated_at
+        if i % batch_size == 0:
+            _forget_before(fresh, watermark)
+    _forget_before(fresh, watermark)
+
+    fresh.merge()
+    fresh.watermark = watermark.isoformat() if watermark else None
+    fresh.built_at = fresh.synced_at = time.time()
+    index.adopt(fresh)
+
+    logger.info(
+        f"Rebuilt sparse resource index: {len(index)} docs in "
+        f"{(time.time() - start) * 1000:.0f}ms"
+    )
+    if save:
+        index.save()
+    return index
+
+
+def sync_sparse_index(
+    db: Session, index: Optional[InvertedIndex] = None
+) -> InvertedIndex:
+    """Bring the sparse index up to date with the database.
+
+    Args:
+        db: Database session
+        index: Optional index (defaults to the engine's sparse index)
+
+    Returns:
+        The synchronized index
+    """
+    index = index or get_sparse_index(db)
+    if index.built_at is None:
+        return rebuild_sparse_index(db)
+
+    stmt = select(Resource.id, Resource.sparse_embedding, Resource.updated_at)
+    if index.watermark:
+        since = datetime.fromisoformat(index.watermark) - _WATERMARK_MARGIN
+        stmt = stmt.where(Resource.updated_at >= since)
+
+    for rid, raw in _changed_rows(index, db.execute(stmt)):
+        vec = parse_sparse_vector(raw)
+        if vec:
+            index.upsert(rid, vec)
+        else:
+            index.remove(rid)
+    index.synced_at = time.time()
+    _maybe_persist(index)
+    return index
+
+
+def search_sparse_index(
+    db: Session, query_sparse: Dict[int, float], limit: int = 100
+) -> List[Tuple[str, float]]:
+    """Sparse top-k search over resource sparse embeddings.
+
+    Hits whose resources no longer exist are dropped and evicted.
+
+    Args:
+        db: Database session
+        query_sparse: Sparse query vector (token id -> weight)
+        limit: Maximum number of results
+
+    Returns:
+        List of (resource_id, score) tuples
+    """
+    index = sync_sparse_index(db)
+    hits = index.search(query_sparse, k=limit)
+    if not hits:
+        return []
+
+    ids = []
+    for rid, _ in hits:
+        try:
+            ids.append(uuid.UUID(rid))
+        except (ValueError, TypeError):
+            continue
+    existing = {
+        str(r)
+        for r in db.execute(select(Resource.id).where(Resource.id.in_(ids))).scalars()
+    }
+
+    results = []
+    for rid, score in hits:
+        if rid in existing:
+            results.append((rid, score))
+        else:
+            index.remove(rid)
+    return results
+
+
+def _apply_rows(index: InvertedIndex, rows: Iterable[Tuple[str, Any, Any]]) -> int:
+    """Apply freshly written (id, sparse_embedding, updated_at) rows.
+
+    Rows are remembered and the watermark advanced exactly as a delta sync
+    would, so the next query's sync does not re-apply them.
+
+    Returns:
+        Number of rows present in the index afterwards
+    """
+    watermark = datetime.fromisoformat(index.watermark) if index.watermark else None
+    upserts = []
+    for rid, raw, updated_at in rows:
+        _note_row(index, rid, raw, updated_at)
+        vec = parse_sparse_vector(raw)
+        if vec:
+            upserts.append((rid, vec))
+        else:
+            index.remove(rid)
+        if updated_at is not None and (watermark is None or updated_at > watermark):
+            watermark = updated_at
+    if upserts:
+        index.upsert_many(upserts)
+    if watermark is not None:
+        index.watermark = watermark.isoformat()
+    _maybe_persist(index)
+    return len(upserts)
+
+
+def index_resources_sparse(db: Session, resource_ids: Iterable[Any]) -> int:
+    """Upsert (or remove) resources in the sparse index after their vectors changed.
+
+    Args:
+        db: Database session
+        resource_ids: Resource IDs
+
+    Returns:
+        Number of the resources present in the index afterwards
+    """
+    index = get_sparse_index(db)
+    if index.built_at is None:
+        return 0
+
+    rids = []
+    for resource_id in resource_ids:
+        try:
+            rids.append(uuid.UUID(str(resource_id)))
+        except (ValueError, TypeError):
+            continue
+    if not rids:
+        return 0
+
+    found = {
+        str(rid): (raw, updated_at)
+        for rid, raw, updated_at in db.execute(
+            select(Resource.id, Resource.sparse_embedding, Resource.updated_at).where(
+                Resource.id.in_(rids)
+            )
+        )
+    }
+    # Deleted resources are removed from the index
+    return _apply_rows(
+        index,
+        [(str(rid), *found.get(str(rid), (None, None))) for rid in rids],
+    )
+
+
+def index_resource_sparse(db: Session, resource_id: str) -> bool:
+    """Upsert (or remove) a single resource in the sparse index.
+
+    Args:
+        db: Database session
+        resource_id: Resource ID
+
+    Returns:
+        True if the resource is present in the index afterwards
+    """
+    return index_resources_sparse(db, [resource_id]) == 1
+
+
+def remove_resource_sparse(db: Session, resource_id: str) -> bool:
+    """Remove a resource from the sparse index.
+
+    Args:
+        db: Database session
+        resource_id: Resource ID
+
+    Returns:
+        True if the resource was indexed
+    """
+    index = get_sparse_index(db)
+    removed = index.remove(str(resource_id))
+    if removed:
+        _maybe_persist(index)
+    return removed
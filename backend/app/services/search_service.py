@@ -5,18 +5,47 @@ Legacy service for backward compatibility.
 Provides basic search functionality.
 """
 
-from typing import Any, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import threading
 import time
-import json
-import numpy as np
 from sqlalchemy.orm import Session
-from sqlalchemy import text, or_
+from sqlalchemy import or_, text
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
 
 from ..database.models import Resource
 from ..modules.search.rrf import ReciprocalRankFusionService
 from ..modules.search.reranking import RerankingService
 from ..modules.search.sparse_embeddings import SparseEmbeddingService
+from ..modules.search.dense_index import search_resource_index
+from ..modules.search.fts_index import ensure_fts_schema, fts_search
+from ..modules.search.sparse_index import search_sparse_index
 from ..shared.embeddings import EmbeddingService
+from ..config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Shared pool for concurrent retrieval legs (three legs per in-flight query)
+_LEG_WORKERS = 12
+_leg_executor: Optional[ThreadPoolExecutor] = None
+_leg_executor_lock = threading.Lock()
+
+# Legs in flight across all queries, including legs still finishing after
+# their query timed out. A leg is only submitted when it can take a slot, so
+# it never queues behind stragglers and at most _LEG_WORKERS leg sessions
+# hold database connections at once.
+_leg_slots = threading.BoundedSemaphore(_LEG_WORKERS)
+
+
+def _get_leg_executor() -> ThreadPoolExecutor:
+    global _leg_executor
+    with _leg_executor_lock:
+        if _leg_executor is None:
+            _leg_executor = ThreadPoolExecutor(
+                max_workers=_LEG_WORKERS, thread_name_prefix="search-leg"
+            )
+        return _leg_executor
 
 
 class AdvancedSearchService:
@@ -69,7 +98,8 @@ class AdvancedSearchService:
         Execute three-way hybrid search combining FTS5, dense vectors, and sparse vectors.
 
         This method implements state-of-the-art search by:
-        1. Executing three retrieval methods in parallel (FTS5, dense, sparse)
+        1. Executing three retrieval methods in parallel (FTS5, dense, sparse),
+           dropping any leg that exceeds SEARCH_LEG_TIMEOUT_MS
         2. Merging results using Reciprocal Rank Fusion (RRF)
         3. Applying query-adaptive weighting based on query characteristics
         4. Optionally reranking top results using ColBERT cross-encoder
@@ -94,26 +124,13 @@ class AdvancedSearchService:
         limit = query.limit if hasattr(query, "limit") else 20
         offset = query.offset if hasattr(query, "offset") else 0
 
-        # Step 1: Execute FTS5 search (100 candidates)
-        fts_start = time.time()
-        fts_results = AdvancedSearchService._execute_fts_search(
-            db, query_text, limit=100
-        )
-        fts_time = (time.time() - fts_start) * 1000
-
-        # Step 2: Execute dense vector search (100 candidates)
-        dense_start = time.time()
-        dense_results = AdvancedSearchService._execute_dense_search(
+        # Steps 1-3: Execute FTS5, dense and sparse retrieval (100 candidates each)
+        leg_results, leg_timing = AdvancedSearchService._run_retrieval_legs(
             db, query_text, limit=100
         )
-        dense_time = (time.time() - dense_start) * 1000
-
-        # Step 3: Execute sparse vector search (100 candidates)
-        sparse_start = time.time()
-        sparse_results = AdvancedSearchService._execute_sparse_search(
-            db, query_text, limit=100
-        )
-        sparse_time = (time.time() - sparse_start) * 1000
+        fts_results = leg_results["fts5"]
+        dense_results = leg_results["dense"]
+        sparse_results = leg_results["sparse"]
 
         # Step 4: Apply query-adaptive weighting
         if adaptive_weighting:
@@ -152,9 +169,7 @@ class AdvancedSearchService:
                 },
                 "weights_used": weights,
                 "timing": {
-                    "fts5_ms": fts_time,
-                    "dense_ms": dense_time,
-                    "sparse_ms": sparse_time,
+                    **leg_timing,
                     "rrf_ms": rrf_time,
                     "rerank_ms": rerank_time,
                 },
@@ -193,9 +208,7 @@ class AdvancedSearchService:
             },
             "weights_used": weights,
             "timing": {
-                "fts5_ms": fts_time,
-                "dense_ms": dense_time,
-                "sparse_ms": sparse_time,
+                **leg_timing,
                 "rrf_ms": rrf_time,
                 "rerank_ms": rerank_time,
             },
@@ -203,6 +216,128 @@ class AdvancedSearchService:
 
         return ordered_resources, total, None, snippets, metadata
 
+    @staticmethod
+    def _run_retrieval_legs(
+        db: Session, query: str, limit: int = 100
+    ) -> Tuple[Dict[str, List[Tuple[str, float]]], Dict[str, Any]]:
+        """
+        Run the FTS5, dense and sparse retrieval legs.
+
+        When SEARCH_PARALLEL_LEGS is enabled and the engine's pool can hand
+        out independent connections, each leg runs on the shared thread pool
+        with its own session. Legs that do not finish within
+        SEARCH_LEG_TIMEOUT_MS contribute no candidates and are listed in
+        ``timed_out``. Timed-out legs that have not started are cancelled;
+        running ones finish in the background (on PostgreSQL their queries
+        hit a statement timeout) and close their own sessions. Legs in
+        flight are capped by ``_leg_slots``, and a leg that finds no free
+        slot runs inline on the caller's session. Single-connection pools
+        (in-memory SQLite) run the legs sequentially on the caller's session.
+
+        Args:
+            db: Database session
+            query: Search query text
+            limit: Candidates per leg
+
+        Returns:
+            Tuple of (results per leg, timing dict)
+        """
+        legs = {
+            "fts5": AdvancedSearchService._execute_fts_search,
+            "dense": AdvancedSearchService._execute_dense_search,
+            "sparse": AdvancedSearchService._execute_sparse_search,
+        }
+        settings = get_settings()
+        timeout_s = settings.SEARCH_LEG_TIMEOUT_MS / 1000.0
+        bind = db.get_bind()
+        parallel = settings.SEARCH_PARALLEL_LEGS and not isinstance(
+            getattr(bind, "pool", None), (StaticPool, SingletonThreadPool)
+        )
+
+        results: Dict[str, List[Tuple[str, float]]] = {name: [] for name in legs}
+        timing: Dict[str, Any] = {}
+        timed_out: List[str] = []
+        start = time.time()
+
+        if not parallel:
+            for name, leg in legs.items():
+                leg_start = time.time()
+                results[name] = leg(db, query, limit=limit)
+                timing[f"{name}_ms"] = (time.time() - leg_start) * 1000
+        else:
+            abandoned = threading.Event()
+
+            def run_leg(leg):
+                try:
+                    if abandoned.is_set():
+                        # The query already returned without this leg
+                        return [], 0.0
+                    leg_db = Session(bind=bind)
+                    leg_start = time.time()
+                    try:
+                        if bind.dialect.name == "postgresql":
+                            # Abort the leg's queries server-side once the
+                            # budget is spent instead of finishing unread work
+                            leg_db.execute(
+                                text(
+                                    "SET LOCAL statement_timeout = "
+                                    f"{int(settings.SEARCH_LEG_TIMEOUT_MS)}"
+                                )
+                            )
+                        return leg(leg_db, query, limit=limit), (time.time() - leg_start) * 1000
+                    finally:
+                        leg_db.close()
+                finally:
+                    _leg_slots.release()
+
+            executor = _get_leg_executor()
+            futures = {}
+            inline = []
+            for name, leg in legs.items():
+                if _leg_slots.acquire(blocking=False):
+                    futures[executor.submit(run_leg, leg)] = name
+                else:
+                    inline.append(name)
+
+            # Legs without a free slot run here on the caller's session
+            for name in inline:
+                leg_start = time.time()
+                try:
+                    results[name] = legs[name](db, query, limit=limit)
+                except Exception as e:
+                    logger.warning(f"Search leg '{name}' failed: {e}")
+                timing[f"{name}_ms"] = (time.time() - leg_start) * 1000
+            if inline:
+                logger.info(f"Search legs {inline} ran inline: leg pool saturated")
+
+            remaining = max(0.0, timeout_s - (time.time() - start))
+            done, not_done = wait(futures, timeout=remaining)
+            abandoned.set()
+            for future in done:
+                name = futures[future]
+                try:
+                    results[name], timing[f"{name}_ms"] = future.result()
+                except Exception as e:
+                    logger.warning(f"Search leg '{name}' failed: {e}")
+                    timing[f"{name}_ms"] = (time.time() - start) * 1000
+            for future in not_done:
+                name = futures[future]
+                if future.cancel():
+                    # Never started, so run_leg will not release its slot
+                    _leg_slots.release()
+                timed_out.append(name)
+                timing[f"{name}_ms"] = settings.SEARCH_LEG_TIMEOUT_MS
+                logger.warning(
+                    f"Search leg '{name}' exceeded {settings.SEARCH_LEG_TIMEOUT_MS}ms "
+                    f"and was dropped from fusion"
+                )
+
+        timing["retrieval_ms"] = (time.time() - start) * 1000
+        timing["parallel"] = parallel
+        timing["leg_timeout_ms"] = settings.SEARCH_LEG_TIMEOUT_MS
+        timing["timed_out"] = sorted(timed_out)
+        return results, timing
+
     @staticmethod
     def fts_search(
         db: Session, query: str, filters: Any, limit: int = 100, offset: int = 0
@@ -332,7 +467,7 @@ class AdvancedSearchService:
         db: Session, query: str, limit: int = 100
     ) -> List[Tuple[str, float]]:
         """
-        Execute FTS5 full-text search.
+        Execute full-text keyword search with BM25-style ranking.
 
         Args:
             db: Database session
@@ -343,61 +478,24 @@ class AdvancedSearchService:
             List of (resource_id, score) tuples
         """
         try:
-            # Check database type
-            dialect_name = db.bind.dialect.name
-
-            if dialect_name == "sqlite":
-                # SQLite FTS5 search
-                # Note: This assumes FTS5 virtual table exists
-                # For now, fall back to LIKE search
-                results = (
-                    db.query(Resource)
-                    .filter(
-                        or_(
-                            Resource.title.ilike(f"%{query}%"),
-                            Resource.description.ilike(f"%{query}%"),
-                        )
-                    )
-                    .limit(limit)
-                    .all()
-                )
+            # Indexed BM25 search (SQLite FTS5 / PostgreSQL tsvector; created at startup)
+            if ensure_fts_schema(db.get_bind()):
+                return fts_search(db, query, limit=limit)
 
-                # Return with simple relevance scores
-                return [(str(r.id), 1.0) for r in results]
-
-            elif dialect_name == "postgresql":
-                # PostgreSQL tsvector search
-                # Use ts_rank for scoring
-                sql = text("""
-                    SELECT id, ts_rank(
-                        to_tsvector('english', COALESCE(title, '') || ' ' || COALESCE(description, '')),
-                        plainto_tsquery('english', :query)
-                    ) as rank
-                    FROM resources
-                    WHERE to_tsvector('english', COALESCE(title, '') || ' ' || COALESCE(description, ''))
-                        @@ plainto_tsquery('english', :query)
-                    ORDER BY rank DESC
-                    LIMIT :limit
-                """)
-
-                result = db.execute(sql, {"query": query, "limit": limit})
-                return [(str(row[0]), float(row[1])) for row in result]
-
-            else:
-                # Fallback for other databases
-                results = (
-                    db.query(Resource)
-                    .filter(
-                        or_(
-                            Resource.title.ilike(f"%{query}%"),
-                            Resource.description.ilike(f"%{query}%"),
-                        )
+            # Fallback when no full-text index is available
+            results = (
+                db.query(Resource.id)
+                .filter(
+                    or_(
+                        Resource.title.ilike(f"%{query}%"),
+                        Resource.description.ilike(f"%{query}%"),
                     )
-                    .limit(limit)
-                    .all()
                 )
+                .limit(limit)
+                .all()
+            )
 
-                return [(str(r.id), 1.0) for r in results]
+            return [(str(r.id), 1.0) for r in results]
 
         except Exception:
             # If FTS search fails, return empty results
@@ -426,47 +524,8 @@ class AdvancedSearchService:
             if not query_embedding:
                 return []
 
-            # Fetch all resources with embeddings
-            resources = db.query(Resource).filter(Resource.embedding.isnot(None)).all()
-
-            if not resources:
-                return []
-
-            # Compute cosine similarity
-            query_vec = np.array(query_embedding)
-            query_norm = np.linalg.norm(query_vec)
-
-            if query_norm == 0:
-                return []
-
-            similarities = []
-            for resource in resources:
-                try:
-                    resource_embedding = resource.embedding
-                    if isinstance(resource_embedding, str):
-                        resource_embedding = json.loads(resource_embedding)
-
-                    if not resource_embedding:
-                        continue
-
-                    resource_vec = np.array(resource_embedding)
-                    resource_norm = np.linalg.norm(resource_vec)
-
-                    if resource_norm == 0:
-                        continue
-
-                    # Cosine similarity
-                    similarity = np.dot(query_vec, resource_vec) / (
-                        query_norm * resource_norm
-                    )
-                    similarities.append((str(resource.id), float(similarity)))
-
-                except Exception:
-                    continue
-
-            # Sort by similarity descending and return top N
-            similarities.sort(key=lambda x: x[1], reverse=True)
-            return similarities[:limit]
+            # Top-k from the process-wide ANN index (delta-synced per query)
+            return search_resource_index(db, query_embedding, limit=limit)
 
         except Exception:
             # If dense search fails, return empty results
@@ -495,40 +554,8 @@ class AdvancedSearchService:
             if not query_sparse:
                 return []
 
-            # Fetch all resources with sparse embeddings
-            resources = (
-                db.query(Resource)
-                .filter(
-                    Resource.sparse_embedding.isnot(None),
-                    Resource.sparse_embedding != "",
-                )
-                .all()
-            )
-
-            if not resources:
-                return []
-
-            # Compute sparse similarity scores
-            scores = []
-            for resource in resources:
-                try:
-                    resource_sparse = json.loads(resource.sparse_embedding)
-
-                    # Compute dot product (sparse vectors are already normalized)
-                    score = 0.0
-                    for token_id, weight in query_sparse.items():
-                        if str(token_id) in resource_sparse:
-                            score += weight * resource_sparse[str(token_id)]
-
-                    if score > 0:
-                        scores.append((str(resource.id), float(score)))
-
-                except Exception:
-                    continue
-
-            # Sort by score descending and return top N
-            scores.sort(key=lambda x: x[1], reverse=True)
-            return scores[:limit]
+            # Top-k from the process-wide inverted index (delta-synced per query)
+            return search_sparse_index(db, query_sparse, limit=limit)
 
         except Exception:
             # If sparse search fails, return empty results
@@ -8,12 +8,14 @@ Features:
 - Text summarization using BART-based models
 - Zero-shot classification for automatic tagging
 - Entity extraction (placeholder for future implementation)
-- Lazy loading and caching for optimal performance
+- Dense embeddings (delegated to app/shared/embeddings.py)
+- Lazy loading through the process-wide model registry
 - Graceful fallback when AI dependencies are unavailable
 - Thread-safe model loading and inference
 
 Related files:
 - app/shared/embeddings.py: Embedding generation
+- app/shared/model_registry.py: Shared model registry
 - app/config/settings.py: AI model configuration settings
 """
 
@@ -27,6 +29,25 @@ try:
 except Exception:  # pragma: no cover
     pipeline = None  # type: ignore
 
+from .model_registry import get_model_registry, register_loader
+
+
+def _pipeline_loader(task: str):
+    """Model registry loader for a transformers pipeline task."""
+
+    def load(model_name: str, device: str):
+        if pipeline is None:  # pragma: no cover
+            return None
+        if device == "auto":
+            return pipeline(task, model=model_name)
+        return pipeline(task, model=model_name, device=device)
+
+    return load
+
+
+register_loader("summarization", _pipeline_loader("summarization"))
+register_loader("zero_shot", _pipeline_loader("zero-shot-classification"))
+
 
 class Summarizer:
     """Abstraction around a text summarization model.
@@ -43,33 +64,28 @@ class Summarizer:
         self.model_name = model_name
         self.max_length = max_length
         self.min_length = min_length
-        self._pipe = None
-
-    def _ensure_loaded(self):
-        if self._pipe is None:
-            if pipeline is None:  # pragma: no cover
-                # Leave pipe as None; caller will use fallback
-                return
-            self._pipe = pipeline("summarization", model=self.model_name)
 
     def summarize(self, text: str) -> str:
         text = (text or "").strip()
         if not text:
             return ""
-        self._ensure_loaded()
-        if self._pipe is not None:
-            try:
-                result = self._pipe(
-                    text,
-                    max_length=self.max_length,
-                    min_length=self.min_length,
-                    do_sample=False,
-                )
-                if isinstance(result, list) and result:
-                    summary_text = result[0].get("summary_text") or ""
-                    return summary_text.strip()
-            except Exception:  # pragma: no cover - model-specific failures
-                pass
+        # Leased per call; None (transformers unavailable) leaves the fallback path
+        with get_model_registry().use(
+            "summarization", self.model_name, optional=True
+        ) as pipe:
+            if pipe is not None:
+                try:
+                    result = pipe(
+                        text,
+                        max_length=self.max_length,
+                        min_length=self.min_length,
+                        do_sample=False,
+                    )
+                    if isinstance(result, list) and result:
+                        summary_text = result[0].get("summary_text") or ""
+                        return summary_text.strip()
+                except Exception:  # pragma: no cover - model-specific failures
+                    pass
         # Fallbacks when transformers unavailable or failed
         if len(text) <= 280:
             return text
@@ -93,7 +109,6 @@ class ZeroShotTagger:
         self.model_name = model_name
         self.multi_label = multi_label
         self.threshold = float(threshold)
-        self._pipe = None
         # Default broad candidate set; AuthorityControl will normalize downstream
         default_candidates = [
             "Artificial Intelligence",
@@ -117,38 +132,34 @@ class ZeroShotTagger:
             list(candidate_labels) if candidate_labels else default_candidates
         )
 
-    def _ensure_loaded(self):
-        if self._pipe is None:
-            if pipeline is None:  # pragma: no cover
-                # Leave pipe as None; caller will use heuristics
-                return
-            self._pipe = pipeline("zero-shot-classification", model=self.model_name)
-
     def generate_tags(self, text: str) -> List[str]:
         text = (text or "").strip()
         if not text:
             return []
-        self._ensure_loaded()
-        if self._pipe is not None:
-            try:
-                res = self._pipe(
-                    text,
-                    candidate_labels=self.candidate_labels,
-                    multi_label=self.multi_label,
-                )
-                labels = res.get("labels") or []
-                scores = res.get("scores") or []
-                out: List[str] = []
-                for label, score in zip(labels, scores):
-                    try:
-                        sc = float(score)
-                    except Exception:
-                        sc = 0.0
-                    if sc >= self.threshold:
-                        out.append(str(label))
-                return out
-            except Exception:  # pragma: no cover
-                pass
+        # Leased per call; None (transformers unavailable) leaves the heuristics path
+        with get_model_registry().use(
+            "zero_shot", self.model_name, optional=True
+        ) as pipe:
+            if pipe is not None:
+                try:
+                    res = pipe(
+                        text,
+                        candidate_labels=self.candidate_labels,
+                        multi_label=self.multi_label,
+                    )
+                    labels = res.get("labels") or []
+                    scores = res.get("scores") or []
+                    out: List[str] = []
+                    for label, score in zip(labels, scores):
+                        try:
+                            sc = float(score)
+                        except Exception:
+                            sc = 0.0
+                        if sc >= self.threshold:
+                            out.append(str(label))
+                    return out
+                except Exception:  # pragma: no cover
+                    pass
         # Fallback: simple heuristic keywords
         lower = text.lower()
         tags: List[str] = []
@@ -174,9 +185,42 @@ class AICore:
         self,
         summarizer: Optional[Summarizer] = None,
         tagger: Optional[ZeroShotTagger] = None,
+        embedding_generator=None,
     ) -> None:
         self.summarizer = summarizer or Summarizer()
         self.tagger = tagger or ZeroShotTagger()
+        self._embedding_generator = embedding_generator
+
+    @property
+    def embedding_generator(self):
+        """Embedding generator, created on first use."""
+        if self._embedding_generator is None:
+            from .embeddings import EmbeddingGenerator
+
+            self._embedding_generator = EmbeddingGenerator()
+        return self._embedding_generator
+
+    def generate_embedding(self, text: str) -> List[float]:
+        """Generate a dense embedding for the given text.
+
+        Args:
+            text: Input text to embed
+
+        Returns:
+            Embedding vector (empty list if the model is unavailable)
+        """
+        return self.embedding_generator.generate_embedding(text)
+
+    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Generate dense embeddings for many texts in batches.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            One embedding vector per text, in input order
+        """
+        return self.embedding_generator.generate_embeddings(texts)
 
     def summarize(self, text: str) -> str:
         """Generate a summary of the given text.
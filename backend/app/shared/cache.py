@@ -10,15 +10,23 @@ Features:
 - Hit/miss/invalidation statistics tracking
 - Key-based TTL strategy for different data types
 - JSON serialization for complex objects
+- Content-addressed two-tier embedding cache (in-process LRU + Redis)
 
 Related files:
 - app/shared/embeddings.py: Uses cache for embedding storage
 - app/config/settings.py: Redis configuration
 """
 
+import hashlib
 import json
 import logging
-from typing import Any, Optional
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
 
 try:
     import redis
@@ -189,23 +197,38 @@ class CacheService:
         """
         self.delete(key)
 
-    def delete_pattern(self, pattern: str):
+    def delete_pattern(self, pattern: str, batch_size: int = 500) -> int:
         """Delete all keys matching pattern.
 
+        Iterates with SCAN and deletes in batches, so Redis is never blocked
+        the way a single KEYS call over a large keyspace would block it.
+
         Args:
-            pattern: Redis key pattern (e.g., "search_query:*")
+            pattern: Redis key pattern (e.g., "graph:*")
+            batch_size: SCAN COUNT hint and delete batch size
+
+        Returns:
+            Number of keys deleted
         """
         if not self.redis:
-            return
-            
+            return 0
+
+        deleted = 0
         try:
-            keys = self.redis.keys(pattern)
-            if keys:
-                deleted = self.redis.delete(*keys)
+            batch = []
+            for key in self.redis.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += self.redis.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += self.redis.delete(*batch)
+            if deleted:
                 self.stats.record_invalidation(deleted)
                 logger.info(f"Deleted {deleted} keys matching pattern: {pattern}")
         except Exception as e:
             logger.error(f"Redis delete_pattern error for pattern {pattern}: {e}")
+        return deleted
 
     def get_default_ttl(self, key: str) -> int:
         """Get TTL based on key type.
@@ -249,8 +272,269 @@ class CacheService:
             return False
 
 
+def normalize_embedding_text(text: str) -> str:
+    """Normalize text before hashing it into an embedding cache key.
+
+    Applies Unicode NFC normalization and collapses whitespace runs, so
+    trivially different copies of the same text share one cache entry.
+    Case is preserved because embedding models are case sensitive.
+    """
+    return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+
+def embedding_cache_key(model_name: str, text: str) -> str:
+    """Content-addressed cache key for (model_name, normalized text)."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(model_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(normalize_embedding_text(text).encode("utf-8"))
+    return f"embedding:text:{digest.hexdigest()}"
+
+
+class EmbeddingCache:
+    """Two-tier, content-addressed cache for embedding vectors.
+
+    Tier 1 is an in-process LRU bounded by a byte budget. Tier 2 is Redis
+    holding packed little-endian float32 bytes (3 KB for a 768-d vector
+    instead of ~15 KB of JSON). Redis hits are promoted into tier 1. When
+    Redis is unreachable, tier 2 is skipped for ``retry_after`` seconds
+    instead of paying a connection attempt on every lookup.
+
+    Attributes:
+        stats: CacheStats instance (hits from either tier, misses of both)
+        local_hits: Hits served from the in-process tier
+        redis_hits: Hits served from Redis
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[int] = None,
+        redis_client: Optional["redis.Redis"] = None,
+        retry_after: float = 30.0,
+    ):
+        """Initialize embedding cache.
+
+        Args:
+            max_bytes: Byte budget of the in-process tier (0 disables it)
+            ttl: Redis TTL in seconds
+            redis_client: Optional Redis client returning raw bytes. If not
+                         provided, creates one using settings.
+            retry_after: Seconds to skip Redis after a connection error
+        """
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else getattr(settings, "EMBEDDING_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+        )
+        self.ttl = ttl if ttl is not None else getattr(settings, "EMBEDDING_CACHE_TTL", 86400)
+        self.retry_after = retry_after
+        self.stats = CacheStats()
+        self.local_hits = 0
+        self.redis_hits = 0
+
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._redis_down_until = 0.0
+
+        if redis_client is not None:
+            self.redis = redis_client
+        elif REDIS_AVAILABLE:
+            try:
+                self.redis = redis.Redis(
+                    host=getattr(settings, "REDIS_HOST", "localhost"),
+                    port=getattr(settings, "REDIS_PORT", 6379),
+                    db=getattr(settings, "REDIS_CACHE_DB", 2),
+                    decode_responses=False,
+                    socket_connect_timeout=1,
+                    socket_timeout=1,
+                )
+            except Exception as e:
+                logger.error(f"Embedding cache Redis initialization failed: {e}")
+                self.redis = None
+        else:
+            self.redis = None
+
+    # ------------------------------------------------------------------
+    # In-process tier
+    # ------------------------------------------------------------------
+
+    def _local_get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+            return vector
+
+    def _local_put(self, key: str, vector: np.ndarray) -> None:
+        if vector.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = vector
+            self._bytes += vector.nbytes
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    # ------------------------------------------------------------------
+    # Redis tier
+    # ------------------------------------------------------------------
+
+    def _redis_usable(self) -> bool:
+        return self.redis is not None and time.monotonic() >= self._redis_down_until
+
+    def _redis_failed(self, e: Exception) -> None:
+        logger.warning(
+            f"Embedding cache Redis error, skipping Redis for {self.retry_after:.0f}s: {e}"
+        )
+        self._redis_down_until = time.monotonic() + self.retry_after
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, model_name: str, text: str) -> Optional[List[float]]:
+        """Get a cached embedding.
+
+        Args:
+            model_name: Embedding model name
+            text: Embedded text
+
+        Returns:
+            Embedding vector if cached in either tier, None otherwise
+        """
+        return self.get_many(model_name, [text])[0]
+
+    def get_many(
+        self, model_name: str, texts: Sequence[str]
+    ) -> List[Optional[List[float]]]:
+        """Get cached embeddings for several texts (one Redis MGET).
+
+        Args:
+            model_name: Embedding model name
+            texts: Embedded texts
+
+        Returns:
+            One vector or None per text, in input order
+        """
+        keys = [embedding_cache_key(model_name, t) for t in texts]
+        results: List[Optional[List[float]]] = [None] * len(keys)
+
+        missing = []
+        for i, key in enumerate(keys):
+            vector = self._local_get(key) if self.max_bytes else None
+            if vector is not None:
+                results[i] = vector.tolist()
+                self.local_hits += 1
+                self.stats.record_hit()
+            else:
+                missing.append(i)
+
+        if missing and self._redis_usable():
+            try:
+                raw_values = self.redis.mget([keys[i] for i in missing])
+            except Exception as e:
+                self._redis_failed(e)
+                raw_values = [None] * len(missing)
+            still_missing = []
+            for i, raw in zip(missing, raw_values):
+                if raw:
+                    vector = np.frombuffer(raw, dtype="<f4")
+                    if self.max_bytes:
+                        self._local_put(keys[i], vector)
+                    results[i] = vector.tolist()
+                    self.redis_hits += 1
+                    self.stats.record_hit()
+                else:
+                    still_missing.append(i)
+            missing = still_missing
+
+        for _ in missing:
+            self.stats.record_miss()
+        return results
+
+    def set(self, model_name: str, text: str, vector: Sequence[float]) -> None:
+        """Cache an embedding in both tiers.
+
+        Args:
+            model_name: Embedding model name
+            text: Embedded text
+            vector: Embedding vector (empty vectors are not cached)
+        """
+        self.set_many(model_name, [text], [vector])
+
+    def set_many(
+        self,
+        model_name: str,
+        texts: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+    ) -> None:
+        """Cache several embeddings (one Redis pipeline round trip).
+
+        Args:
+            model_name: Embedding model name
+            texts: Embedded texts
+            vectors: Embedding vectors, aligned with ``texts``
+        """
+        packed: Dict[str, np.ndarray] = {}
+        for text, vector in zip(texts, vectors):
+            if vector is None or len(vector) == 0:
+                continue
+            packed[embedding_cache_key(model_name, text)] = np.asarray(
+                vector, dtype="<f4"
+            )
+        if not packed:
+            return
+
+        if self.max_bytes:
+            for key, array in packed.items():
+                self._local_put(key, array)
+
+        if self._redis_usable():
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                for key, array in packed.items():
+                    pipe.setex(key, self.ttl, array.tobytes())
+                pipe.execute()
+            except Exception as e:
+                self._redis_failed(e)
+
+    def clear(self) -> None:
+        """Drop the in-process tier and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        self.stats.reset()
+        self.local_hits = 0
+        self.redis_hits = 0
+
+    def stats_dict(self) -> Dict[str, Any]:
+        """Hit/miss and size statistics for monitoring."""
+        with self._lock:
+            entries = len(self._entries)
+            size = self._bytes
+        return {
+            "hit_rate": round(self.stats.hit_rate(), 4),
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "local_entries": entries,
+            "local_bytes": size,
+            "local_max_bytes": self.max_bytes,
+            "redis_available": self._redis_usable(),
+        }
+
+
 # Backward compatibility - maintain the old RedisCache class name
 RedisCache = CacheService
 
 # Global cache instance for backward compatibility
 cache = CacheService()
+
+# Process-wide embedding cache
+embedding_cache = EmbeddingCache()
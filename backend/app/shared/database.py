@@ -9,12 +9,14 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.orm import DeclarativeBase, Session as OrmSession, sessionmaker
 from sqlalchemy import create_engine, event, Engine
 from sqlalchemy.exc import OperationalError, DBAPIError
-from typing import AsyncGenerator, Literal, Callable, TypeVar, ParamSpec, Generator
+from typing import Any, AsyncGenerator, Literal, Callable, TypeVar, ParamSpec, Generator
 from functools import wraps
 import asyncio
+import threading
 import time
 import logging
 import os
+import weakref
 
 logger = logging.getLogger(__name__)
 
@@ -166,9 +168,16 @@ def create_database_engine(
 
     # Create engine
     if is_async:
-        return create_async_engine(database_url, **engine_params)
+        engine = create_async_engine(database_url, **engine_params)
     else:
-        return create_engine(database_url, **engine_params)
+        engine = create_engine(database_url, **engine_params)
+
+    # Test-only: in-memory SQLite connections each start out empty
+    testing = os.environ.get("TESTING", "").lower() in ("true", "1", "yes")
+    if testing and is_memory_sqlite(database_url):
+        enable_schema_on_connect(engine)
+
+    return engine
 
 
 def _is_connection_refused_error(error: Exception) -> bool:
@@ -195,6 +204,86 @@ def _is_connection_refused_error(error: Exception) -> bool:
     return any(indicator in error_msg for indicator in connection_refused_indicators)
 
 
+# ============================================================================
+# Schema Management
+# ============================================================================
+
+# Engines whose schema has been checked by ensure_schema()
+_schema_checked: "weakref.WeakKeyDictionary[Engine, bool]" = weakref.WeakKeyDictionary()
+_schema_lock = threading.Lock()
+
+
+def is_memory_sqlite(database_url: str) -> bool:
+    """Check whether a URL points at an in-memory SQLite database."""
+    url = str(database_url)
+    if not url.startswith("sqlite"):
+        return False
+    return ":memory:" in url or "mode=memory" in url or url.split("://", 1)[-1] in ("", "/")
+
+
+def ensure_schema(bind) -> bool:
+    """
+    Create missing tables once per engine.
+
+    ``Base.metadata.create_all`` issues a catalog query per table, so it must
+    stay off the request and flush paths. This runs it the first time an
+    engine is seen (startup, worker init) and is a dictionary lookup after
+    that. Production schemas come from Alembic migrations; this only fills
+    gaps in development databases.
+
+    Args:
+        bind: Engine, AsyncEngine or Connection
+
+    Returns:
+        True if the schema was checked by this call, False if cached or
+        if the check failed (it is retried on the next call)
+    """
+    engine = getattr(bind, "sync_engine", None) or getattr(bind, "engine", bind)
+    if engine in _schema_checked:
+        return False
+
+    with _schema_lock:
+        if engine in _schema_checked:
+            return False
+        try:
+            Base.metadata.create_all(bind=engine)
+        except Exception as e:
+            # Not cached, so the next caller retries
+            logger.warning(f"Schema check failed for {engine.url!r}: {e}")
+            return False
+        _schema_checked[engine] = True
+        return True
+
+
+def enable_schema_on_connect(engine) -> None:
+    """
+    Create the schema on every new connection of an in-memory SQLite engine.
+
+    Test-only: each in-memory SQLite connection is a separate, empty
+    database, so the once-per-engine ``ensure_schema`` check is not enough.
+    ``create_database_engine`` enables this when ``TESTING`` is set.
+
+    Args:
+        engine: Engine or AsyncEngine for an in-memory SQLite database
+
+    Raises:
+        ValueError: If the engine is not an in-memory SQLite database
+    """
+    sync = getattr(engine, "sync_engine", engine)
+    if not is_memory_sqlite(str(sync.url)):
+        raise ValueError(f"Not an in-memory SQLite engine: {sync.url!r}")
+
+    @event.listens_for(sync, "engine_connect")
+    def _create_schema_for_connection(connection):
+        # Connection record info lives as long as the DBAPI connection
+        info = connection.connection.info
+        if info.get("schema_created"):
+            return
+        Base.metadata.create_all(bind=connection)
+        connection.commit()
+        info["schema_created"] = True
+
+
 def init_database(database_url: str | None = None, env: str = "prod") -> None:
     """
     Initialize database engine and session factory with retry logic for serverless databases.
@@ -246,6 +335,9 @@ def init_database(database_url: str | None = None, env: str = "prod") -> None:
             # Setup event listeners
             _setup_event_listeners()
 
+            # One-time schema check (missing tables only; see ensure_schema)
+            ensure_schema(sync_engine)
+
             db_type = get_database_type(database_url)
             
             if attempt > 0:
@@ -292,7 +384,7 @@ def init_database(database_url: str | None = None, env: str = "prod") -> None:
 
 
 def _setup_event_listeners():
-    """Setup database event listeners for monitoring and table creation."""
+    """Setup database event listeners for query monitoring."""
 
     # Store query start time in connection context
     @event.listens_for(Engine, "before_cursor_execute")
@@ -323,17 +415,6 @@ def _setup_event_listeners():
                 },
             )
 
-    # Ensure tables exist for any Session bind (helps in-memory SQLite tests)
-    @event.listens_for(OrmSession, "before_flush")
-    def _ensure_tables_before_flush(session: OrmSession, flush_context, instances):
-        """Ensure tables exist before flush (useful for in-memory SQLite)."""
-        try:
-            bind = session.get_bind()
-            if bind is not None:
-                Base.metadata.create_all(bind=bind)
-        except Exception:
-            pass
-
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -359,12 +440,6 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     for attempt in range(max_retries):
         try:
             async with AsyncSessionLocal() as session:
-                # Ensure metadata exists for this connection (esp. sqlite in-memory)
-                try:
-                    async with session.bind.begin() as conn:
-                        await conn.run_sync(Base.metadata.create_all)
-                except Exception:
-                    pass
                 yield session
                 return  # Success!
                 
@@ -404,11 +479,6 @@ def get_sync_db() -> Generator[OrmSession, None, None]:
 
     db = SessionLocal()
     try:
-        # Ensure metadata exists for this connection (esp. sqlite in-memory)
-        try:
-            Base.metadata.create_all(bind=db.get_bind())
-        except Exception:
-            pass
         yield db
     finally:
         db.close()
@@ -7,19 +7,23 @@ It consolidates embedding operations used across all domain modules.
 Features:
 - Vector embedding generation using sentence-transformers
 - Sparse embedding generation for hybrid search
-- Batch embedding generation for efficiency
+- Length-bucketed batch embedding generation under a padded-token budget
+- Optional micro-batch coalescing of concurrent single-text requests
 - Redis caching with intelligent TTL
-- Thread-safe model loading
+- Content-addressed embedding cache (in-process LRU + packed float32 in Redis)
+- Thread-safe model loading through the shared model registry
 
 Related files:
 - app/shared/ai_core.py: Core AI operations
 - app/shared/cache.py: Caching layer
 - app/shared/database.py: Database access
+- app/shared/model_registry.py: Process-wide model registry
 """
 
 import logging
 import threading
-from typing import List, Optional
+import time
+from typing import Callable, Dict, List, Optional, Sequence
 from sqlalchemy.orm import Session
 
 # Lazy import sentence-transformers for embeddings
@@ -28,37 +32,250 @@ try:
 except Exception:  # pragma: no cover
     SentenceTransformer = None  # type: ignore
 
+from .model_registry import get_model_registry, register_loader
+
 logger = logging.getLogger(__name__)
 
 
+def _load_sentence_transformer(model_name: str, device: str):
+    """Model registry loader for sentence-transformers models."""
+    if SentenceTransformer is None:  # pragma: no cover
+        return None
+    if device == "auto":
+        return SentenceTransformer(model_name)
+    return SentenceTransformer(model_name, device=device)
+
+
+register_loader("sentence_transformer", _load_sentence_transformer)
+
+
+# Rough characters-per-token ratio used to size batches without tokenizing
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str, max_tokens: Optional[int] = None) -> int:
+    """Cheap token count estimate used for batch planning.
+
+    Args:
+        text: Input text
+        max_tokens: Truncation length of the model, if known
+
+    Returns:
+        Estimated number of tokens (at least 1)
+    """
+    tokens = max(1, len(text) // _CHARS_PER_TOKEN + 1)
+    return min(tokens, max_tokens) if max_tokens else tokens
+
+
+def plan_batches(
+    lengths: Sequence[int], max_batch_tokens: int, max_batch_size: int
+) -> List[List[int]]:
+    """Group texts into length-bucketed batches.
+
+    Texts are sorted by length so each batch holds similarly sized inputs and
+    little compute is wasted on padding. A batch is closed once its padded
+    size (items x longest item) would exceed ``max_batch_tokens`` or it holds
+    ``max_batch_size`` items. A single text longer than the budget still gets
+    a batch of its own.
+
+    Args:
+        lengths: Estimated token length per text
+        max_batch_tokens: Padded token budget per batch
+        max_batch_size: Maximum number of texts per batch
+
+    Returns:
+        Batches as lists of indices into ``lengths``
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+    batches: List[List[int]] = []
+    current: List[int] = []
+    longest = 0
+    for i in order:
+        # Descending order: the first item of a batch is its longest
+        if current and (
+            len(current) >= max_batch_size
+            or (len(current) + 1) * longest > max_batch_tokens
+        ):
+            batches.append(current)
+            current = []
+        if not current:
+            longest = lengths[i]
+        current.append(i)
+    if current:
+        batches.append(current)
+    return batches
+
+
+class _PendingRequest:
+    __slots__ = ("text", "done", "finished", "result", "error")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        # Set when the request is answered, or when it is handed leadership
+        self.done = threading.Event()
+        self.finished = False
+        self.result: List[float] = []
+        self.error: Optional[BaseException] = None
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-text requests into one batched call.
+
+    The first caller to arrive becomes the leader: it waits ``window_ms`` for
+    other callers to queue their texts, then encodes queued texts in batches
+    until its own request is answered and hands each caller its own vector.
+    It then hands leadership to the oldest caller still queued, so no caller
+    keeps encoding other callers' texts indefinitely under sustained load.
+    No background thread is used, so the batcher is safe across forked
+    worker processes.
+    """
+
+    def __init__(
+        self,
+        encode_batch: Callable[[List[str]], List[List[float]]],
+        window_ms: float,
+        max_batch_size: int = 64,
+    ) -> None:
+        self.encode_batch = encode_batch
+        self.window = max(0.0, window_ms) / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        self._lock = threading.Lock()
+        self._pending: List[_PendingRequest] = []
+        self._leader_active = False
+        self.batches = 0
+        self.requests = 0
+
+    def submit(self, text: str) -> List[float]:
+        """Embed one text, sharing the forward pass with concurrent callers."""
+        request = _PendingRequest(text)
+        with self._lock:
+            self._pending.append(request)
+            self.requests += 1
+            is_leader = not self._leader_active
+            self._leader_active = True
+
+        if is_leader:
+            if self.window:
+                time.sleep(self.window)
+        else:
+            request.done.wait()
+        if not request.finished:
+            # First caller, or handed leadership by the previous leader
+            self._drain(request)
+
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _drain(self, own: _PendingRequest) -> None:
+        while not own.finished:
+            with self._lock:
+                batch = self._pending[: self.max_batch_size]
+                del self._pending[: self.max_batch_size]
+                self.batches += 1
+            try:
+                vectors = self.encode_batch([r.text for r in batch])
+                for request, vector in zip(batch, vectors):
+                    request.result = vector
+            except Exception as e:
+                for request in batch:
+                    request.error = e
+            finally:
+                for request in batch:
+                    request.finished = True
+                    request.done.set()
+
+        with self._lock:
+            successor = self._pending[0] if self._pending else None
+            if successor is None:
+                self._leader_active = False
+        if successor is not None:
+            successor.done.set()
+
+
+# One batcher per model so concurrent requests from different services share
+# forward passes
+_batchers: Dict[str, MicroBatcher] = {}
+_batchers_lock = threading.Lock()
+
+
+def _get_batcher(generator: "EmbeddingGenerator") -> MicroBatcher:
+    with _batchers_lock:
+        batcher = _batchers.get(generator.model_name)
+        if batcher is None:
+            batcher = MicroBatcher(
+                generator.generate_embeddings,
+                window_ms=generator.coalesce_window_ms,
+                max_batch_size=generator.max_batch_size,
+            )
+            _batchers[generator.model_name] = batcher
+        return batcher
+
+
+def embed_texts(embedder, texts: List[str]) -> List[List[float]]:
+    """Embed texts with any embedder, batching when it supports it.
+
+    Accepts an ``EmbeddingGenerator``, ``EmbeddingService`` or ``AICore``
+    (anything with ``generate_embeddings``) and falls back to one
+    ``generate_embedding`` call per text for embedders without a batch API.
+
+    Args:
+        embedder: Object exposing ``generate_embeddings`` and/or ``generate_embedding``
+        texts: Input texts
+
+    Returns:
+        One embedding per input text (empty list where generation failed)
+    """
+    batch_fn = getattr(embedder, "generate_embeddings", None)
+    if callable(batch_fn):
+        vectors = batch_fn(texts)
+        if isinstance(vectors, list) and len(vectors) == len(texts):
+            return vectors
+    return [embedder.generate_embedding(text) for text in texts]
+
+
 class EmbeddingGenerator:
     """Abstraction around a sentence embedding model.
 
     Uses sentence-transformers with a configurable model for generating
-    vector embeddings from text content.
+    vector embeddings from text content. ``generate_embeddings`` encodes many
+    texts in length-bucketed batches; single-text calls are optionally
+    coalesced across threads (see ``MicroBatcher``).
     """
 
-    def __init__(self, model_name: str = "nomic-ai/nomic-embed-text-v1") -> None:
+    def __init__(
+        self,
+        model_name: str = "nomic-ai/nomic-embed-text-v1",
+        max_batch_tokens: Optional[int] = None,
+        max_batch_size: Optional[int] = None,
+        coalesce_window_ms: Optional[int] = None,
+    ) -> None:
         self.model_name = model_name
-        self._model = None
-        self._model_lock = threading.Lock()
         self._warmed_up = False
 
-    def _ensure_loaded(self):
-        """Lazy load the embedding model in a thread-safe manner."""
-        if self._model is None:
-            with self._model_lock:
-                if self._model is None:  # Double-check locking pattern
-                    if SentenceTransformer is None:  # pragma: no cover
-                        # Leave model as None; caller will use fallback
-                        return
-                    try:
-                        self._model = SentenceTransformer(self.model_name)
-                        logger.info(f"Loaded embedding model: {self.model_name}")
-                    except Exception as e:  # pragma: no cover - model loading failures
-                        # Model loading failed, leave as None for fallback
-                        logger.error(f"Failed to load embedding model: {e}")
-                        pass
+        if None in (max_batch_tokens, max_batch_size, coalesce_window_ms):
+            from ..config.settings import get_settings
+
+            settings = get_settings()
+            if max_batch_tokens is None:
+                max_batch_tokens = getattr(settings, "EMBEDDING_MAX_BATCH_TOKENS", 8192)
+            if max_batch_size is None:
+                max_batch_size = getattr(settings, "EMBEDDING_MAX_BATCH_SIZE", 64)
+            if coalesce_window_ms is None:
+                coalesce_window_ms = getattr(settings, "EMBEDDING_COALESCE_WINDOW_MS", 0)
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.coalesce_window_ms = coalesce_window_ms
+
+    def _lease(self):
+        """Lease the shared embedding model for one call.
+
+        Yields None when the model cannot be loaded (fallback path). The
+        model is never kept on the generator, so the registry can evict it.
+        """
+        return get_model_registry().use(
+            "sentence_transformer", self.model_name, optional=True
+        )
 
     def warmup(self) -> bool:
         """Warmup the model with a dummy encoding to avoid cold start latency.
@@ -73,18 +290,18 @@ class EmbeddingGenerator:
             logger.debug("Model already warmed up, skipping")
             return True
             
-        self._ensure_loaded()
-        if self._model is not None:
+        with self._lease() as model:
+            if model is None:
+                return False
             try:
                 # Perform a dummy encoding to warm up the model
-                _ = self._model.encode("warmup", convert_to_tensor=False)
+                _ = model.encode("warmup", convert_to_tensor=False)
                 self._warmed_up = True
                 logger.info(f"Embedding model warmed up: {self.model_name}")
                 return True
             except Exception as e:  # pragma: no cover
                 logger.error(f"Model warmup failed: {e}")
                 return False
-        return False
 
     def generate_embedding(self, text: str) -> List[float]:
         """Generate vector embedding for the given text.
@@ -100,18 +317,84 @@ class EmbeddingGenerator:
         if not text:
             return []
 
-        self._ensure_loaded()
-        if self._model is not None:
+        if self.coalesce_window_ms and self.coalesce_window_ms > 0:
             try:
-                # sentence-transformers returns numpy array, convert to list
-                embedding = self._model.encode(text, convert_to_tensor=False)
-                return embedding.tolist()
+                return _get_batcher(self).submit(text)
             except Exception:  # pragma: no cover - encoding failures
-                pass
+                return []
+
+        with self._lease() as model:
+            if model is not None:
+                try:
+                    # sentence-transformers returns numpy array, convert to list
+                    embedding = model.encode(text, convert_to_tensor=False)
+                    return embedding.tolist()
+                except Exception:  # pragma: no cover - encoding failures
+                    pass
 
         # Fallback: return empty embedding
         return []
 
+    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for many texts with batched forward passes.
+
+        Texts are grouped by length (see ``plan_batches``) so each
+        ``encode`` call stays within ``max_batch_tokens`` padded tokens.
+        If a batch fails, its texts are retried one at a time.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            One embedding per input text, in input order. Empty or failed
+            texts get an empty list.
+        """
+        results: List[List[float]] = [[] for _ in texts]
+        cleaned = [(text or "").strip() for text in texts]
+        positions = [i for i, text in enumerate(cleaned) if text]
+        if not positions:
+            return results
+
+        with self._lease() as model:
+            if model is None:
+                return results
+            self._encode_batches(model, cleaned, positions, results)
+        return results
+
+    def _encode_batches(
+        self,
+        model,
+        cleaned: List[str],
+        positions: List[int],
+        results: List[List[float]],
+    ) -> None:
+        """Encode ``cleaned[i]`` for each position into ``results`` in batches."""
+        max_tokens = getattr(model, "max_seq_length", None)
+        lengths = [estimate_tokens(cleaned[i], max_tokens) for i in positions]
+        for batch in plan_batches(lengths, self.max_batch_tokens, self.max_batch_size):
+            batch_texts = [cleaned[positions[j]] for j in batch]
+            try:
+                vectors = model.encode(
+                    batch_texts,
+                    batch_size=len(batch_texts),
+                    convert_to_tensor=False,
+                    show_progress_bar=False,
+                )
+                for j, vector in zip(batch, vectors):
+                    results[positions[j]] = vector.tolist()
+            except Exception as e:
+                logger.warning(
+                    f"Batch embedding failed for {len(batch_texts)} texts, "
+                    f"retrying individually: {e}"
+                )
+                for j, text in zip(batch, batch_texts):
+                    try:
+                        results[positions[j]] = model.encode(
+                            text, convert_to_tensor=False
+                        ).tolist()
+                    except Exception:  # pragma: no cover - encoding failures
+                        pass
+
 
 def create_composite_text(resource) -> str:
     """Create composite text from resource for embedding generation.
@@ -152,12 +435,15 @@ class EmbeddingService:
     """Service for generating and caching embeddings.
 
     This service provides embedding generation with Redis caching
-    to reduce expensive computation. Embeddings are cached with a 1-hour TTL.
+    to reduce expensive computation. Per-resource embeddings are cached with
+    a 1-hour TTL; text embeddings are cached by content hash in the
+    process-wide two-tier ``EmbeddingCache`` (see app/shared/cache.py).
 
     Attributes:
         db: Database session
         embedding_generator: EmbeddingGenerator instance
         cache: Optional cache service for caching embeddings
+        embedding_cache: Content-addressed text embedding cache
     """
 
     def __init__(
@@ -165,6 +451,7 @@ class EmbeddingService:
         db: Optional[Session] = None,
         embedding_generator: Optional[EmbeddingGenerator] = None,
         cache_service=None,
+        embedding_cache=None,
     ):
         """Initialize embedding service.
 
@@ -172,10 +459,23 @@ class EmbeddingService:
             db: Optional database session
             embedding_generator: Optional EmbeddingGenerator instance
             cache_service: Optional cache service for caching
+            embedding_cache: Optional EmbeddingCache (defaults to the
+                process-wide instance)
         """
         self.db = db
         self.embedding_generator = embedding_generator or EmbeddingGenerator()
         self.cache = cache_service
+        if embedding_cache is None:
+            from .cache import embedding_cache as default_embedding_cache
+
+            embedding_cache = default_embedding_cache
+        self.embedding_cache = embedding_cache
+
+    @property
+    def _cache_model_name(self) -> Optional[str]:
+        """Model name for content-addressed caching (None disables it)."""
+        model_name = getattr(self.embedding_generator, "model_name", None)
+        return model_name if isinstance(model_name, str) else None
 
     def warmup(self) -> bool:
         """Warmup the embedding model to avoid cold start latency.
@@ -188,7 +488,7 @@ class EmbeddingService:
         return self.embedding_generator.warmup()
 
     def generate_embedding(self, text: str) -> List[float]:
-        """Generate embedding for text.
+        """Generate embedding for text, reusing cached vectors for identical text.
 
         Args:
             text: Input text to embed
@@ -196,7 +496,18 @@ class EmbeddingService:
         Returns:
             Embedding vector as list of floats
         """
-        return self.embedding_generator.generate_embedding(text)
+        model_name = self._cache_model_name
+        if model_name is None or not (text or "").strip():
+            return self.embedding_generator.generate_embedding(text)
+
+        cached = self.embedding_cache.get(model_name, text)
+        if cached is not None:
+            return cached
+
+        embedding = self.embedding_generator.generate_embedding(text)
+        if embedding:
+            self.embedding_cache.set(model_name, text, embedding)
+        return embedding
 
     def generate_sparse_embedding(self, text: str) -> dict:
         """Generate sparse embedding for hybrid search.
@@ -218,6 +529,39 @@ class EmbeddingService:
             word_freq[word] = word_freq.get(word, 0) + 1
         return word_freq
 
+    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for multiple texts in batched forward passes.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            List of embedding vectors, in input order
+        """
+        model_name = self._cache_model_name
+        if model_name is None:
+            return self.embedding_generator.generate_embeddings(texts)
+
+        results: List[Optional[List[float]]] = [[] for _ in texts]
+        positions = [i for i, text in enumerate(texts) if (text or "").strip()]
+        cached = self.embedding_cache.get_many(model_name, [texts[i] for i in positions])
+        missing = []
+        for i, vector in zip(positions, cached):
+            if vector is None:
+                missing.append(i)
+            else:
+                results[i] = vector
+        if missing:
+            computed = self.embedding_generator.generate_embeddings(
+                [texts[i] for i in missing]
+            )
+            for i, vector in zip(missing, computed):
+                results[i] = vector
+            self.embedding_cache.set_many(
+                model_name, [texts[i] for i in missing], computed
+            )
+        return results
+
     def batch_generate(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for multiple texts efficiently.
 
@@ -227,7 +571,7 @@ class EmbeddingService:
         Returns:
             List of embedding vectors
         """
-        return [self.generate_embedding(text) for text in texts]
+        return self.generate_embeddings(texts)
 
     def get_embedding(self, resource_id: str) -> Optional[List[float]]:
         """Get embedding for a resource with caching.
@@ -313,7 +657,11 @@ class EmbeddingService:
             logger.error(f"Error generating embedding for resource {resource_id}: {e}")
             return None
 
-    def generate_and_store_embedding(self, resource_id: str) -> bool:
+    def generate_and_store_embedding(
+        self,
+        resource_id: str,
+        on_replaced: Optional[Callable[[Dict], None]] = None,
+    ) -> bool:
         """Generate embedding and store in both database and cache.
 
         This method is used by background tasks to regenerate embeddings
@@ -321,6 +669,9 @@ class EmbeddingService:
 
         Args:
             resource_id: Resource ID
+            on_replaced: Called with {resource_id: (old, new)} before commit,
+                so derived data (e.g. collection running sums) can be
+                updated in the same transaction
 
         Returns:
             True if successful, False otherwise
@@ -350,7 +701,10 @@ class EmbeddingService:
                 logger.warning(f"Resource not found: {resource_id}")
                 return False
 
+            previous = resource.embedding if on_replaced else None
             resource.embedding = embedding
+            if on_replaced:
+                on_replaced({resource.id: (previous, embedding)})
             self.db.commit()
 
             # Store in cache if available
@@ -367,6 +721,70 @@ class EmbeddingService:
                 self.db.rollback()
             return False
 
+    def generate_and_store_embeddings(
+        self,
+        resource_ids: List[str],
+        batch_size: int = 256,
+        on_replaced: Optional[Callable[[Dict], None]] = None,
+    ) -> int:
+        """Re-embed many resources with batched generation.
+
+        Resources are loaded ``batch_size`` at a time, embedded in one
+        ``generate_embeddings`` call per slice and committed per slice.
+
+        Args:
+            resource_ids: Resource IDs
+            batch_size: Resources loaded and committed per round trip
+            on_replaced: Called once per slice with {resource_id: (old, new)}
+                before commit
+
+        Returns:
+            Number of resources whose embedding was stored
+        """
+        if not self.db:
+            logger.warning("No database session provided to EmbeddingService")
+            return 0
+
+        from ..database import models as db_models
+        from ..database.load_profiles import resource_profile
+
+        stored = 0
+        for start in range(0, len(resource_ids), batch_size):
+            slice_ids = resource_ids[start : start + batch_size]
+            try:
+                query = self.db.query(db_models.Resource).filter(
+                    db_models.Resource.id.in_(slice_ids)
+                )
+                if on_replaced:
+                    # Old vectors are needed: load them with the rows
+                    query = query.options(*resource_profile("vectors"))
+                resources = query.all()
+                texts = [create_composite_text(r) for r in resources]
+                embeddings = self.generate_embeddings(texts)
+
+                replaced = {}
+                for resource, embedding in zip(resources, embeddings):
+                    if not embedding:
+                        logger.warning(
+                            f"Embedding generation failed for resource: {resource.id}"
+                        )
+                        continue
+                    if on_replaced:
+                        replaced[resource.id] = (resource.embedding, embedding)
+                    resource.embedding = embedding
+                    stored += 1
+                    if self.cache:
+                        self.cache.set(f"embedding:{resource.id}", embedding, ttl=3600)
+                if replaced:
+                    on_replaced(replaced)
+                self.db.commit()
+            except Exception as e:
+                logger.error(f"Error storing embeddings for batch at {start}: {e}")
+                self.db.rollback()
+
+        logger.info(f"Stored embeddings for {stored}/{len(resource_ids)} resources")
+        return stored
+
     def invalidate_cache(self, resource_id: str):
         """Invalidate cached embedding for a resource.
 
@@ -1,15 +1,20 @@
 """
 Shared event bus for inter-module communication.
 
-Implements publish-subscribe pattern with synchronous delivery.
+Implements publish-subscribe pattern with synchronous delivery by default.
+Handlers can opt in to asynchronous delivery, in which case emit() enqueues
+them on bounded per-priority queues served by a pool of worker threads.
 Provides error isolation, metrics tracking, and logging.
 """
 
-from typing import Callable, Dict, List, Any, Optional
+from typing import Callable, Deque, Dict, List, Any, Optional
+from collections import deque
 from enum import Enum
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+import inspect
 import logging
+import threading
 import time
 import uuid
 
@@ -25,6 +30,21 @@ class EventPriority(Enum):
     LOW = 25
 
 
+class DeliveryMode(Enum):
+    """How a handler is invoked when its event is emitted."""
+
+    SYNC = "sync"  # Inline on the emitting thread
+    ASYNC = "async"  # On a dispatch worker (inline if no dispatcher is running)
+
+
+# Queues are served highest priority first
+_PRIORITY_ORDER = sorted(EventPriority, key=lambda p: p.value, reverse=True)
+
+# Priorities delivered inline on the emitting thread when their queue is full;
+# lower priorities are dropped instead
+_INLINE_ON_FULL = frozenset({EventPriority.CRITICAL, EventPriority.HIGH})
+
+
 @dataclass
 class Event:
     """Represents a system event with metadata (for API compatibility)."""
@@ -36,15 +56,58 @@ class Event:
     correlation_id: Optional[str] = field(default_factory=lambda: str(uuid.uuid4()))
 
 
+@dataclass(frozen=True)
+class _Subscription:
+    """A handler with its calling convention resolved at subscribe time."""
+
+    handler: Callable
+    name: str
+    pass_event: bool
+    mode: DeliveryMode
+
+
+def _wants_event_object(handler: Callable) -> bool:
+    """Check whether a handler's first parameter is annotated as Event."""
+    try:
+        sig = inspect.signature(handler)
+    except (TypeError, ValueError):
+        return False
+
+    if not sig.parameters:
+        return False
+
+    annotation = next(iter(sig.parameters.values())).annotation
+    return annotation is not inspect.Parameter.empty and (
+        annotation is Event
+        or str(annotation) == "Event"
+        or str(annotation).endswith(".Event")
+    )
+
+
+def _new_metrics() -> Dict[str, Any]:
+    return {
+        "events_emitted": 0,
+        "events_delivered": 0,
+        "handler_errors": 0,
+        "total_handler_time_ms": 0.0,
+        "total_emission_time_ms": 0.0,
+        "events_queued": 0,
+        "events_dropped": 0,
+        "inline_fallbacks": 0,
+    }
+
+
 class EventBus:
     """
-    Synchronous event bus for module communication.
+    Event bus for module communication.
 
     Features:
     - Type-safe event names
     - Priority-based delivery
+    - Per-handler sync or async delivery (bounded queues + worker pool)
+    - Handler calling conventions resolved once at subscribe time
     - Error isolation (handler failures don't affect other handlers)
-    - Logging and metrics tracking
+    - Logging and metrics tracking, including backpressure and drops
     - Handler execution time tracking
     - Singleton pattern for global event bus
     """
@@ -61,42 +124,62 @@ class EventBus:
     def __init__(self):
         """Initialize event bus with empty handlers and metrics (only once due to singleton)."""
         if not EventBus._initialized:
-            from collections import deque
-
-            self._handlers: Dict[str, List[Callable]] = {}
-            self._metrics = {
-                "events_emitted": 0,
-                "events_delivered": 0,
-                "handler_errors": 0,
-                "total_handler_time_ms": 0.0,
-                "total_emission_time_ms": 0.0,
-            }
+            self._subscriptions: Dict[str, List[_Subscription]] = {}
+            self._metrics = _new_metrics()
+            self._metrics_lock = threading.Lock()
             self._event_types: Dict[str, int] = {}
-            self._handler_latencies: List[float] = []
-            self._emission_latencies: List[float] = []
-            self._event_history: deque = deque(maxlen=1000)
+            self._dropped_by_priority: Dict[str, int] = {}
+            self._handler_latencies: Deque[float] = deque(maxlen=1000)
+            self._emission_latencies: Deque[float] = deque(maxlen=1000)
+            # Off unless enabled with set_history_size() (EVENT_HISTORY_SIZE)
+            self._event_history: Deque[Event] = deque(maxlen=0)
+
+            # Async dispatch state (idle until start_dispatcher() is called)
+            self._queues: Dict[EventPriority, Deque] = {
+                priority: deque() for priority in _PRIORITY_ORDER
+            }
+            self._queue_size = 1000
+            self._queue_cond = threading.Condition()
+            self._workers: List[threading.Thread] = []
+            self._in_flight = 0
+            self._stopping = False
+
             EventBus._initialized = True
             logger.info("EventBus initialized")
 
     def subscribe(
-        self, event_type: str, handler: Callable[[Dict[str, Any]], None]
+        self,
+        event_type: str,
+        handler: Callable[[Dict[str, Any]], None],
+        mode: DeliveryMode = DeliveryMode.SYNC,
     ) -> None:
         """
         Subscribe to an event type.
 
         Args:
             event_type: Event type to subscribe to (e.g., "resource.deleted")
-            handler: Callable that receives event payload as dict
+            handler: Callable that receives event payload as dict, or the
+                Event object if its first parameter is annotated as Event
+            mode: SYNC to run inline in emit(), ASYNC to run on a dispatch worker
         """
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
+        current = self._subscriptions.get(event_type, [])
 
         # Avoid duplicate registrations
-        if handler not in self._handlers[event_type]:
-            self._handlers[event_type].append(handler)
-            logger.info(
-                f"Subscribed handler '{handler.__name__}' to event '{event_type}'"
-            )
+        if any(sub.handler == handler for sub in current):
+            return
+
+        subscription = _Subscription(
+            handler=handler,
+            name=getattr(handler, "__name__", repr(handler)),
+            pass_event=_wants_event_object(handler),
+            mode=mode,
+        )
+        # Copy-on-write so emit() and workers can iterate without locking
+        self._subscriptions[event_type] = current + [subscription]
+        logger.info(
+            f"Subscribed handler '{subscription.name}' to event '{event_type}' "
+            f"({mode.value})"
+        )
 
     def on(
         self, event_name: str, handler: Callable, async_handler: bool = False
@@ -107,9 +190,13 @@ class EventBus:
         Args:
             event_name: Name of the event to listen for
             handler: Callback function to execute when event is emitted
-            async_handler: Whether the handler is async (ignored in EventBus, for compatibility)
+            async_handler: Deliver the event asynchronously (DeliveryMode.ASYNC)
         """
-        self.subscribe(event_name, handler)
+        self.subscribe(
+            event_name,
+            handler,
+            mode=DeliveryMode.ASYNC if async_handler else DeliveryMode.SYNC,
+        )
 
     def unsubscribe(
         self, event_type: str, handler: Callable[[Dict[str, Any]], None]
@@ -121,12 +208,13 @@ class EventBus:
             event_type: Event type to unsubscribe from
             handler: Handler function to remove
         """
-        if event_type in self._handlers:
-            self._handlers[event_type] = [
-                h for h in self._handlers[event_type] if h != handler
+        if event_type in self._subscriptions:
+            self._subscriptions[event_type] = [
+                sub for sub in self._subscriptions[event_type] if sub.handler != handler
             ]
             logger.info(
-                f"Unsubscribed handler '{handler.__name__}' from event '{event_type}'"
+                f"Unsubscribed handler '{getattr(handler, '__name__', repr(handler))}' "
+                f"from event '{event_type}'"
             )
 
     def off(self, event_name: str, handler: Callable) -> None:
@@ -148,13 +236,15 @@ class EventBus:
         """
         Emit an event to all subscribers.
 
+        SYNC handlers run before emit() returns. ASYNC handlers are queued
+        for the dispatch workers, or run inline when no dispatcher is running.
         Implements error isolation - handler failures don't affect other handlers.
         Tracks metrics for monitoring and performance analysis.
 
         Args:
             event_type: Event type to emit (e.g., "resource.deleted")
             payload: Event data as dictionary
-            priority: Event priority (for logging/metrics)
+            priority: Event priority (selects the dispatch queue for ASYNC handlers)
 
         Returns:
             The emitted Event object
@@ -165,150 +255,256 @@ class EventBus:
         # Create Event object for API compatibility
         event = Event(name=event_type, data=payload, priority=priority)
 
-        self._metrics["events_emitted"] += 1
+        with self._metrics_lock:
+            self._metrics["events_emitted"] += 1
+            self._event_types[event_type] = self._event_types.get(event_type, 0) + 1
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Emitting event '{event_type}' with priority {priority.name}",
+                extra={
+                    "component": "event_bus",
+                    "operation": "event_emission",
+                    "event_type": event_type,
+                    "priority": priority.name,
+                    "payload": payload,
+                    "correlation_id": event.correlation_id,
+                },
+            )
+
+        # History (opt-in) keeps the Event itself; dicts are built only when read
+        if self._event_history.maxlen:
+            self._event_history.append(event)
+
+        subscriptions = self._subscriptions.get(event_type, [])
+
+        if not subscriptions:
+            logger.debug(f"No handlers registered for event '{event_type}'")
+            return event
+
+        for subscription in subscriptions:
+            if subscription.mode is DeliveryMode.ASYNC and self._workers:
+                self._enqueue(subscription, event)
+            else:
+                self._deliver(subscription, event)
+
+        # Track total emission time (including inline handler executions)
+        total_emission_time_ms = (time.time() - emission_start_time) * 1000
+        with self._metrics_lock:
+            self._metrics["total_emission_time_ms"] += total_emission_time_ms
+            self._emission_latencies.append(total_emission_time_ms)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Event emission completed: '{event_type}' dispatched to "
+                f"{len(subscriptions)} handlers",
+                extra={
+                    "component": "event_bus",
+                    "operation": "emission_complete",
+                    "event_type": event_type,
+                    "handlers_count": len(subscriptions),
+                    "total_duration_ms": round(total_emission_time_ms, 2),
+                },
+            )
+
+        return event
 
-        # Track event types
-        if event_type not in self._event_types:
-            self._event_types[event_type] = 0
-        self._event_types[event_type] += 1
+    def _deliver(self, subscription: _Subscription, event: Event) -> None:
+        """Run one handler for one event with error isolation and metrics."""
+        start_time = time.time()
+        try:
+            subscription.handler(event if subscription.pass_event else event.data)
+        except Exception as e:
+            # Log error but continue to next handler (error isolation)
+            with self._metrics_lock:
+                self._metrics["handler_errors"] += 1
+            logger.error(
+                f"Handler error: '{subscription.name}' for event '{event.name}': {e}",
+                exc_info=True,
+                extra={
+                    "component": "event_bus",
+                    "operation": "handler_error",
+                    "event_type": event.name,
+                    "handler": subscription.name,
+                    "error": str(e),
+                    "status": "error",
+                },
+            )
+            return
+
+        execution_time_ms = (time.time() - start_time) * 1000
+        with self._metrics_lock:
+            self._metrics["events_delivered"] += 1
+            self._metrics["total_handler_time_ms"] += execution_time_ms
+            self._handler_latencies.append(execution_time_ms)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Event handler executed: '{subscription.name}' for '{event.name}'",
+                extra={
+                    "component": "event_bus",
+                    "operation": "handler_execution",
+                    "event_type": event.name,
+                    "handler": subscription.name,
+                    "duration_ms": round(execution_time_ms, 2),
+                    "status": "success",
+                },
+            )
+
+        # Log warning for slow handlers
+        if execution_time_ms > 100:
+            logger.warning(
+                f"Slow event handler detected: '{subscription.name}' for '{event.name}' "
+                f"took {execution_time_ms:.2f}ms",
+                extra={
+                    "component": "event_bus",
+                    "operation": "slow_handler",
+                    "event_type": event.name,
+                    "handler": subscription.name,
+                    "duration_ms": round(execution_time_ms, 2),
+                    "threshold_ms": 100,
+                },
+            )
 
-        logger.debug(
-            f"Emitting event '{event_type}' with priority {priority.name}",
+    # ========================================================================
+    # Async dispatch
+    # ========================================================================
+
+    def _enqueue(self, subscription: _Subscription, event: Event) -> None:
+        """Queue an ASYNC delivery, applying backpressure when the queue is full."""
+        with self._queue_cond:
+            queue = self._queues[event.priority]
+            if len(queue) < self._queue_size:
+                queue.append((subscription, event))
+                self._queue_cond.notify()
+                with self._metrics_lock:
+                    self._metrics["events_queued"] += 1
+                return
+
+        if event.priority in _INLINE_ON_FULL:
+            # Backpressure: the emitting thread pays for the delivery itself
+            with self._metrics_lock:
+                self._metrics["inline_fallbacks"] += 1
+            self._deliver(subscription, event)
+            return
+
+        with self._metrics_lock:
+            self._metrics["events_dropped"] += 1
+            name = event.priority.name
+            self._dropped_by_priority[name] = self._dropped_by_priority.get(name, 0) + 1
+        logger.warning(
+            f"Event queue full: dropped '{event.name}' for handler "
+            f"'{subscription.name}' (priority {event.priority.name})",
             extra={
                 "component": "event_bus",
-                "operation": "event_emission",
-                "event_type": event_type,
-                "priority": priority.name,
-                "payload": payload,
-                "correlation_id": event.correlation_id,
+                "operation": "event_dropped",
+                "event_type": event.name,
+                "handler": subscription.name,
+                "priority": event.priority.name,
             },
         )
 
-        # Store in history (deque automatically maintains maxlen of 1000)
-        from datetime import timezone
+    def _next_delivery(self):
+        """Pop the highest-priority queued delivery (caller holds the condition)."""
+        for priority in _PRIORITY_ORDER:
+            queue = self._queues[priority]
+            if queue:
+                return queue.popleft()
+        return None
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._queue_cond:
+                item = self._next_delivery()
+                while item is None:
+                    if self._stopping:
+                        return
+                    self._queue_cond.wait()
+                    item = self._next_delivery()
+                self._in_flight += 1
 
-        self._event_history.append(
-            {
-                "name": event_type,
-                "data": payload,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "priority": priority.name,
-                "correlation_id": event.correlation_id,
-            }
-        )
+            try:
+                self._deliver(*item)
+            finally:
+                with self._queue_cond:
+                    self._in_flight -= 1
+                    self._queue_cond.notify_all()
 
-        handlers = self._handlers.get(event_type, [])
+    def start_dispatcher(self, workers: int = 4, queue_size: int = 1000) -> None:
+        """
+        Start the worker pool that delivers ASYNC subscriptions.
 
-        if not handlers:
-            logger.debug(f"No handlers registered for event '{event_type}'")
-            return event
+        Until this is called (and after stop_dispatcher()), ASYNC handlers are
+        delivered inline like SYNC ones.
 
-        for handler in handlers:
-            start_time = time.time()
-            try:
-                # Try to call handler with Event object first (new API)
-                # Fall back to dict payload for backward compatibility
-                import inspect
-
-                sig = inspect.signature(handler)
-                pass_event_object = False
-
-                if len(sig.parameters) > 0:
-                    first_param = list(sig.parameters.values())[0]
-                    annotation = first_param.annotation
-                    
-                    # Check if handler explicitly requests Event object via type hint
-                    if annotation is not inspect.Parameter.empty and (
-                        annotation is Event or 
-                        str(annotation) == "Event" or 
-                        str(annotation).endswith(".Event")
-                    ):
-                        pass_event_object = True
-
-                if pass_event_object:
-                    handler(event)
-                else:
-                    # Fallback to dict payload for backward compatibility
-                    handler(payload)
-
-                # Track successful delivery
-                self._metrics["events_delivered"] += 1
-
-                # Track handler execution time
-                execution_time_ms = (time.time() - start_time) * 1000
-                self._metrics["total_handler_time_ms"] += execution_time_ms
-                self._handler_latencies.append(execution_time_ms)
-
-                # Keep only last 1000 latencies for percentile calculation
-                if len(self._handler_latencies) > 1000:
-                    self._handler_latencies = self._handler_latencies[-1000:]
-
-                # Structured logging for successful handler execution
-                logger.debug(
-                    f"Event handler executed: '{handler.__name__}' for '{event_type}'",
-                    extra={
-                        "component": "event_bus",
-                        "operation": "handler_execution",
-                        "event_type": event_type,
-                        "handler": handler.__name__,
-                        "duration_ms": round(execution_time_ms, 2),
-                        "status": "success",
-                    },
+        Args:
+            workers: Number of worker threads (0 leaves the dispatcher off)
+            queue_size: Maximum pending deliveries per priority level
+        """
+        if queue_size <= 0:
+            raise ValueError(f"queue_size must be positive, got {queue_size}")
+
+        with self._queue_cond:
+            if self._workers or workers <= 0:
+                return
+            self._queue_size = queue_size
+            self._stopping = False
+            self._workers = [
+                threading.Thread(
+                    target=self._worker_loop,
+                    name=f"event-bus-worker-{i}",
+                    daemon=True,
                 )
+                for i in range(workers)
+            ]
+        for worker in self._workers:
+            worker.start()
+        logger.info(
+            f"Event dispatcher started: {workers} workers, "
+            f"{queue_size} pending deliveries per priority"
+        )
 
-                # Log warning for slow handlers
-                if execution_time_ms > 100:
-                    logger.warning(
-                        f"Slow event handler detected: '{handler.__name__}' for '{event_type}' "
-                        f"took {execution_time_ms:.2f}ms",
-                        extra={
-                            "component": "event_bus",
-                            "operation": "slow_handler",
-                            "event_type": event_type,
-                            "handler": handler.__name__,
-                            "duration_ms": round(execution_time_ms, 2),
-                            "threshold_ms": 100,
-                        },
-                    )
-
-            except Exception as e:
-                # Log error but continue to next handler (error isolation)
-                self._metrics["handler_errors"] += 1
-                logger.error(
-                    f"Handler error: '{handler.__name__}' for event '{event_type}': {e}",
-                    exc_info=True,
-                    extra={
-                        "component": "event_bus",
-                        "operation": "handler_error",
-                        "event_type": event_type,
-                        "handler": handler.__name__,
-                        "error": str(e),
-                        "status": "error",
-                    },
-                )
+    def stop_dispatcher(self, timeout: float = 5.0) -> None:
+        """
+        Stop the worker pool after delivering everything already queued.
 
-        # Track total emission time (including all handler executions)
-        total_emission_time_ms = (time.time() - emission_start_time) * 1000
-        self._metrics["total_emission_time_ms"] += total_emission_time_ms
-        self._emission_latencies.append(total_emission_time_ms)
+        Args:
+            timeout: Seconds to wait for each worker to finish
+        """
+        with self._queue_cond:
+            workers = self._workers
+            if not workers:
+                return
+            self._stopping = True
+            self._queue_cond.notify_all()
 
-        # Keep only last 1000 emission latencies for percentile calculation
-        if len(self._emission_latencies) > 1000:
-            self._emission_latencies = self._emission_latencies[-1000:]
+        for worker in workers:
+            worker.join(timeout)
 
-        # Log structured info about emission completion
-        logger.debug(
-            f"Event emission completed: '{event_type}' delivered to {len(handlers)} handlers",
-            extra={
-                "component": "event_bus",
-                "operation": "emission_complete",
-                "event_type": event_type,
-                "handlers_count": len(handlers),
-                "total_duration_ms": round(total_emission_time_ms, 2),
-            },
-        )
+        with self._queue_cond:
+            self._workers = []
+        logger.info("Event dispatcher stopped")
 
-        return event
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued ASYNC delivery has completed.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queues drained, False on timeout
+        """
+        with self._queue_cond:
+            return self._queue_cond.wait_for(
+                lambda: self._in_flight == 0
+                and not any(self._queues.values()),
+                timeout,
+            )
+
+    # ========================================================================
+    # Introspection
+    # ========================================================================
 
     def get_metrics(self) -> Dict[str, Any]:
         """
@@ -320,7 +516,14 @@ class EventBus:
                 - events_delivered: Total successful handler executions
                 - handler_errors: Total handler failures
                 - total_handler_time_ms: Cumulative handler execution time
-                - total_emission_time_ms: Cumulative emission time (including handlers)
+                - total_emission_time_ms: Cumulative emission time (including inline handlers)
+                - events_queued: ASYNC deliveries handed to the dispatcher
+                - events_dropped: ASYNC deliveries dropped because a queue was full
+                - inline_fallbacks: ASYNC deliveries run inline because a queue was full
+                - dropped_by_priority: events_dropped broken down by priority
+                - queue_depth: Pending ASYNC deliveries per priority
+                - queue_capacity: Maximum pending deliveries per priority
+                - dispatch_workers: Running dispatch worker threads
                 - event_types: Breakdown of events by type
                 - handler_latency_p50: 50th percentile handler latency (ms)
                 - handler_latency_p95: 95th percentile handler latency (ms)
@@ -329,30 +532,39 @@ class EventBus:
                 - emission_latency_p95: 95th percentile emission latency (ms)
                 - emission_latency_p99: 99th percentile emission latency (ms)
         """
-        metrics = self._metrics.copy()
-        metrics["event_types"] = self._event_types.copy()
+        with self._metrics_lock:
+            metrics = self._metrics.copy()
+            metrics["event_types"] = self._event_types.copy()
+            metrics["dropped_by_priority"] = self._dropped_by_priority.copy()
+            handler_latencies = sorted(self._handler_latencies)
+            emission_latencies = sorted(self._emission_latencies)
+
+        with self._queue_cond:
+            metrics["queue_depth"] = {
+                priority.name: len(queue) for priority, queue in self._queues.items()
+            }
+            metrics["queue_capacity"] = self._queue_size
+            metrics["dispatch_workers"] = len(self._workers)
 
         # Calculate handler latency percentiles
-        if self._handler_latencies:
-            sorted_latencies = sorted(self._handler_latencies)
-            n = len(sorted_latencies)
+        if handler_latencies:
+            n = len(handler_latencies)
 
-            metrics["handler_latency_p50"] = round(sorted_latencies[int(n * 0.50)], 2)
-            metrics["handler_latency_p95"] = round(sorted_latencies[int(n * 0.95)], 2)
-            metrics["handler_latency_p99"] = round(sorted_latencies[int(n * 0.99)], 2)
+            metrics["handler_latency_p50"] = round(handler_latencies[int(n * 0.50)], 2)
+            metrics["handler_latency_p95"] = round(handler_latencies[int(n * 0.95)], 2)
+            metrics["handler_latency_p99"] = round(handler_latencies[int(n * 0.99)], 2)
         else:
             metrics["handler_latency_p50"] = 0.0
             metrics["handler_latency_p95"] = 0.0
             metrics["handler_latency_p99"] = 0.0
 
         # Calculate emission latency percentiles
-        if self._emission_latencies:
-            sorted_emission = sorted(self._emission_latencies)
-            n = len(sorted_emission)
+        if emission_latencies:
+            n = len(emission_latencies)
 
-            metrics["emission_latency_p50"] = round(sorted_emission[int(n * 0.50)], 2)
-            metrics["emission_latency_p95"] = round(sorted_emission[int(n * 0.95)], 2)
-            metrics["emission_latency_p99"] = round(sorted_emission[int(n * 0.99)], 2)
+            metrics["emission_latency_p50"] = round(emission_latencies[int(n * 0.50)], 2)
+            metrics["emission_latency_p95"] = round(emission_latencies[int(n * 0.95)], 2)
+            metrics["emission_latency_p99"] = round(emission_latencies[int(n * 0.99)], 2)
         else:
             metrics["emission_latency_p50"] = 0.0
             metrics["emission_latency_p95"] = 0.0
@@ -370,7 +582,7 @@ class EventBus:
         Returns:
             List of handler functions
         """
-        return self._handlers.get(event_type, []).copy()
+        return [sub.handler for sub in self._subscriptions.get(event_type, [])]
 
     def get_listeners(self, event_name: str) -> List[Callable]:
         """
@@ -392,10 +604,10 @@ class EventBus:
             event_type: Specific event to clear, or None to clear all
         """
         if event_type:
-            self._handlers[event_type] = []
+            self._subscriptions[event_type] = []
             logger.debug(f"Cleared handlers for event '{event_type}'")
         else:
-            self._handlers.clear()
+            self._subscriptions.clear()
             logger.debug("Cleared all event handlers")
 
     def clear_listeners(self, event_name: str | None = None) -> None:
@@ -418,10 +630,10 @@ class EventBus:
             Dictionary mapping event names to lists of handler functions
         """
         if event_type:
-            return {event_type: self._handlers.get(event_type, []).copy()}
+            return {event_type: self.get_handlers(event_type)}
 
         # Return all subscribers
-        return {event: handlers.copy() for event, handlers in self._handlers.items()}
+        return {event: self.get_handlers(event) for event in self._subscriptions}
 
     def clear_subscribers(self, event_type: str | None = None) -> None:
         """
@@ -434,18 +646,25 @@ class EventBus:
 
     def reset_metrics(self) -> None:
         """Reset metrics for testing purposes."""
-        self._metrics = {
-            "events_emitted": 0,
-            "events_delivered": 0,
-            "handler_errors": 0,
-            "total_handler_time_ms": 0.0,
-            "total_emission_time_ms": 0.0,
-        }
-        self._event_types.clear()
-        self._handler_latencies.clear()
-        self._emission_latencies.clear()
+        with self._metrics_lock:
+            self._metrics = _new_metrics()
+            self._event_types.clear()
+            self._dropped_by_priority.clear()
+            self._handler_latencies.clear()
+            self._emission_latencies.clear()
         logger.debug("Reset event bus metrics")
 
+    def set_history_size(self, size: int) -> None:
+        """
+        Set how many recent events are kept for get_event_history().
+
+        History is off by default, since it holds every event payload.
+
+        Args:
+            size: Maximum events kept (0 disables history)
+        """
+        self._event_history = deque(self._event_history, maxlen=max(size, 0))
+
     def get_event_history(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
         Get recent event history.
@@ -456,11 +675,20 @@ class EventBus:
         Returns:
             List of event dictionaries with name, data, timestamp, priority
         """
-        if not self._event_history:
+        if not self._event_history or limit <= 0:
             return []
         # Convert deque to list and slice
-        history_list = list(self._event_history)
-        return history_list[-limit:] if len(history_list) > limit else history_list
+        recent = list(self._event_history)[-limit:]
+        return [
+            {
+                "name": event.name,
+                "data": event.data,
+                "timestamp": event.timestamp.replace(tzinfo=timezone.utc).isoformat(),
+                "priority": event.priority.name,
+                "correlation_id": event.correlation_id,
+            }
+            for event in recent
+        ]
 
     def clear_history(self) -> None:
         """Clear event history for testing purposes."""
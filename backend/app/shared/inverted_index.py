@@ -0,0 +1,531 @@
+"""
+Neo Alexandria 2.0 - Shared Inverted Index
+
+This module provides an in-process inverted index for sparse vectors
+(SPLADE / BGE-M3 lexical weights) in the shared kernel. It replaces
+full-table sparse dot products with postings lists and MaxScore top-k
+pruning.
+
+Features:
+- Array-backed postings (CSR layout: term ids, offsets, rows, weights)
+- Append-only delta segment for incremental updates, merged on demand
+- Tombstones for removed/replaced documents
+- MaxScore term-at-a-time top-k with per-term upper bounds
+- File-backed persistence (.npy + JSON metadata, memory-mapped on load)
+- Process-wide registry scoped per database engine
+
+Related files:
+- app/shared/vector_index.py: Dense ANN counterpart (shares path resolution)
+- app/modules/search/sparse_embeddings.py: Sparse vector generation
+- app/modules/search/sparse_index.py: Resource sparse index maintenance
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .vector_index import _index_path_for, publish_dir, staging_dir
+
+logger = logging.getLogger(__name__)
+
+
+def parse_sparse_vector(value: Any) -> Optional[Dict[int, float]]:
+    """Decode a sparse vector stored as JSON text or a dict.
+
+    Args:
+        value: Raw column value (JSON object text, dict, or None)
+
+    Returns:
+        Dict mapping token ids to positive weights, or None if empty/malformed
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        if not value.strip():
+            return None
+        try:
+            value = json.loads(value)
+        except (ValueError, TypeError):
+            return None
+    if not isinstance(value, Mapping):
+        return None
+    vec = {}
+    for token_id, weight in value.items():
+        try:
+            token_id, weight = int(token_id), float(weight)
+        except (ValueError, TypeError):
+            continue
+        if weight > 0:
+            vec[token_id] = weight
+    return vec or None
+
+
+class InvertedIndex:
+    """Inverted index over non-negative sparse vectors scored by dot product.
+
+    Postings live in two segments. The base segment is a CSR layout sorted by
+    term id, with postings sorted by row inside each term; it is memory-mapped
+    when loaded from disk. New documents are appended to a small delta
+    segment and always receive a fresh row, so row order inside every
+    posting list stays ascending across both segments. Replaced or removed
+    documents are tombstoned and dropped when the segments are merged.
+
+    Attributes:
+        name: Index name (used for the on-disk directory)
+        path: Optional directory for persistence
+        merge_threshold: Delta postings count that triggers a merge
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: Optional[Path] = None,
+        merge_threshold: int = 200_000,
+    ) -> None:
+        self.name = name
+        self.path = Path(path) if path else None
+        self.merge_threshold = max(1, merge_threshold)
+
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        # Base segment (CSR)
+        self._terms = np.zeros(0, dtype=np.int64)
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._rows = np.zeros(0, dtype=np.int32)
+        self._weights = np.zeros(0, dtype=np.float32)
+        self._max_weights = np.zeros(0, dtype=np.float32)
+        # Delta segment: term -> ([rows], [weights])
+        self._delta: Dict[int, Tuple[List[int], List[float]]] = defaultdict(
+            lambda: ([], [])
+        )
+        self._delta_max: Dict[int, float] = {}
+        self._delta_postings = 0
+        # Documents
+        self._keys: List[Optional[str]] = []
+        self._key_to_row: Dict[str, int] = {}
+        self._live = np.zeros(0, dtype=bool)
+
+        # Delta-sync bookkeeping (see app/modules/search/dense_index.py)
+        self.margin_seen: Dict[str, Tuple[Any, int]] = {}
+        self.watermark: Optional[str] = None
+        self.built_at: Optional[float] = None
+        self.synced_at: Optional[float] = None
+        self.saved_at: Optional[float] = None
+        self._mutations_since_save = 0
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._key_to_row)
+
+    def __contains__(self, key: str) -> bool:
+        return str(key) in self._key_to_row
+
+    def _tombstone(self, key: str) -> bool:
+        row = self._key_to_row.pop(key, None)
+        if row is None:
+            return False
+        self._live[row] = False
+        self._keys[row] = None
+        return True
+
+    def upsert(self, key: str, vector: Mapping[int, float]) -> bool:
+        """Insert or replace the postings for a document.
+
+        Args:
+            key: Document identifier
+            vector: Sparse vector (token id -> weight); non-positive weights are ignored
+
+        Returns:
+            True if the document is indexed afterwards
+        """
+        key = str(key)
+        with self._lock:
+            self._tombstone(key)
+            entries = [(int(t), float(w)) for t, w in (vector or {}).items() if w > 0]
+            if not entries:
+                self._mutations_since_save += 1
+                return False
+
+            row = len(self._keys)
+            self._keys.append(key)
+            self._key_to_row[key] = row
+            if row >= len(self._live):
+                live = np.zeros(max(64, 2 * len(self._live)), dtype=bool)
+                live[: len(self._live)] = self._live
+                self._live = live
+            self._live[row] = True
+
+            for term, weight in entries:
+                rows, weights = self._delta[term]
+                rows.append(row)
+                weights.append(weight)
+                if weight > self._delta_max.get(term, 0.0):
+                    self._delta_max[term] = weight
+            self._delta_postings += len(entries)
+            self._mutations_since_save += 1
+
+            if self._delta_postings >= self.merge_threshold:
+                self.merge()
+            return True
+
+    def upsert_many(self, items: List[Tuple[str, Mapping[int, float]]]) -> int:
+        """Insert or replace several documents.
+
+        Args:
+            items: (key, sparse vector) pairs
+
+        Returns:
+            Number of documents indexed
+        """
+        with self._lock:
+            return sum(1 for key, vec in items if self.upsert(key, vec))
+
+    def remove(self, key: str) -> bool:
+        """Remove a document.
+
+        Args:
+            key: Document identifier
+
+        Returns:
+            True if the key was present
+        """
+        with self._lock:
+            removed = self._tombstone(str(key))
+            if removed:
+                self._mutations_since_save += 1
+            return removed
+
+    def clear(self) -> None:
+        """Drop all documents and postings."""
+        with self._lock:
+            self._reset()
+
+    def adopt(self, other: "InvertedIndex") -> None:
+        """Replace this index's contents with those of ``other``.
+
+        Lets callers build a fresh index without holding this index's lock
+        and then swap it in atomically.
+
+        Args:
+            other: Fully built index (not used afterwards)
+        """
+        with self._lock, other._lock:
+            for attr in (
+                "_terms", "_offsets", "_rows", "_weights", "_max_weights",
+                "_delta", "_delta_max", "_delta_postings",
+                "_keys", "_key_to_row", "_live",
+                "margin_seen", "watermark", "built_at", "synced_at",
+                "_mutations_since_save",
+            ):
+                setattr(self, attr, getattr(other, attr))
+
+    def merge(self) -> None:
+        """Fold the delta segment into the base segment and drop tombstones.
+
+        Rows are renumbered densely, so stale rows from replaced documents no
+        longer take up space in postings.
+        """
+        with self._lock:
+            n_rows = len(self._keys)
+            live = self._live[:n_rows]
+            remap = np.full(n_rows, -1, dtype=np.int64)
+            live_rows = np.flatnonzero(live)
+            remap[live_rows] = np.arange(len(live_rows))
+
+            # Flatten both segments into (term, row, weight) triples
+            base_terms = np.repeat(self._terms, np.diff(self._offsets))
+            parts_t, parts_r, parts_w = [base_terms], [np.asarray(self._rows, dtype=np.int64)], [np.asarray(self._weights)]
+            for term, (rows, weights) in self._delta.items():
+                parts_t.append(np.full(len(rows), term, dtype=np.int64))
+                parts_r.append(np.asarray(rows, dtype=np.int64))
+                parts_w.append(np.asarray(weights, dtype=np.float32))
+            terms = np.concatenate(parts_t)
+            rows = np.concatenate(parts_r)
+            weights = np.concatenate(parts_w).astype(np.float32)
+
+            keep = remap[rows] >= 0 if len(rows) else np.zeros(0, dtype=bool)
+            terms, rows, weights = terms[keep], remap[rows[keep]], weights[keep]
+            order = np.lexsort((rows, terms))
+            terms, rows, weights = terms[order], rows[order], weights[order]
+
+            uniq, starts = np.unique(terms, return_index=True)
+            self._terms = uniq.astype(np.int64)
+            self._offsets = np.append(starts, len(terms)).astype(np.int64)
+            self._rows = rows.astype(np.int32)
+            self._weights = weights
+            self._max_weights = (
+                np.maximum.reduceat(weights, starts).astype(np.float32)
+                if len(weights)
+                else np.zeros(0, dtype=np.float32)
+            )
+
+            self._keys = [self._keys[r] for r in live_rows]
+            self._key_to_row = {k: i for i, k in enumerate(self._keys)}
+            self._live = np.ones(len(self._keys), dtype=bool)
+            self._delta = defaultdict(lambda: ([], []))
+            self._delta_max = {}
+            self._delta_postings = 0
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _postings(self, term: int) -> Tuple[np.ndarray, np.ndarray, float]:
+        """Return (rows, weights, max_weight) for a term across both segments."""
+        rows = weights = None
+        max_weight = 0.0
+        pos = np.searchsorted(self._terms, term)
+        if pos < len(self._terms) and self._terms[pos] == term:
+            start, end = self._offsets[pos], self._offsets[pos + 1]
+            rows, weights = self._rows[start:end], self._weights[start:end]
+            max_weight = float(self._max_weights[pos])
+        if term in self._delta:
+            d_rows, d_weights = self._delta[term]
+            d_rows = np.asarray(d_rows, dtype=np.int32)
+            d_weights = np.asarray(d_weights, dtype=np.float32)
+            if rows is None:
+                rows, weights = d_rows, d_weights
+            else:
+                rows = np.concatenate([rows, d_rows])
+                weights = np.concatenate([weights, d_weights])
+            max_weight = max(max_weight, self._delta_max[term])
+        if rows is None:
+            return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32), 0.0
+        return rows, weights, max_weight
+
+    def search(
+        self, query: Mapping[int, float], k: int = 10
+    ) -> List[Tuple[str, float]]:
+        """Return the top-k documents by dot product with the query.
+
+        Uses term-at-a-time MaxScore: query terms are processed in order of
+        decreasing upper bound (query weight x max posting weight). Once the
+        summed upper bounds of the remaining terms cannot lift an unseen
+        document past the current k-th score, no new candidates are admitted
+        and the remaining posting lists are only probed for existing
+        candidates.
+
+        Args:
+            query: Sparse query vector (token id -> weight)
+            k: Number of results
+
+        Returns:
+            List of (key, score) tuples sorted by score descending
+        """
+        if k <= 0 or not query or len(self) == 0:
+            return []
+
+        with self._lock:
+            n_rows = len(self._keys)
+            live = self._live[:n_rows]
+
+            terms = []
+            for term, q_weight in query.items():
+                q_weight = float(q_weight)
+                if q_weight <= 0:
+                    continue
+                rows, weights, max_weight = self._postings(int(term))
+                if len(rows):
+                    terms.append((q_weight * max_weight, q_weight, rows, weights))
+            if not terms:
+                return []
+
+            terms.sort(key=lambda t: t[0], reverse=True)
+            remaining = np.cumsum([t[0] for t in terms][::-1])[::-1]
+
+            cand_rows = np.zeros(0, dtype=np.int64)
+            cand_scores = np.zeros(0, dtype=np.float64)
+            for i, (_, q_weight, rows, weights) in enumerate(terms):
+                threshold = (
+                    np.partition(cand_scores, len(cand_scores) - k)[len(cand_scores) - k]
+                    if len(cand_scores) >= k
+                    else 0.0
+                )
+                contrib = q_weight * weights.astype(np.float64)
+                if remaining[i] > threshold or len(cand_scores) < k:
+                    # Essential term: union postings into the candidate set
+                    alive = live[rows]
+                    all_rows = np.concatenate([cand_rows, rows[alive].astype(np.int64)])
+                    all_scores = np.concatenate([cand_scores, contrib[alive]])
+                    cand_rows, inverse = np.unique(all_rows, return_inverse=True)
+                    cand_scores = np.bincount(inverse, weights=all_scores)
+                else:
+                    # Non-essential: only refine existing candidates
+                    if i + 1 < len(terms):
+                        upper = cand_scores + remaining[i]
+                        keep = upper >= threshold
+                        cand_rows, cand_scores = cand_rows[keep], cand_scores[keep]
+                    pos = np.searchsorted(rows, cand_rows)
+                    pos[pos >= len(rows)] = 0
+                    hit = rows[pos] == cand_rows
+                    cand_scores[hit] += contrib[pos[hit]]
+
+            if len(cand_rows) == 0:
+                return []
+            take = min(k, len(cand_rows))
+            top = np.argpartition(-cand_scores, take - 1)[:take]
+            top = top[np.argsort(-cand_scores[top], kind="stable")]
+            return [(self._keys[cand_rows[i]], float(cand_scores[i])) for i in top]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self) -> bool:
+        """Merge and persist the index to ``self.path`` atomically.
+
+        Returns:
+            True if saved, False if the index has no path
+        """
+        if self.path is None:
+            return False
+
+        with self._lock:
+            self.merge()
+            tmp_dir = staging_dir(self.path)
+
+            np.save(tmp_dir / "terms.npy", self._terms)
+            np.save(tmp_dir / "offsets.npy", self._offsets)
+            np.save(tmp_dir / "rows.npy", self._rows)
+            np.save(tmp_dir / "weights.npy", self._weights)
+            np.save(tmp_dir / "max_weights.npy", self._max_weights)
+            meta = {
+                "name": self.name,
+                "keys": self._keys,
+                "watermark": self.watermark,
+                "built_at": self.built_at,
+                "synced_at": self.synced_at,
+            }
+            with open(tmp_dir / "meta.json", "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            publish_dir(tmp_dir, self.path)
+
+            self.saved_at = time.time()
+            self._mutations_since_save = 0
+            logger.info(f"Saved inverted index '{self.name}' ({len(self)} docs) to {self.path}")
+            return True
+
+    def load(self) -> bool:
+        """Load the index from ``self.path`` if present.
+
+        Postings arrays are memory-mapped read-only; merges write new arrays.
+
+        Returns:
+            True if an index was loaded
+        """
+        if self.path is None or not (self.path / "meta.json").exists():
+            return False
+
+        try:
+            with open(self.path / "meta.json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            arrays = {
+                name: np.load(self.path / f"{name}.npy", mmap_mode="r")
+                for name in ("terms", "offsets", "rows", "weights", "max_weights")
+            }
+        except Exception as e:
+            logger.error(f"Failed to load inverted index '{self.name}' from {self.path}: {e}")
+            return False
+
+        with self._lock:
+            self.clear()
+            self._terms = arrays["terms"]
+            self._offsets = arrays["offsets"]
+            self._rows = arrays["rows"]
+            self._weights = arrays["weights"]
+            self._max_weights = arrays["max_weights"]
+            self._keys = list(meta.get("keys", []))
+            self._key_to_row = {k: i for i, k in enumerate(self._keys)}
+            self._live = np.ones(len(self._keys), dtype=bool)
+            self.watermark = meta.get("watermark")
+            self.built_at = meta.get("built_at")
+            self.synced_at = meta.get("synced_at")
+            self.saved_at = os.path.getmtime(self.path / "meta.json")
+
+        logger.info(f"Loaded inverted index '{self.name}' ({len(self)} docs) from {self.path}")
+        return True
+
+    # ------------------------------------------------------------------
+    # Monitoring
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and freshness statistics.
+
+        Returns:
+            Dictionary of index statistics
+        """
+        now = time.time()
+        n_rows = len(self._keys)
+        return {
+            "name": self.name,
+            "size": len(self),
+            "terms": int(len(self._terms)),
+            "postings": int(len(self._rows)) + self._delta_postings,
+            "delta_postings": self._delta_postings,
+            "tombstones": n_rows - len(self),
+            "memory_bytes": int(
+                self._terms.nbytes
+                + self._offsets.nbytes
+                + self._rows.nbytes
+                + self._weights.nbytes
+                + self._max_weights.nbytes
+            ),
+            "unsaved_mutations": self._mutations_since_save,
+            "seconds_since_build": round(now - self.built_at, 1) if self.built_at else None,
+            "seconds_since_sync": round(now - self.synced_at, 1) if self.synced_at else None,
+            "persisted": self.path is not None,
+        }
+
+
+# ============================================================================
+# Process-wide registry
+# ============================================================================
+
+_registry: "weakref.WeakKeyDictionary[Any, Dict[str, InvertedIndex]]" = (
+    weakref.WeakKeyDictionary()
+)
+_registry_lock = threading.Lock()
+
+
+def get_inverted_index(bind: Any, name: str) -> InvertedIndex:
+    """Get (or create and load) the process-wide inverted index for an engine.
+
+    Args:
+        bind: SQLAlchemy engine or connection the index mirrors
+        name: Index name (e.g. "resources_sparse")
+
+    Returns:
+        InvertedIndex instance
+    """
+    engine = getattr(bind, "engine", bind)
+    with _registry_lock:
+        indexes = _registry.get(engine)
+        if indexes is None:
+            indexes = {}
+            _registry[engine] = indexes
+        index = indexes.get(name)
+        if index is None:
+            index = InvertedIndex(name, path=_index_path_for(engine, name))
+            index.load()
+            indexes[name] = index
+        return index
+
+
+def get_all_inverted_indexes() -> List[InvertedIndex]:
+    """Return every inverted index currently held by this process."""
+    with _registry_lock:
+        return [idx for indexes in _registry.values() for idx in indexes.values()]
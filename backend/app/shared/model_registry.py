@@ -0,0 +1,392 @@
+"""
+Neo Alexandria 2.0 - Shared ML Model Registry
+
+Process-wide registry of loaded ML models (sentence-transformers, cross
+encoders, BGE-M3, transformers pipelines, NCF checkpoints). Services are
+request-scoped and cheap to build; the models behind them are not, so every
+service resolves its model here instead of loading its own copy.
+
+Features:
+- Models keyed by (kind, model_name, device)
+- Thread-safe single loading (concurrent callers wait for one load)
+- RAM budget (MODEL_REGISTRY_MAX_BYTES) with LRU eviction of idle models;
+  services lease models per call (``use``) rather than keeping them, so an
+  evicted model is really freed
+- Preload list (MODEL_PRELOAD) applied at API and Celery worker start
+- Load counts and resident memory for monitoring
+
+Loaders are registered per kind by the modules that own the model type
+(see ``register_loader``), so the optional ML libraries are only imported
+where they are used.
+
+Related files:
+- app/shared/embeddings.py: sentence-transformers embedding models
+- app/shared/ai_core.py: Summarization and zero-shot pipelines
+- app/modules/search/reranking.py: Cross-encoder reranker
+- app/modules/search/sparse_embeddings.py: BGE-M3 sparse model
+- app/modules/recommendations/ncf.py: NCF checkpoints
+"""
+
+import importlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ModelKey = Tuple[str, str, str]
+
+# Modules that register the loader for each kind (imported on demand)
+LOADER_MODULES = {
+    "sentence_transformer": "app.shared.embeddings",
+    "summarization": "app.shared.ai_core",
+    "zero_shot": "app.shared.ai_core",
+    "cross_encoder": "app.modules.search.reranking",
+    "bge_m3": "app.modules.search.sparse_embeddings",
+    "ncf": "app.modules.recommendations.ncf",
+}
+
+_loaders: Dict[str, Callable[[str, str], Any]] = {}
+
+
+def register_loader(kind: str, loader: Callable[[str, str], Any]) -> None:
+    """Register the loader for a model kind.
+
+    Args:
+        kind: Model kind (e.g. "cross_encoder")
+        loader: Callable of (model_name, device) returning the model, or
+            None when the backing library is unavailable
+    """
+    _loaders[kind] = loader
+
+
+def _get_loader(kind: str) -> Callable[[str, str], Any]:
+    loader = _loaders.get(kind)
+    if loader is None and kind in LOADER_MODULES:
+        importlib.import_module(LOADER_MODULES[kind])
+        loader = _loaders.get(kind)
+    if loader is None:
+        raise ValueError(f"No loader registered for model kind '{kind}'")
+    return loader
+
+
+def estimate_model_bytes(model: Any) -> int:
+    """Approximate resident size of a model from its tensors.
+
+    Looks for ``parameters()``/``buffers()`` on the object itself or on a
+    wrapped ``.model`` (pipelines, CrossEncoder, BGE-M3).
+
+    Returns:
+        Size in bytes (0 if unknown)
+    """
+    for candidate in (model, getattr(model, "model", None)):
+        parameters = getattr(candidate, "parameters", None)
+        if not callable(parameters):
+            continue
+        try:
+            total = sum(p.numel() * p.element_size() for p in parameters())
+            buffers = getattr(candidate, "buffers", None)
+            if callable(buffers):
+                total += sum(b.numel() * b.element_size() for b in buffers())
+            return int(total)
+        except Exception:
+            continue
+    return int(getattr(model, "nbytes", 0) or 0)
+
+
+@dataclass
+class _Entry:
+    model: Any
+    nbytes: int
+    loaded_at: float
+    load_seconds: float
+    last_used: float
+    in_use: int = 0
+    hits: int = 0
+
+
+@dataclass
+class _KeyState:
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    loads: int = 0
+    failures: int = 0
+
+
+class ModelRegistry:
+    """LRU registry of loaded models under a memory budget.
+
+    Attributes:
+        max_bytes: Memory budget for idle models (0 = unlimited)
+        evictions: Models dropped to stay under the budget
+    """
+
+    def __init__(self, max_bytes: int = 0):
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._models: "OrderedDict[ModelKey, _Entry]" = OrderedDict()
+        self._keys: Dict[ModelKey, _KeyState] = {}
+        self._lock = threading.RLock()
+
+    def _key_state(self, key: ModelKey) -> _KeyState:
+        with self._lock:
+            state = self._keys.get(key)
+            if state is None:
+                state = self._keys[key] = _KeyState()
+            return state
+
+    def _touch(self, key: ModelKey, hold: bool = False) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is not None:
+                entry.hits += 1
+                entry.last_used = time.time()
+                if hold:
+                    entry.in_use += 1
+                self._models.move_to_end(key)
+            return entry
+
+    def get(
+        self,
+        kind: str,
+        model_name: str,
+        device: str = "auto",
+        loader: Optional[Callable[[str, str], Any]] = None,
+    ) -> Any:
+        """Return a loaded model, loading it once if needed.
+
+        Concurrent callers for the same key wait for a single load. Loader
+        exceptions propagate and nothing is cached, so a later call retries.
+        The model may be evicted as soon as this returns; callers that run
+        inference should hold it with ``use`` instead of keeping a reference.
+
+        Args:
+            kind: Model kind (selects the registered loader)
+            model_name: Model name or checkpoint path
+            device: Target device ("auto" lets the library decide)
+            loader: Optional loader overriding the registered one
+
+        Returns:
+            The model, or None if its library is unavailable
+        """
+        return self._acquire((kind, model_name, device or "auto"), loader, hold=False)
+
+    def _acquire(
+        self,
+        key: ModelKey,
+        loader: Optional[Callable[[str, str], Any]],
+        hold: bool,
+    ) -> Any:
+        entry = self._touch(key, hold)
+        if entry is not None:
+            return entry.model
+
+        state = self._key_state(key)
+        with state.lock:
+            entry = self._touch(key, hold)
+            if entry is not None:
+                return entry.model
+
+            kind, model_name, device = key
+            load = loader or _get_loader(kind)
+            start = time.time()
+            try:
+                model = load(model_name, device)
+            except Exception:
+                state.failures += 1
+                raise
+            if model is None:
+                return None
+
+            now = time.time()
+            entry = _Entry(
+                model=model,
+                nbytes=estimate_model_bytes(model),
+                loaded_at=now,
+                load_seconds=now - start,
+                last_used=now,
+                in_use=1 if hold else 0,
+            )
+            with self._lock:
+                state.loads += 1
+                self._models[key] = entry
+                self._evict(keep=key)
+            logger.info(
+                f"Loaded {kind} model {model_name} on {device} in "
+                f"{entry.load_seconds:.1f}s ({entry.nbytes / 1e6:.0f} MB)"
+            )
+            return model
+
+    @contextmanager
+    def use(
+        self,
+        kind: str,
+        model_name: str,
+        device: str = "auto",
+        optional: bool = False,
+    ) -> Iterator[Any]:
+        """Hold a model for the duration of a block (never evicted meanwhile).
+
+        Services lease their model per call instead of keeping it on the
+        instance, so an evicted model is actually freed. When the lease ends
+        the registry evicts down to its budget again.
+
+        Args:
+            kind: Model kind (selects the registered loader)
+            model_name: Model name or checkpoint path
+            device: Target device ("auto" lets the library decide)
+            optional: Log load failures and yield None instead of raising
+
+        Yields:
+            The model, or None if its library is unavailable
+        """
+        key = (kind, model_name, device or "auto")
+        try:
+            model = self._acquire(key, None, hold=True)
+        except Exception as e:
+            if not optional:
+                raise
+            logger.warning(f"Could not load {kind} model {model_name}: {e}")
+            model = None
+        try:
+            yield model
+        finally:
+            if model is not None:
+                self._release(key, model)
+
+    def _release(self, key: ModelKey, model: Any) -> None:
+        with self._lock:
+            entry = self._models.get(key)
+            # The entry may have been unloaded (and reloaded) meanwhile
+            if entry is not None and entry.model is model and entry.in_use:
+                entry.in_use -= 1
+                self._evict()
+
+    def _evict(self, keep: Optional[ModelKey] = None) -> None:
+        if not self.max_bytes:
+            return
+        total = sum(entry.nbytes for entry in self._models.values())
+        for key in list(self._models):
+            if total <= self.max_bytes:
+                break
+            entry = self._models[key]
+            if key == keep or entry.in_use:
+                continue
+            del self._models[key]
+            total -= entry.nbytes
+            self.evictions += 1
+            logger.info(
+                f"Evicted idle {key[0]} model {key[1]} "
+                f"({entry.nbytes / 1e6:.0f} MB)"
+            )
+
+    def unload(self, kind: str, model_name: str, device: str = "auto") -> bool:
+        """Drop a model from the registry.
+
+        Returns:
+            True if the model was loaded
+        """
+        with self._lock:
+            key = (kind, model_name, device or "auto")
+            return self._models.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Drop all models and counters."""
+        with self._lock:
+            self._models.clear()
+            self._keys.clear()
+            self.evictions = 0
+
+    def preload(self, specs: List[str]) -> int:
+        """Load models listed as ``kind:model_name[@device]``.
+
+        Failures are logged and skipped.
+
+        Returns:
+            Number of models available after preloading
+        """
+        loaded = 0
+        for spec in specs:
+            kind, _, rest = spec.partition(":")
+            model_name, _, device = rest.partition("@")
+            if not kind or not model_name:
+                logger.warning(f"Ignoring malformed model preload entry: {spec!r}")
+                continue
+            try:
+                model = self.get(
+                    kind.strip(), model_name.strip(), device.strip() or "auto"
+                )
+                if model is not None:
+                    loaded += 1
+            except Exception as e:
+                logger.warning(f"Failed to preload {spec}: {e}")
+        return loaded
+
+    def stats(self) -> Dict[str, Any]:
+        """Loaded models, load counts and resident memory."""
+        with self._lock:
+            models = [
+                {
+                    "kind": kind,
+                    "model_name": model_name,
+                    "device": device,
+                    "memory_bytes": entry.nbytes,
+                    "load_seconds": round(entry.load_seconds, 3),
+                    "idle_seconds": round(time.time() - entry.last_used, 1),
+                    "hits": entry.hits,
+                    "in_use": entry.in_use,
+                }
+                for (kind, model_name, device), entry in self._models.items()
+            ]
+            return {
+                "models": models,
+                "resident_bytes": sum(m["memory_bytes"] for m in models),
+                "max_bytes": self.max_bytes,
+                "loads": {
+                    ":".join(key): state.loads
+                    for key, state in self._keys.items()
+                    if state.loads
+                },
+                "load_failures": sum(
+                    state.failures for state in self._keys.values()
+                ),
+                "evictions": self.evictions,
+            }
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide model registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                try:
+                    from ..config.settings import get_settings
+
+                    max_bytes = get_settings().MODEL_REGISTRY_MAX_BYTES
+                except Exception:
+                    max_bytes = 0
+                _registry = ModelRegistry(max_bytes)
+    return _registry
+
+
+def preload_models() -> int:
+    """Preload the models listed in MODEL_PRELOAD into the process registry."""
+    try:
+        from ..config.settings import get_settings
+
+        specs = list(get_settings().MODEL_PRELOAD)
+    except Exception:
+        specs = []
+    if not specs:
+        return 0
+    loaded = get_model_registry().preload(specs)
+    logger.info(f"Preloaded {loaded}/{len(specs)} models")
+    return loaded
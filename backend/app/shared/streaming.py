@@ -0,0 +1,62 @@
+"""
+Neo Alexandria 2.0 - Streaming Response Helpers
+
+Helpers for streaming large text exports through ``StreamingResponse``
+without materializing them: small text pieces are coalesced into
+fixed-size chunks, optionally gzip-compressed on the fly.
+
+Related files:
+- app/modules/annotations/router.py: Streaming annotation exports
+"""
+
+import zlib
+from typing import Iterable, Iterator
+
+# Bytes per chunk handed to the ASGI server
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def buffer_chunks(
+    pieces: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Coalesce small text pieces into UTF-8 chunks of about ``chunk_size`` bytes.
+
+    Args:
+        pieces: Text fragments in output order
+        chunk_size: Target chunk size in bytes
+
+    Yields:
+        Encoded chunks (the last one may be smaller)
+    """
+    buffer = bytearray()
+    for piece in pieces:
+        buffer += piece.encode("utf-8")
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def gzip_chunks(
+    pieces: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE, level: int = 6
+) -> Iterator[bytes]:
+    """Gzip-compress text pieces as a stream.
+
+    Memory use is bounded by ``chunk_size`` plus the compressor window,
+    regardless of the total output size.
+
+    Args:
+        pieces: Text fragments in output order
+        chunk_size: Uncompressed bytes fed to the compressor at a time
+        level: zlib compression level
+
+    Yields:
+        Chunks of a single gzip member
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31 = gzip container
+    for chunk in buffer_chunks(pieces, chunk_size):
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
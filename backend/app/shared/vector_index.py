@@ -0,0 +1,795 @@
+"""
+Neo Alexandria 2.0 - Shared Vector Index
+
+This module provides an in-process approximate nearest neighbour (ANN) index
+for dense embeddings in the shared kernel. It replaces full-table cosine
+scans with a NumPy IVF-flat index that can be persisted to disk and kept in
+sync incrementally.
+
+Features:
+- IVF-flat index (k-means coarse quantizer + exact re-scoring of probed lists)
+- Exact brute-force matrix search for small corpora (below training threshold)
+- Incremental upsert/remove with slot reuse
+- Compact float32 byte encoding for vectors stored in binary columns
+- File-backed persistence (.npy + JSON metadata, memory-mapped on load)
+- Staleness and size statistics for monitoring
+- Process-wide registry scoped per database engine
+- Background retraining/persistence so request paths never pay for either
+
+Related files:
+- app/shared/embeddings.py: Embedding generation
+- app/modules/search/dense_index.py: Resource embedding index maintenance
+- scripts/rebuild_vector_index.py: Offline rebuild CLI
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def parse_embedding(value: Any) -> Optional[List[float]]:
+    """Decode an embedding stored as a JSON string or list.
+
+    Args:
+        value: Raw column value (JSON text, list, or None)
+
+    Returns:
+        List of floats, or None if the value is empty or malformed
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        if not value.strip():
+            return None
+        try:
+            value = json.loads(value)
+        except (ValueError, TypeError):
+            return None
+    if not isinstance(value, (list, tuple)) or len(value) == 0:
+        return None
+    return list(value)
+
+
+def encode_vector(vector: Sequence[float]) -> bytes:
+    """Encode a vector as compact little-endian float32 bytes.
+
+    Args:
+        vector: Embedding vector
+
+    Returns:
+        Raw bytes (4 bytes per dimension)
+    """
+    return np.asarray(vector, dtype="<f4").tobytes()
+
+
+def decode_vector(data: Optional[bytes]) -> Optional[np.ndarray]:
+    """Decode float32 bytes produced by ``encode_vector``.
+
+    Args:
+        data: Raw bytes, or None
+
+    Returns:
+        float32 array, or None if the value is empty or malformed
+    """
+    if not isinstance(data, (bytes, bytearray, memoryview)) or not data or len(data) % 4:
+        return None
+    return np.frombuffer(data, dtype="<f4")
+
+
+def staging_dir(path: Path) -> Path:
+    """Create a unique sibling directory to write a new copy of ``path`` into.
+
+    Each save gets its own directory, so concurrent saves from several
+    worker processes never write into each other's files.
+    """
+    tmp_dir = path.with_name(f"{path.name}.tmp-{os.getpid()}-{uuid.uuid4().hex[:8]}")
+    tmp_dir.mkdir(parents=True)
+    return tmp_dir
+
+
+def publish_dir(tmp_dir: Path, path: Path) -> None:
+    """Move a fully written staging directory into place at ``path``.
+
+    The previous copy is moved aside under a unique name first. If another
+    process publishes between the two renames, its copy is kept and ours is
+    discarded; both are complete snapshots.
+    """
+    old_dir = path.with_name(f"{path.name}.old-{os.getpid()}-{uuid.uuid4().hex[:8]}")
+    try:
+        os.replace(path, old_dir)
+    except FileNotFoundError:
+        pass
+    try:
+        os.replace(tmp_dir, path)
+    except OSError as e:
+        logger.info(f"Concurrent save already published {path}, discarding ours: {e}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+
+class VectorIndex:
+    """IVF-flat approximate nearest neighbour index over cosine similarity.
+
+    Vectors are L2-normalized and stored in a contiguous float32 matrix, so
+    cosine similarity reduces to a dot product. Until the index holds
+    ``train_threshold`` live vectors, search is an exact matrix product over
+    all rows. Once trained, each row is assigned to its nearest centroid and
+    queries only re-score rows in the ``nprobe`` closest lists.
+
+    Attributes:
+        name: Index name (used for the on-disk directory)
+        dim: Vector dimensionality (fixed by the first inserted vector)
+        path: Optional directory for persistence
+        nprobe: Number of inverted lists probed per query
+        train_threshold: Minimum live vectors before the quantizer is trained
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dim: Optional[int] = None,
+        path: Optional[Path] = None,
+        nprobe: int = 8,
+        train_threshold: int = 4096,
+    ) -> None:
+        self.name = name
+        self.path = Path(path) if path else None
+        self.nprobe = max(1, nprobe)
+        self.train_threshold = max(1, train_threshold)
+
+        self._lock = threading.RLock()
+        self._reset_storage(dim)
+
+        # Delta-sync bookkeeping: key -> (updated_at, value fingerprint) for
+        # rows inside the watermark margin window (see dense_index.py)
+        self.margin_seen: Dict[str, Tuple[Any, int]] = {}
+        self.watermark: Optional[str] = None
+        self.built_at: Optional[float] = None
+        self.synced_at: Optional[float] = None
+        self.saved_at: Optional[float] = None
+        self._mutations_since_train = 0
+        self._mutations_since_save = 0
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._key_to_row)
+
+    def __contains__(self, key: str) -> bool:
+        return str(key) in self._key_to_row
+
+    def _reset_storage(self, dim: Optional[int]) -> None:
+        self.dim = dim
+        self._vectors = np.zeros((0, dim or 0), dtype=np.float32)
+        self._assign = np.zeros(0, dtype=np.int32)
+        self._live = np.zeros(0, dtype=bool)
+        self._keys: List[Optional[str]] = []
+        self._key_to_row: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+        self._centroids: Optional[np.ndarray] = None
+
+    def _normalize(self, vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (vectors / norms).astype(np.float32, copy=False)
+
+    def _ensure_capacity(self, needed: int) -> None:
+        capacity = self._vectors.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2, 64)
+        vectors = np.zeros((new_capacity, self.dim), dtype=np.float32)
+        vectors[:capacity] = self._vectors
+        assign = np.full(new_capacity, -1, dtype=np.int32)
+        assign[:capacity] = self._assign
+        live = np.zeros(new_capacity, dtype=bool)
+        live[:capacity] = self._live
+        self._vectors, self._assign, self._live = vectors, assign, live
+
+    def upsert_many(
+        self, keys: Sequence[str], vectors: Sequence[Sequence[float]]
+    ) -> int:
+        """Insert or replace vectors for the given keys.
+
+        Vectors whose dimension does not match the index are skipped.
+
+        Args:
+            keys: Identifiers (stringified)
+            vectors: Embedding vectors, one per key
+
+        Returns:
+            Number of vectors written
+        """
+        if not keys:
+            return 0
+
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[0] != len(keys):
+            return sum(self.upsert(k, v) for k, v in zip(keys, vectors))
+
+        with self._lock:
+            if self.dim is None or (len(self) == 0 and self._vectors.shape[1] != matrix.shape[1]):
+                # Empty index: adopt the new dimension, dropping free slots
+                # and centroids sized for the old one
+                self._reset_storage(int(matrix.shape[1]))
+            if matrix.shape[1] != self.dim:
+                logger.warning(
+                    f"Vector index '{self.name}': dimension {matrix.shape[1]} "
+                    f"does not match index dimension {self.dim}, skipping batch"
+                )
+                return 0
+
+            matrix = self._normalize(matrix)
+            rows = np.empty(len(keys), dtype=np.int64)
+            next_row = len(self._keys)
+            for i, key in enumerate(keys):
+                key = str(key)
+                row = self._key_to_row.get(key)
+                if row is None:
+                    if self._free_rows:
+                        row = self._free_rows.pop()
+                        self._keys[row] = key
+                    else:
+                        row = next_row
+                        next_row += 1
+                        self._keys.append(key)
+                    self._key_to_row[key] = row
+                rows[i] = row
+
+            self._ensure_capacity(next_row)
+            self._vectors[rows] = matrix
+            self._live[rows] = True
+            if self._centroids is not None:
+                self._assign[rows] = np.argmax(matrix @ self._centroids.T, axis=1)
+            else:
+                self._assign[rows] = -1
+
+            self._mutations_since_train += len(keys)
+            self._mutations_since_save += len(keys)
+            return len(keys)
+
+    def upsert(self, key: str, vector: Sequence[float]) -> int:
+        """Insert or replace a single vector.
+
+        Args:
+            key: Identifier
+            vector: Embedding vector
+
+        Returns:
+            1 if written, 0 if skipped
+        """
+        if vector is None or len(vector) == 0:
+            return 0
+        return self.upsert_many([key], [vector])
+
+    def remove(self, key: str) -> bool:
+        """Remove a vector from the index.
+
+        Args:
+            key: Identifier
+
+        Returns:
+            True if the key was present
+        """
+        with self._lock:
+            row = self._key_to_row.pop(str(key), None)
+            if row is None:
+                return False
+            self._live[row] = False
+            self._assign[row] = -1
+            self._keys[row] = None
+            self._free_rows.append(row)
+            self._mutations_since_train += 1
+            self._mutations_since_save += 1
+            return True
+
+    def clear(self) -> None:
+        """Drop all vectors and the trained quantizer."""
+        with self._lock:
+            self._reset_storage(self.dim)
+            self.margin_seen = {}
+            self.watermark = None
+            self._mutations_since_train = 0
+            self._mutations_since_save = 0
+
+    def adopt(self, other: "VectorIndex") -> None:
+        """Replace this index's contents with those of ``other``.
+
+        Lets callers build a fresh index without holding this index's lock
+        and then swap it in atomically.
+
+        Args:
+            other: Fully built index (not used afterwards)
+        """
+        with self._lock, other._lock:
+            self.dim = other.dim
+            self._vectors = other._vectors
+            self._assign = other._assign
+            self._live = other._live
+            self._keys = other._keys
+            self._key_to_row = other._key_to_row
+            self._free_rows = other._free_rows
+            self._centroids = other._centroids
+            self.margin_seen = other.margin_seen
+            self.watermark = other.watermark
+            self.built_at = other.built_at
+            self.synced_at = other.synced_at
+            self._mutations_since_train = other._mutations_since_train
+            self._mutations_since_save = other._mutations_since_save
+
+    def compact(self) -> None:
+        """Rewrite storage without free slots."""
+        with self._lock:
+            rows = np.flatnonzero(self._live[: len(self._keys)])
+            self._vectors = np.ascontiguousarray(self._vectors[rows])
+            self._assign = self._assign[rows].copy()
+            self._live = np.ones(len(rows), dtype=bool)
+            self._keys = [self._keys[r] for r in rows]
+            self._key_to_row = {k: i for i, k in enumerate(self._keys)}
+            self._free_rows = []
+
+    # ------------------------------------------------------------------
+    # Training
+    # ------------------------------------------------------------------
+
+    def train(self, nlist: Optional[int] = None, iterations: int = 10, seed: int = 0) -> bool:
+        """Train the coarse quantizer with spherical k-means and reassign rows.
+
+        Only the training sample is copied under the lock; k-means runs
+        without it, so searches and upserts continue while the quantizer is
+        being trained.
+
+        Args:
+            nlist: Number of inverted lists (default: ~4 * sqrt(n))
+            iterations: Lloyd iterations
+            seed: RNG seed for reproducible centroids
+
+        Returns:
+            True if the quantizer was trained, False if there are too few vectors
+        """
+        rng = np.random.default_rng(seed)
+        with self._lock:
+            n = len(self)
+            if n < self.train_threshold:
+                self._centroids = None
+                self._assign[:] = -1
+                return False
+
+            rows = np.flatnonzero(self._live[: len(self._keys)])
+            nlist = nlist or int(min(max(16, 4 * np.sqrt(n)), n // 8 or 1))
+            sample_size = min(n, max(nlist * 64, 20000))
+            sample = self._vectors[np.sort(rng.choice(rows, size=sample_size, replace=False))]
+            dim = self.dim
+            pending = self._mutations_since_train
+
+        centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=nlist)
+            empty = counts == 0
+            if empty.any():
+                sums[empty] = sample[rng.choice(sample_size, size=int(empty.sum()))]
+            centroids = self._normalize(sums)
+
+        with self._lock:
+            if self.dim != dim:
+                # Cleared and refilled with another dimension meanwhile
+                return False
+            self._centroids = centroids.astype(np.float32)
+            rows = np.flatnonzero(self._live[: len(self._keys)])
+            for start in range(0, len(rows), 65536):
+                batch = rows[start : start + 65536]
+                self._assign[batch] = np.argmax(
+                    self._vectors[batch] @ self._centroids.T, axis=1
+                )
+            self._mutations_since_train = max(0, self._mutations_since_train - pending)
+            logger.info(f"Vector index '{self.name}' trained: {n} vectors, {nlist} lists")
+            return True
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    @property
+    def nlist(self) -> int:
+        """Number of inverted lists (0 until trained; searches are then exact)."""
+        centroids = self._centroids
+        return 0 if centroids is None else int(centroids.shape[0])
+
+    @property
+    def needs_training(self) -> bool:
+        """True once the index is large enough and the quantizer is missing or stale."""
+        size = len(self)
+        return size >= self.train_threshold and (
+            self._centroids is None or self._mutations_since_train > size
+        )
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _candidate_mask(
+        self, n_rows: int, exclude: Optional[Iterable[str]]
+    ) -> np.ndarray:
+        """Boolean mask of live rows, with excluded keys already cleared."""
+        mask = self._live[:n_rows].copy()
+        if exclude:
+            excluded_rows = [
+                row
+                for row in (self._key_to_row.get(str(e)) for e in exclude)
+                if row is not None and row < n_rows
+            ]
+            mask[excluded_rows] = False
+        return mask
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int = 10,
+        exclude: Optional[Iterable[str]] = None,
+        nprobe: Optional[int] = None,
+    ) -> List[Tuple[str, float]]:
+        """Return the top-k most similar keys by cosine similarity.
+
+        Args:
+            query: Query vector
+            k: Number of results
+            exclude: Keys to leave out of the result (masked out before
+                     scoring, so they never displace a top-k hit)
+            nprobe: Override for the number of probed lists
+
+        Returns:
+            List of (key, similarity) tuples sorted by similarity descending
+        """
+        if k <= 0 or len(self) == 0:
+            return []
+
+        q = np.asarray(query, dtype=np.float32).reshape(-1)
+        if self.dim is None or q.shape[0] != self.dim:
+            return []
+        q_norm = np.linalg.norm(q)
+        if q_norm == 0:
+            return []
+        q = q / q_norm
+
+        with self._lock:
+            n_rows = len(self._keys)
+            mask = self._candidate_mask(n_rows, exclude)
+            if self._centroids is not None:
+                probes = min(nprobe or self.nprobe, len(self._centroids))
+                centroid_scores = self._centroids @ q
+                probe_ids = np.argpartition(-centroid_scores, probes - 1)[:probes]
+                mask &= np.isin(self._assign[:n_rows], probe_ids)
+            rows = np.flatnonzero(mask)
+            if len(rows) == 0:
+                return []
+
+            scores = self._vectors[rows] @ q
+            want = min(len(rows), k)
+            top = np.argpartition(-scores, want - 1)[:want]
+            top = top[np.argsort(-scores[top])]
+
+            return [
+                (self._keys[rows[i]], float(scores[i]))
+                for i in top
+                if self._keys[rows[i]] is not None
+            ]
+
+    def search_many(
+        self,
+        queries: Sequence[Sequence[float]],
+        k: int = 10,
+        exclude: Optional[Iterable[str]] = None,
+        nprobe: Optional[int] = None,
+        max_block_cells: int = 1 << 24,
+    ) -> List[List[Tuple[str, float]]]:
+        """Top-k search for a batch of queries.
+
+        Untrained indexes score all queries with blocked matrix products
+        (at most ``max_block_cells`` similarities at a time); trained indexes
+        probe per query.
+
+        Args:
+            queries: Query vectors (one per row)
+            k: Number of results per query
+            exclude: Keys to leave out of every result
+            nprobe: Override for the number of probed lists
+            max_block_cells: Upper bound on query rows x index rows per block
+
+        Returns:
+            One result list per query, as returned by ``search``
+        """
+        matrix = np.asarray(queries, dtype=np.float32)
+        if matrix.ndim != 2 or len(matrix) == 0:
+            return [[] for _ in range(len(queries))]
+        if k <= 0 or len(self) == 0 or self.dim is None or matrix.shape[1] != self.dim:
+            return [[] for _ in range(len(matrix))]
+        if self._centroids is not None:
+            exclude = list(exclude) if exclude else None
+            return [self.search(q, k=k, exclude=exclude, nprobe=nprobe) for q in matrix]
+
+        norms = np.linalg.norm(matrix, axis=1)
+        matrix = self._normalize(matrix)
+
+        results: List[List[Tuple[str, float]]] = []
+        with self._lock:
+            rows = np.flatnonzero(self._candidate_mask(len(self._keys), exclude))
+            if len(rows) == 0:
+                return [[] for _ in range(len(matrix))]
+            vectors = self._vectors[rows]
+            want = min(len(rows), k)
+            block_size = max(1, max_block_cells // len(rows))
+
+            for start in range(0, len(matrix), block_size):
+                scores = matrix[start : start + block_size] @ vectors.T
+                top = np.argpartition(-scores, want - 1, axis=1)[:, :want]
+                top_scores = np.take_along_axis(scores, top, axis=1)
+                order = np.argsort(-top_scores, axis=1)
+                top = np.take_along_axis(top, order, axis=1)
+                top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+                for offset in range(len(top)):
+                    hits: List[Tuple[str, float]] = []
+                    if norms[start + offset] > 0:
+                        for i, score in zip(top[offset], top_scores[offset]):
+                            key = self._keys[rows[i]]
+                            if key is None:
+                                continue
+                            hits.append((key, float(score)))
+                            if len(hits) >= k:
+                                break
+                    results.append(hits)
+        return results
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self) -> bool:
+        """Persist the index to ``self.path`` atomically.
+
+        Returns:
+            True if saved, False if the index has no path
+        """
+        if self.path is None:
+            return False
+
+        with self._lock:
+            self.compact()
+            tmp_dir = staging_dir(self.path)
+
+            np.save(tmp_dir / "vectors.npy", self._vectors)
+            np.save(tmp_dir / "assign.npy", self._assign)
+            if self._centroids is not None:
+                np.save(tmp_dir / "centroids.npy", self._centroids)
+            meta = {
+                "name": self.name,
+                "dim": self.dim,
+                "keys": self._keys,
+                "watermark": self.watermark,
+                "built_at": self.built_at,
+                "synced_at": self.synced_at,
+                "mutations_since_train": self._mutations_since_train,
+            }
+            with open(tmp_dir / "meta.json", "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            publish_dir(tmp_dir, self.path)
+
+            self.saved_at = time.time()
+            self._mutations_since_save = 0
+            logger.info(f"Saved vector index '{self.name}' ({len(self)} vectors) to {self.path}")
+            return True
+
+    def load(self) -> bool:
+        """Load the index from ``self.path`` if present.
+
+        The vector matrix is memory-mapped copy-on-write, so loading a large
+        index does not read it fully into memory until it is modified.
+
+        Returns:
+            True if an index was loaded
+        """
+        if self.path is None or not (self.path / "meta.json").exists():
+            return False
+
+        try:
+            with open(self.path / "meta.json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            vectors = np.load(self.path / "vectors.npy", mmap_mode="c")
+            assign = np.load(self.path / "assign.npy")
+            centroids_file = self.path / "centroids.npy"
+            centroids = np.load(centroids_file) if centroids_file.exists() else None
+        except Exception as e:
+            logger.error(f"Failed to load vector index '{self.name}' from {self.path}: {e}")
+            return False
+
+        with self._lock:
+            self.dim = meta.get("dim")
+            self._keys = list(meta.get("keys", []))
+            self._vectors = vectors
+            self._assign = assign.astype(np.int32)
+            self._live = np.ones(len(self._keys), dtype=bool)
+            self._key_to_row = {k: i for i, k in enumerate(self._keys)}
+            self._free_rows = []
+            self._centroids = centroids
+            self.watermark = meta.get("watermark")
+            self.built_at = meta.get("built_at")
+            self.synced_at = meta.get("synced_at")
+            self._mutations_since_train = meta.get("mutations_since_train", 0)
+            self._mutations_since_save = 0
+            self.saved_at = os.path.getmtime(self.path / "meta.json")
+
+        logger.info(f"Loaded vector index '{self.name}' ({len(self)} vectors) from {self.path}")
+        return True
+
+    # ------------------------------------------------------------------
+    # Monitoring
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and staleness statistics.
+
+        ``staleness`` is the fraction of the index mutated since the
+        quantizer was last trained; a value near 1.0 means the IVF lists no
+        longer reflect the data and a rebuild is recommended.
+
+        Returns:
+            Dictionary of index statistics
+        """
+        size = len(self)
+        now = time.time()
+        return {
+            "name": self.name,
+            "size": size,
+            "dim": self.dim,
+            "free_slots": len(self._free_rows),
+            "trained": self.is_trained,
+            "nlist": self.nlist,
+            "nprobe": self.nprobe,
+            "memory_bytes": int(self._vectors.nbytes),
+            "mutations_since_train": self._mutations_since_train,
+            "unsaved_mutations": self._mutations_since_save,
+            "staleness": round(self._mutations_since_train / size, 4) if size else 0.0,
+            "seconds_since_build": round(now - self.built_at, 1) if self.built_at else None,
+            "seconds_since_sync": round(now - self.synced_at, 1) if self.synced_at else None,
+            "persisted": self.path is not None,
+        }
+
+
+# ============================================================================
+# Background maintenance
+# ============================================================================
+
+_maintenance_lock = threading.Lock()
+_maintenance_running: Set[int] = set()
+
+
+def schedule_maintenance(index: Any, save_every: int) -> bool:
+    """Retrain and/or persist an index on a background thread when due.
+
+    Request paths call this after mutating an index instead of training or
+    saving inline. At most one maintenance thread runs per index; calls made
+    while it runs are no-ops, and the next mutation re-checks.
+
+    Args:
+        index: VectorIndex or InvertedIndex
+        save_every: Unsaved mutations that trigger a save (file-backed only)
+
+    Returns:
+        True if a maintenance thread was started
+    """
+
+    def save_due() -> bool:
+        return index.path is not None and index.stats()["unsaved_mutations"] >= save_every
+
+    if not (getattr(index, "needs_training", False) or save_due()):
+        return False
+
+    with _maintenance_lock:
+        if id(index) in _maintenance_running:
+            return False
+        _maintenance_running.add(id(index))
+
+    def run() -> None:
+        try:
+            if getattr(index, "needs_training", False):
+                index.train()
+            if save_due():
+                index.save()
+        except Exception as e:
+            logger.warning(f"Background maintenance of index '{index.name}' failed: {e}")
+        finally:
+            with _maintenance_lock:
+                _maintenance_running.discard(id(index))
+
+    threading.Thread(
+        target=run, name=f"index-maintenance-{index.name}", daemon=True
+    ).start()
+    return True
+
+
+# ============================================================================
+# Process-wide registry
+# ============================================================================
+
+_registry: "weakref.WeakKeyDictionary[Any, Dict[str, VectorIndex]]" = (
+    weakref.WeakKeyDictionary()
+)
+_registry_lock = threading.Lock()
+
+
+def _index_path_for(bind: Any, name: str) -> Optional[Path]:
+    """Resolve the on-disk location for an index, or None for in-memory databases."""
+    url = str(getattr(bind, "url", ""))
+    if not url or ":memory:" in url or url in ("sqlite://", "sqlite+pysqlite://"):
+        return None
+    try:
+        from ..config.settings import get_settings
+
+        settings = get_settings()
+        base_dir = getattr(settings, "VECTOR_INDEX_DIR", None)
+    except Exception:
+        base_dir = None
+    return Path(base_dir) / name if base_dir else None
+
+
+def get_vector_index(bind: Any, name: str) -> VectorIndex:
+    """Get (or create and load) the process-wide index for an engine.
+
+    Indexes are scoped per engine so that separate databases (e.g. test
+    engines) never share vectors. Indexes for file-backed databases are
+    persisted under ``VECTOR_INDEX_DIR``.
+
+    Args:
+        bind: SQLAlchemy engine or connection the index mirrors
+        name: Index name (e.g. "resources")
+
+    Returns:
+        VectorIndex instance
+    """
+    engine = getattr(bind, "engine", bind)
+    with _registry_lock:
+        indexes = _registry.get(engine)
+        if indexes is None:
+            indexes = {}
+            _registry[engine] = indexes
+        index = indexes.get(name)
+        if index is None:
+            try:
+                from ..config.settings import get_settings
+
+                settings = get_settings()
+                nprobe = getattr(settings, "VECTOR_INDEX_NPROBE", 8)
+                threshold = getattr(settings, "VECTOR_INDEX_TRAIN_THRESHOLD", 4096)
+            except Exception:
+                nprobe, threshold = 8, 4096
+            index = VectorIndex(
+                name,
+                path=_index_path_for(engine, name),
+                nprobe=nprobe,
+                train_threshold=threshold,
+            )
+            index.load()
+            indexes[name] = index
+        return index
+
+
+def get_all_vector_indexes() -> List[VectorIndex]:
+    """Return every index currently held by this process."""
+    with _registry_lock:
+        return [idx for indexes in _registry.values() for idx in indexes.values()]
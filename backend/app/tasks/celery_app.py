@@ -30,7 +30,7 @@ import time
 from typing import Optional, TYPE_CHECKING
 
 from celery import Celery
-from celery.signals import worker_process_init
+from celery.signals import worker_process_init, worker_process_shutdown
 from celery.schedules import crontab
 from kombu import Queue
 
@@ -63,6 +63,12 @@ celery_app.conf.update(
         "app.tasks.celery_tasks.recompute_quality_task": {"queue": "default"},
         "app.tasks.celery_tasks.update_search_index_task": {"queue": "urgent"},
         "app.tasks.celery_tasks.update_graph_edges_task": {"queue": "default"},
+        "app.tasks.celery_tasks.regenerate_embeddings_batch_task": {
+            "queue": "high_priority"
+        },
+        "app.tasks.celery_tasks.recompute_quality_batch_task": {"queue": "default"},
+        "app.tasks.celery_tasks.update_graph_edges_batch_task": {"queue": "default"},
+        "app.tasks.celery_tasks.flush_coalesced_tasks_task": {"queue": "urgent"},
         "app.tasks.celery_tasks.classify_resource_task": {"queue": "ml_tasks"},
         "app.tasks.celery_tasks.invalidate_cache_task": {"queue": "urgent"},
         "app.tasks.celery_tasks.refresh_recommendation_profile_task": {
@@ -71,6 +77,7 @@ celery_app.conf.update(
         "app.tasks.celery_tasks.batch_process_resources_task": {"queue": "batch"},
         "app.tasks.celery_tasks.normalize_author_names_task": {"queue": "default"},
         "app.tasks.celery_tasks.ingest_repo_task": {"queue": "repo_ingestion"},
+        "app.tasks.celery_tasks.backfill_chunk_embeddings_task": {"queue": "batch"},
     },
     # Define task queues with priority support
     task_queues=(
@@ -136,6 +143,12 @@ celery_app.conf.beat_schedule = {
         "schedule": crontab(day_of_month=1, hour=0, minute=0),
         "options": {"queue": "ml_tasks", "priority": 5},
     },
+    # Graph centrality refresh - hourly at minute 30
+    "refresh-graph-centrality": {
+        "task": "app.tasks.celery_tasks.refresh_graph_centrality_task",
+        "schedule": crontab(minute=30),
+        "options": {"queue": "default", "priority": 3},
+    },
     # Cache cleanup - daily at 4 AM
     "cleanup-expired-cache": {
         "task": "app.tasks.celery_tasks.cleanup_expired_cache_task",
@@ -157,6 +170,55 @@ except ImportError:
 _embedding_service: Optional["EmbeddingService"] = None
 
 
+@worker_process_init.connect
+def init_worker_schema(**kwargs):
+    """Check the task engine's schema (and full-text index) once per worker process.
+
+    Tasks never re-check it (see app/shared/database.py:ensure_schema).
+    """
+    try:
+        from ..database.base import get_sync_engine
+        from ..modules.search.fts_index import ensure_fts_schema
+        from ..shared.database import ensure_schema
+
+        engine = get_sync_engine()
+        ensure_schema(engine)
+        ensure_fts_schema(engine)
+    except Exception as e:
+        logger.warning(f"Worker schema check skipped: {e}")
+
+
+@worker_process_init.connect
+def init_worker_models(**kwargs):
+    """Preload the MODEL_PRELOAD models into the worker's model registry.
+
+    Tasks then resolve them from app/shared/model_registry.py without
+    loading their own copies.
+    """
+    try:
+        from ..shared.model_registry import preload_models
+
+        preload_models()
+    except Exception as e:
+        logger.warning(f"Worker model preload skipped: {e}")
+
+
+@worker_process_shutdown.connect
+def flush_worker_usage(**kwargs):
+    """Flush buffered subject usage counts before a worker process exits.
+
+    Tasks buffer authority usage increments in the process-wide subject
+    index (see app/modules/authority/subject_index.py); without this the
+    increments still pending at shutdown would be lost.
+    """
+    try:
+        from ..modules.authority.subject_index import flush_all_usage
+
+        flush_all_usage()
+    except Exception as e:
+        logger.warning(f"Failed to flush subject usage counts: {e}")
+
+
 @worker_process_init.connect
 def init_worker_process(**kwargs):
     """Initialize worker process with pre-loaded ML models.
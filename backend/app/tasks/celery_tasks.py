@@ -27,7 +27,7 @@ from typing import List, Optional, Dict, Any
 from celery import Task
 
 from .celery_app import celery_app
-from ..database.base import SessionLocal, Base
+from ..database.base import SessionLocal
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +49,6 @@ class DatabaseTask(Task):
 
     Features:
     - Automatic session creation and cleanup
-    - Ensures tables exist (useful for SQLite)
     - Proper exception handling and session rollback
     - Compatible with Celery's retry mechanism
     """
@@ -74,13 +73,6 @@ class DatabaseTask(Task):
         db = SessionLocal()
 
         try:
-            # Ensure tables exist (especially for SQLite)
-            try:
-                Base.metadata.create_all(bind=db.get_bind())
-            except Exception:
-                # Best effort; ignore if fails
-                pass
-
             # Execute task with db session
             return self.run(*args, db=db, **kwargs)
 
@@ -117,10 +109,14 @@ def regenerate_embedding_task(self, resource_id: str, db=None):
         logger.info(f"Regenerating embedding for resource {resource_id}")
 
         # Import here to avoid circular dependencies
+        from ..modules.collections.service import CollectionService
         from ..shared.embeddings import EmbeddingService
 
         embedding_service = EmbeddingService(db)
-        embedding_service.generate_and_store_embedding(resource_id)
+        embedding_service.generate_and_store_embedding(
+            resource_id,
+            on_replaced=CollectionService(db).apply_member_reembeddings,
+        )
 
         logger.info(f"Successfully regenerated embedding for resource {resource_id}")
 
@@ -182,6 +178,180 @@ def recompute_quality_task(
         raise
 
 
+@celery_app.task(name="app.tasks.celery_tasks.flush_coalesced_tasks_task")
+def flush_coalesced_tasks_task(channel: str):
+    """
+    Dispatch the due keys of a coalescing channel as batch tasks.
+
+    Triggered by: TaskCoalescer when the first key of a window is submitted
+    Priority: Channel priority
+
+    Args:
+        channel: Coalescing channel name (see app/tasks/coalescing.py)
+    """
+    from .coalescing import get_coalescer
+
+    return get_coalescer().flush(channel)
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    max_retries=3,
+    default_retry_delay=60,
+    name="app.tasks.celery_tasks.regenerate_embeddings_batch_task",
+)
+def regenerate_embeddings_batch_task(self, resource_ids: List[str], db=None):
+    """
+    Regenerate embedding vectors for a coalesced batch of resources.
+
+    Triggered by: "embedding" coalescing channel (resource.content_changed)
+    Priority: HIGH (7)
+    Retry: 3 attempts with exponential backoff for transient errors
+
+    Args:
+        resource_ids: UUIDs of the resources to process
+        db: Database session (automatically provided by DatabaseTask)
+    """
+    from .coalescing import get_coalescer
+
+    try:
+        logger.info(f"Regenerating embeddings for {len(resource_ids)} resources")
+
+        from ..modules.collections.service import CollectionService
+        from ..shared.embeddings import EmbeddingService
+
+        embedding_service = EmbeddingService(db)
+        # Member re-embeds update collection running sums in the same commit
+        stored = embedding_service.generate_and_store_embeddings(
+            resource_ids, on_replaced=CollectionService(db).apply_member_reembeddings
+        )
+        get_coalescer().record_executed("embedding", len(resource_ids))
+
+        logger.info(f"Regenerated embeddings for {stored}/{len(resource_ids)} resources")
+        return stored
+
+    except Exception as e:
+        error_msg = str(e).lower()
+        if any(
+            keyword in error_msg for keyword in ["timeout", "connection", "network"]
+        ):
+            logger.warning(f"Transient error regenerating embedding batch: {e}")
+            raise self.retry(exc=e, countdown=2**self.request.retries)
+        logger.error(f"Error regenerating embedding batch: {e}", exc_info=True)
+        raise
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    max_retries=2,
+    name="app.tasks.celery_tasks.recompute_quality_batch_task",
+)
+def recompute_quality_batch_task(self, resource_ids: List[str], db=None):
+    """
+    Recompute quality scores for a coalesced batch of resources.
+
+    Triggered by: "quality" coalescing channel (resource.metadata_changed)
+    Priority: MEDIUM (5)
+
+    A failure on one resource is logged and does not stop the batch.
+
+    Args:
+        resource_ids: UUIDs of the resources to process
+        db: Database session (automatically provided by DatabaseTask)
+
+    Returns:
+        Number of resources recomputed
+    """
+    from ..modules.quality.service import QualityService
+    from .coalescing import get_coalescer
+
+    logger.info(f"Recomputing quality for {len(resource_ids)} resources")
+
+    quality_service = QualityService(db)
+    recomputed = 0
+    for resource_id in resource_ids:
+        try:
+            quality_service.compute_quality(resource_id)
+            recomputed += 1
+        except Exception as e:
+            db.rollback()
+            logger.error(
+                f"Error recomputing quality for {resource_id}: {e}", exc_info=True
+            )
+
+    get_coalescer().record_executed("quality", len(resource_ids))
+    logger.info(f"Recomputed quality for {recomputed}/{len(resource_ids)} resources")
+    return recomputed
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.celery_tasks.update_graph_edges_batch_task",
+)
+def update_graph_edges_batch_task(self, resource_ids: List[str], db=None):
+    """
+    Resolve the new citations of a coalesced batch of resources into graph edges.
+
+    Triggered by: "graph_edges" coalescing channel (citations.extracted)
+    Priority: MEDIUM (5)
+
+    Resolved citations are published as graph.edge_added events by the
+    citation service, which keeps the shared graph snapshot current.
+
+    Args:
+        resource_ids: UUIDs of the citing resources
+        db: Database session (automatically provided by DatabaseTask)
+
+    Returns:
+        Number of citations resolved
+    """
+    import uuid
+
+    from ..database.models import Citation
+    from ..modules.graph.citations import CitationService
+    from .coalescing import get_coalescer
+
+    try:
+        source_ids = []
+        for resource_id in resource_ids:
+            try:
+                source_ids.append(uuid.UUID(str(resource_id)))
+            except (ValueError, TypeError):
+                logger.warning(f"Invalid resource_id format: {resource_id}")
+
+        citation_ids = [
+            str(citation_id)
+            for (citation_id,) in db.query(Citation.id).filter(
+                Citation.source_resource_id.in_(source_ids),
+                Citation.target_resource_id.is_(None),
+            )
+        ]
+
+        resolved = 0
+        if citation_ids:
+            resolved = CitationService(db).resolve_internal_citations(citation_ids)
+
+        # Invalidate graph caches once for the whole batch
+        invalidate_cache_task.apply_async(
+            args=[[f"graph:neighbors:{rid}" for rid in resource_ids] + ["graph:*"]],
+            priority=9,
+        )
+        get_coalescer().record_executed("graph_edges", len(resource_ids))
+
+        logger.info(
+            f"Resolved {resolved} citations into graph edges for "
+            f"{len(resource_ids)} resources"
+        )
+        return resolved
+
+    except Exception as e:
+        logger.error(f"Error updating graph edge batch: {e}", exc_info=True)
+        raise
+
+
 @celery_app.task(
     bind=True,
     base=DatabaseTask,
@@ -432,7 +602,7 @@ def extract_citations_task(self, resource_id: str, db=None):
     try:
         logger.info(f"Extracting citations for resource {resource_id}")
 
-        from ..services.citation_service import CitationService
+        from ..modules.graph.citations import CitationService
 
         service = CitationService(db)
         service.extract_citations(resource_id)
@@ -468,7 +638,7 @@ def resolve_citations_task(self, db=None):
     try:
         logger.info("Resolving internal citations")
 
-        from ..services.citation_service import CitationService
+        from ..modules.graph.citations import CitationService
 
         service = CitationService(db)
         service.resolve_internal_citations()
@@ -503,7 +673,7 @@ def compute_citation_importance_task(self, db=None):
     try:
         logger.info("Computing citation importance scores")
 
-        from ..services.citation_service import CitationService
+        from ..modules.graph.citations import CitationService
 
         service = CitationService(db)
         service.compute_citation_importance()
@@ -515,6 +685,44 @@ def compute_citation_importance_task(self, db=None):
         raise
 
 
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    max_retries=2,
+    name="app.tasks.celery_tasks.refresh_graph_centrality_task",
+)
+def refresh_graph_centrality_task(self, db=None):
+    """
+    Recompute degree, betweenness and PageRank for the whole graph.
+
+    Triggered by: Celery Beat (hourly)
+    Priority: LOW (3)
+    Retry: 2 attempts
+
+    Results replace the contents of graph_centrality_cache, which the
+    /graph/centrality endpoint reads.
+
+    Args:
+        db: Database session (automatically provided by DatabaseTask)
+
+    Returns:
+        Number of resources with persisted centrality
+    """
+    try:
+        logger.info("Refreshing graph centrality")
+
+        from ..modules.graph.centrality import refresh_centrality_cache
+
+        count = refresh_centrality_cache(db)
+
+        logger.info(f"Persisted centrality for {count} resources")
+        return count
+
+    except Exception as e:
+        logger.error(f"Error refreshing graph centrality: {e}", exc_info=True)
+        raise
+
+
 @celery_app.task(
     bind=True,
     base=DatabaseTask,
@@ -606,7 +814,8 @@ def batch_process_resources_task(
     Priority: LOW (3) - batch queue
 
     Supported operations:
-    - regenerate_embeddings: Regenerate embeddings for all resources
+    - regenerate_embeddings: Regenerate embeddings for all resources in
+      batched forward passes within this task
     - recompute_quality: Recompute quality scores for all resources
 
     Args:
@@ -621,6 +830,20 @@ def batch_process_resources_task(
         total = len(resource_ids)
         logger.info(f"Starting batch {operation} for {total} resources")
 
+        if operation == "regenerate_embeddings":
+            from ..modules.collections.service import CollectionService
+            from ..shared.embeddings import EmbeddingService
+
+            self.update_state(
+                state="PROCESSING",
+                meta={"current": 0, "total": total, "operation": operation},
+            )
+            stored = EmbeddingService(db).generate_and_store_embeddings(
+                resource_ids, on_replaced=CollectionService(db).apply_member_reembeddings
+            )
+            logger.info(f"Regenerated embeddings for {stored}/{total} resources")
+            return {"status": "completed", "processed": stored, "operation": operation}
+
         for i, resource_id in enumerate(resource_ids):
             # Update progress
             self.update_state(
@@ -629,9 +852,7 @@ def batch_process_resources_task(
             )
 
             # Queue individual task based on operation
-            if operation == "regenerate_embeddings":
-                regenerate_embedding_task.apply_async(args=[resource_id], priority=5)
-            elif operation == "recompute_quality":
+            if operation == "recompute_quality":
                 recompute_quality_task.apply_async(args=[resource_id], priority=5)
             else:
                 logger.warning(f"Unknown operation: {operation}")
@@ -671,14 +892,15 @@ def monitor_quality_degradation_task(self, db=None):
     try:
         logger.info("Starting quality degradation monitoring")
 
-        # TODO: Implement quality degradation detection
-        # This would involve:
-        # 1. Query resources with quality history
-        # 2. Detect significant drops in quality scores
-        # 3. Trigger recomputation for degraded resources
-        # 4. Generate alerts for manual review
+        from ..modules.quality.service import QualityService
+
+        # Chunked sweep: stale scores are recomputed and degraded resources
+        # flagged for review (needs_quality_review)
+        degraded = QualityService(db).monitor_quality_degradation()
 
-        logger.info("Completed quality degradation monitoring")
+        logger.info(
+            f"Completed quality degradation monitoring: {len(degraded)} degraded"
+        )
 
     except Exception as e:
         logger.error(f"Error in quality degradation monitoring: {e}", exc_info=True)
@@ -706,14 +928,15 @@ def detect_quality_outliers_task(self, db=None):
     try:
         logger.info("Starting quality outlier detection")
 
-        # TODO: Implement quality outlier detection
-        # This would involve:
-        # 1. Calculate quality score statistics (mean, std dev)
-        # 2. Identify outliers (e.g., >3 standard deviations)
-        # 3. Generate report for manual review
-        # 4. Optionally trigger recomputation
+        from ..modules.quality.service import QualityService
 
-        logger.info("Completed quality outlier detection")
+        try:
+            outliers = QualityService(db).detect_quality_outliers()
+        except ValueError as e:
+            logger.info(f"Skipping quality outlier detection: {e}")
+            return
+
+        logger.info(f"Completed quality outlier detection: {outliers} outliers")
 
     except Exception as e:
         logger.error(f"Error in quality outlier detection: {e}", exc_info=True)
@@ -771,13 +994,16 @@ def cleanup_expired_cache_task():
     try:
         logger.info("Starting cache cleanup")
 
+        from ..modules.search.result_cache import search_result_cache
         from ..shared.cache import cache
 
-        # Redis automatically handles TTL expiration
-        # This task can perform additional cleanup if needed
-        # For now, just log cache statistics
-        stats = cache.get_stats()
-        logger.info(f"Cache statistics: {stats}")
+        # Redis handles TTL expiration; superseded search result
+        # generations are removed early with SCAN
+        removed = search_result_cache.cleanup()
+        logger.info(
+            f"Removed {removed} superseded search result entries; cache hit rate "
+            f"{cache.stats.hit_rate():.2%}"
+        )
 
         logger.info("Completed cache cleanup")
 
@@ -794,76 +1020,132 @@ def cleanup_expired_cache_task():
     name="app.tasks.celery_tasks.update_collection_embeddings_task",
 )
 def update_collection_embeddings_task(
-    self, resource_id: str, db=None
+    self, collection_ids: Optional[List[str]] = None, db=None
 ) -> Dict[str, Any]:
     """
-    Update collection embeddings after a resource is deleted.
+    Rebuild collection embeddings from member resources (repair).
 
-    This task finds all collections that contained the deleted resource and
-    recomputes their embeddings. Collection embeddings are the average of
-    member resource embeddings, so they need to be updated when membership changes.
+    Collection embeddings are maintained incrementally from a running sum of
+    member embeddings on membership changes, re-embedding and resource
+    deletion. This task recomputes the running sums from scratch, for the
+    given collections or for all of them, e.g. after bulk imports that
+    bypass CollectionService. See also scripts/rebuild_collection_embeddings.py.
 
     Args:
-        resource_id: UUID of the deleted resource
+        collection_ids: UUIDs of the collections to rebuild (None = all)
         db: Database session (automatically provided by DatabaseTask)
 
     Returns:
-        Dict with status and number of collections updated
+        Dict with status and number of collections rebuilt
 
     Raises:
         Exception: If collection embedding update fails (will retry)
     """
     import uuid
-    from ..services.collection_service import CollectionService
-    from ..database.models import Collection
+    from ..modules.collections.service import CollectionService
 
     try:
-        logger.info(
-            f"Updating collection embeddings for deleted resource {resource_id}"
-        )
-
-        # Convert resource_id to UUID
-        try:
-            uuid.UUID(resource_id)
-        except (ValueError, TypeError) as e:
-            logger.error(f"Invalid resource_id format: {resource_id}")
-            return {"status": "error", "message": f"Invalid UUID: {e}"}
-
-        # Find all collections that contained this resource
-        # Note: The resource is already deleted, but we can find collections
-        # that need updating by checking for any that might have had it
-        collection_service = CollectionService(db)
-
-        # Get all collections (we'll recompute all since we can't query deleted resource)
-        # In a production system, you might want to track this relationship before deletion
-        collections = db.query(Collection).all()
-
-        updated_count = 0
-        for collection in collections:
+        ids = None
+        if collection_ids is not None:
             try:
-                # Recompute embedding for each collection
-                collection_service.compute_collection_embedding(collection.id)
-                updated_count += 1
-                logger.debug(f"Updated embedding for collection {collection.id}")
-            except Exception as e:
-                logger.warning(f"Failed to update collection {collection.id}: {e}")
-                # Continue with other collections
+                ids = [uuid.UUID(cid) for cid in collection_ids]
+            except (ValueError, TypeError) as e:
+                logger.error(f"Invalid collection_ids: {collection_ids}")
+                return {"status": "error", "message": f"Invalid UUID: {e}"}
 
-        logger.info(
-            f"Updated {updated_count} collection embeddings after resource {resource_id} deletion"
-        )
+        updated_count = CollectionService(db).rebuild_collection_embeddings(ids)
+
+        logger.info(f"Rebuilt {updated_count} collection embeddings")
 
         return {
             "status": "success",
-            "resource_id": resource_id,
             "collections_updated": updated_count,
         }
 
     except Exception as e:
-        logger.error(
-            f"Error updating collection embeddings for resource {resource_id}: {e}",
-            exc_info=True,
-        )
+        logger.error(f"Error rebuilding collection embeddings: {e}", exc_info=True)
+
+        # Retry with exponential backoff
+        raise self.retry(exc=e, countdown=2**self.request.retries * 60)
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    max_retries=3,
+    default_retry_delay=60,
+    name="app.tasks.celery_tasks.backfill_chunk_embeddings_task",
+)
+def backfill_chunk_embeddings_task(self, index_name: str, db=None) -> Dict[str, Any]:
+    """
+    Embed chunks without a stored vector in a chunk index's scope.
+
+    Queued by PDF<->code auto-linking when link targets lack embeddings, so
+    the request only links against chunks that are already indexed. Chunks
+    are embedded and committed one page at a time.
+
+    Args:
+        index_name: Chunk index whose scope is backfilled
+        db: Database session (automatically provided by DatabaseTask)
+
+    Returns:
+        Dict with status and number of chunks embedded
+
+    Raises:
+        Exception: If the backfill fails (will retry)
+    """
+    from ..modules.resources.service import AutoLinkingService
+
+    try:
+        embedded = AutoLinkingService(db).backfill_chunk_embeddings(index_name)
+
+        logger.info(f"Backfilled {embedded} chunk embeddings for '{index_name}'")
+
+        return {"status": "success", "chunks_embedded": embedded}
+
+    except Exception as e:
+        logger.error(f"Error backfilling chunk embeddings: {e}", exc_info=True)
+
+        # Retry with exponential backoff
+        raise self.retry(exc=e, countdown=2**self.request.retries * 60)
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    max_retries=3,
+    default_retry_delay=60,
+    name="app.tasks.celery_tasks.regenerate_legacy_sparse_embeddings_task",
+)
+def regenerate_legacy_sparse_embeddings_task(self, db=None) -> Dict[str, Any]:
+    """
+    Re-encode sparse embeddings stored by the old salted-hash fallback (one-off).
+
+    Those vectors were recorded under the BGE-M3 model name, so the regular
+    batch job (which only fills missing embeddings) never revisits them. They
+    are found by token ids outside the BGE-M3 vocabulary, re-encoded and
+    re-indexed. Run once after upgrading; later runs find nothing.
+
+    Args:
+        db: Database session (automatically provided by DatabaseTask)
+
+    Returns:
+        Dict with status and number of resources regenerated
+
+    Raises:
+        Exception: If regeneration fails (will retry)
+    """
+    from ..modules.search.sparse_embeddings import SparseEmbeddingService
+
+    try:
+        regenerated = SparseEmbeddingService(db).regenerate_legacy_hashed_embeddings()
+
+        logger.info(f"Regenerated {regenerated} legacy sparse embeddings")
+
+        return {"status": "success", "resources_regenerated": regenerated}
+
+    except Exception as e:
+        logger.error(f"Error regenerating legacy sparse embeddings: {e}", exc_info=True)
 
         # Retry with exponential backoff
         raise self.retry(exc=e, countdown=2**self.request.retries * 60)
@@ -1084,6 +1366,8 @@ def ingest_repo_task(
     Ingests a code repository (local directory or Git URL) by crawling files,
     creating Resource entries, and emitting events for downstream processing.
     Files are processed in batches with transaction management to ensure data integrity.
+    Re-ingestion is incremental: files whose content hash is unchanged are
+    skipped, and changed files update their existing Resource.
 
     Performance limits:
     - Maximum 3 concurrent ingestion tasks per worker
@@ -1267,7 +1551,8 @@ def ingest_repo_task(
 
         logger.info(
             f"Repository ingestion completed: {total_files} files processed "
-            f"({error_metadata.get('failed', 0)} failed) in {processing_time:.2f}s"
+            f"({error_metadata.get('unchanged', 0)} unchanged, "
+            f"{error_metadata.get('failed', 0)} failed) in {processing_time:.2f}s"
         )
 
         # Return success result with error metadata
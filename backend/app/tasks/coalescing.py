@@ -0,0 +1,391 @@
+"""
+Neo Alexandria 2.0 - Task Coalescing
+
+Debounces hook-triggered Celery work. Instead of enqueuing one task per
+event with a countdown, hooks submit (channel, resource_id) to a delay
+queue. The first submission for a key schedules it ``window`` seconds out;
+further submissions inside the window are collapsed into it. When the
+window elapses, every due key of the channel is dispatched as one
+multi-resource batch task.
+
+Delay queue backends:
+- Redis: one sorted set per channel (member = key, score = due time), shared
+  by API processes and workers. Flushes run as a Celery task.
+- Local: in-process stand-in used when Redis is unreachable. Flushes run on
+  a timer thread.
+
+Counters per channel (see get_stats()):
+- submitted: Submissions received from hooks
+- coalesced: Submissions collapsed into an already pending key
+- enqueued: Batch tasks enqueued
+- batched: Keys handed to batch tasks
+- executed: Keys processed by batch tasks
+
+Related files:
+- app/events/hooks.py: Hooks that submit work
+- app/tasks/celery_tasks.py: Batch tasks and flush_coalesced_tasks_task
+"""
+
+import heapq
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None  # type: ignore
+
+from ..config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+STAT_FIELDS = ("submitted", "coalesced", "enqueued", "batched", "executed")
+
+
+@dataclass(frozen=True)
+class CoalescingChannel:
+    """A kind of coalesced work.
+
+    Attributes:
+        name: Channel name (e.g. "quality")
+        window: Seconds between the first submission of a key and its dispatch
+        dispatch: Enqueues one batch task for a list of keys
+        priority: Celery priority of the flush task
+    """
+
+    name: str
+    window: float
+    dispatch: Callable[[List[str]], None]
+    priority: int = 5
+
+
+# ============================================================================
+# Delay queue backends
+# ============================================================================
+
+
+class LocalDelayQueue:
+    """In-process delay queue (stand-in when Redis is unavailable)."""
+
+    def __init__(self, use_timers: bool = True):
+        """
+        Args:
+            use_timers: Schedule flushes on timer threads (tests flush manually)
+        """
+        self.use_timers = use_timers
+        self._due: Dict[str, Dict[str, float]] = {}
+        self._heaps: Dict[str, List[Tuple[float, str]]] = {}
+        self._armed: Dict[str, float] = {}
+        self._stats: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, channel: str, key: str, due: float) -> bool:
+        with self._lock:
+            pending = self._due.setdefault(channel, {})
+            if key in pending:
+                return False
+            pending[key] = due
+            heapq.heappush(self._heaps.setdefault(channel, []), (due, key))
+            return True
+
+    def pop_due(self, channel: str, now: float) -> List[str]:
+        with self._lock:
+            pending = self._due.get(channel, {})
+            heap = self._heaps.get(channel, [])
+            keys = []
+            while heap and heap[0][0] <= now:
+                _, key = heapq.heappop(heap)
+                if pending.pop(key, None) is not None:
+                    keys.append(key)
+            return keys
+
+    def next_due(self, channel: str) -> Optional[float]:
+        with self._lock:
+            heap = self._heaps.get(channel)
+            return heap[0][0] if heap else None
+
+    def arm(self, channel: CoalescingChannel, delay: float, flush: Callable) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if self._armed.get(channel.name, 0.0) > now:
+                return False
+            self._armed[channel.name] = now + delay + 1.0
+        if self.use_timers:
+            timer = threading.Timer(delay, flush, args=[channel.name])
+            timer.daemon = True
+            timer.start()
+        return True
+
+    def disarm(self, channel: str) -> None:
+        with self._lock:
+            self._armed.pop(channel, None)
+
+    def incr(self, channel: str, field: str, amount: int = 1) -> None:
+        with self._lock:
+            name = f"{channel}:{field}"
+            self._stats[name] = self._stats.get(name, 0) + amount
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
+class RedisDelayQueue:
+    """Redis sorted-set delay queue shared by API processes and workers."""
+
+    PREFIX = "coalesce"
+
+    def __init__(self, client: "redis.Redis"):
+        """
+        Args:
+            client: Redis client created with decode_responses=True
+        """
+        self.redis = client
+
+    def _due_key(self, channel: str) -> str:
+        return f"{self.PREFIX}:{channel}:due"
+
+    def add(self, channel: str, key: str, due: float) -> bool:
+        return bool(self.redis.zadd(self._due_key(channel), {key: due}, nx=True))
+
+    def pop_due(self, channel: str, now: float) -> List[str]:
+        due_key = self._due_key(channel)
+        keys = self.redis.zrangebyscore(due_key, "-inf", now)
+        if not keys:
+            return []
+        # ZREM decides ownership when several flushes race for the same keys
+        pipe = self.redis.pipeline()
+        for key in keys:
+            pipe.zrem(due_key, key)
+        removed = pipe.execute()
+        return [key for key, owned in zip(keys, removed) if owned]
+
+    def next_due(self, channel: str) -> Optional[float]:
+        head = self.redis.zrange(self._due_key(channel), 0, 0, withscores=True)
+        return float(head[0][1]) if head else None
+
+    def arm(self, channel: CoalescingChannel, delay: float, flush: Callable) -> bool:
+        armed = self.redis.set(
+            f"{self.PREFIX}:{channel.name}:armed",
+            1,
+            nx=True,
+            px=int((delay + 1.0) * 1000),
+        )
+        if not armed:
+            return False
+
+        from .celery_tasks import flush_coalesced_tasks_task
+
+        flush_coalesced_tasks_task.apply_async(
+            args=[channel.name], countdown=delay, priority=channel.priority
+        )
+        return True
+
+    def disarm(self, channel: str) -> None:
+        self.redis.delete(f"{self.PREFIX}:{channel}:armed")
+
+    def incr(self, channel: str, field: str, amount: int = 1) -> None:
+        self.redis.hincrby(f"{self.PREFIX}:stats", f"{channel}:{field}", amount)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            name: int(value)
+            for name, value in self.redis.hgetall(f"{self.PREFIX}:stats").items()
+        }
+
+
+# ============================================================================
+# Coalescer
+# ============================================================================
+
+
+class TaskCoalescer:
+    """Collapses repeated (channel, key) submissions into batched task runs."""
+
+    def __init__(
+        self,
+        store=None,
+        channels: Optional[List[CoalescingChannel]] = None,
+        max_batch: Optional[int] = None,
+    ):
+        """
+        Args:
+            store: LocalDelayQueue or RedisDelayQueue (defaults to local)
+            channels: Channels to register (defaults to DEFAULT_CHANNELS)
+            max_batch: Maximum keys per batch task
+        """
+        self.store = store if store is not None else LocalDelayQueue()
+        self.channels: Dict[str, CoalescingChannel] = {
+            channel.name: channel
+            for channel in (channels if channels is not None else DEFAULT_CHANNELS)
+        }
+        self.max_batch = max_batch or getattr(
+            get_settings(), "TASK_COALESCE_MAX_BATCH", 500
+        )
+
+    def _channel(self, name: str) -> CoalescingChannel:
+        try:
+            return self.channels[name]
+        except KeyError:
+            raise ValueError(f"Unknown coalescing channel: {name}") from None
+
+    def submit(self, channel_name: str, key: str) -> bool:
+        """
+        Schedule work for a key, collapsing it into a pending run if one exists.
+
+        Args:
+            channel_name: Channel name
+            key: Work key (usually a resource ID)
+
+        Returns:
+            True if a new run was scheduled, False if the submission was coalesced
+        """
+        channel = self._channel(channel_name)
+        try:
+            scheduled = self.store.add(channel.name, key, time.time() + channel.window)
+            self.store.incr(channel.name, "submitted")
+            if not scheduled:
+                self.store.incr(channel.name, "coalesced")
+                return False
+            self.store.arm(channel, channel.window, self.flush)
+            return True
+        except Exception as e:
+            # Never lose work because the delay queue is unreachable
+            logger.warning(
+                f"Task coalescing unavailable for '{channel.name}', dispatching "
+                f"{key} directly: {e}"
+            )
+            channel.dispatch([key])
+            return True
+
+    def flush(self, channel_name: str, now: Optional[float] = None) -> int:
+        """
+        Dispatch every due key of a channel as batch tasks.
+
+        Re-arms the channel if keys that are not yet due remain.
+
+        Args:
+            channel_name: Channel name
+            now: Current time (defaults to time.time())
+
+        Returns:
+            Number of keys dispatched
+        """
+        channel = self._channel(channel_name)
+        now = time.time() if now is None else now
+
+        self.store.disarm(channel.name)
+        keys = self.store.pop_due(channel.name, now)
+
+        for start in range(0, len(keys), self.max_batch):
+            batch = keys[start : start + self.max_batch]
+            try:
+                channel.dispatch(batch)
+            except Exception as e:
+                logger.error(
+                    f"Error dispatching {len(batch)} coalesced '{channel.name}' keys: {e}",
+                    exc_info=True,
+                )
+                continue
+            self.store.incr(channel.name, "enqueued")
+            self.store.incr(channel.name, "batched", len(batch))
+
+        next_due = self.store.next_due(channel.name)
+        if next_due is not None:
+            self.store.arm(channel, max(next_due - now, 0.0), self.flush)
+
+        if keys:
+            logger.info(f"Dispatched {len(keys)} coalesced '{channel.name}' keys")
+        return len(keys)
+
+    def record_executed(self, channel_name: str, count: int) -> None:
+        """Count keys processed by a batch task."""
+        try:
+            self.store.incr(channel_name, "executed", count)
+        except Exception as e:
+            logger.warning(f"Failed to record coalescing stats: {e}")
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get per-channel counters.
+
+        Returns:
+            Dict mapping channel name to submitted/coalesced/enqueued/batched/
+            executed counts
+        """
+        raw = self.store.stats()
+        return {
+            name: {field: raw.get(f"{name}:{field}", 0) for field in STAT_FIELDS}
+            for name in self.channels
+        }
+
+
+# ============================================================================
+# Channels
+# ============================================================================
+
+
+def _dispatch_embeddings(resource_ids: List[str]) -> None:
+    from .celery_tasks import regenerate_embeddings_batch_task
+
+    regenerate_embeddings_batch_task.apply_async(args=[resource_ids], priority=7)
+
+
+def _dispatch_quality(resource_ids: List[str]) -> None:
+    from .celery_tasks import recompute_quality_batch_task
+
+    recompute_quality_batch_task.apply_async(args=[resource_ids], priority=5)
+
+
+def _dispatch_graph_edges(resource_ids: List[str]) -> None:
+    from .celery_tasks import update_graph_edges_batch_task
+
+    update_graph_edges_batch_task.apply_async(args=[resource_ids], priority=5)
+
+
+DEFAULT_CHANNELS = [
+    CoalescingChannel("embedding", window=5, dispatch=_dispatch_embeddings, priority=7),
+    CoalescingChannel("quality", window=10, dispatch=_dispatch_quality),
+    CoalescingChannel("graph_edges", window=30, dispatch=_dispatch_graph_edges),
+]
+
+
+_coalescer: Optional[TaskCoalescer] = None
+_coalescer_lock = threading.Lock()
+
+
+def _create_store():
+    if REDIS_AVAILABLE:
+        settings = get_settings()
+        try:
+            client = redis.Redis(
+                host=getattr(settings, "REDIS_HOST", "localhost"),
+                port=getattr(settings, "REDIS_PORT", 6379),
+                db=getattr(settings, "REDIS_CACHE_DB", 2),
+                decode_responses=True,
+                socket_connect_timeout=1,
+                socket_timeout=1,
+            )
+            client.ping()
+            return RedisDelayQueue(client)
+        except Exception as e:
+            logger.warning(
+                f"Redis unavailable for task coalescing, using in-process queue: {e}"
+            )
+    return LocalDelayQueue()
+
+
+def get_coalescer() -> TaskCoalescer:
+    """Return the process-wide task coalescer (created on first use)."""
+    global _coalescer
+    if _coalescer is None:
+        with _coalescer_lock:
+            if _coalescer is None:
+                _coalescer = TaskCoalescer(store=_create_store())
+    return _coalescer
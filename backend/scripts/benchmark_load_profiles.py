@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark Resource Load Profiles
+
+Compares the Resource queries behind hot endpoints before and after column
+projection. "Before" loads every column, as ``db.query(Resource)`` did
+before the large Text columns were deferred (the "full" profile). "After"
+uses the load profile the service now applies.
+
+For each query the script reports the bytes fetched from the database
+(summed over all column values of the raw rows) and the time spent
+fetching and hydrating ORM objects.
+
+By default it seeds an in-memory SQLite database with synthetic resources
+that carry 768-dimensional embeddings, sparse vectors and scholarly
+content blobs. Pass --database-url to measure an existing database
+read-only.
+
+Usage:
+    python scripts/benchmark_load_profiles.py [--resources 2000] [--repeat 3] [--database-url URL]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, undefer
+
+from app.database.load_profiles import resource_profile
+from app.database.models import Resource
+from app.shared.base_model import Base
+
+# (endpoint, query description, options after the change)
+BENCHMARKS = [
+    ("GET /api/graph/overview", "global overview resources", resource_profile("vectors")),
+    ("GET /api/graph/resource/{id}/neighbors", "hybrid neighbor candidates", resource_profile("vectors")),
+    (
+        "GET /recommendations",
+        "_rank_candidates",
+        resource_profile("quality") + (undefer(Resource.embedding),),
+    ),
+    ("GET /quality/outliers", "outlier listing", resource_profile("quality")),
+    ("GET /discovery/open", "concept mention scan", resource_profile("card")),
+    ("POST /api/graph/communities", "community detection nodes", resource_profile("card")),
+]
+
+
+def seed(session: Session, count: int) -> None:
+    """Insert synthetic resources with realistic blob sizes."""
+    rng = random.Random(0)
+    for i in range(count):
+        session.add(
+            Resource(
+                title=f"Resource {i}",
+                description="Synthetic description " * 20,
+                type="article",
+                subject=[f"topic-{rng.randint(0, 50)}" for _ in range(4)],
+                classification_code=str(rng.randint(0, 9) * 100),
+                quality_overall=rng.random(),
+                embedding=json.dumps([rng.uniform(-1, 1) for _ in range(768)]),
+                sparse_embedding=json.dumps(
+                    {str(rng.randint(0, 30000)): rng.random() for _ in range(200)}
+                ),
+                equations=json.dumps(["E = mc^2"] * 50),
+                tables=json.dumps([{"rows": [[rng.random()] * 8] * 20}] * 3),
+                figures=json.dumps([{"caption": "Figure " * 20}] * 5),
+            )
+        )
+        if i % 500 == 499:
+            session.flush()
+    session.commit()
+
+
+def _value_size(value) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    return len(str(value).encode("utf-8"))
+
+
+def measure(engine, options, repeat: int):
+    """Return (bytes fetched, best fetch+hydration time in ms) for one query shape."""
+    stmt = select(Resource).options(*options)
+
+    with engine.connect() as conn:
+        fetched = sum(
+            _value_size(value) for row in conn.execute(stmt) for value in row
+        )
+
+    best = float("inf")
+    for _ in range(repeat):
+        with Session(engine) as session:
+            start = time.perf_counter()
+            session.execute(stmt).scalars().all()
+            best = min(best, (time.perf_counter() - start) * 1000)
+    return fetched, best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark bytes fetched and ORM hydration time per load profile"
+    )
+    parser.add_argument(
+        "--resources",
+        type=int,
+        default=2000,
+        help="Synthetic resources to seed (default: 2000)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timed runs per query; the best is reported (default: 3)",
+    )
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="Measure an existing database instead of seeding an in-memory one",
+    )
+    args = parser.parse_args()
+
+    if args.database_url:
+        engine = create_engine(args.database_url)
+    else:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine, tables=[Resource.__table__])
+        with Session(engine) as session:
+            seed(session, args.resources)
+
+    full = resource_profile("full")
+    print(
+        f"{'endpoint':<40} {'query':<28} {'before KB':>10} {'after KB':>10} "
+        f"{'before ms':>10} {'after ms':>10}"
+    )
+    for endpoint, description, options in BENCHMARKS:
+        before_bytes, before_ms = measure(engine, full, args.repeat)
+        after_bytes, after_ms = measure(engine, options, args.repeat)
+        print(
+            f"{endpoint:<40} {description:<28} {before_bytes / 1024:>10.0f} "
+            f"{after_bytes / 1024:>10.0f} {before_ms:>10.1f} {after_ms:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
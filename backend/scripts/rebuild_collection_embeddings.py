@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Rebuild Collection Embeddings
+
+Recomputes every collection's running embedding sum, member count and
+normalized embedding from its member resources. Collection embeddings are
+maintained incrementally; use this to repair them after bulk imports that
+bypass CollectionService, or to initialize collections created before
+running sums existed.
+
+Usage:
+    python scripts/rebuild_collection_embeddings.py [--collection UUID ...] [--batch-size 100]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import uuid
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.shared import database
+from app.modules.collections.service import CollectionService
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild collection embeddings from member resources"
+    )
+    parser.add_argument(
+        "--collection",
+        action="append",
+        type=uuid.UUID,
+        help="Collection to rebuild (repeatable; default: all collections)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=100,
+        help="Collections rebuilt per commit (default: 100)",
+    )
+    args = parser.parse_args()
+
+    database.init_database(env="prod")
+    db = database.SessionLocal()
+    try:
+        rebuilt = CollectionService(db).rebuild_collection_embeddings(
+            args.collection, batch_size=args.batch_size
+        )
+        print(json.dumps({"collections_rebuilt": rebuilt}, indent=2))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
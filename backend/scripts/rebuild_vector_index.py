@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Rebuild Search Indexes
+
+Rebuilds the file-backed ANN indexes over resource and chunk embeddings
+(including the code/document chunk indexes used by auto-linking) and
+the inverted index over sparse embeddings from the database, and writes them
+to VECTOR_INDEX_DIR. Running API and worker processes
+pick up the new index on restart; until then they keep delta-syncing their
+in-memory copy.
+
+Usage:
+    python scripts/rebuild_vector_index.py [--index dense|sparse|chunks|all] [--batch-size 2000] [--stats]
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.shared import database
+from app.modules.search.chunk_index import (
+    CHUNK_INDEX_NAMES,
+    get_chunk_index,
+    rebuild_chunk_index,
+)
+from app.modules.search.dense_index import get_resource_index, rebuild_resource_index
+from app.modules.search.sparse_index import get_sparse_index, rebuild_sparse_index
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild the dense, chunk and sparse search indexes"
+    )
+    parser.add_argument(
+        "--index",
+        choices=["dense", "sparse", "chunks", "all"],
+        default="all",
+        help="Which index to rebuild (default: all)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=2000,
+        help="Rows fetched per database round trip (default: 2000)",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print statistics for the persisted indexes without rebuilding",
+    )
+    args = parser.parse_args()
+
+    database.init_database(env="prod")
+    db = database.SessionLocal()
+    try:
+        stats = {}
+        if args.index in ("dense", "all"):
+            if args.stats:
+                index = get_resource_index(db)
+            else:
+                index = rebuild_resource_index(db, batch_size=args.batch_size)
+            stats["dense"] = index.stats()
+        if args.index in ("sparse", "all"):
+            if args.stats:
+                index = get_sparse_index(db)
+            else:
+                index = rebuild_sparse_index(db, batch_size=args.batch_size)
+            stats["sparse"] = index.stats()
+        if args.index in ("chunks", "all"):
+            for name in CHUNK_INDEX_NAMES:
+                if args.stats:
+                    index = get_chunk_index(db, name)
+                else:
+                    index = rebuild_chunk_index(
+                        db, batch_size=args.batch_size, name=name
+                    )
+                stats[name] = index.stats()
+        print(json.dumps(stats, indent=2))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
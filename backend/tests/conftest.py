@@ -10,6 +10,8 @@ All fixtures are self-contained and independent.
 import os
 
 os.environ["TESTING"] = "true"
+# Search responses must reflect each test's data, not a shared Redis cache
+os.environ.setdefault("SEARCH_CACHE_ENABLED", "false")
 
 import pytest
 from typing import Generator
@@ -25,10 +25,11 @@ from app.database.models import DocumentChunk, GraphEntity
 def clear_event_handlers():
     """Clear event handlers before and after each test."""
     event_bus.clear_handlers()
+    event_bus.set_history_size(1000)
     event_bus.clear_history()
     yield
     event_bus.clear_handlers()
-    event_bus.clear_history()
+    event_bus.set_history_size(0)
 
 
 class TestResourceChunkingEventHandler:
@@ -6,10 +6,14 @@ Tests Markdown and JSON export functionality.
 Requirements: 1.5, 1.7
 """
 
+import gzip
 import pytest
 import json
 from datetime import datetime
+from unittest.mock import patch
+
 from app.modules.annotations.service import AnnotationService
+from app.shared.streaming import buffer_chunks, gzip_chunks
 
 
 def test_markdown_export_single_resource(
@@ -506,3 +510,88 @@ def test_export_performance(db_session, create_test_resource, create_test_annota
     # Should complete quickly (scaled: 100 annotations in <0.2s)
     assert json_time < 0.2, f"JSON export took {json_time}s"
     assert len(json_data) == 100
+
+
+def test_streaming_markdown_export_groups_by_resource(
+    db_session, create_test_resource, create_test_annotation
+):
+    """
+    Test that the streamed Markdown export groups the ordered stream by
+    resource and matches the in-memory export.
+
+    Requirements: 1.5
+    """
+    service = AnnotationService(db_session)
+
+    first = create_test_resource(title="First Resource")
+    second = create_test_resource(title="Second Resource")
+    for i in range(3):
+        for resource in (first, second):
+            create_test_annotation(
+                resource_id=resource.id,
+                user_id="test_user",
+                highlighted_text=f"{resource.title} highlight {i}",
+                start_offset=i * 10,
+                end_offset=i * 10 + 5,
+            )
+
+    # Batches smaller than a resource group
+    with patch("app.modules.annotations.service.EXPORT_BATCH_SIZE", 2):
+        fragments = list(service.stream_annotations_markdown(user_id="test_user"))
+    markdown = "".join(fragments)
+
+    assert markdown == service.export_annotations_markdown(user_id="test_user")
+    assert markdown.count("## First Resource") == 1
+    assert markdown.count("## Second Resource") == 1
+    # One fragment per annotation, not one document
+    assert len(fragments) > 6
+
+
+def test_streaming_jsonl_export(db_session, create_test_resource, create_test_annotation):
+    """
+    Test that the JSON Lines stream carries the same records as the JSON export.
+
+    Requirements: 1.7
+    """
+    service = AnnotationService(db_session)
+    resource = create_test_resource(title="JSONL Resource")
+    for i in range(3):
+        create_test_annotation(
+            resource_id=resource.id,
+            user_id="test_user",
+            highlighted_text=f"Highlight {i}",
+            start_offset=i * 10,
+            end_offset=i * 10 + 5,
+            tags=json.dumps([f"tag{i}"]),
+        )
+
+    lines = list(service.stream_annotations_jsonl(user_id="test_user"))
+
+    assert all(line.endswith("\n") for line in lines)
+    records = [json.loads(line) for line in lines]
+    assert records == service.export_annotations_json(user_id="test_user")
+    assert records[0]["resource"]["title"] == "JSONL Resource"
+
+
+def test_streaming_export_validates_before_streaming(db_session):
+    """
+    Test that an invalid resource filter fails when the stream is requested,
+    so the endpoint can still answer 400.
+    """
+    service = AnnotationService(db_session)
+
+    with pytest.raises(ValueError, match="Invalid resource_id"):
+        service.stream_annotations_jsonl(user_id="test_user", resource_id="bad")
+    with pytest.raises(ValueError, match="Invalid resource_id"):
+        service.stream_annotations_markdown(user_id="test_user", resource_id="bad")
+
+
+def test_gzip_stream_round_trip():
+    """Test that streamed gzip output decompresses to the concatenated text."""
+    pieces = [f"line {i}\n" for i in range(1000)]
+
+    chunks = list(gzip_chunks(pieces, chunk_size=256))
+
+    assert len(chunks) > 1
+    assert gzip.decompress(b"".join(chunks)).decode("utf-8") == "".join(pieces)
+    assert b"".join(buffer_chunks(pieces, chunk_size=256)) == "".join(pieces).encode()
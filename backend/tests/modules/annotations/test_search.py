@@ -7,6 +7,8 @@ Requirements: 1.2, 1.4
 """
 
 import json
+from unittest.mock import patch
+
 from app.modules.annotations.service import AnnotationService
 
 
@@ -537,3 +539,91 @@ def test_tag_search_no_matches(
     )
 
     assert len(results) == 0
+
+
+def test_fulltext_search_ranks_and_follows_edits(
+    db_session, create_test_resource, create_test_annotation
+):
+    """
+    Test that full-text results are ranked and the index tracks edits.
+
+    Verifies:
+    1. Word prefixes match ("optim" finds "optimizer")
+    2. Annotations matching the query in the note rank above highlight-only matches
+    3. Updated notes are searchable and deleted annotations disappear
+
+    Requirements: 1.2
+    """
+    service = AnnotationService(db_session)
+
+    resource = create_test_resource(title="Ranking Test")
+
+    highlight_only = create_test_annotation(
+        resource_id=resource.id,
+        user_id="test_user",
+        highlighted_text="the optimizer converges",
+        start_offset=0,
+        end_offset=23,
+        note="unrelated remark",
+    )
+    in_note = create_test_annotation(
+        resource_id=resource.id,
+        user_id="test_user",
+        highlighted_text="results table",
+        start_offset=30,
+        end_offset=43,
+        note="optimizer choice matters: optimizer settings",
+    )
+
+    results = service.search_annotations_fulltext(
+        user_id="test_user", query="optim", limit=10
+    )
+    assert [a.id for a in results] == [in_note.id, highlight_only.id]
+
+    with patch.object(service.embedding_generator, "generate_embedding") as embed:
+        embed.return_value = None
+        service.update_annotation(
+            str(highlight_only.id), "test_user", note="learning rate schedule"
+        )
+    assert [
+        a.id
+        for a in service.search_annotations_fulltext(
+            user_id="test_user", query="schedule", limit=10
+        )
+    ] == [highlight_only.id]
+
+    service.delete_annotation(str(in_note.id), "test_user")
+    results = service.search_annotations_fulltext(
+        user_id="test_user", query="optimizer", limit=10
+    )
+    assert [a.id for a in results] == [highlight_only.id]
+
+
+def test_fulltext_index_check_retries_after_transient_error(tmp_path):
+    """
+    Test that a transient error while checking the FTS schema is not cached.
+
+    Verifies:
+    1. A failed check reports the index as unavailable
+    2. The next check retries and finds the index
+
+    Requirements: 1.2
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.exc import OperationalError
+
+    from app.modules.annotations.fts_index import ensure_annotation_fts_schema
+    from app.shared.database import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'annotations.db'}")
+    Base.metadata.create_all(engine)
+
+    with patch.object(
+        engine,
+        "begin",
+        side_effect=OperationalError("BEGIN", {}, Exception("database is locked")),
+    ):
+        assert ensure_annotation_fts_schema(engine) is False
+
+    assert ensure_annotation_fts_schema(engine) is True
+    engine.dispose()
@@ -0,0 +1,95 @@
+"""
+Annotations Module - Search Benchmarks
+
+Enforces the "<100ms for 10,000 annotations" search target for one user's
+annotations (full-text and warm semantic search).
+"""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from sqlalchemy import insert
+
+from app.database.models import Annotation
+from app.modules.annotations.service import AnnotationService
+from tests.performance import performance_limit
+
+ANNOTATION_COUNT = 10_000
+EMBEDDING_DIM = 384
+
+WORDS = (
+    "neural network gradient descent transformer attention embedding corpus "
+    "retrieval ranking citation graph taxonomy ontology inference dataset"
+).split()
+
+
+@pytest.fixture
+def power_user(db_session, create_test_resource):
+    """One user with 10,000 embedded annotations."""
+    resource = create_test_resource(title="Benchmark Resource")
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(ANNOTATION_COUNT, EMBEDDING_DIM)).astype(np.float32)
+    now = datetime.now(timezone.utc)
+
+    rows = []
+    for i in range(ANNOTATION_COUNT):
+        words = rng.choice(WORDS, size=8)
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "resource_id": resource.id,
+                "user_id": "power_user",
+                "start_offset": i,
+                "end_offset": i + 10,
+                "highlighted_text": " ".join(words[:4]),
+                "note": f"note {i} " + " ".join(words[4:]),
+                "color": "#FFFF00",
+                "embedding": vectors[i].tolist(),
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+    db_session.execute(insert(Annotation), rows)
+    db_session.commit()
+    return vectors
+
+
+@pytest.mark.performance
+def test_fulltext_search_10k_annotations(db_session, power_user):
+    service = AnnotationService(db_session)
+    # First call creates the SQLite FTS schema for this engine
+    service.search_annotations_fulltext("power_user", "warmup", limit=1)
+
+    @performance_limit(100)
+    def search():
+        return service.search_annotations_fulltext(
+            "power_user", "gradient transformer", limit=50
+        )
+
+    results = search()
+
+    assert results
+    assert all(a.user_id == "power_user" for a in results)
+
+
+@pytest.mark.performance
+def test_semantic_search_10k_annotations(db_session, power_user):
+    service = AnnotationService(db_session)
+    query = power_user[42].tolist()
+
+    with patch.object(service.embedding_generator, "generate_embedding") as embed:
+        embed.return_value = query
+        # First call loads the user's embedding matrix
+        service.search_annotations_semantic("power_user", "warmup", limit=10)
+
+        @performance_limit(100)
+        def search():
+            return service.search_annotations_semantic("power_user", "query", limit=10)
+
+        results = search()
+
+    assert len(results) == 10
+    assert results[0][1] == pytest.approx(1.0, abs=1e-5)
@@ -262,3 +262,85 @@ def test_annotation_semantic_search_user_isolation(
 
     assert len(results_user2) == 1
     assert results_user2[0][0].user_id == "user2"
+
+
+def test_annotation_embedding_cache_tracks_changes(
+    db_session, create_test_resource, create_test_annotation
+):
+    """
+    Test that the per-user embedding matrix follows creates, deletes and
+    changes made outside the service.
+
+    Requirements: 9.2
+    """
+    from app.modules.annotations.embedding_index import get_annotation_cache
+
+    service = AnnotationService(db_session)
+    cache = get_annotation_cache(db_session)
+    resource = create_test_resource(title="Cache Test")
+
+    first = create_test_annotation(
+        resource_id=resource.id,
+        user_id="cache_user",
+        highlighted_text="first",
+        note="first",
+        embedding=[1.0, 0.0],
+    )
+
+    with patch.object(service.embedding_generator, "generate_embedding") as mock_embed:
+        mock_embed.return_value = [1.0, 0.0]
+        assert len(service.search_annotations_semantic("cache_user", "q")) == 1
+        misses = cache.misses
+
+        # Created through the service: applied to the cached matrix
+        mock_embed.return_value = [0.0, 1.0]
+        created = service.create_annotation(
+            resource_id=str(resource.id),
+            user_id="cache_user",
+            start_offset=10,
+            end_offset=20,
+            highlighted_text="second",
+            note="second",
+        )
+        results = service.search_annotations_semantic("cache_user", "q")
+        assert results[0][0].id == created.id
+        assert len(results) == 2
+
+        # Deleted through the service
+        service.delete_annotation(str(first.id), "cache_user")
+        results = service.search_annotations_semantic("cache_user", "q")
+        assert [a.id for a, _ in results] == [created.id]
+        assert cache.misses == misses
+
+        # Written by someone else: the signature changes and the matrix reloads
+        create_test_annotation(
+            resource_id=resource.id,
+            user_id="cache_user",
+            highlighted_text="third",
+            start_offset=30,
+            end_offset=40,
+            embedding=[0.0, 1.0],
+        )
+        assert len(service.search_annotations_semantic("cache_user", "q")) == 2
+        assert cache.misses == misses + 1
+
+
+def test_annotation_embedding_cache_is_memory_bounded(db_session):
+    """
+    Test that least recently used user matrices are evicted over budget.
+    """
+    from app.modules.annotations.embedding_index import AnnotationEmbeddingCache
+    from app.shared.vector_index import VectorIndex
+
+    def load(db, user_id):
+        index = VectorIndex(user_id)
+        index.upsert(f"{user_id}-annotation", [1.0, 0.0])
+        return index
+
+    cache = AnnotationEmbeddingCache(max_bytes=1)
+    cache._load = load
+    with patch.object(AnnotationEmbeddingCache, "_signature", return_value=(0, None)):
+        cache.get(db_session, "user1")
+        cache.get(db_session, "user2")
+
+    assert list(cache._users) == ["user2"]
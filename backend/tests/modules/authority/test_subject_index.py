@@ -0,0 +1,121 @@
+"""
+Authority Module - Subject Index Tests
+
+Tests for the in-memory subject authority index: dictionary lookups for known
+subjects, buffered usage counts, word-prefix suggestions and invalidation on
+change events.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from app.config.settings import get_settings
+from app.database.models import AuthoritySubject
+from app.modules.authority.handlers import handle_subject_changed
+from app.modules.authority.service import AuthorityControl
+from app.modules.authority.subject_index import (
+    SubjectAuthorityIndex,
+    get_subject_index,
+)
+
+
+@pytest.fixture
+def statements(db_session):
+    """SQL statements executed on the test engine."""
+    captured = []
+    engine = db_session.get_bind()
+
+    def capture(conn, cursor, statement, *args):
+        captured.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def usage(db_session, canonical):
+    db_session.expire_all()
+    return (
+        db_session.query(AuthoritySubject)
+        .filter_by(canonical_form=canonical)
+        .one()
+        .usage_count
+    )
+
+
+def test_known_subjects_normalize_without_queries(db_session, statements):
+    tags = ["ML", "deep  learning", "machine learning"]
+    AuthorityControl(db_session).normalize_subjects(tags)
+
+    statements.clear()
+    result = AuthorityControl(db_session).normalize_subjects(tags)
+
+    assert result == ["Machine Learning", "Deep Learning"]
+    assert statements == []
+    assert get_subject_index(db_session.get_bind()).pending == 2
+
+
+def test_new_subjects_persist_usage_immediately(db_session):
+    AuthorityControl(db_session).normalize_subjects(["quantum computing", "ai"])
+
+    assert usage(db_session, "Quantum Computing") == 1
+    assert usage(db_session, "Artificial Intelligence") == 1
+
+
+def test_usage_increments_flush_in_bulk(db_session, statements, monkeypatch):
+    AuthorityControl(db_session).normalize_subjects(["python", "rust"])
+    monkeypatch.setattr(get_settings(), "AUTHORITY_USAGE_FLUSH_SIZE", 3)
+
+    AuthorityControl(db_session).normalize_subjects(["python"])
+    assert usage(db_session, "Python") == 1
+
+    statements.clear()
+    AuthorityControl(db_session).normalize_subjects(["python", "rust", "Rust"])
+
+    updates = [s for s in statements if s.lstrip().upper().startswith("UPDATE")]
+    assert len(updates) == 1
+    assert usage(db_session, "Python") == 3
+    assert usage(db_session, "Rust") == 2
+    assert get_subject_index(db_session.get_bind()).pending == 0
+
+
+def test_variants_resolve_from_the_index(db_session, statements):
+    authority = AuthorityControl(db_session)
+    authority.normalize_subjects(["Information Retrieval"])
+    authority.add_subject_variant("Information Retrieval", "IR")
+
+    statements.clear()
+    assert AuthorityControl(db_session).normalize_subject("ir") == (
+        "Information Retrieval"
+    )
+    assert statements == []
+
+
+def test_suggestions_match_word_prefixes_by_usage(db_session):
+    authority = AuthorityControl(db_session)
+    authority.normalize_subjects(["reinforcement learning"])
+    authority.normalize_subjects(["deep learning"])
+    authority.normalize_subjects(["deep learning", "learning theory"])
+
+    suggestions = AuthorityControl(db_session).get_subject_suggestions("learn")
+
+    # Built-in synonym targets first, then stored subjects by usage
+    assert suggestions == [
+        "Machine Learning",
+        "Deep Learning",
+        "Learning Theory",
+        "Reinforcement Learning",
+    ]
+    assert AuthorityControl(db_session).get_subject_suggestions("zzz") == []
+
+
+def test_subject_changes_invalidate_other_indexes(db_session):
+    index = get_subject_index(db_session.get_bind())
+    index.ensure_loaded(db_session)
+    other = SubjectAuthorityIndex()
+
+    handle_subject_changed({"index_token": index.token})
+    assert index.loaded_at is not None and not index._stale
+
+    handle_subject_changed({"index_token": other.token})
+    assert index._stale
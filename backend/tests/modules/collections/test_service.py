@@ -7,8 +7,11 @@ Tests cover:
 - Collection recommendations
 - Hierarchy validation
 - Batch resource operations
+- Vector-index backed recommendations
+- Incremental (running-sum) embedding maintenance
 """
 
+import json
 import uuid
 import pytest
 import numpy as np
@@ -362,6 +365,131 @@ class TestCollectionRecommendations:
         assert results[0]["collection_id"] == public.id
 
 
+class TestIndexedRecommendations:
+    """Test vector-index backed recommendations."""
+
+    def test_members_excluded_inside_index_search(self, db_session):
+        """Members never crowd non-members out of the top-k."""
+        service = CollectionService(db_session)
+        collection = Collection(
+            name="Test", description="Test", owner_id="user1", visibility="private"
+        )
+        db_session.add(collection)
+        db_session.commit()
+
+        members = []
+        for i in range(5):
+            resource = Resource(
+                title=f"Member {i}",
+                source=f"http://example.com/m{i}",
+                type="article",
+                embedding=json.dumps([1.0, 0.01 * i, 0.0]),
+            )
+            db_session.add(resource)
+            db_session.flush()
+            members.append(resource.id)
+        outsider = Resource(
+            title="Outsider",
+            source="http://example.com/out",
+            type="article",
+            embedding=json.dumps([0.8, 0.2, 0.0]),
+        )
+        db_session.add(outsider)
+        db_session.commit()
+        service.add_resources_batch(collection.id, members, owner_id="user1")
+
+        results = service.find_similar_resources(
+            collection_id=collection.id, owner_id="user1", limit=1, min_similarity=0.5
+        )
+
+        assert [r["resource_id"] for r in results] == [outsider.id]
+        assert results[0]["title"] == "Outsider"
+
+    def test_similar_collections_counts_and_widening(self, db_session):
+        """Inaccessible hits are skipped and member counts come back grouped."""
+        service = CollectionService(db_session)
+        source = Collection(
+            name="Source",
+            owner_id="user1",
+            visibility="private",
+            embedding=[1.0, 0.0, 0.0],
+        )
+        # Closer than every public match, but private to another user
+        hidden = [
+            Collection(
+                name=f"Hidden {i}",
+                owner_id="user2",
+                visibility="private",
+                embedding=[1.0, 0.01 * i, 0.0],
+            )
+            for i in range(3)
+        ]
+        public = Collection(
+            name="Public",
+            owner_id="user2",
+            visibility="public",
+            embedding=[0.9, 0.1, 0.0],
+        )
+        db_session.add_all([source, public, *hidden])
+        resource = Resource(title="R", source="http://example.com/r", type="article")
+        db_session.add(resource)
+        db_session.commit()
+        db_session.add(CollectionResource(collection_id=public.id, resource_id=resource.id))
+        db_session.commit()
+
+        results = service.find_similar_collections(
+            collection_id=source.id, owner_id="user1", limit=1, min_similarity=0.5
+        )
+
+        assert [r["collection_id"] for r in results] == [public.id]
+        assert results[0]["resource_count"] == 1
+
+    def test_deleted_collection_not_recommended(self, db_session):
+        """Deleting a collection removes it from the collection index."""
+        service = CollectionService(db_session)
+        source = Collection(
+            name="Source",
+            owner_id="user1",
+            visibility="private",
+            embedding=[1.0, 0.0, 0.0],
+        )
+        other = Collection(
+            name="Other",
+            owner_id="user1",
+            visibility="private",
+            embedding=[1.0, 0.0, 0.0],
+        )
+        db_session.add_all([source, other])
+        db_session.commit()
+        assert len(service.find_similar_collections(source.id, owner_id="user1")) == 1
+
+        service.delete_collection(other.id, owner_id="user1")
+
+        assert service.find_similar_collections(source.id, owner_id="user1") == []
+
+    def test_top_k_widens_probes_until_index_exhausted(self, db_session):
+        """A trained index with few probed lists still yields every match."""
+        from app.shared.vector_index import VectorIndex
+
+        rng = np.random.default_rng(0)
+        index = VectorIndex("probe-test", nprobe=1, train_threshold=16)
+        keys = [str(uuid.uuid4()) for _ in range(64)]
+        index.upsert_many(keys, rng.normal(size=(64, 8)).astype(np.float32))
+        assert index.train(nlist=8)
+
+        ranked = CollectionService(db_session)._top_k_from_index(
+            index,
+            rng.normal(size=8).tolist(),
+            limit=40,
+            min_similarity=-1.0,
+            exclude=set(),
+            fetch=lambda ids: {str(i): str(i) for i in ids},
+        )
+
+        assert len(ranked) == 40
+        assert len({key for key, _ in ranked}) == 40
+
+
 class TestHierarchyValidation:
     """Test hierarchy validation to prevent circular references."""
 
@@ -676,3 +804,183 @@ class TestBatchOperations:
         # Should report all as not found
         assert result["removed"] == 0
         assert result["not_found"] == 3
+
+
+class TestIncrementalEmbedding:
+    """Test running-sum maintenance of collection embeddings."""
+
+    @staticmethod
+    def _collection(db_session, name="Test Collection"):
+        collection = Collection(
+            name=name, description="Test", owner_id="user1", visibility="private"
+        )
+        db_session.add(collection)
+        db_session.commit()
+        return collection
+
+    @staticmethod
+    def _resources(db_session, embeddings):
+        resource_ids = []
+        for i, emb in enumerate(embeddings):
+            resource = Resource(
+                title=f"Resource {i}",
+                source=f"http://example.com/{i}",
+                type="article",
+                # Stored as JSON text (Resource.embedding is a Text column)
+                embedding=json.dumps(emb),
+            )
+            db_session.add(resource)
+            db_session.flush()
+            resource_ids.append(resource.id)
+        db_session.commit()
+        return resource_ids
+
+    def test_batch_add_and_remove_update_running_sum(self, db_session):
+        """Adds and removes adjust the sum and count without a rebuild."""
+        service = CollectionService(db_session)
+        collection = self._collection(db_session)
+        ids = self._resources(db_session, [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+
+        service.add_resources_batch(collection.id, ids, owner_id="user1")
+        db_session.refresh(collection)
+
+        assert collection.embedding_sum == [2.0, 2.0]
+        assert collection.embedding_count == 3
+        np.testing.assert_allclose(collection.embedding, [2**-0.5, 2**-0.5])
+
+        service.remove_resources_batch(collection.id, ids[1:], owner_id="user1")
+        db_session.refresh(collection)
+
+        assert collection.embedding_sum == [1.0, 0.0]
+        assert collection.embedding_count == 1
+        np.testing.assert_allclose(collection.embedding, [1.0, 0.0])
+
+        service.remove_resources_batch(collection.id, ids[:1], owner_id="user1")
+        db_session.refresh(collection)
+
+        assert collection.embedding is None
+        assert collection.embedding_count == 0
+
+    def test_incremental_matches_rebuild(self, db_session):
+        """The running sum gives the same embedding as a full recompute."""
+        service = CollectionService(db_session)
+        collection = self._collection(db_session)
+        rng = np.random.default_rng(0)
+        ids = self._resources(db_session, rng.normal(size=(6, 4)).tolist())
+
+        service.add_resources_batch(collection.id, ids[:4], owner_id="user1")
+        service.add_resources_batch(collection.id, ids[4:], owner_id="user1")
+        service.remove_resources_batch(collection.id, ids[1:3], owner_id="user1")
+        db_session.refresh(collection)
+        incremental = list(collection.embedding)
+
+        rebuilt = service.compute_collection_embedding(collection.id)
+
+        np.testing.assert_allclose(incremental, rebuilt)
+
+    def test_detach_resource_updates_only_member_collections(self, db_session):
+        """Deletion subtracts the resource from the collections holding it."""
+        service = CollectionService(db_session)
+        holding = self._collection(db_session, "Holding")
+        other = self._collection(db_session, "Other")
+        ids = self._resources(db_session, [[1.0, 0.0], [0.0, 1.0]])
+        service.add_resources_batch(holding.id, ids, owner_id="user1")
+        service.add_resources_batch(other.id, ids[1:], owner_id="user1")
+
+        affected = service.detach_resource(ids[0])
+        db_session.commit()
+
+        assert affected == [holding.id]
+        db_session.refresh(holding)
+        db_session.refresh(other)
+        assert holding.embedding_sum == [0.0, 1.0]
+        assert holding.embedding_count == 1
+        assert other.embedding_count == 1
+        assert (
+            db_session.query(CollectionResource)
+            .filter(CollectionResource.resource_id == ids[0])
+            .count()
+            == 0
+        )
+
+    def test_member_reembedding_swaps_vector(self, db_session):
+        """A re-embedded member replaces its old vector in the sum."""
+        service = CollectionService(db_session)
+        collection = self._collection(db_session)
+        ids = self._resources(db_session, [[1.0, 0.0], [0.0, 1.0]])
+        service.add_resources_batch(collection.id, ids, owner_id="user1")
+
+        updated = service.apply_member_reembeddings(
+            {ids[0]: (json.dumps([1.0, 0.0]), [0.0, 3.0])}
+        )
+        db_session.commit()
+
+        assert updated == 1
+        db_session.refresh(collection)
+        assert collection.embedding_sum == [0.0, 4.0]
+        assert collection.embedding_count == 2
+
+    def test_collection_without_running_sum_is_rebuilt(self, db_session):
+        """Collections embedded before running sums existed are rebuilt once."""
+        service = CollectionService(db_session)
+        collection = self._collection(db_session)
+        ids = self._resources(db_session, [[1.0, 0.0], [0.0, 1.0]])
+        db_session.add(
+            CollectionResource(collection_id=collection.id, resource_id=ids[0])
+        )
+        collection.embedding = [1.0, 0.0]
+        db_session.commit()
+
+        service.add_resources_batch(collection.id, ids[1:], owner_id="user1")
+        db_session.refresh(collection)
+
+        assert collection.embedding_sum == [1.0, 1.0]
+        assert collection.embedding_count == 2
+
+    def test_rebuild_collection_embeddings(self, db_session):
+        """The repair rebuild recomputes sums for every collection."""
+        service = CollectionService(db_session)
+        first = self._collection(db_session, "First")
+        second = self._collection(db_session, "Second")
+        ids = self._resources(db_session, [[1.0, 0.0], [0.0, 1.0]])
+        db_session.add_all(
+            [
+                CollectionResource(collection_id=first.id, resource_id=ids[0]),
+                CollectionResource(collection_id=second.id, resource_id=ids[0]),
+                CollectionResource(collection_id=second.id, resource_id=ids[1]),
+            ]
+        )
+        db_session.commit()
+
+        assert service.rebuild_collection_embeddings(batch_size=1) == 2
+
+        db_session.refresh(first)
+        db_session.refresh(second)
+        assert first.embedding_sum == [1.0, 0.0]
+        assert second.embedding_sum == [1.0, 1.0]
+        assert second.embedding_count == 2
+
+    def test_ingestion_embedding_counts_existing_membership(self, db_session):
+        """A member embedded after it joined a collection enters the sum."""
+        from unittest.mock import Mock, patch
+
+        from app.modules.resources.service import _generate_embeddings
+
+        service = CollectionService(db_session)
+        collection = self._collection(db_session)
+        resource = Resource(title="Pending", source="http://example.com/p", type="article")
+        db_session.add(resource)
+        db_session.commit()
+        service.add_resources_batch(collection.id, [resource.id], owner_id="user1")
+        db_session.refresh(collection)
+        assert collection.embedding_count == 0
+
+        ai_core = Mock()
+        ai_core.generate_embedding.return_value = [0.0, 2.0]
+        with patch("app.modules.search.sparse_embeddings.SparseEmbeddingService"):
+            _generate_embeddings(ai_core, resource, db_session, "Pending", "", [])
+
+        # Applied in the ingestion transaction, before its commit
+        assert collection.embedding_sum == [0.0, 2.0]
+        assert collection.embedding_count == 1
+        db_session.rollback()
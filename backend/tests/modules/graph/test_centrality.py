@@ -0,0 +1,201 @@
+"""
+Tests for the sparse graph centrality engine.
+
+Tests cover:
+- CSR PageRank, degrees and exact betweenness against NetworkX
+- Sampled betweenness bounds and reproducibility
+- Persisting whole-graph centrality to graph_centrality_cache
+- The centrality endpoint reading persisted scores
+- Citation importance written in one bulk UPDATE
+"""
+
+import asyncio
+
+import networkx as nx
+import numpy as np
+import pytest
+from sqlalchemy import event
+
+from app.database.models import Citation, GraphCentralityCache, GraphEdge, Resource
+from app.modules.graph.centrality import (
+    approximate_betweenness,
+    degrees,
+    directed_matrix,
+    get_cached_centrality,
+    pagerank,
+    refresh_centrality_cache,
+    undirected_pattern,
+)
+from app.modules.graph.citations import CitationService
+from app.modules.graph.router import get_centrality_metrics
+
+
+def random_edges(n=30, m=80, seed=7):
+    rng = np.random.default_rng(seed)
+    src = rng.integers(0, n, size=m)
+    dst = rng.integers(0, n, size=m)
+    return src, dst
+
+
+def test_pagerank_and_degrees_match_networkx():
+    src, dst = random_edges()
+    weights = np.linspace(0.2, 1.0, len(src))
+    G = nx.DiGraph()
+    G.add_nodes_from(range(30))
+    for a, b, w in zip(src.tolist(), dst.tolist(), weights.tolist()):
+        previous = G.get_edge_data(a, b, {"weight": 0.0})["weight"]
+        G.add_edge(a, b, weight=previous + w)
+
+    scores = pagerank(directed_matrix(src, dst, weights, 30), alpha=0.85)
+    expected = nx.pagerank(G, alpha=0.85, weight="weight")
+    for node, score in expected.items():
+        assert scores[node] == pytest.approx(score, abs=1e-4)
+
+    pattern = directed_matrix(src, dst, np.ones(len(src)), 30)
+    pattern.data[:] = 1.0
+    in_degree, out_degree = degrees(pattern)
+    G.remove_edges_from(nx.selfloop_edges(G))
+    for node in range(30):
+        loop = int(node in src[src == dst])
+        assert in_degree[node] == G.in_degree(node) + loop
+        assert out_degree[node] == G.out_degree(node) + loop
+
+
+def test_exact_betweenness_matches_networkx():
+    src, dst = random_edges()
+    G = nx.Graph()
+    G.add_nodes_from(range(32))  # Two isolated nodes count towards n
+    G.add_edges_from(zip(src.tolist(), dst.tolist()))
+
+    scores = approximate_betweenness(
+        undirected_pattern(src, dst, 32), np.arange(32), k=None
+    )
+    expected = nx.betweenness_centrality(G)
+    for node, score in expected.items():
+        assert scores[node] == pytest.approx(score, abs=1e-9)
+
+
+def test_sampled_betweenness_is_bounded_and_seeded():
+    src, dst = random_edges(n=200, m=600)
+    adjacency = undirected_pattern(src, dst, 200)
+    nodes = np.arange(200)
+
+    first = approximate_betweenness(adjacency, nodes, k=40, seed=3)
+    second = approximate_betweenness(adjacency, nodes, k=40, seed=3)
+
+    assert np.array_equal(first, second)
+    assert first.min() >= 0.0 and first.max() <= 1.0
+    exact = approximate_betweenness(adjacency, nodes, k=None)
+    # The sampled estimate finds the same most central node
+    assert np.argmax(first) == np.argmax(exact)
+
+
+@pytest.fixture
+def path_graph(db_session):
+    """a -> b -> c -> d (edges) plus an isolated resource."""
+    resources = [Resource(title=name) for name in "abcde"]
+    db_session.add_all(resources)
+    db_session.flush()
+    for a, b in zip(resources, resources[1:4]):
+        db_session.add(
+            GraphEdge(
+                source_id=a.id,
+                target_id=b.id,
+                edge_type="citation",
+                weight=1.0,
+                created_by="test",
+            )
+        )
+    db_session.commit()
+    return resources
+
+
+def test_refresh_persists_whole_graph(db_session, path_graph):
+    a, b, c, d, e = path_graph
+    db_session.add(GraphCentralityCache(resource_id=a.id, pagerank=9.0))
+    db_session.commit()
+
+    assert refresh_centrality_cache(db_session) == 5
+
+    rows = db_session.query(GraphCentralityCache).all()
+    assert len(rows) == 5
+    cached = get_cached_centrality(db_session, [str(r.id) for r in path_graph])
+    assert (cached[b.id].in_degree, cached[b.id].out_degree) == (1, 1)
+    # 5 nodes, one isolated: b lies on 2 of the 6 pairs not involving it
+    assert cached[b.id].betweenness == pytest.approx(2 / 6)
+    assert cached[a.id].betweenness == 0.0
+    assert cached[d.id].pagerank > cached[a.id].pagerank
+    assert cached[e.id].pagerank == 0.0
+
+
+def test_endpoint_reads_persisted_scores(db_session, path_graph):
+    _, b, _, _, e = path_graph
+    refresh_centrality_cache(db_session)
+    db_session.query(GraphCentralityCache).filter_by(resource_id=b.id).update(
+        {"pagerank": 0.42}
+    )
+    db_session.commit()
+
+    data = asyncio.run(
+        get_centrality_metrics(
+            resource_ids=f"{b.id},{e.id}", damping_factor=0.85, db=db_session
+        )
+    )
+
+    assert data["cached"] is True
+    assert data["metrics"][b.id]["pagerank"] == 0.42
+    assert data["metrics"][b.id]["total_degree"] == 2
+    assert data["metrics"][e.id]["computed_at"] is not None
+
+    data = asyncio.run(
+        get_centrality_metrics(
+            resource_ids=str(b.id), damping_factor=0.5, db=db_session
+        )
+    )
+    assert data["cached"] is False
+    assert data["metrics"][b.id]["pagerank"] != 0.42
+
+
+def test_citation_importance_bulk_update(db_session):
+    resources = [Resource(title=f"R{i}") for i in range(4)]
+    db_session.add_all(resources)
+    db_session.flush()
+    hub = resources[0]
+    for resource in resources[1:]:
+        db_session.add(
+            Citation(
+                source_resource_id=resource.id,
+                target_resource_id=hub.id,
+                target_url=f"https://example.com/{hub.id}",
+            )
+        )
+    db_session.add(
+        Citation(
+            source_resource_id=hub.id,
+            target_resource_id=resources[1].id,
+            target_url=f"https://example.com/{resources[1].id}",
+        )
+    )
+    db_session.commit()
+
+    statements = []
+    engine = db_session.get_bind()
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        scores = CitationService(db_session).compute_citation_importance()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert scores[str(hub.id)] == 1.0
+    assert len([s for s in statements if s.lstrip().startswith("UPDATE")]) == 1
+    db_session.expire_all()
+    importance = {
+        c.target_resource_id: c.importance_score
+        for c in db_session.query(Citation).all()
+    }
+    assert importance[hub.id] == 1.0
+    assert 0.0 <= importance[resources[1].id] < 1.0
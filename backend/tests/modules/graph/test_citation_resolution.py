@@ -0,0 +1,202 @@
+"""
+Tests for set-based citation resolution and level-batched citation graphs.
+
+Tests cover:
+- URL keys maintained on resources and citations
+- Bulk resolution (one join + one UPDATE per batch) and edge events
+- Backfill of URL keys missing on older rows
+- Citation graph expansion with a fixed number of queries per level
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event, update
+
+from app.database.models import Citation, Resource, url_key
+from app.modules.graph import citations as citations_module
+from app.modules.graph.citations import CitationService
+
+
+@pytest.fixture
+def statements(db_session):
+    """SQL statements executed on the test engine."""
+    captured = []
+    engine = db_session.get_bind()
+
+    def capture(conn, cursor, statement, *args):
+        captured.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+@pytest.fixture
+def emitted(monkeypatch):
+    """Edges passed to emit_graph_edges_added."""
+    edges = []
+    monkeypatch.setattr(citations_module, "emit_graph_edges_added", edges.extend)
+    return edges
+
+
+def test_url_key_normalization():
+    assert url_key("HTTPS://Example.com/Paper/#section") == "https://example.com/paper"
+    assert url_key("https://example.com/paper?id=1") == "https://example.com/paper?id=1"
+    assert url_key(None) is None
+
+    resource = Resource(title="R", source="https://Example.com/a/")
+    citation = Citation(target_url="https://example.com/A#top")
+    assert resource.source_url_key == citation.target_url_key
+
+
+def test_resolves_citations_in_bulk(db_session, statements, emitted, monkeypatch):
+    monkeypatch.setattr(citations_module, "RESOLVE_BATCH_SIZE", 2)
+    source = Resource(title="Source", source="https://example.com/source")
+    targets = [
+        Resource(title=f"Target {i}", source=f"https://example.com/t{i}/")
+        for i in range(3)
+    ]
+    db_session.add_all([source, *targets])
+    db_session.flush()
+    db_session.add_all(
+        [
+            Citation(
+                source_resource_id=source.id, target_url=f"https://example.com/T{i}"
+            )
+            for i in range(3)
+        ]
+        + [Citation(source_resource_id=source.id, target_url="https://elsewhere.org")]
+    )
+    db_session.commit()
+
+    statements.clear()
+    resolved = CitationService(db_session).resolve_internal_citations()
+
+    assert resolved == 3
+    assert len([s for s in statements if s.lstrip().startswith("UPDATE")]) == 2
+    db_session.expire_all()
+    resolved_targets = {
+        c.target_resource_id
+        for c in db_session.query(Citation).filter(
+            Citation.target_resource_id.isnot(None)
+        )
+    }
+    assert resolved_targets == {t.id for t in targets}
+    assert {e["target_id"] for e in emitted} == {str(t.id) for t in targets}
+
+    assert CitationService(db_session).resolve_internal_citations() == 0
+
+
+def test_resolution_bumps_citation_updated_at(db_session, emitted):
+    old = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    source = Resource(title="Source")
+    target = Resource(title="Target", source="https://example.com/t")
+    db_session.add_all([source, target])
+    db_session.flush()
+    citation = Citation(
+        source_resource_id=source.id, target_url="https://example.com/t"
+    )
+    db_session.add(citation)
+    db_session.commit()
+    db_session.execute(update(Citation).values(updated_at=old))
+    db_session.commit()
+
+    CitationService(db_session).resolve_internal_citations([str(citation.id)])
+
+    db_session.expire_all()
+    refreshed = db_session.get(Citation, citation.id)
+    assert refreshed.target_resource_id == target.id
+    assert refreshed.updated_at.replace(tzinfo=timezone.utc) > old
+
+
+def test_backfills_missing_url_keys(db_session, emitted):
+    source = Resource(title="Source")
+    target = Resource(title="Target", source="https://example.com/legacy")
+    db_session.add_all([source, target])
+    db_session.flush()
+    citation = Citation(
+        source_resource_id=source.id, target_url="https://example.com/legacy/"
+    )
+    db_session.add(citation)
+    db_session.commit()
+    db_session.execute(update(Resource).values(source_url_key=None))
+    db_session.execute(update(Citation).values(target_url_key=None))
+    db_session.commit()
+
+    assert CitationService(db_session).resolve_internal_citations() == 1
+    db_session.expire_all()
+    assert db_session.get(Resource, target.id).source_url_key == (
+        "https://example.com/legacy"
+    )
+
+
+def test_citation_graph_queries_per_level(db_session, statements):
+    focal = Resource(title="Focal")
+    cited = [Resource(title=f"Cited {i}") for i in range(5)]
+    citing = Resource(title="Citing")
+    second = [Resource(title=f"Second {i}") for i in range(3)]
+    db_session.add_all([focal, *cited, citing, *second])
+    db_session.flush()
+    links = [(focal, c) for c in cited] + [(citing, focal)]
+    links += [(cited[0], s) for s in second]
+    db_session.add_all(
+        [
+            Citation(
+                source_resource_id=a.id,
+                target_resource_id=b.id,
+                target_url=f"https://example.com/{b.id}",
+            )
+            for a, b in links
+        ]
+    )
+    db_session.commit()
+
+    statements.clear()
+    graph = CitationService(db_session).get_citation_graph(str(focal.id), depth=2)
+
+    nodes = {n["id"]: n for n in graph["nodes"]}
+    assert nodes[str(focal.id)]["type"] == "source"
+    assert {nodes[str(c.id)]["type"] for c in cited} == {"cited"}
+    assert nodes[str(citing.id)] == {
+        "id": str(citing.id),
+        "title": "Citing",
+        "type": "citing",
+    }
+    assert all(str(s.id) in nodes for s in second)
+    # Edges are listed per expanded node, as before: 6 from the focal level,
+    # then 3 new ones plus the 6 seen again from the neighbours' side
+    assert len(graph["edges"]) == 15
+
+    # Focal lookup + (outbound, inbound, titles) for each of the two levels
+    assert len(statements) == 7
+
+
+def test_citation_graph_depth_one(db_session):
+    focal = Resource(title="Focal")
+    cited = Resource(title="Cited")
+    further = Resource(title="Further")
+    db_session.add_all([focal, cited, further])
+    db_session.flush()
+    db_session.add_all(
+        [
+            Citation(
+                source_resource_id=focal.id,
+                target_resource_id=cited.id,
+                target_url="https://example.com/cited",
+            ),
+            Citation(
+                source_resource_id=cited.id,
+                target_resource_id=further.id,
+                target_url="https://example.com/further",
+            ),
+        ]
+    )
+    db_session.commit()
+
+    graph = CitationService(db_session).get_citation_graph(str(focal.id), depth=1)
+
+    assert {n["title"] for n in graph["nodes"]} == {"Focal", "Cited"}
+    assert graph["edges"] == [
+        {"source": str(focal.id), "target": str(cited.id), "type": "reference"}
+    ]
@@ -252,9 +252,9 @@ class TestGraphEmbeddingsService:
         # Setup mock database queries
         def query_side_effect(model):
             mock_query = Mock()
-            if model == Citation:
+            if model is Citation:
                 mock_query.all.return_value = [mock_citation]
-            elif model == Resource:
+            elif model is Resource.id:
                 mock_query.all.return_value = [mock_resource1, mock_resource2]
             return mock_query
 
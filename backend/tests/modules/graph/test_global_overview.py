@@ -0,0 +1,190 @@
+"""
+Tests for global overview graph generation.
+
+Tests cover:
+- Blocked top-k similarity join against a brute-force reference
+- Sparse subject co-occurrence for tag-overlap pairs
+- End-to-end overview edges and scores
+- Overview caching and invalidation on resource changes
+"""
+
+import itertools
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.database.models import Resource
+from app.modules.graph.handlers import handle_resource_changed
+from app.modules.graph.service import (
+    _find_high_tag_overlap_pairs,
+    _top_k_similarity_join,
+    compute_tag_overlap_score,
+    generate_global_overview,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def make_resources(db_session):
+    def _make(specs):
+        resources = [
+            Resource(
+                title=title,
+                embedding=json.dumps(embedding) if embedding else None,
+                subject=subjects,
+            )
+            for title, embedding, subjects in specs
+        ]
+        db_session.add_all(resources)
+        db_session.commit()
+        return resources
+
+    return _make
+
+
+def normalized(rows):
+    matrix = np.asarray(rows, dtype=np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+# ============================================================================
+# Similarity join
+# ============================================================================
+
+
+class TestTopKSimilarityJoin:
+    def test_matches_brute_force_when_k_covers_all(self):
+        matrix = normalized(np.random.default_rng(0).normal(size=(40, 8)))
+
+        rows, cols, sims = _top_k_similarity_join(
+            matrix, threshold=0.3, top_k=39, max_block_cells=100
+        )
+
+        expected = {
+            (i, j)
+            for i, j in itertools.combinations(range(40), 2)
+            if matrix[i] @ matrix[j] >= 0.3
+        }
+        assert set(zip(rows.tolist(), cols.tolist())) == expected
+        assert np.allclose(sims, np.einsum("ij,ij->i", matrix[rows], matrix[cols]))
+
+    def test_keeps_top_k_per_row(self):
+        matrix = normalized([[1, 0], [0.99, 0.1], [0.98, 0.2], [0, 1]])
+
+        rows, cols, _ = _top_k_similarity_join(matrix, threshold=0.5, top_k=1)
+
+        assert set(zip(rows.tolist(), cols.tolist())) == {(0, 1), (1, 2)}
+
+    def test_single_row_returns_no_pairs(self):
+        rows, _, _ = _top_k_similarity_join(normalized([[1, 0]]), 0.0, top_k=5)
+        assert len(rows) == 0
+
+
+class TestTagOverlapPairs:
+    def test_ranks_pairs_by_shared_subjects(self, make_resources):
+        resources = make_resources(
+            [
+                ("A", None, ["ml", "nlp", "graphs"]),
+                ("B", None, ["ml", "nlp", "graphs"]),
+                ("C", None, ["ml", "vision"]),
+                ("D", None, ["history"]),
+            ]
+        )
+
+        pairs = _find_high_tag_overlap_pairs(resources, limit=1)
+
+        assert pairs == {tuple(sorted((resources[0].id, resources[1].id)))}
+
+    def test_matches_pairwise_reference(self, make_resources):
+        rng = np.random.default_rng(1)
+        subjects = ["a", "b", "c", "d", "e"]
+        resources = make_resources(
+            [
+                (f"R{i}", None, list(rng.choice(subjects, size=2, replace=False)))
+                for i in range(12)
+            ]
+        )
+
+        pairs = _find_high_tag_overlap_pairs(resources, limit=1000)
+
+        expected = {
+            tuple(sorted((a.id, b.id)))
+            for a, b in itertools.combinations(resources, 2)
+            if compute_tag_overlap_score(a.subject, b.subject)[1]
+        }
+        assert pairs == expected
+
+    def test_skips_subjects_above_size_cap(self, make_resources):
+        resources = make_resources(
+            [
+                ("A", None, ["common", "ml"]),
+                ("B", None, ["common", "ml"]),
+                ("C", None, ["common"]),
+                ("D", None, ["common"]),
+            ]
+        )
+
+        pairs = _find_high_tag_overlap_pairs(resources, limit=1000, max_subject_size=3)
+
+        assert pairs == {tuple(sorted((resources[0].id, resources[1].id)))}
+
+
+# ============================================================================
+# Overview generation and caching
+# ============================================================================
+
+
+class TestGlobalOverview:
+    def test_connects_similar_and_topical_resources(self, db_session, make_resources):
+        a, b, c, d = make_resources(
+            [
+                ("A", [1.0, 0.0, 0.0], ["ml"]),
+                ("B", [0.99, 0.05, 0.0], None),
+                ("C", [0.0, 0.0, 1.0], ["ml"]),
+                ("D", [0.0, 1.0, 0.0], None),
+            ]
+        )
+
+        graph = generate_global_overview(
+            db_session, limit=10, vector_threshold=0.9, use_cache=False
+        )
+
+        edges = {frozenset((e.source, e.target)): e for e in graph.edges}
+        assert set(edges) == {frozenset((a.id, b.id)), frozenset((a.id, c.id))}
+        assert edges[frozenset((a.id, b.id))].details.vector_similarity == pytest.approx(
+            0.9987, abs=1e-3
+        )
+        assert edges[frozenset((a.id, c.id))].details.shared_subjects == ["ml"]
+        assert d.id not in {n.id for n in graph.nodes}
+
+    def test_cache_reused_until_resources_change(self, db_session, make_resources):
+        make_resources([("A", [1.0, 0.0], None), ("B", [1.0, 0.01], None)])
+        generate_global_overview(db_session, limit=5, vector_threshold=0.5)
+
+        with patch(
+            "app.modules.graph.service._compute_global_overview"
+        ) as compute:
+            generate_global_overview(db_session, limit=5, vector_threshold=0.5)
+            assert compute.call_count == 0
+
+            make_resources([("C", [0.0, 1.0], None)])
+            generate_global_overview(db_session, limit=5, vector_threshold=0.5)
+            assert compute.call_count == 1
+
+    def test_resource_event_invalidates_cache(self, db_session, make_resources):
+        make_resources([("A", [1.0, 0.0], None), ("B", [1.0, 0.01], None)])
+        generate_global_overview(db_session, limit=5, vector_threshold=0.5)
+
+        handle_resource_changed({"resource_id": "any"})
+        with patch(
+            "app.modules.graph.service._compute_global_overview"
+        ) as compute:
+            generate_global_overview(db_session, limit=5, vector_threshold=0.5)
+
+        assert compute.call_count == 1
@@ -0,0 +1,288 @@
+"""
+Tests for the process-wide graph snapshot.
+
+Tests cover:
+- CSR adjacency and edge-type / weight filtering
+- Copy-on-write versioning of queued mutations
+- Event-driven edge and node updates
+- Delta sync of rows written after the initial build
+- Delta syncs that find no changes keep the snapshot version
+- Degree and PageRank parity with NetworkX
+"""
+
+import asyncio
+
+import networkx as nx
+import pytest
+
+from app.database.models import Citation, GraphEdge, Resource
+from app.modules.graph.handlers import (
+    handle_graph_edge_added,
+    handle_graph_edge_removed,
+    handle_resource_deleted,
+)
+from app.modules.graph.service import GraphService
+from app.modules.graph.snapshot import (
+    GraphSnapshotStore,
+    get_graph_store,
+    rebuild_graph_snapshot,
+    sync_graph_snapshot,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def store():
+    store = GraphSnapshotStore()
+    store.load(
+        [("a", 0.9), ("b", None), ("c", 0.1), ("d", 0.5)],
+        [
+            ("a", "b", "citation", 1.0),
+            ("b", "c", "citation", 1.0),
+            ("c", "a", "semantic_similarity", 0.4),
+            ("b", "a", "citation", 1.0),
+        ],
+    )
+    return store
+
+
+@pytest.fixture
+def resources(db_session):
+    items = [Resource(title=f"R{i}", quality_overall=0.5) for i in range(4)]
+    db_session.add_all(items)
+    db_session.commit()
+    return items
+
+
+def neighbor_ids(snapshot, resource_id, **kwargs):
+    nbrs, _, _ = snapshot.adjacent(snapshot.index_of(resource_id), **kwargs)
+    return sorted(snapshot.id_of(i) for i in nbrs)
+
+
+# ============================================================================
+# Snapshot structure
+# ============================================================================
+
+
+class TestSnapshotStructure:
+    def test_csr_neighbors_are_undirected(self, store):
+        snapshot = store.snapshot()
+
+        assert neighbor_ids(snapshot, "a") == ["b", "c"]
+        assert neighbor_ids(snapshot, "c") == ["a", "b"]
+        assert neighbor_ids(snapshot, "d") == []
+        # a->b and b->a collapse to one undirected edge
+        assert snapshot.num_edges == 4
+        assert snapshot.num_undirected_edges == 3
+
+    def test_adjacent_filters(self, store):
+        snapshot = store.snapshot()
+
+        assert neighbor_ids(snapshot, "a", edge_types=["citation"]) == ["b"]
+        assert neighbor_ids(snapshot, "a", min_weight=0.5) == ["b"]
+        assert neighbor_ids(snapshot, "a", edge_types=["unknown"]) == []
+
+    def test_unknown_quality_uses_default(self, store):
+        snapshot = store.snapshot()
+
+        assert snapshot.quality[snapshot.index_of("b")] == pytest.approx(0.5)
+        assert snapshot.quality[snapshot.index_of("a")] == pytest.approx(0.9)
+
+
+class TestVersioning:
+    def test_mutations_produce_new_version(self, store):
+        before = store.snapshot()
+
+        store.add_edges([("d", "a", "citation", 1.0)])
+        store.remove_edges([("b", "c", "citation")])
+        after = store.snapshot()
+
+        assert after.version == before.version + 1
+        assert neighbor_ids(after, "a") == ["b", "c", "d"]
+        assert neighbor_ids(after, "b") == ["a"]
+        # The old snapshot is unchanged
+        assert neighbor_ids(before, "a") == ["b", "c"]
+        assert neighbor_ids(before, "b") == ["a", "c"]
+
+    def test_re_adding_edge_replaces_weight(self, store):
+        store.add_edges([("c", "a", "semantic_similarity", 0.9)])
+        snapshot = store.snapshot()
+
+        assert snapshot.num_edges == 4
+        assert neighbor_ids(snapshot, "a", min_weight=0.5) == ["b", "c"]
+
+    def test_remove_node_drops_incident_edges(self, store):
+        store.remove_nodes(["a"])
+        snapshot = store.snapshot()
+
+        assert not snapshot.has_node("a")
+        assert neighbor_ids(snapshot, "b") == ["c"]
+        assert len(snapshot) == 3
+
+    def test_mutations_before_build_are_ignored(self):
+        store = GraphSnapshotStore()
+        store.add_edges([("a", "b", "citation", 1.0)])
+
+        assert store.snapshot() is None
+        assert store.stats()["pending_mutations"] == 0
+
+
+# ============================================================================
+# Metrics
+# ============================================================================
+
+
+class TestMetrics:
+    def test_degrees_count_distinct_pairs(self, store):
+        store.add_edges([("a", "b", "semantic_similarity", 0.3)])
+        snapshot = store.snapshot()
+        in_degrees, out_degrees = snapshot.degrees()
+
+        a = snapshot.index_of("a")
+        assert (int(in_degrees[a]), int(out_degrees[a])) == (2, 1)
+
+    def test_pagerank_matches_networkx(self, store):
+        snapshot = store.snapshot()
+
+        G = nx.DiGraph()
+        for src, dst, weight in [
+            ("a", "b", 1.0),
+            ("b", "c", 1.0),
+            ("c", "a", 0.4),
+            ("b", "a", 1.0),
+        ]:
+            G.add_edge(src, dst, weight=weight)
+        expected = nx.pagerank(G, alpha=0.85, weight="weight")
+
+        actual = snapshot.pagerank(alpha=0.85)
+        assert set(actual) == set(expected)
+        for node, score in expected.items():
+            assert actual[node] == pytest.approx(score, abs=1e-4)
+
+
+# ============================================================================
+# Events and database sync
+# ============================================================================
+
+
+class TestSynchronization:
+    def test_build_reads_citations_and_edges(self, db_session, resources):
+        r0, r1, r2, _ = resources
+        db_session.add_all(
+            [
+                Citation(
+                    source_resource_id=r0.id,
+                    target_resource_id=r1.id,
+                    target_url="https://example.com/r1",
+                ),
+                Citation(
+                    source_resource_id=r0.id, target_url="https://example.com/none"
+                ),
+                GraphEdge(
+                    source_id=r1.id,
+                    target_id=r2.id,
+                    edge_type="semantic_similarity",
+                    weight=0.7,
+                    created_by="system",
+                ),
+            ]
+        )
+        db_session.commit()
+
+        snapshot = rebuild_graph_snapshot(db_session)
+
+        assert len(snapshot) == 4
+        assert snapshot.num_edges == 2
+        assert neighbor_ids(snapshot, str(r1.id)) == sorted([str(r0.id), str(r2.id)])
+
+    def test_delta_sync_picks_up_new_rows(self, db_session, resources):
+        r0, r1, r2, _ = resources
+        first = rebuild_graph_snapshot(db_session)
+        assert first.num_edges == 0
+
+        db_session.add(
+            GraphEdge(
+                source_id=r0.id,
+                target_id=r2.id,
+                edge_type="citation",
+                weight=1.0,
+                created_by="user",
+            )
+        )
+        db_session.commit()
+        snapshot = sync_graph_snapshot(db_session, force=True)
+
+        assert snapshot.version > first.version
+        assert neighbor_ids(snapshot, str(r0.id)) == [str(r2.id)]
+
+    def test_idle_delta_sync_keeps_version(self, db_session, resources):
+        r0, _, r2, _ = resources
+        db_session.add(
+            GraphEdge(
+                source_id=r0.id,
+                target_id=r2.id,
+                edge_type="semantic_similarity",
+                weight=0.7,
+                created_by="system",
+            )
+        )
+        db_session.commit()
+        first = rebuild_graph_snapshot(db_session)
+
+        versions = [sync_graph_snapshot(db_session, force=True).version for _ in range(5)]
+        assert versions == [first.version] * 5
+
+        r2.quality_overall = 0.9
+        db_session.commit()
+        snapshot = sync_graph_snapshot(db_session, force=True)
+        assert snapshot.version == first.version + 1
+        assert snapshot.quality[snapshot.index_of(str(r2.id))] == pytest.approx(0.9)
+
+    def test_event_handlers_update_store(self, db_session, resources):
+        r0, r1, r2, _ = resources
+        rebuild_graph_snapshot(db_session)
+        store = get_graph_store(db_session.get_bind())
+
+        handle_graph_edge_added(
+            {
+                "edges": [
+                    {"source_id": str(r0.id), "target_id": str(r1.id), "weight": 1.0},
+                    {"source_id": str(r1.id), "target_id": str(r2.id), "weight": 1.0},
+                ]
+            }
+        )
+        assert store.snapshot().num_edges == 2
+
+        handle_graph_edge_removed(
+            {"source_id": str(r0.id), "target_id": str(r1.id), "edge_type": "citation"}
+        )
+        handle_resource_deleted({"resource_id": str(r2.id)})
+        snapshot = store.snapshot()
+
+        assert snapshot.num_edges == 0
+        assert not snapshot.has_node(str(r2.id))
+
+    def test_graph_service_reads_snapshot(self, db_session, resources):
+        r0, r1, r2, _ = resources
+        rebuild_graph_snapshot(db_session)
+        handle_graph_edge_added(
+            {
+                "edges": [
+                    {"source_id": str(r0.id), "target_id": str(r1.id)},
+                    {"source_id": str(r1.id), "target_id": str(r2.id)},
+                ]
+            }
+        )
+        service = GraphService(db_session)
+
+        one_hop = service.get_neighbors_multihop(str(r0.id), hops=1)
+        two_hop = service.get_neighbors_multihop(str(r0.id), hops=2)
+        degrees = asyncio.run(service.compute_degree_centrality([r1.id]))
+
+        assert [n["resource_id"] for n in one_hop] == [str(r1.id)]
+        assert str(r2.id) in [n["resource_id"] for n in two_hop]
+        assert degrees[r1.id] == {"in_degree": 1, "out_degree": 1, "total_degree": 2}
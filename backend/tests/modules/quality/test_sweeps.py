@@ -0,0 +1,187 @@
+"""
+Quality Module - Sweep Tests
+
+Tests for the chunked corpus-wide quality sweeps:
+- Vectorized dimension scores match the per-resource computation
+- Degradation monitoring recomputes stale scores across chunks
+- Process-pool execution matches inline execution
+- Outlier detection scores the whole corpus, not just the first batch
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.database.models import Resource
+from app.modules.quality.service import (
+    COMPLETENESS_FIELDS,
+    QualityService,
+    compute_dimension_scores,
+)
+
+STALE = datetime.now(timezone.utc) - timedelta(days=60)
+
+
+@pytest.fixture
+def stale_resources(create_test_resource):
+    """Resources with 60-day-old quality scores."""
+
+    def _create(count, **kwargs):
+        defaults = {
+            "quality_overall": 0.95,
+            "quality_last_computed": STALE,
+        }
+        defaults.update(kwargs)
+        return [
+            create_test_resource(title=f"Resource {i}", **defaults)
+            for i in range(count)
+        ]
+
+    return _create
+
+
+class TestDimensionScores:
+    def test_matches_per_resource_computation(self, db_session, create_test_resource):
+        service = QualityService(db_session)
+        resources = [
+            create_test_resource(title="Bare", description=None),
+            create_test_resource(creator="Author", publication_year=2020),
+            create_test_resource(creator="Author", publication_year=2020, doi="10.1/x"),
+        ]
+
+        present = np.array(
+            [[bool(getattr(r, f)) for f in COMPLETENESS_FIELDS] for r in resources]
+        )
+        scores = compute_dimension_scores(present)
+
+        for resource, row in zip(resources, scores):
+            quality = service.compute_quality(str(resource.id))
+            assert row[:5] == pytest.approx(
+                [
+                    quality.accuracy,
+                    quality.completeness,
+                    quality.consistency,
+                    quality.timeliness,
+                    quality.relevance,
+                ]
+            )
+            assert row[5] == pytest.approx(quality.overall_score())
+
+
+class TestDegradationSweep:
+    def test_recomputes_stale_scores_in_chunks(self, db_session, stale_resources):
+        degrading = stale_resources(3, description=None)
+        healthy = stale_resources(
+            2, creator="Author", publication_year=2020, doi="10.1/x", quality_overall=0.8
+        )
+        fresh = stale_resources(
+            1, description=None, quality_last_computed=datetime.now(timezone.utc)
+        )
+
+        degraded = QualityService(db_session).monitor_quality_degradation(
+            chunk_size=2, workers=0
+        )
+
+        assert {d["resource_id"] for d in degraded} == {str(r.id) for r in degrading}
+        report = degraded[0]
+        assert report["old_quality"] == pytest.approx(0.95)
+        assert report["degradation_pct"] == pytest.approx(
+            (0.95 - report["new_quality"]) / 0.95 * 100.0
+        )
+
+        db_session.expire_all()
+        for resource in degrading + healthy:
+            assert resource.quality_last_computed.replace(tzinfo=None) > STALE.replace(
+                tzinfo=None
+            )
+            assert resource.quality_computation_version == "v2.0"
+        assert all(r.needs_quality_review for r in degrading)
+        assert not any(r.needs_quality_review for r in healthy)
+        assert healthy[0].quality_completeness == pytest.approx(1.0)
+        # Recently computed scores are left alone
+        assert fresh[0].quality_overall == pytest.approx(0.95)
+
+    def test_process_pool_matches_inline(self, db_session, stale_resources):
+        stale_resources(5, description=None)
+        stale_resources(4, doi="10.1/x", quality_overall=0.5)
+
+        degraded = QualityService(db_session).monitor_quality_degradation(
+            chunk_size=3, workers=2
+        )
+
+        assert len(degraded) == 5
+        db_session.expire_all()
+        completeness = {
+            r.doi: r.quality_completeness for r in db_session.query(Resource).all()
+        }
+        assert completeness[None] == pytest.approx(0.2)
+        assert completeness["10.1/x"] == pytest.approx(0.6)
+
+
+class TestOutlierDetection:
+    def _create_corpus(self, create_test_resource, count=40):
+        rng = np.random.default_rng(0)
+        resources = []
+        for i in range(count):
+            values = rng.normal(0.7, 0.03, size=5).tolist()
+            resources.append(
+                create_test_resource(
+                    title=f"Resource {i}",
+                    quality_overall=sum(values) / 5,
+                    quality_accuracy=values[0],
+                    quality_completeness=values[1],
+                    quality_consistency=values[2],
+                    quality_timeliness=values[3],
+                    quality_relevance=values[4],
+                )
+            )
+        anomaly = create_test_resource(
+            title="Anomaly",
+            quality_overall=0.1,
+            quality_accuracy=0.1,
+            quality_completeness=0.05,
+            quality_consistency=0.1,
+            quality_timeliness=0.9,
+            quality_relevance=0.1,
+        )
+        return resources, anomaly
+
+    def test_scores_whole_corpus(self, db_session, create_test_resource):
+        resources, anomaly = self._create_corpus(create_test_resource)
+
+        count = QualityService(db_session).detect_quality_outliers(
+            batch_size=7, sample_size=20, workers=0
+        )
+
+        db_session.expire_all()
+        assert count >= 1
+        assert all(r.outlier_score is not None for r in resources + [anomaly])
+        assert anomaly.is_quality_outlier is True
+        assert anomaly.needs_quality_review is True
+        assert "low_completeness" in anomaly.outlier_reasons
+        assert "low_timeliness" not in anomaly.outlier_reasons
+        flagged = sum(1 for r in resources + [anomaly] if r.is_quality_outlier)
+        assert flagged == count
+
+    def test_process_pool_matches_inline(self, db_session, create_test_resource):
+        resources, anomaly = self._create_corpus(create_test_resource, count=20)
+        service = QualityService(db_session)
+
+        inline = service.detect_quality_outliers(batch_size=6, workers=0)
+        db_session.expire_all()
+        inline_scores = {r.id: r.outlier_score for r in resources + [anomaly]}
+
+        pooled = service.detect_quality_outliers(batch_size=6, workers=2)
+        db_session.expire_all()
+
+        assert pooled == inline
+        for r in resources + [anomaly]:
+            assert r.outlier_score == pytest.approx(inline_scores[r.id])
+
+    def test_requires_minimum_resources(self, db_session, create_test_resource):
+        for i in range(5):
+            create_test_resource(title=f"Resource {i}", quality_overall=0.7)
+
+        with pytest.raises(ValueError, match="minimum 10"):
+            QualityService(db_session).detect_quality_outliers()
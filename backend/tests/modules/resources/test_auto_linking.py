@@ -205,23 +205,28 @@ async def test_no_existing_chunks(mock_db, mock_embedding_generator):
 # ============================================================================
 
 
-def test_empty_embedding_returns_none(auto_linking_service):
+def test_empty_embedding_is_not_stored(auto_linking_service, mock_embedding_generator):
     """
-    Test that empty embeddings are handled gracefully.
+    Test that a chunk whose embedding comes back empty is left unembedded.
     
     Edge case: Missing or invalid embeddings
     """
+    mock_embedding_generator.generate_embeddings = Mock(return_value=[[]])
+
     # Create mock chunk with no embedding
     chunk = Mock(spec=db_models.DocumentChunk)
     chunk.id = uuid.uuid4()
     chunk.content = "Test content"
     chunk.chunk_metadata = {}  # No embedding
-    
-    # Get embedding
-    embedding = auto_linking_service._get_chunk_embedding(chunk)
-    
-    # Should generate embedding
-    assert embedding is not None or embedding == []
+    chunk.embedding = None
+
+    vectors = {}
+    written = auto_linking_service._embed_missing_chunks([chunk], vectors)
+
+    # Nothing to write, nothing to index
+    assert written == []
+    assert vectors == {}
+    assert chunk.embedding is None
 
 
 def test_zero_norm_embeddings(auto_linking_service):
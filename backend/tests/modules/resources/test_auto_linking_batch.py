@@ -0,0 +1,171 @@
+"""
+Tests for batched, index-backed PDF<->code auto-linking.
+
+Tests cover:
+- Batched top-k search over a vector index
+- Linking PDF chunks against the code chunk index only
+- Bulk embedding of the resource's chunks without stored vectors
+- Paged background backfill of link targets without stored vectors
+- Link direction for code resources
+"""
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from app.database.models import ChunkLink, DocumentChunk, Resource
+from app.modules.resources.service import AutoLinkingService
+from app.modules.search.chunk_index import CODE_CHUNK_INDEX_NAME
+from app.shared.vector_index import VectorIndex, decode_vector, encode_vector
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def make_resource_with_chunks(db_session):
+    """Create a resource whose chunks carry the given embeddings."""
+
+    def _make(title, vectors, resource_type="article"):
+        resource = Resource(title=title, type=resource_type)
+        db_session.add(resource)
+        db_session.flush()
+        chunks = []
+        for i, vector in enumerate(vectors):
+            chunk = DocumentChunk(
+                resource_id=resource.id,
+                content=f"{title} chunk {i}",
+                chunk_index=i,
+                chunk_metadata={},
+                embedding=encode_vector(vector) if vector is not None else None,
+            )
+            db_session.add(chunk)
+            chunks.append(chunk)
+        db_session.commit()
+        return resource, chunks
+
+    return _make
+
+
+@pytest.fixture
+def embedder():
+    gen = Mock(spec=["generate_embeddings", "generate_embedding"])
+    gen.generate_embeddings.side_effect = lambda texts: [[1.0, 0.0, 0.0] for _ in texts]
+    return gen
+
+
+# ============================================================================
+# Batched index search
+# ============================================================================
+
+
+class TestSearchMany:
+    def test_matches_single_query_search(self):
+        rng = np.random.default_rng(0)
+        index = VectorIndex("test")
+        index.upsert_many([f"k{i}" for i in range(50)], rng.normal(size=(50, 8)))
+        queries = rng.normal(size=(7, 8))
+
+        batched = index.search_many(queries, k=5, exclude=["k3"], max_block_cells=60)
+
+        for query, hits in zip(queries, batched):
+            expected = index.search(query, k=5, exclude=["k3"])
+            assert [key for key, _ in hits] == [key for key, _ in expected]
+            assert np.allclose([s for _, s in hits], [s for _, s in expected], atol=1e-5)
+
+    def test_zero_query_and_dimension_mismatch(self):
+        index = VectorIndex("test")
+        index.upsert_many(["a"], [[1.0, 0.0]])
+
+        assert index.search_many([[0.0, 0.0]], k=3) == [[]]
+        assert index.search_many([[1.0, 0.0, 0.0]], k=3) == [[]]
+
+
+# ============================================================================
+# Linking
+# ============================================================================
+
+
+class TestBatchedAutoLinking:
+    @pytest.mark.asyncio
+    async def test_links_pdf_chunks_to_code_chunks_only(
+        self, db_session, make_resource_with_chunks, embedder
+    ):
+        pdf, pdf_chunks = make_resource_with_chunks("Paper", [[1.0, 0.0, 0.0]])
+        _, code_chunks = make_resource_with_chunks(
+            "model.py", [[0.9, 0.1, 0.0], [0.0, 1.0, 0.0]], resource_type="code_file"
+        )
+        _, other_pdf_chunks = make_resource_with_chunks("Other paper", [[1.0, 0.0, 0.0]])
+
+        service = AutoLinkingService(db_session, embedding_generator=embedder)
+        links = await service.link_pdf_to_code(str(pdf.id), similarity_threshold=0.7)
+
+        pairs = {(l.source_chunk_id, l.target_chunk_id, l.link_type) for l in links}
+        assert pairs == {
+            (pdf_chunks[0].id, code_chunks[0].id, "pdf_to_code"),
+            (code_chunks[0].id, pdf_chunks[0].id, "code_to_pdf"),
+        }
+        assert db_session.query(ChunkLink).count() == 2
+        embedder.generate_embeddings.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_embeds_own_chunks_and_queues_target_backfill(
+        self, db_session, make_resource_with_chunks, embedder
+    ):
+        pdf, pdf_chunks = make_resource_with_chunks("Paper", [None, None])
+        _, code_chunks = make_resource_with_chunks(
+            "model.py", [None, [1.0, 0.0, 0.0]], resource_type="code_file"
+        )
+
+        service = AutoLinkingService(db_session, embedding_generator=embedder)
+        with patch(
+            "app.tasks.celery_tasks.backfill_chunk_embeddings_task.apply_async"
+        ) as backfill:
+            links = await service.link_pdf_to_code(str(pdf.id))
+
+        # Only the PDF's own chunks are embedded inline, in one batch
+        assert [len(c.args[0]) for c in embedder.generate_embeddings.call_args_list] == [2]
+        assert db_session.get(DocumentChunk, code_chunks[0].id).embedding is None
+        backfill.assert_called_once()
+        assert backfill.call_args.kwargs["args"] == [CODE_CHUNK_INDEX_NAME]
+        # Two PDF chunks x the one indexed code chunk, in both directions
+        assert len(links) == 4
+
+    def test_backfill_embeds_targets_page_by_page(
+        self, db_session, make_resource_with_chunks, embedder
+    ):
+        _, pdf_chunks = make_resource_with_chunks("Paper", [None])
+        _, code_chunks = make_resource_with_chunks(
+            "model.py", [None, None, None], resource_type="code_file"
+        )
+
+        service = AutoLinkingService(db_session, embedding_generator=embedder)
+        assert service.backfill_chunk_embeddings(CODE_CHUNK_INDEX_NAME, batch_size=2) == 3
+
+        assert [len(c.args[0]) for c in embedder.generate_embeddings.call_args_list] == [2, 1]
+        for chunk in code_chunks:
+            stored = db_session.get(DocumentChunk, chunk.id)
+            assert decode_vector(stored.embedding).tolist() == [1.0, 0.0, 0.0]
+        # Out-of-scope chunks are left alone
+        assert db_session.get(DocumentChunk, pdf_chunks[0].id).embedding is None
+
+    @pytest.mark.asyncio
+    async def test_code_resource_links_to_document_chunks(
+        self, db_session, make_resource_with_chunks, embedder
+    ):
+        _, pdf_chunks = make_resource_with_chunks("Paper", [[0.0, 0.0, 1.0]])
+        code, code_chunks = make_resource_with_chunks(
+            "model.py", [[0.0, 0.0, 1.0]], resource_type="code_file"
+        )
+        make_resource_with_chunks("util.py", [[0.0, 0.0, 1.0]], resource_type="code_file")
+
+        service = AutoLinkingService(db_session, embedding_generator=embedder)
+        links = await service.link_code_to_pdfs(str(code.id))
+
+        assert {(l.source_chunk_id, l.target_chunk_id) for l in links} == {
+            (code_chunks[0].id, pdf_chunks[0].id),
+            (pdf_chunks[0].id, code_chunks[0].id),
+        }
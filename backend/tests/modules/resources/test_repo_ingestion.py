@@ -0,0 +1,110 @@
+"""
+Tests for incremental repository ingestion.
+
+Tests cover:
+- Ignored directories are pruned from the walk
+- Re-ingesting an unchanged repository creates no resources
+- Changed files update their existing resource in place
+- Binary files are skipped
+"""
+
+import pytest
+from sqlalchemy import func, select
+
+from app.database.models import RepoFileManifest, Resource
+from app.modules.resources.logic import repo_ingestion
+from app.modules.resources.logic.repo_ingestion import RepoIngestionService
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Small repository with an ignored dependency tree."""
+    root = tmp_path / "repo"
+    (root / "src").mkdir(parents=True)
+    (root / "node_modules" / "lib").mkdir(parents=True)
+    (root / ".git").mkdir()
+
+    (root / ".gitignore").write_text("node_modules/\n*.log\n")
+    (root / "README.md").write_text("# Project\n")
+    (root / "src" / "main.py").write_text("def main():\n    pass\n")
+    (root / "src" / "util.py").write_text("def util():\n    pass\n")
+    (root / "debug.log").write_text("log line\n")
+    (root / "node_modules" / "lib" / "index.js").write_text("module.exports = 1;\n")
+    (root / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+
+    yield root
+    repo_ingestion._GITIGNORE_CACHE.pop(str(root), None)
+
+
+async def _count(db, model):
+    return (await db.execute(select(func.count()).select_from(model))).scalar()
+
+
+class TestRepoIngestion:
+    @pytest.mark.asyncio
+    async def test_ignored_directories_are_pruned(self, async_db_session, repo):
+        service = RepoIngestionService(async_db_session)
+
+        resources, metadata = await service.crawl_directory(repo, batch_size=2)
+
+        assert {r.identifier for r in resources} == {
+            "README.md",
+            "src/main.py",
+            "src/util.py",
+        }
+        # node_modules/ and .git/ are never entered
+        assert metadata["directories_pruned"] == 2
+        assert metadata["created"] == 3
+        assert metadata["batches_processed"] == 2
+        assert await _count(async_db_session, RepoFileManifest) == 3
+
+    @pytest.mark.asyncio
+    async def test_unchanged_repository_is_skipped(self, async_db_session, repo):
+        service = RepoIngestionService(async_db_session)
+        await service.crawl_directory(repo)
+
+        resources, metadata = await service.crawl_directory(repo)
+
+        assert resources == []
+        assert metadata["unchanged"] == 3
+        assert metadata["created"] == 0
+        assert await _count(async_db_session, Resource) == 3
+
+    @pytest.mark.asyncio
+    async def test_changed_file_updates_existing_resource(self, async_db_session, repo):
+        service = RepoIngestionService(async_db_session)
+        first, _ = await service.crawl_directory(repo)
+        main_id = next(r.id for r in first if r.identifier == "src/main.py")
+
+        (repo / "src" / "main.py").write_text("def main():\n    return 42\n")
+        (repo / "src" / "new.py").write_text("def new():\n    pass\n")
+
+        resources, metadata = await service.crawl_directory(repo)
+
+        assert metadata["updated"] == 1
+        assert metadata["created"] == 1
+        assert metadata["unchanged"] == 2
+        updated = next(r for r in resources if r.identifier == "src/main.py")
+        assert updated.id == main_id
+        assert "return 42" in updated.description
+        assert await _count(async_db_session, Resource) == 4
+
+        entry = (
+            await async_db_session.execute(
+                select(RepoFileManifest).where(RepoFileManifest.path == "src/main.py")
+            )
+        ).scalar_one()
+        assert entry.resource_id == main_id
+        assert entry.size == len("def main():\n    return 42\n")
+
+    @pytest.mark.asyncio
+    async def test_binary_files_are_skipped(self, async_db_session, repo):
+        (repo / "src" / "blob.py").write_bytes(b"\x00\x01\x02")
+        service = RepoIngestionService(async_db_session)
+
+        resources, metadata = await service.crawl_directory(repo)
+
+        assert "src/blob.py" not in {r.identifier for r in resources}
+        # .gitignore, debug.log and blob.py
+        assert metadata["skipped"] == 3
+        assert metadata["failed"] == 0
@@ -0,0 +1,211 @@
+"""
+Tests for chunk-level dense retrieval in parent-child search.
+
+Tests cover:
+- float32 byte encoding of chunk vectors
+- ANN-backed chunk ranking, filters and deduplication
+- Lexical fallback for chunks without stored vectors
+- Batched surrounding-chunk fetch
+- Eviction of deleted chunks
+- Delta sync on embedding_updated_at, once per query, without idle mutations
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from app.database.models import DocumentChunk, Resource
+from app.modules.search import chunk_index as chunk_index_module
+from app.modules.search.chunk_index import get_chunk_index
+from app.modules.search.service import SearchService
+from app.shared.vector_index import decode_vector, encode_vector
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def make_resource_with_chunks(db_session):
+    """Create a resource whose chunks carry the given embeddings."""
+
+    def _make(title, vectors, resource_type="article"):
+        resource = Resource(title=title, type=resource_type)
+        db_session.add(resource)
+        db_session.flush()
+        chunks = []
+        for i, vector in enumerate(vectors):
+            chunk = DocumentChunk(
+                resource_id=resource.id,
+                content=f"{title} chunk {i}",
+                chunk_index=i,
+                chunk_metadata={"page": i + 1},
+                embedding=encode_vector(vector) if vector is not None else None,
+            )
+            db_session.add(chunk)
+            chunks.append(chunk)
+        db_session.commit()
+        return resource, chunks
+
+    return _make
+
+
+def run_search(db_session, query_vector, **kwargs):
+    with patch("app.shared.embeddings.EmbeddingService") as service_class:
+        service = Mock()
+        service.generate_embedding.return_value = query_vector
+        service_class.return_value = service
+        return SearchService(db_session).parent_child_search(query="q", **kwargs)
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+
+def test_encode_decode_round_trip():
+    vector = [0.25, -1.5, 3.0]
+    data = encode_vector(vector)
+    assert len(data) == 12
+    assert decode_vector(data).tolist() == vector
+    assert decode_vector(b"") is None
+    assert decode_vector(None) is None
+
+
+class TestChunkVectorRetrieval:
+    def test_ranks_chunks_by_vector_similarity(
+        self, db_session, make_resource_with_chunks
+    ):
+        near, near_chunks = make_resource_with_chunks(
+            "Near", [[0.0, 1.0], [1.0, 0.0], [0.0, 1.0]]
+        )
+        far, _ = make_resource_with_chunks("Far", [[0.0, 1.0], [0.6, 0.4]])
+
+        results = run_search(db_session, [1.0, 0.0], top_k=2, context_window=1)
+
+        assert [r["parent_resource"].id for r in results] == [near.id, far.id]
+        assert results[0]["chunk"]["id"] == str(near_chunks[1].id)
+        assert results[0]["score"] == pytest.approx(1.0, abs=1e-5)
+        assert [c["chunk_index"] for c in results[0]["surrounding_chunks"]] == [0, 1, 2]
+
+    def test_filters_skip_non_matching_resources(
+        self, db_session, make_resource_with_chunks
+    ):
+        make_resource_with_chunks("Book", [[1.0, 0.0]], resource_type="book")
+        article, _ = make_resource_with_chunks("Article", [[0.5, 0.5]])
+
+        results = run_search(
+            db_session,
+            [1.0, 0.0],
+            top_k=1,
+            context_window=0,
+            filters={"resource_type": "article"},
+        )
+
+        assert [r["parent_resource"].id for r in results] == [article.id]
+
+    def test_unembedded_chunks_fall_back_to_lexical_scoring(
+        self, db_session, make_resource_with_chunks
+    ):
+        embedded, _ = make_resource_with_chunks("Embedded", [[1.0, 0.0]])
+        pending, _ = make_resource_with_chunks("Pending", [None])
+
+        results = run_search(db_session, [1.0, 0.0], top_k=5, context_window=0)
+
+        assert [r["parent_resource"].id for r in results] == [embedded.id, pending.id]
+
+    def test_deleted_chunks_are_evicted(self, db_session, make_resource_with_chunks):
+        resource, chunks = make_resource_with_chunks("Gone", [[1.0, 0.0]])
+        run_search(db_session, [1.0, 0.0], top_k=1, context_window=0)
+        assert str(chunks[0].id) in get_chunk_index(db_session)
+
+        db_session.delete(chunks[0])
+        db_session.commit()
+        results = run_search(db_session, [1.0, 0.0], top_k=1, context_window=0)
+
+        assert results == []
+        assert str(chunks[0].id) not in get_chunk_index(db_session)
+
+
+def test_surrounding_chunks_batch_uses_one_query(
+    db_session, make_resource_with_chunks
+):
+    from sqlalchemy import event
+
+    first, _ = make_resource_with_chunks("A", [None] * 6)
+    second, _ = make_resource_with_chunks("B", [None] * 3)
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        surrounding = SearchService(db_session)._get_surrounding_chunks_batch(
+            [(first.id, 0), (first.id, 5), (second.id, 1)], context_window=1
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert [c.chunk_index for c in surrounding[(first.id, 0)]] == [0, 1]
+    assert [c.chunk_index for c in surrounding[(first.id, 5)]] == [4, 5]
+    assert [c.chunk_index for c in surrounding[(second.id, 1)]] == [0, 1, 2]
+    assert np.all(
+        [c.resource_id == second.id for c in surrounding[(second.id, 1)]]
+    )
+
+
+class TestChunkIndexSync:
+    def test_chunks_embedded_after_creation_are_synced(
+        self, db_session, make_resource_with_chunks
+    ):
+        make_resource_with_chunks("Indexed", [[0.0, 1.0]])
+        _, [late] = make_resource_with_chunks("Late", [None])
+        late.created_at = datetime.now(timezone.utc) - timedelta(days=30)
+        db_session.commit()
+        run_search(db_session, [1.0, 0.0], top_k=1, context_window=0)
+        assert str(late.id) not in get_chunk_index(db_session)
+
+        late.embedding = encode_vector([1.0, 0.0])
+        db_session.commit()
+        assert late.embedding_updated_at is not None
+
+        results = run_search(db_session, [1.0, 0.0], top_k=1, context_window=0)
+        assert results[0]["chunk"]["id"] == str(late.id)
+
+    def test_idle_syncs_do_not_mutate_index(
+        self, db_session, make_resource_with_chunks
+    ):
+        make_resource_with_chunks("A", [[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]])
+        run_search(db_session, [1.0, 0.0], top_k=1, context_window=0)
+        before = get_chunk_index(db_session).stats()
+
+        for _ in range(10):
+            run_search(db_session, [1.0, 0.0], top_k=1, context_window=0)
+
+        after = get_chunk_index(db_session).stats()
+        assert after["unsaved_mutations"] == before["unsaved_mutations"]
+        assert after["mutations_since_train"] == before["mutations_since_train"]
+
+    def test_widening_search_syncs_once(self, db_session, make_resource_with_chunks):
+        make_resource_with_chunks("Book", [[1.0, 0.0]] * 40, resource_type="book")
+        article, _ = make_resource_with_chunks("Article", [[0.0, 1.0]])
+
+        with patch.object(
+            chunk_index_module,
+            "sync_chunk_index",
+            wraps=chunk_index_module.sync_chunk_index,
+        ) as sync:
+            results = run_search(
+                db_session,
+                [1.0, 0.0],
+                top_k=1,
+                context_window=0,
+                filters={"resource_type": "article"},
+            )
+
+        assert [r["parent_resource"].id for r in results] == [article.id]
+        assert sync.call_count == 1
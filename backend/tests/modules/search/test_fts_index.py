@@ -0,0 +1,102 @@
+"""
+Tests for the full-text keyword index (SQLite FTS5 + BM25).
+
+Tests cover:
+- Backfill of existing rows when the index is first created
+- BM25 ranking (title weighted above description, more matches rank higher)
+- Trigger maintenance on insert, update and delete
+- Upgrade from the original contentless FTS5 table
+- Transient schema check failures are retried
+"""
+
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.modules.search.fts_index import ensure_fts_schema, fts_search
+from app.services.search_service import AdvancedSearchService
+from app.shared.database import Base
+
+
+class TestFTSIndex:
+    def test_backfill_and_bm25_ranking(self, db_session, create_test_resource):
+        in_title = create_test_resource(
+            title="Transformer retrieval", description="A paper about models"
+        )
+        in_desc = create_test_resource(
+            title="Unrelated", description="Mentions retrieval once among many other words"
+        )
+        create_test_resource(title="Cooking", description="Recipes for pasta")
+
+        results = fts_search(db_session, "retrieval", limit=10)
+
+        assert [rid for rid, _ in results] == [str(in_title.id), str(in_desc.id)]
+        assert results[0][1] > results[1][1] > 0
+
+    def test_stemming_and_partial_matches(self, db_session, create_test_resource):
+        both = create_test_resource(title="Graph neural networks", description="")
+        one = create_test_resource(title="Social network analysis", description="")
+
+        results = fts_search(db_session, "neural network", limit=10)
+
+        # "network" matches "networks" via the porter stemmer; matching both
+        # terms ranks above matching one
+        assert [rid for rid, _ in results] == [str(both.id), str(one.id)]
+
+    def test_triggers_track_updates_and_deletes(self, db_session, create_test_resource):
+        resource = create_test_resource(title="Quantum computing", description="")
+        assert fts_search(db_session, "quantum", limit=10)
+
+        resource.title = "Classical mechanics"
+        db_session.commit()
+        assert fts_search(db_session, "quantum", limit=10) == []
+        assert [rid for rid, _ in fts_search(db_session, "mechanics", limit=10)] == [
+            str(resource.id)
+        ]
+
+        db_session.delete(resource)
+        db_session.commit()
+        assert fts_search(db_session, "mechanics", limit=10) == []
+
+    def test_replaces_contentless_table(self, db_engine, db_session, create_test_resource):
+        with db_engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE VIRTUAL TABLE resources_fts USING fts5("
+                    "title, description, content='')"
+                )
+            )
+        resource = create_test_resource(title="Sparse retrieval", description="")
+
+        assert ensure_fts_schema(db_engine)
+        assert [rid for rid, _ in fts_search(db_session, "sparse", limit=10)] == [
+            str(resource.id)
+        ]
+
+    def test_execute_fts_search_returns_ranked_scores(
+        self, db_session, create_test_resource
+    ):
+        create_test_resource(title="Machine learning", description="learning systems")
+        create_test_resource(title="Gardening", description="machine washing")
+
+        results = AdvancedSearchService._execute_fts_search(
+            db_session, "machine learning", limit=10
+        )
+
+        assert len(results) == 2
+        assert results[0][1] > results[1][1]
+
+
+def test_transient_schema_failure_is_retried(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fts.db'}")
+    Base.metadata.create_all(engine)
+
+    with patch(
+        "app.modules.search.fts_index._sqlite_has_fts_table",
+        side_effect=OperationalError("SELECT", {}, Exception("database is locked")),
+    ):
+        assert ensure_fts_schema(engine) is False
+
+    assert ensure_fts_schema(engine) is True
+    engine.dispose()
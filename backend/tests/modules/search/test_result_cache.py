@@ -0,0 +1,145 @@
+"""
+Search Module Tests - Result Cache
+
+Tests for the generation-namespaced search result cache:
+- Hits and misses per endpoint
+- Invalidation by bumping the corpus generation
+- SCAN-based cleanup of superseded generations
+- Backing off from Redis after connection errors
+- Corpus change handler
+"""
+
+import fnmatch
+
+import pytest
+
+from app.modules.search.result_cache import SearchResultCache
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+class InMemoryRedis:
+    """Minimal decoded-response Redis stand-in (get/setex/incr/scan)."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def scan_iter(self, match=None, count=None):
+        for key in list(self.data):
+            if match is None or fnmatch.fnmatch(key, match):
+                yield key
+
+    def unlink(self, *keys):
+        return sum(1 for k in keys if self.data.pop(k, None) is not None)
+
+
+class DownRedis:
+    """Redis stand-in whose every command fails to connect."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def _refuse(self, *args, **kwargs):
+        self.calls += 1
+        raise ConnectionError("Connection refused")
+
+    get = setex = incr = _refuse
+
+
+@pytest.fixture
+def redis_client():
+    return InMemoryRedis()
+
+
+@pytest.fixture
+def result_cache(redis_client):
+    return SearchResultCache(redis_client=redis_client, ttl=60)
+
+
+PARAMS = {"query": "neural networks", "limit": 20, "offset": 0}
+
+
+# ============================================================================
+# Lookups
+# ============================================================================
+
+
+class TestSearchResultCache:
+    def test_miss_then_hit(self, result_cache, redis_client):
+        assert result_cache.get("three_way_hybrid", PARAMS) is None
+
+        result_cache.set("three_way_hybrid", PARAMS, {"total": 3})
+
+        assert result_cache.get("three_way_hybrid", PARAMS) == {"total": 3}
+        assert set(redis_client.ttls.values()) == {60}
+        stats = result_cache.stats_dict()["endpoints"]["three_way_hybrid"]
+        assert stats == {"hit_rate": 0.5, "hits": 1, "misses": 1}
+
+    def test_params_and_endpoint_are_part_of_key(self, result_cache):
+        result_cache.set("three_way_hybrid", PARAMS, {"total": 3})
+
+        assert result_cache.get("three_way_hybrid", {**PARAMS, "limit": 10}) is None
+        assert result_cache.get("hybrid", PARAMS) is None
+
+    def test_corpus_invalidation_is_one_incr(self, result_cache, redis_client):
+        result_cache.set("hybrid", PARAMS, {"total": 3})
+        keys_before = set(redis_client.data)
+
+        assert result_cache.invalidate() == 1
+
+        assert result_cache.get("hybrid", PARAMS) is None
+        # Old entries are left to expire, not deleted
+        assert keys_before <= set(redis_client.data)
+
+    def test_cleanup_removes_superseded_generations(self, result_cache, redis_client):
+        result_cache.set("hybrid", PARAMS, {"total": 3})
+        result_cache.invalidate()
+        result_cache.set("hybrid", PARAMS, {"total": 4})
+
+        assert result_cache.cleanup(batch_size=1) == 1
+
+        assert result_cache.get("hybrid", PARAMS) == {"total": 4}
+        assert sum(k.startswith("search_result:") for k in redis_client.data) == 1
+
+    def test_backs_off_after_connection_error(self):
+        down = DownRedis()
+        result_cache = SearchResultCache(redis_client=down, ttl=60, retry_after=30)
+
+        assert result_cache.get("hybrid", PARAMS) is None
+        assert result_cache.get("hybrid", PARAMS) is None
+        result_cache.set("hybrid", PARAMS, {"total": 1})
+
+        assert down.calls == 1
+        assert result_cache.stats_dict()["redis_available"] is False
+
+
+# ============================================================================
+# Event handler
+# ============================================================================
+
+
+class TestCorpusChangedHandler:
+    def test_resource_change_bumps_generation(self, monkeypatch, result_cache):
+        from app.modules.search import handlers, result_cache as module
+
+        monkeypatch.setattr(module, "search_result_cache", result_cache)
+        result_cache.set("hybrid", PARAMS, {"total": 3})
+
+        handlers.handle_corpus_changed({"resource_id": "r1"})
+
+        assert result_cache.get("hybrid", PARAMS) is None
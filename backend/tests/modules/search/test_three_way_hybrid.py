@@ -4,6 +4,7 @@ Three-Way Hybrid Search Integration Tests
 Tests for three-way hybrid search combining FTS5, dense vectors, and sparse vectors.
 """
 
+import threading
 import time
 from sqlalchemy.orm import Session
 
@@ -297,6 +298,86 @@ class TestThreeWaySearchPerformance:
         assert rrf_time < 50, f"RRF took {rrf_time}ms, expected <50ms"
 
 
+class TestParallelRetrievalLegs:
+    """Test concurrent leg execution and per-leg timeouts."""
+
+    def test_slow_leg_is_dropped_from_fusion(self, tmp_path, monkeypatch):
+        """A leg exceeding the timeout budget contributes no candidates."""
+        from sqlalchemy import create_engine
+
+        from app.config.settings import get_settings
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'legs.db'}")
+        db = Session(bind=engine)
+
+        def fast(name):
+            return staticmethod(lambda db, query, limit=100: [(name, 1.0)])
+
+        def slow(db, query, limit=100):
+            time.sleep(0.5)
+            return [("slow", 1.0)]
+
+        monkeypatch.setattr(AdvancedSearchService, "_execute_fts_search", fast("fts"))
+        monkeypatch.setattr(AdvancedSearchService, "_execute_dense_search", staticmethod(slow))
+        monkeypatch.setattr(AdvancedSearchService, "_execute_sparse_search", fast("sparse"))
+        monkeypatch.setattr(get_settings(), "SEARCH_PARALLEL_LEGS", True)
+        monkeypatch.setattr(get_settings(), "SEARCH_LEG_TIMEOUT_MS", 100)
+
+        start = time.time()
+        results, timing = AdvancedSearchService._run_retrieval_legs(db, "q")
+        elapsed = time.time() - start
+        db.close()
+
+        assert elapsed < 0.4
+        assert timing["parallel"] is True
+        assert timing["timed_out"] == ["dense"]
+        assert results == {"fts5": [("fts", 1.0)], "dense": [], "sparse": [("sparse", 1.0)]}
+        assert {"fts5_ms", "dense_ms", "sparse_ms", "retrieval_ms"} <= set(timing)
+
+    def test_saturated_leg_pool_runs_legs_inline(self, tmp_path, monkeypatch):
+        """Legs that find no free slot run on the caller's session."""
+        from sqlalchemy import create_engine
+
+        from app.config.settings import get_settings
+        from app.services import search_service
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'legs.db'}")
+        db = Session(bind=engine)
+        sessions = []
+
+        def leg(name):
+            def run(leg_db, query, limit=100):
+                sessions.append((name, leg_db is db))
+                return [(name, 1.0)]
+
+            return staticmethod(run)
+
+        monkeypatch.setattr(AdvancedSearchService, "_execute_fts_search", leg("fts"))
+        monkeypatch.setattr(AdvancedSearchService, "_execute_dense_search", leg("dense"))
+        monkeypatch.setattr(AdvancedSearchService, "_execute_sparse_search", leg("sparse"))
+        monkeypatch.setattr(get_settings(), "SEARCH_PARALLEL_LEGS", True)
+        monkeypatch.setattr(search_service, "_leg_slots", threading.BoundedSemaphore(1))
+
+        results, timing = AdvancedSearchService._run_retrieval_legs(db, "q")
+        db.close()
+
+        assert results == {
+            "fts5": [("fts", 1.0)],
+            "dense": [("dense", 1.0)],
+            "sparse": [("sparse", 1.0)],
+        }
+        # Only the first leg got the single slot; it was returned afterwards
+        assert sorted(sessions) == [("dense", True), ("fts", False), ("sparse", True)]
+        assert search_service._leg_slots.acquire(blocking=False)
+
+    def test_single_connection_pool_runs_sequentially(self, db_session: Session):
+        """In-memory SQLite (StaticPool) cannot share work across threads."""
+        _, timing = AdvancedSearchService._run_retrieval_legs(db_session, "anything")
+
+        assert timing["parallel"] is False
+        assert timing["timed_out"] == []
+
+
 class TestQueryAnalysis:
     """Test query analysis for adaptive weighting."""
 
@@ -0,0 +1,110 @@
+"""
+Write Path Benchmarks
+
+Measures ORM insert throughput (inserts per second, one flush per insert)
+for resources, chunks and interactions on an engine built by the
+application's engine factory, and checks that the flush path issues no
+schema/catalog queries.
+"""
+
+import time
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import DocumentChunk, Resource, User, UserInteraction
+from app.shared.database import create_database_engine, ensure_schema
+
+INSERTS = 500
+MIN_INSERTS_PER_SECOND = 250
+
+
+@pytest.fixture
+def write_engine(tmp_path):
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'writes.db'}", env="test")
+    ensure_schema(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def write_session(write_engine):
+    session = sessionmaker(autoflush=False, bind=write_engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def catalog_queries(write_engine):
+    """Statements that inspect the schema (create_all issues these)."""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if "sqlite_master" in statement or "table_info" in statement:
+            statements.append(statement)
+
+    event.listen(write_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(write_engine, "before_cursor_execute", _record)
+
+
+def _inserts_per_second(session, make_row) -> float:
+    start = time.perf_counter()
+    for i in range(INSERTS):
+        session.add(make_row(i))
+        session.flush()
+    session.commit()
+    rate = INSERTS / (time.perf_counter() - start)
+    print(f"✓ {rate:.0f} inserts/s ({INSERTS} rows, flush per insert)")
+    return rate
+
+
+@pytest.fixture
+def parent_rows(write_session):
+    resource = Resource(title="Parent", source="https://example.com/parent")
+    user = User(email="writer@example.com", username="writer", hashed_password="x")
+    write_session.add_all([resource, user])
+    write_session.commit()
+    return resource, user
+
+
+@pytest.mark.performance
+class TestWritePathThroughput:
+    def test_resource_inserts(self, write_session, catalog_queries):
+        rate = _inserts_per_second(
+            write_session,
+            lambda i: Resource(title=f"Resource {i}", source=f"https://example.com/{i}"),
+        )
+
+        assert catalog_queries == []
+        assert rate >= MIN_INSERTS_PER_SECOND
+
+    def test_chunk_inserts(self, write_session, parent_rows, catalog_queries):
+        resource, _ = parent_rows
+
+        rate = _inserts_per_second(
+            write_session,
+            lambda i: DocumentChunk(
+                resource_id=resource.id, content=f"chunk {i} text", chunk_index=i
+            ),
+        )
+
+        assert catalog_queries == []
+        assert rate >= MIN_INSERTS_PER_SECOND
+
+    def test_interaction_inserts(self, write_session, parent_rows, catalog_queries):
+        resource, user = parent_rows
+
+        rate = _inserts_per_second(
+            write_session,
+            lambda i: UserInteraction(
+                user_id=user.id,
+                resource_id=resource.id,
+                interaction_type="view",
+                interaction_strength=0.5,
+            ),
+        )
+
+        assert catalog_queries == []
+        assert rate >= MIN_INSERTS_PER_SECOND
@@ -19,8 +19,11 @@ from unittest.mock import Mock, MagicMock, patch
 from hypothesis import given, strategies as st, settings, assume
 from hypothesis import HealthCheck
 
+from app.config.settings import get_settings
 from app.modules.resources.service import AutoLinkingService
+from app.modules.search import chunk_index
 from app.database import models as db_models
+from app.shared.vector_index import VectorIndex
 
 
 # ============================================================================
@@ -200,52 +203,68 @@ async def test_property_11_auto_linking_performance(num_chunks: int):
         }
         code_chunks.append(chunk)
     
-    # Mock database queries
+    # Mock database queries in the shape the batched linker issues them
     def mock_query(model):
         query_mock = Mock()
         if model == db_models.Resource:
             query_mock.filter.return_value.first.return_value = pdf_resource
         elif model == db_models.DocumentChunk:
-            # First call returns PDF chunks, second returns code chunks
-            filter_mock = Mock()
-            filter_mock.all.side_effect = [pdf_chunks, code_chunks]
-            query_mock.filter.return_value = filter_mock
+            # PDF chunks of the resource; no unembedded code chunks
+            query_mock.filter.return_value.all.return_value = pdf_chunks
+            query_mock.join.return_value.filter.return_value.first.return_value = None
         return query_mock
-    
+
+    def mock_execute(stmt):
+        columns = [column.key for column in stmt.selected_columns]
+        if columns == ["id", "resource_id"]:
+            # Candidate validation: every code chunk still exists
+            return [(chunk.id, code_resource_id) for chunk in code_chunks]
+        # Stored embeddings: none, the legacy metadata vectors are used
+        return []
+
     mock_db.query = mock_query
+    mock_db.execute = Mock(side_effect=mock_execute)
     mock_db.add = Mock()
+    mock_db.add_all = Mock()
     mock_db.commit = Mock()
-    
+
+    # Code chunk index the PDF chunks are searched against
+    code_resource_id = uuid.uuid4()
+    code_index = VectorIndex("code_chunks")
+    code_index.upsert_many(
+        [str(chunk.id) for chunk in code_chunks],
+        [chunk.chunk_metadata["embedding_vector"] for chunk in code_chunks],
+    )
+
     # Create service
     service = AutoLinkingService(
         db=mock_db,
         similarity_threshold=0.7
     )
-    
+
     # Measure execution time
     start_time = time.time()
-    
-    try:
+
+    with patch.object(chunk_index, "sync_chunk_index", return_value=code_index), \
+            patch.object(chunk_index, "index_chunks", return_value=0):
         links = await service.link_pdf_to_code(pdf_resource_id)
-        
-        elapsed_time = time.time() - start_time
-        
-        # Property: Auto-linking should complete within 5 seconds for 100 chunks
-        # Scale the threshold based on actual chunk count
-        time_threshold = 5.0 * (num_chunks / 100.0)
-        
-        assert elapsed_time < time_threshold, (
-            f"Auto-linking took {elapsed_time:.2f}s for {num_chunks} chunks, "
-            f"should be < {time_threshold:.2f}s"
-        )
-        
-        # Property: Links should be created
-        assert isinstance(links, list), "Should return list of links"
-        
-    except Exception as e:
-        # Performance test should not fail on implementation errors
-        # Just verify the method exists and is callable
-        pytest.skip(f"Auto-linking not fully implemented: {e}")
+
+    elapsed_time = time.time() - start_time
+
+    # Property: Auto-linking should complete within 5 seconds for 100 chunks
+    # Scale the threshold based on actual chunk count
+    time_threshold = 5.0 * (num_chunks / 100.0)
+
+    assert elapsed_time < time_threshold, (
+        f"Auto-linking took {elapsed_time:.2f}s for {num_chunks} chunks, "
+        f"should be < {time_threshold:.2f}s"
+    )
+
+    # Property: Every PDF chunk is linked both ways to its top code matches
+    assert isinstance(links, list), "Should return list of links"
+    top_k = min(get_settings().AUTO_LINK_TOP_K, len(code_chunks))
+    assert len(links) == 2 * num_chunks * top_k
+    mock_db.add_all.assert_called_once_with(links)
 
 
 # ============================================================================
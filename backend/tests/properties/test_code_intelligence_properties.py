@@ -1787,9 +1787,12 @@ async def test_property_graceful_error_handling(
     """
     from app.modules.resources.logic.repo_ingestion import RepoIngestionService
     import shutil
+    import uuid
     
     # Create test directory (clean up if exists)
-    test_dir = tmp_path / "test_repo"
+    # Hypothesis reuses tmp_path across examples; ingestion is incremental
+    # per directory, so each example gets its own repository
+    test_dir = tmp_path / f"test_repo_{uuid.uuid4().hex}"
     if test_dir.exists():
         shutil.rmtree(test_dir)
     test_dir.mkdir()
@@ -1891,9 +1894,12 @@ async def test_property_batch_transaction_rollback(
     """
     from app.modules.resources.logic.repo_ingestion import RepoIngestionService
     import shutil
+    import uuid
     
     # Create test directory with files (clean up if exists)
-    test_dir = tmp_path / "test_repo"
+    # Hypothesis reuses tmp_path across examples; ingestion is incremental
+    # per directory, so each example gets its own repository
+    test_dir = tmp_path / f"test_repo_{uuid.uuid4().hex}"
     if test_dir.exists():
         shutil.rmtree(test_dir)
     test_dir.mkdir()
@@ -0,0 +1,84 @@
+"""Unit tests for one-time schema management.
+
+Tests cover:
+- ensure_schema creates missing tables once per engine
+- A failed schema check is retried
+- In-memory SQLite detection
+- The test-only per-connection schema hook
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.exc import OperationalError
+
+from app.shared.database import (
+    create_database_engine,
+    enable_schema_on_connect,
+    ensure_schema,
+    is_memory_sqlite,
+)
+
+
+def test_ensure_schema_runs_once_per_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    statements = []
+    event.listen(
+        engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+
+    assert ensure_schema(engine) is True
+    assert "resources" in inspect(engine).get_table_names()
+
+    statements.clear()
+    with engine.connect() as conn:
+        assert ensure_schema(conn) is False
+    assert statements == []
+    engine.dispose()
+
+
+def test_failed_schema_check_is_retried(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'retry.db'}")
+
+    with patch(
+        "app.shared.database.Base.metadata.create_all",
+        side_effect=OperationalError("CREATE TABLE", {}, Exception("locked")),
+    ):
+        assert ensure_schema(engine) is False
+
+    assert ensure_schema(engine) is True
+    assert "resources" in inspect(engine).get_table_names()
+    engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("sqlite://", True),
+        ("sqlite:///:memory:", True),
+        ("sqlite+aiosqlite:///:memory:", True),
+        ("sqlite:///file:test?mode=memory&cache=shared&uri=true", True),
+        ("sqlite:///./backend.db", False),
+        ("postgresql://user@localhost/db", False),
+    ],
+)
+def test_is_memory_sqlite(url, expected):
+    assert is_memory_sqlite(url) is expected
+
+
+def test_memory_sqlite_connections_get_schema(monkeypatch):
+    monkeypatch.setenv("TESTING", "true")
+    engine = create_database_engine("sqlite:///:memory:", env="test")
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM resources")).scalar() == 0
+    engine.dispose()
+
+
+def test_schema_on_connect_rejects_file_databases(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'file.db'}")
+
+    with pytest.raises(ValueError):
+        enable_schema_on_connect(engine)
+    engine.dispose()
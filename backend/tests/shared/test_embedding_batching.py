@@ -0,0 +1,236 @@
+"""Unit tests for batched embedding generation.
+
+Tests cover:
+- Length-bucketed batch planning under a padded-token budget
+- EmbeddingGenerator.generate_embeddings ordering, empty texts and fallback
+- Micro-batch coalescing of concurrent single-text requests and leader hand-off
+- embed_texts with and without a batch API
+"""
+
+import itertools
+import threading
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from app.shared import embeddings, model_registry
+from app.shared.embeddings import (
+    EmbeddingGenerator,
+    MicroBatcher,
+    embed_texts,
+    plan_batches,
+)
+from app.shared.model_registry import ModelRegistry
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+_model_ids = itertools.count()
+
+
+class FakeModel:
+    """Records encode() calls and embeds text as [len(text), 1.0]."""
+
+    max_seq_length = 512
+
+    def __init__(self, fail_batches=False):
+        self.calls = []
+        self.fail_batches = fail_batches
+        self._lock = threading.Lock()
+
+    def encode(self, texts, **kwargs):
+        with self._lock:
+            self.calls.append(texts)
+        if isinstance(texts, str):
+            return np.array([len(texts), 1.0], dtype=np.float32)
+        if self.fail_batches:
+            raise RuntimeError("batch too large")
+        return np.array([[len(t), 1.0] for t in texts], dtype=np.float32)
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    """Fresh model registry whose embedding loader finds no library."""
+    registry = ModelRegistry()
+    monkeypatch.setattr(embeddings, "get_model_registry", lambda: registry)
+    monkeypatch.setitem(model_registry._loaders, "sentence_transformer", lambda n, d: None)
+    return registry
+
+
+def make_generator(model, **kwargs):
+    kwargs.setdefault("max_batch_tokens", 8192)
+    kwargs.setdefault("max_batch_size", 64)
+    kwargs.setdefault("coalesce_window_ms", 0)
+    # Unique name so each test's model (and micro-batcher) stands alone
+    model_name = f"fake-model-{next(_model_ids)}"
+    generator = EmbeddingGenerator(model_name=model_name, **kwargs)
+    if model is not None:
+        embeddings.get_model_registry().get(
+            "sentence_transformer", model_name, loader=lambda n, d: model
+        )
+    return generator
+
+
+# ============================================================================
+# Batch planning
+# ============================================================================
+
+
+class TestPlanBatches:
+    def test_groups_similar_lengths(self):
+        lengths = [100, 5, 98, 6, 101, 4]
+        batches = plan_batches(lengths, max_batch_tokens=310, max_batch_size=8)
+
+        assert batches == [[4, 0, 2], [3, 1, 5]]
+
+    def test_respects_batch_size(self):
+        batches = plan_batches([1] * 10, max_batch_tokens=1000, max_batch_size=4)
+
+        assert [len(b) for b in batches] == [4, 4, 2]
+
+    def test_oversized_text_gets_own_batch(self):
+        batches = plan_batches([5000, 10, 10], max_batch_tokens=100, max_batch_size=8)
+
+        assert batches == [[0], [1, 2]]
+
+
+# ============================================================================
+# EmbeddingGenerator
+# ============================================================================
+
+
+class TestGenerateEmbeddings:
+    def test_preserves_input_order_and_skips_empty(self):
+        model = FakeModel()
+        generator = make_generator(model)
+        texts = ["c" * 30, "", "a" * 5, "  ", "b" * 15]
+
+        vectors = generator.generate_embeddings(texts)
+
+        assert vectors == [[30.0, 1.0], [], [5.0, 1.0], [], [15.0, 1.0]]
+        # One forward pass for all non-empty texts, longest first
+        assert model.calls == [[texts[0], texts[4], texts[2]]]
+
+    def test_splits_by_token_budget(self):
+        model = FakeModel()
+        generator = make_generator(model, max_batch_tokens=60)
+        texts = ["x" * 200, "y" * 10, "z" * 12, "w" * 190]
+
+        vectors = generator.generate_embeddings(texts)
+
+        assert [v[0] for v in vectors] == [200.0, 10.0, 12.0, 190.0]
+        assert [len(call) for call in model.calls] == [1, 1, 2]
+
+    def test_failed_batch_retries_individually(self):
+        model = FakeModel(fail_batches=True)
+        generator = make_generator(model)
+
+        vectors = generator.generate_embeddings(["aa", "b"])
+
+        assert vectors == [[2.0, 1.0], [1.0, 1.0]]
+
+    def test_without_model_returns_empty_vectors(self):
+        generator = make_generator(None)
+
+        assert generator.generate_embeddings(["text"]) == [[]]
+
+
+# ============================================================================
+# Micro-batch coalescing
+# ============================================================================
+
+
+class TestMicroBatcher:
+    def test_concurrent_requests_share_batches(self):
+        model = FakeModel()
+        generator = make_generator(model)
+        batcher = MicroBatcher(generator.generate_embeddings, window_ms=50)
+        texts = ["t" * (i + 1) for i in range(8)]
+        results = {}
+        barrier = threading.Barrier(len(texts))
+
+        def worker(text):
+            barrier.wait()
+            results[text] = batcher.submit(text)
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in texts]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert {t: v[0] for t, v in results.items()} == {t: float(len(t)) for t in texts}
+        assert batcher.requests == 8
+        assert batcher.batches < 8
+
+    def test_leader_hands_off_after_its_own_batch(self):
+        encoded_by = {}
+
+        def encode(texts):
+            for text in texts:
+                encoded_by[text] = threading.current_thread().name
+            return [[float(len(t))] for t in texts]
+
+        batcher = MicroBatcher(encode, window_ms=50, max_batch_size=1)
+        texts = [f"text-{i}" for i in range(4)]
+        barrier = threading.Barrier(len(texts))
+
+        def worker(text):
+            barrier.wait()
+            assert batcher.submit(text) == [float(len(text))]
+
+        threads = [
+            threading.Thread(target=worker, args=(t,), name=t) for t in texts
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        # Every caller encoded exactly its own text, then passed leadership on
+        assert encoded_by == {t: t for t in texts}
+        assert batcher.batches == 4
+        assert batcher._leader_active is False
+
+    def test_errors_propagate_to_callers(self):
+        def failing(texts):
+            raise RuntimeError("boom")
+
+        batcher = MicroBatcher(failing, window_ms=0)
+
+        try:
+            batcher.submit("x")
+        except RuntimeError as e:
+            assert str(e) == "boom"
+        else:
+            raise AssertionError("expected RuntimeError")
+
+    def test_generator_routes_single_calls_through_batcher(self):
+        model = FakeModel()
+        generator = make_generator(model, coalesce_window_ms=1)
+
+        assert generator.generate_embedding("abcd") == [4.0, 1.0]
+        assert model.calls == [["abcd"]]
+
+
+# ============================================================================
+# embed_texts
+# ============================================================================
+
+
+class TestEmbedTexts:
+    def test_uses_batch_api(self):
+        model = FakeModel()
+        generator = make_generator(model)
+
+        assert embed_texts(generator, ["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+        assert len(model.calls) == 1
+
+    def test_falls_back_to_single_calls(self):
+        embedder = Mock(spec=["generate_embedding"])
+        embedder.generate_embedding.side_effect = lambda t: [float(len(t))]
+
+        assert embed_texts(embedder, ["a", "bb"]) == [[1.0], [2.0]]
@@ -0,0 +1,190 @@
+"""Unit tests for the content-addressed embedding cache.
+
+Tests cover:
+- Key normalization and model separation
+- In-process LRU tier with a byte budget
+- Redis tier storing packed float32 bytes, promotion into the local tier
+- Backing off from Redis after connection errors
+- EmbeddingService query embedding reuse
+"""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from app.shared.cache import EmbeddingCache, embedding_cache_key
+from app.shared.embeddings import EmbeddingService
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+class InMemoryRedis:
+    """Minimal bytes-returning Redis stand-in (mget/setex/pipeline)."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.mget_calls = 0
+
+    def mget(self, keys):
+        self.mget_calls += 1
+        return [self.data.get(k) for k in keys]
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.ttls[key] = ttl
+        return self
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def execute(self):
+        return []
+
+
+class DownRedis:
+    def __init__(self):
+        self.calls = 0
+
+    def mget(self, keys):
+        self.calls += 1
+        raise ConnectionError("Connection refused")
+
+    def pipeline(self, transaction=True):
+        self.calls += 1
+        raise ConnectionError("Connection refused")
+
+
+@pytest.fixture
+def redis_client():
+    return InMemoryRedis()
+
+
+# ============================================================================
+# EmbeddingCache
+# ============================================================================
+
+
+class TestEmbeddingCacheKeys:
+    def test_whitespace_normalized_case_preserved(self):
+        assert embedding_cache_key("m", "graph  neural\nnets ") == embedding_cache_key(
+            "m", "graph neural nets"
+        )
+        assert embedding_cache_key("m", "Graph") != embedding_cache_key("m", "graph")
+
+    def test_model_name_is_part_of_key(self):
+        assert embedding_cache_key("a", "text") != embedding_cache_key("b", "text")
+
+
+class TestEmbeddingCache:
+    def test_round_trip_through_local_tier(self, redis_client):
+        cache = EmbeddingCache(max_bytes=1024, redis_client=redis_client)
+        cache.set("m", "hello", [0.5, -1.0, 2.0])
+
+        assert cache.get("m", "hello") == [0.5, -1.0, 2.0]
+        assert cache.get("m", "other") is None
+        assert (cache.local_hits, cache.stats.hits, cache.stats.misses) == (1, 1, 1)
+
+    def test_redis_stores_packed_float32(self, redis_client):
+        cache = EmbeddingCache(max_bytes=1024, ttl=60, redis_client=redis_client)
+        cache.set("m", "hello", [1.0, 2.0])
+
+        key = embedding_cache_key("m", "hello")
+        assert redis_client.data[key] == np.array([1.0, 2.0], dtype="<f4").tobytes()
+        assert redis_client.ttls[key] == 60
+
+    def test_redis_hit_is_promoted_to_local(self, redis_client):
+        writer = EmbeddingCache(max_bytes=0, redis_client=redis_client)
+        writer.set("m", "shared", [3.0, 4.0])
+        reader = EmbeddingCache(max_bytes=1024, redis_client=redis_client)
+
+        assert reader.get("m", "shared") == [3.0, 4.0]
+        assert reader.get("m", "shared") == [3.0, 4.0]
+        assert (reader.redis_hits, reader.local_hits) == (1, 1)
+        assert redis_client.mget_calls == 1
+
+    def test_lru_evicts_within_byte_budget(self, redis_client):
+        # Each 4-d float32 vector is 16 bytes; budget fits two
+        cache = EmbeddingCache(max_bytes=32, redis_client=None)
+        cache.set("m", "a", [1.0] * 4)
+        cache.set("m", "b", [2.0] * 4)
+        cache.get("m", "a")  # a becomes most recently used
+        cache.set("m", "c", [3.0] * 4)
+
+        assert cache.get("m", "b") is None
+        assert cache.get("m", "a") == [1.0] * 4
+        assert cache.stats_dict()["local_bytes"] == 32
+
+    def test_get_many_preserves_order(self, redis_client):
+        cache = EmbeddingCache(max_bytes=1024, redis_client=redis_client)
+        cache.set_many("m", ["x", "y"], [[1.0], [2.0]])
+
+        assert cache.get_many("m", ["y", "missing", "x"]) == [[2.0], None, [1.0]]
+
+    def test_backs_off_after_redis_error(self):
+        down = DownRedis()
+        cache = EmbeddingCache(max_bytes=1024, redis_client=down, retry_after=60)
+
+        assert cache.get("m", "q") is None
+        assert cache.get("m", "q") is None
+        cache.set("m", "q", [1.0])
+        assert down.calls == 1
+        assert cache.get("m", "q") == [1.0]
+        assert cache.stats_dict()["redis_available"] is False
+
+
+# ============================================================================
+# EmbeddingService integration
+# ============================================================================
+
+
+class TestEmbeddingServiceCaching:
+    def test_repeated_query_is_encoded_once(self, redis_client):
+        generator = Mock()
+        generator.model_name = "test-model"
+        generator.generate_embedding.return_value = [0.25, 0.75]
+        service = EmbeddingService(
+            embedding_generator=generator,
+            embedding_cache=EmbeddingCache(max_bytes=1024, redis_client=redis_client),
+        )
+
+        assert service.generate_embedding("neural search") == [0.25, 0.75]
+        assert service.generate_embedding("neural  search") == [0.25, 0.75]
+        assert generator.generate_embedding.call_count == 1
+
+    def test_batch_only_encodes_uncached_texts(self, redis_client):
+        generator = Mock()
+        generator.model_name = "test-model"
+        generator.generate_embedding.return_value = [1.0]
+        generator.generate_embeddings.side_effect = lambda texts: [
+            [float(len(t))] for t in texts
+        ]
+        service = EmbeddingService(
+            embedding_generator=generator,
+            embedding_cache=EmbeddingCache(max_bytes=1024, redis_client=redis_client),
+        )
+        service.generate_embedding("seen")
+
+        vectors = service.generate_embeddings(["seen", "", "new text"])
+
+        assert vectors == [[1.0], [], [8.0]]
+        generator.generate_embeddings.assert_called_once_with(["new text"])
+
+    def test_failed_generation_is_not_cached(self, redis_client):
+        generator = Mock()
+        generator.model_name = "test-model"
+        generator.generate_embedding.return_value = []
+        service = EmbeddingService(
+            embedding_generator=generator,
+            embedding_cache=EmbeddingCache(max_bytes=1024, redis_client=redis_client),
+        )
+
+        service.generate_embedding("q")
+        service.generate_embedding("q")
+
+        assert generator.generate_embedding.call_count == 2
+        assert redis_client.data == {}
@@ -0,0 +1,251 @@
+"""Unit tests for EventBus delivery modes and async dispatch.
+
+Tests cover:
+- Calling conventions resolved once at subscribe time
+- ASYNC handlers run inline when no dispatcher is running
+- ASYNC handlers run on dispatch workers, highest priority first
+- Backpressure: inline fallback for high priorities, drops for low ones
+- Dispatch metrics and event history
+"""
+
+import inspect
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.shared.event_bus import DeliveryMode, Event, EventPriority, event_bus
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def bus():
+    event_bus.clear_handlers()
+    event_bus.clear_history()
+    event_bus.reset_metrics()
+    yield event_bus
+    event_bus.stop_dispatcher()
+    event_bus.clear_handlers()
+    event_bus.clear_history()
+    event_bus.reset_metrics()
+
+
+# ============================================================================
+# Calling conventions
+# ============================================================================
+
+
+class TestCallingConventions:
+    def test_signature_inspected_once_per_subscription(self, bus):
+        received = []
+
+        def payload_handler(payload):
+            received.append(payload)
+
+        def event_handler(event: Event):
+            received.append(event)
+
+        with patch(
+            "app.shared.event_bus.inspect.signature", wraps=inspect.signature
+        ) as sig:
+            bus.subscribe("test.conventions", payload_handler)
+            bus.subscribe("test.conventions", event_handler)
+            for _ in range(5):
+                bus.emit("test.conventions", {"n": 1})
+
+        assert sig.call_count == 2
+        assert received[0] == {"n": 1}
+        assert isinstance(received[1], Event)
+
+    def test_duplicate_subscription_ignored(self, bus):
+        calls = []
+
+        def handler(payload):
+            calls.append(payload)
+
+        bus.subscribe("test.duplicate", handler)
+        bus.subscribe("test.duplicate", handler, mode=DeliveryMode.ASYNC)
+        bus.emit("test.duplicate", {})
+
+        assert len(calls) == 1
+        assert bus.get_handlers("test.duplicate") == [handler]
+
+
+# ============================================================================
+# Async dispatch
+# ============================================================================
+
+
+class TestAsyncDispatch:
+    def test_async_handler_inline_without_dispatcher(self, bus):
+        threads = []
+        bus.subscribe(
+            "test.inline",
+            lambda payload: threads.append(threading.current_thread()),
+            mode=DeliveryMode.ASYNC,
+        )
+
+        bus.emit("test.inline", {})
+
+        assert threads == [threading.current_thread()]
+
+    def test_async_handler_runs_on_worker(self, bus):
+        threads = []
+        bus.subscribe(
+            "test.async",
+            lambda payload: threads.append(threading.current_thread()),
+            mode=DeliveryMode.ASYNC,
+        )
+        bus.start_dispatcher(workers=2, queue_size=10)
+
+        bus.emit("test.async", {})
+        assert bus.drain(timeout=5)
+
+        assert len(threads) == 1
+        assert threads[0] is not threading.current_thread()
+        assert bus.get_metrics()["events_delivered"] == 1
+
+    def test_sync_handler_not_delayed_by_async_handler(self, bus):
+        release = threading.Event()
+        order = []
+        bus.subscribe(
+            "test.mixed", lambda payload: release.wait(5), mode=DeliveryMode.ASYNC
+        )
+        bus.subscribe("test.mixed", lambda payload: order.append("sync"))
+        bus.start_dispatcher(workers=1, queue_size=10)
+
+        bus.emit("test.mixed", {})
+        assert order == ["sync"]
+
+        release.set()
+        assert bus.drain(timeout=5)
+
+    def test_higher_priority_served_first(self, bus):
+        release = threading.Event()
+        order = []
+        bus.subscribe(
+            "test.block", lambda payload: release.wait(5), mode=DeliveryMode.ASYNC
+        )
+        bus.subscribe(
+            "test.order",
+            lambda payload: order.append(payload["p"]),
+            mode=DeliveryMode.ASYNC,
+        )
+        bus.start_dispatcher(workers=1, queue_size=10)
+
+        bus.emit("test.block", {})
+        bus.emit("test.order", {"p": "low"}, priority=EventPriority.LOW)
+        bus.emit("test.order", {"p": "critical"}, priority=EventPriority.CRITICAL)
+        bus.emit("test.order", {"p": "normal"}, priority=EventPriority.NORMAL)
+        release.set()
+        assert bus.drain(timeout=5)
+
+        assert order == ["critical", "normal", "low"]
+
+    def test_stop_delivers_queued_events(self, bus):
+        calls = []
+        bus.subscribe(
+            "test.stop", lambda payload: calls.append(payload), mode=DeliveryMode.ASYNC
+        )
+        bus.start_dispatcher(workers=1, queue_size=100)
+
+        for i in range(20):
+            bus.emit("test.stop", {"i": i})
+        bus.stop_dispatcher()
+
+        assert len(calls) == 20
+        assert bus.get_metrics()["dispatch_workers"] == 0
+
+
+# ============================================================================
+# Backpressure
+# ============================================================================
+
+
+class TestBackpressure:
+    def _fill_queue(self, bus, release):
+        bus.subscribe(
+            "test.block", lambda payload: release.wait(5), mode=DeliveryMode.ASYNC
+        )
+        bus.start_dispatcher(workers=1, queue_size=1)
+        bus.emit("test.block", {})  # Occupies the only worker
+        # Wait until the worker has taken it off the queue
+        for _ in range(100):
+            if bus.get_metrics()["queue_depth"]["NORMAL"] == 0:
+                break
+            time.sleep(0.01)
+        bus.emit("test.block", {}, priority=EventPriority.LOW)
+        bus.emit("test.block", {}, priority=EventPriority.HIGH)
+
+    def test_low_priority_dropped_when_full(self, bus):
+        release = threading.Event()
+        self._fill_queue(bus, release)
+        calls = []
+        bus.subscribe(
+            "test.drop", lambda payload: calls.append(1), mode=DeliveryMode.ASYNC
+        )
+
+        bus.emit("test.drop", {}, priority=EventPriority.LOW)
+
+        metrics = bus.get_metrics()
+        assert metrics["events_dropped"] == 1
+        assert metrics["dropped_by_priority"] == {"LOW": 1}
+        assert metrics["queue_depth"]["LOW"] == 1
+        assert metrics["queue_capacity"] == 1
+        release.set()
+        assert bus.drain(timeout=5)
+        assert calls == []
+
+    def test_high_priority_delivered_inline_when_full(self, bus):
+        release = threading.Event()
+        self._fill_queue(bus, release)
+        threads = []
+        bus.subscribe(
+            "test.inline_fallback",
+            lambda payload: threads.append(threading.current_thread()),
+            mode=DeliveryMode.ASYNC,
+        )
+
+        bus.emit("test.inline_fallback", {}, priority=EventPriority.HIGH)
+
+        assert threads == [threading.current_thread()]
+        assert bus.get_metrics()["inline_fallbacks"] == 1
+        release.set()
+        assert bus.drain(timeout=5)
+
+
+# ============================================================================
+# History
+# ============================================================================
+
+
+class TestEventHistory:
+    def test_history_rendered_on_read(self, bus):
+        try:
+            bus.set_history_size(10)
+            bus.emit("test.history", {"a": 1}, priority=EventPriority.HIGH)
+
+            (entry,) = bus.get_event_history()
+            assert entry["name"] == "test.history"
+            assert entry["data"] == {"a": 1}
+            assert entry["priority"] == "HIGH"
+            assert entry["timestamp"].endswith("+00:00")
+        finally:
+            bus.set_history_size(0)
+
+    def test_history_is_opt_in(self, bus):
+        try:
+            bus.set_history_size(0)
+            bus.emit("test.history", {})
+            assert bus.get_event_history() == []
+
+            bus.set_history_size(10)
+            bus.emit("test.history", {})
+            assert len(bus.get_event_history()) == 1
+        finally:
+            bus.set_history_size(0)
@@ -0,0 +1,224 @@
+"""Unit tests for the shared sparse inverted index.
+
+Tests cover:
+- MaxScore top-k agrees with exhaustive dot-product scoring
+- Incremental upsert/remove with tombstones and merges
+- Persistence round trip
+- Stable token hashing for the fallback sparse encoder
+- Resource sparse index delta sync against the database
+"""
+
+import json
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from app.modules.search.sparse_embeddings import stable_token_id
+from app.shared.inverted_index import InvertedIndex, parse_sparse_vector
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def sparse_docs():
+    """Deterministic random sparse documents over a Zipf-like vocabulary."""
+    rng = np.random.default_rng(3)
+    docs = {}
+    for i in range(500):
+        terms = rng.zipf(1.3, size=20) % 2000
+        docs[f"d{i}"] = {int(t): float(w) for t, w in zip(terms, rng.random(20))}
+    return docs
+
+
+def brute_force(docs, query, k):
+    scores = []
+    for key, vec in docs.items():
+        score = sum(w * vec.get(t, 0.0) for t, w in query.items())
+        if score > 0:
+            scores.append((key, score))
+    scores.sort(key=lambda x: x[1], reverse=True)
+    return scores[:k]
+
+
+# ============================================================================
+# InvertedIndex
+# ============================================================================
+
+
+class TestInvertedIndex:
+    @pytest.mark.parametrize("merged", [False, True])
+    def test_maxscore_matches_brute_force(self, sparse_docs, merged):
+        index = InvertedIndex("test")
+        index.upsert_many(list(sparse_docs.items()))
+        if merged:
+            index.merge()
+
+        rng = np.random.default_rng(11)
+        for _ in range(20):
+            terms = rng.zipf(1.3, size=5) % 2000
+            query = {int(t): float(w) for t, w in zip(terms, rng.random(5) + 0.1)}
+            expected = brute_force(sparse_docs, query, 10)
+            got = index.search(query, k=10)
+            assert [s for _, s in got] == pytest.approx([s for _, s in expected])
+
+    def test_replace_and_remove_are_tombstoned(self):
+        index = InvertedIndex("test")
+        index.upsert("a", {1: 1.0})
+        index.upsert("b", {1: 0.5, 2: 1.0})
+        index.upsert("a", {2: 2.0})
+
+        assert index.search({1: 1.0}, k=5) == [("b", 0.5)]
+        assert index.remove("b")
+        assert index.search({1: 1.0}, k=5) == []
+        assert index.stats()["tombstones"] == 2
+
+        index.merge()
+        assert index.stats()["tombstones"] == 0
+        assert index.search({2: 1.0}, k=5) == [("a", 2.0)]
+
+    def test_empty_vector_removes_document(self):
+        index = InvertedIndex("test")
+        index.upsert("a", {1: 1.0})
+        assert not index.upsert("a", {})
+        assert "a" not in index
+
+    def test_save_and_load_round_trip(self, tmp_path, sparse_docs):
+        index = InvertedIndex("test", path=tmp_path / "sparse")
+        index.upsert_many(list(sparse_docs.items()))
+        index.remove("d0")
+        assert index.save()
+
+        loaded = InvertedIndex("test", path=tmp_path / "sparse")
+        assert loaded.load()
+        assert len(loaded) == len(sparse_docs) - 1
+        query = {t: 1.0 for t in list(sparse_docs["d1"])[:3]}
+        assert loaded.search(query, k=5) == index.search(query, k=5)
+
+        # Loaded (memory-mapped) indexes still accept updates
+        loaded.upsert("new", {999_999: 1.0})
+        assert loaded.search({999_999: 1.0}, k=1) == [("new", 1.0)]
+
+
+def test_parse_sparse_vector():
+    assert parse_sparse_vector(json.dumps({"5": 0.5, "6": 0})) == {5: 0.5}
+    assert parse_sparse_vector({7: 1}) == {7: 1.0}
+    assert parse_sparse_vector("[1, 2]") is None
+    assert parse_sparse_vector("") is None
+
+
+def test_stable_token_id_is_process_independent():
+    code = (
+        "from app.modules.search.sparse_embeddings import stable_token_id;"
+        "print(stable_token_id('retrieval'))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONHASHSEED": "123", "PATH": ""},
+        cwd=".",
+    )
+    assert out.returncode == 0, out.stderr
+    assert int(out.stdout.strip().splitlines()[-1]) == stable_token_id("retrieval")
+    assert 0 <= stable_token_id("retrieval") < 2**31
+
+
+# ============================================================================
+# Resource sparse index sync
+# ============================================================================
+
+
+class TestResourceSparseIndexSync:
+    def test_search_reflects_inserts_and_deletes(self, db_session, create_test_resource):
+        from app.modules.search.sparse_index import search_sparse_index
+
+        a = create_test_resource(title="A", sparse_embedding=json.dumps({"1": 0.9}))
+        b = create_test_resource(
+            title="B", sparse_embedding=json.dumps({"1": 0.2, "2": 0.8})
+        )
+
+        results = search_sparse_index(db_session, {1: 1.0}, limit=5)
+        assert [rid for rid, _ in results] == [str(a.id), str(b.id)]
+
+        c = create_test_resource(title="C", sparse_embedding=json.dumps({"2": 0.5}))
+        results = search_sparse_index(db_session, {2: 1.0}, limit=5)
+        assert [rid for rid, _ in results] == [str(b.id), str(c.id)]
+
+        db_session.delete(b)
+        db_session.commit()
+        results = search_sparse_index(db_session, {2: 1.0}, limit=5)
+        assert [rid for rid, _ in results] == [str(c.id)]
+
+    def test_idle_syncs_add_no_tombstones(self, db_session, create_test_resource):
+        from app.modules.search.sparse_index import get_sparse_index, search_sparse_index
+
+        for i in range(5):
+            create_test_resource(
+                title=f"R{i}", sparse_embedding=json.dumps({"1": 0.1 * (i + 1)})
+            )
+        search_sparse_index(db_session, {1: 1.0}, limit=5)
+        before = get_sparse_index(db_session).stats()
+
+        for _ in range(10):
+            search_sparse_index(db_session, {1: 1.0}, limit=5)
+
+        after = get_sparse_index(db_session).stats()
+        assert after["tombstones"] == before["tombstones"]
+        assert after["delta_postings"] == before["delta_postings"]
+        assert after["unsaved_mutations"] == before["unsaved_mutations"]
+
+    def test_batch_update_is_not_reapplied_by_sync(self, db_session, create_test_resource):
+        from app.modules.search.sparse_embeddings import SparseEmbeddingService
+        from app.modules.search.sparse_index import get_sparse_index, search_sparse_index
+
+        resources = [
+            create_test_resource(title=f"R{i}", description=f"graph retrieval {i}")
+            for i in range(3)
+        ]
+        search_sparse_index(db_session, {1: 1.0}, limit=5)
+
+        SparseEmbeddingService(db_session).batch_update_sparse_embeddings(
+            resource_ids=[str(r.id) for r in resources]
+        )
+        before = get_sparse_index(db_session).stats()
+
+        search_sparse_index(db_session, {stable_token_id("graph"): 1.0}, limit=5)
+
+        after = get_sparse_index(db_session).stats()
+        assert after["size"] == 3
+        assert after["unsaved_mutations"] == before["unsaved_mutations"]
+
+    def test_legacy_hashed_vectors_are_regenerated(self, db_session, create_test_resource):
+        from app.modules.search.sparse_embeddings import (
+            BGE_M3_VOCAB_SIZE,
+            SparseEmbeddingService,
+        )
+
+        legacy = create_test_resource(
+            title="Legacy",
+            description="graph retrieval",
+            sparse_embedding=json.dumps({str(BGE_M3_VOCAB_SIZE + 17): 0.5}),
+            sparse_embedding_model="BAAI/bge-m3",
+        )
+        genuine = create_test_resource(
+            title="Genuine",
+            sparse_embedding=json.dumps({"42": 0.5}),
+            sparse_embedding_model="BAAI/bge-m3",
+        )
+        service = SparseEmbeddingService(db_session)
+
+        assert service.find_legacy_hashed_embeddings() == [str(legacy.id)]
+        assert service.regenerate_legacy_hashed_embeddings() == 1
+
+        db_session.refresh(legacy)
+        db_session.refresh(genuine)
+        assert parse_sparse_vector(legacy.sparse_embedding) == (
+            service.generate_embedding("graph retrieval")
+        )
+        assert genuine.sparse_embedding == json.dumps({"42": 0.5})
+        assert service.find_legacy_hashed_embeddings() == []
@@ -0,0 +1,119 @@
+"""Unit tests for Resource load profiles.
+
+Tests cover:
+- Large Text columns are deferred by default
+- Each profile loads its columns and leaves the rest unloaded
+- Deferred columns still load on access
+- Unknown profile names
+"""
+
+import json
+
+import pytest
+from sqlalchemy import inspect
+
+from app.database.load_profiles import RESOURCE_PROFILES, resource_profile
+from app.database.models import Resource
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def stored_resource(db_session):
+    resource = Resource(
+        title="Deferred Columns",
+        type="article",
+        quality_overall=0.8,
+        embedding=json.dumps([0.1, 0.2, 0.3]),
+        sparse_embedding=json.dumps({"1": 0.5}),
+        equations=json.dumps(["E = mc^2"]),
+    )
+    db_session.add(resource)
+    db_session.commit()
+    resource_id = resource.id
+    db_session.expunge_all()
+    return resource_id
+
+
+def _unloaded(resource):
+    return inspect(resource).unloaded
+
+
+# ============================================================================
+# Profiles
+# ============================================================================
+
+
+class TestResourceProfiles:
+    def test_plain_query_defers_heavy_columns(self, db_session, stored_resource):
+        resource = db_session.query(Resource).filter_by(id=stored_resource).one()
+
+        unloaded = _unloaded(resource)
+        for column in ("embedding", "sparse_embedding", "search_vector", "equations"):
+            assert column in unloaded
+        assert "quality_overall" not in unloaded
+
+    def test_card_profile(self, db_session, stored_resource):
+        resource = (
+            db_session.query(Resource)
+            .options(*resource_profile("card"))
+            .filter_by(id=stored_resource)
+            .one()
+        )
+
+        unloaded = _unloaded(resource)
+        assert "title" not in unloaded
+        assert "embedding" in unloaded
+        assert "quality_overall" in unloaded
+
+    def test_vectors_profile_loads_embedding(self, db_session, stored_resource):
+        resource = (
+            db_session.query(Resource)
+            .options(*resource_profile("vectors"))
+            .filter_by(id=stored_resource)
+            .one()
+        )
+
+        unloaded = _unloaded(resource)
+        assert "embedding" not in unloaded
+        assert "sparse_embedding" in unloaded
+
+    def test_quality_profile_loads_quality_fields(self, db_session, stored_resource):
+        resource = (
+            db_session.query(Resource)
+            .options(*resource_profile("quality"))
+            .filter_by(id=stored_resource)
+            .one()
+        )
+
+        unloaded = _unloaded(resource)
+        assert "quality_overall" not in unloaded
+        assert "embedding" in unloaded
+
+    def test_full_profile_loads_every_column(self, db_session, stored_resource):
+        resource = (
+            db_session.query(Resource)
+            .options(*resource_profile("full"))
+            .filter_by(id=stored_resource)
+            .one()
+        )
+
+        assert not _unloaded(resource) & {c.key for c in Resource.__table__.columns}
+
+    def test_deferred_column_loads_on_access(self, db_session, stored_resource):
+        resource = (
+            db_session.query(Resource)
+            .options(*resource_profile("card"))
+            .filter_by(id=stored_resource)
+            .one()
+        )
+
+        assert json.loads(resource.embedding) == [0.1, 0.2, 0.3]
+
+    def test_unknown_profile(self):
+        assert set(RESOURCE_PROFILES) == {"card", "vectors", "quality", "full"}
+        with pytest.raises(ValueError, match="Unknown resource load profile"):
+            resource_profile("everything")
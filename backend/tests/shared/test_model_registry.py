@@ -0,0 +1,253 @@
+"""Unit tests for the process-wide ML model registry.
+
+Tests cover:
+- Concurrent callers share a single load per (kind, model_name, device)
+- Loader failures and unavailable libraries are not cached
+- LRU eviction of idle models under the memory budget
+- Leases release back under the budget
+- Preload specs and statistics
+- Services leasing their models from the registry per call
+"""
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.shared import model_registry
+from app.shared.model_registry import (
+    ModelRegistry,
+    estimate_model_bytes,
+    register_loader,
+)
+
+
+class FakeModel:
+    """Model stand-in with a fixed size."""
+
+    def __init__(self, name, nbytes=100):
+        self.name = name
+        self.nbytes = nbytes
+
+
+def test_concurrent_get_loads_once():
+    registry = ModelRegistry()
+    calls = []
+
+    def load(model_name, device):
+        calls.append((model_name, device))
+        time.sleep(0.05)
+        return FakeModel(model_name)
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(registry.get("fake", "m", loader=load))
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [("m", "auto")]
+    assert len({id(model) for model in results}) == 1
+    assert registry.stats()["loads"] == {"fake:m:auto": 1}
+
+
+def test_device_is_part_of_the_key():
+    registry = ModelRegistry()
+    load = lambda name, device: FakeModel(f"{name}@{device}")  # noqa: E731
+
+    cpu = registry.get("fake", "m", "cpu", loader=load)
+    cuda = registry.get("fake", "m", "cuda", loader=load)
+
+    assert cpu is not cuda
+    assert registry.get("fake", "m", "cpu", loader=load) is cpu
+
+
+def test_failures_and_missing_libraries_are_not_cached():
+    registry = ModelRegistry()
+    attempts = []
+
+    def flaky(model_name, device):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("download failed")
+        return FakeModel(model_name)
+
+    with pytest.raises(RuntimeError):
+        registry.get("fake", "m", loader=flaky)
+    assert registry.get("fake", "m", loader=flaky) is not None
+    assert registry.stats()["load_failures"] == 1
+
+    assert registry.get("fake", "absent", loader=lambda n, d: None) is None
+    assert registry.stats()["models"][0]["model_name"] == "m"
+
+
+def test_budget_evicts_least_recently_used_idle_models():
+    registry = ModelRegistry(max_bytes=250)
+    load = lambda name, device: FakeModel(name, nbytes=100)  # noqa: E731
+
+    a = registry.get("fake", "a", loader=load)
+    registry.get("fake", "b", loader=load)
+    assert registry.get("fake", "a", loader=load) is a  # a is now most recent
+    registry.get("fake", "c", loader=load)
+
+    loaded = {m["model_name"] for m in registry.stats()["models"]}
+    assert loaded == {"a", "c"}
+    assert registry.evictions == 1
+    assert registry.stats()["resident_bytes"] == 200
+
+
+def test_models_in_use_are_not_evicted(monkeypatch):
+    registry = ModelRegistry(max_bytes=150)
+    monkeypatch.setitem(model_registry._loaders, "fake_sized", None)
+    register_loader("fake_sized", lambda name, device: FakeModel(name, nbytes=100))
+
+    with registry.use("fake_sized", "held") as held:
+        registry.get("fake_sized", "other")
+        loaded = {m["model_name"] for m in registry.stats()["models"]}
+        assert loaded == {"held", "other"}
+
+    registry.get("fake_sized", "third")
+    loaded = {m["model_name"] for m in registry.stats()["models"]}
+    assert "held" not in loaded
+    assert held.name == "held"
+
+
+def test_preload_parses_specs_and_skips_failures(monkeypatch):
+    registry = ModelRegistry()
+    monkeypatch.setitem(model_registry._loaders, "fake_preload", None)
+    register_loader("fake_preload", lambda name, device: FakeModel(f"{name}@{device}"))
+
+    loaded = registry.preload(
+        ["fake_preload:a", "fake_preload:b@cpu", "unknown_kind:x", "malformed"]
+    )
+
+    assert loaded == 2
+    keys = {(m["model_name"], m["device"]) for m in registry.stats()["models"]}
+    assert keys == {("a", "auto"), ("b", "cpu")}
+
+
+def test_estimate_model_bytes_from_parameters():
+    class Tensor:
+        def __init__(self, n):
+            self.n = n
+
+        def numel(self):
+            return self.n
+
+        def element_size(self):
+            return 4
+
+    class Wrapper:
+        class model:
+            @staticmethod
+            def parameters():
+                return [Tensor(10), Tensor(5)]
+
+    assert estimate_model_bytes(Wrapper()) == 60
+    assert estimate_model_bytes(np.zeros(8, dtype=np.float32)) == 32
+    assert estimate_model_bytes(object()) == 0
+
+
+def test_lease_release_evicts_down_to_budget(monkeypatch):
+    registry = ModelRegistry(max_bytes=150)
+    monkeypatch.setitem(model_registry._loaders, "fake_sized", None)
+    register_loader("fake_sized", lambda name, device: FakeModel(name, nbytes=100))
+
+    with registry.use("fake_sized", "held"):
+        with registry.use("fake_sized", "other"):
+            # Both leased: over budget until one is released
+            assert registry.stats()["resident_bytes"] == 200
+        loaded = {m["model_name"] for m in registry.stats()["models"]}
+        assert loaded == {"held"}
+
+    assert registry.stats()["models"][0]["in_use"] == 0
+
+
+def test_optional_lease_yields_none_on_load_failure(monkeypatch):
+    registry = ModelRegistry()
+    monkeypatch.setitem(model_registry._loaders, "fake_broken", None)
+
+    def broken(name, device):
+        raise RuntimeError("download failed")
+
+    register_loader("fake_broken", broken)
+
+    with registry.use("fake_broken", "m", optional=True) as model:
+        assert model is None
+    with pytest.raises(RuntimeError):
+        with registry.use("fake_broken", "m"):
+            pass
+
+
+def test_rerankers_lease_one_shared_model(monkeypatch):
+    from app.modules.search import reranking
+
+    registry = ModelRegistry()
+    monkeypatch.setattr(reranking, "get_model_registry", lambda: registry)
+    monkeypatch.setattr(reranking, "CROSSENCODER_AVAILABLE", True)
+    loads = []
+
+    class Scorer(FakeModel):
+        def predict(self, pairs):
+            return [len(doc) for _, doc in pairs]
+
+    def load(model_name, device):
+        loads.append(model_name)
+        return Scorer(model_name)
+
+    monkeypatch.setitem(model_registry._loaders, "cross_encoder", load)
+    db = MagicMock()
+    db.query.return_value.filter.return_value.all.return_value = [
+        SimpleNamespace(id="a", title="short", description=""),
+        SimpleNamespace(id="b", title="a longer title", description=""),
+    ]
+
+    for service in (reranking.RerankingService(db), reranking.RerankingService(db)):
+        ranked = service.rerank("q", [("a", 1.0), ("b", 0.5)])
+        assert [rid for rid, _ in ranked] == ["b", "a"]
+        assert not hasattr(service, "model")
+
+    assert loads == ["cross-encoder/ms-marco-MiniLM-L-6-v2"]
+    assert registry.stats()["models"][0]["in_use"] == 0
+
+
+def test_ncf_reloads_checkpoint_overwritten_on_disk(monkeypatch, tmp_path):
+    from app.modules.recommendations import ncf
+
+    registry = ModelRegistry()
+    monkeypatch.setattr(ncf, "get_model_registry", lambda: registry)
+    checkpoint = tmp_path / "ncf_model.pt"
+    checkpoint.write_bytes(b"v1")
+    loads = []
+
+    def load(model_path, device):
+        loads.append(model_path)
+        return ncf.NCFCheckpoint(
+            None, device, {"u1": 0}, {}, mtime_ns=os.stat(model_path).st_mtime_ns
+        )
+
+    monkeypatch.setitem(model_registry._loaders, "ncf", load)
+    service = ncf.NCFService(db=None, model_path=str(checkpoint))
+
+    with service._lease() as first:
+        pass
+    with service._lease() as same:
+        assert same is first
+
+    # Retraining overwrites the checkpoint in place
+    stat = checkpoint.stat()
+    os.utime(checkpoint, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    with service._lease() as reloaded:
+        assert reloaded is not first
+
+    assert loads == [str(checkpoint)] * 2
+    assert len(registry.stats()["models"]) == 1
@@ -0,0 +1,224 @@
+"""Unit tests for the shared ANN vector index.
+
+Tests cover:
+- Exact search below the training threshold
+- IVF search recall after training
+- Upsert/remove with slot reuse
+- Persistence round trip
+- Resource index delta sync against the database
+- Idle delta syncs leave the index untouched
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from app.shared.vector_index import (
+    VectorIndex,
+    get_vector_index,
+    parse_embedding,
+    staging_dir,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def random_vectors():
+    """Deterministic random unit vectors."""
+    rng = np.random.default_rng(42)
+    vectors = rng.normal(size=(2000, 32)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+# ============================================================================
+# VectorIndex
+# ============================================================================
+
+
+class TestVectorIndex:
+    def test_exact_search_matches_brute_force(self, random_vectors):
+        index = VectorIndex("test", train_threshold=10_000)
+        keys = [f"r{i}" for i in range(len(random_vectors))]
+        index.upsert_many(keys, random_vectors)
+
+        query = random_vectors[7]
+        results = index.search(query, k=5)
+
+        expected = np.argsort(-(random_vectors @ query))[:5]
+        assert [k for k, _ in results] == [keys[i] for i in expected]
+        assert results[0][0] == "r7"
+        assert results[0][1] == pytest.approx(1.0, abs=1e-5)
+
+    def test_trained_index_recall(self):
+        # Clustered data, like real embeddings (isotropic noise is IVF's worst case)
+        rng = np.random.default_rng(7)
+        centers = rng.normal(size=(40, 32))
+        vectors = centers[rng.integers(0, 40, size=2000)] + 0.3 * rng.normal(
+            size=(2000, 32)
+        )
+        vectors = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(
+            np.float32
+        )
+
+        index = VectorIndex("test", train_threshold=500, nprobe=8)
+        keys = [f"r{i}" for i in range(len(vectors))]
+        index.upsert_many(keys, vectors)
+        assert index.train()
+        assert index.is_trained
+
+        hits = 0
+        for qi in range(0, 200, 10):
+            query = vectors[qi]
+            expected = set(keys[i] for i in np.argsort(-(vectors @ query))[:10])
+            got = set(k for k, _ in index.search(query, k=10))
+            hits += len(expected & got)
+        assert hits / 200 >= 0.8
+
+    def test_upsert_replaces_and_remove_reuses_slot(self):
+        index = VectorIndex("test")
+        index.upsert("a", [1.0, 0.0])
+        index.upsert("b", [0.0, 1.0])
+        index.upsert("a", [0.0, 1.0])
+        assert len(index) == 2
+
+        assert index.remove("b")
+        assert not index.remove("b")
+        assert len(index) == 1
+
+        index.upsert("c", [1.0, 0.0])
+        assert index.stats()["free_slots"] == 0
+        assert index.search([1.0, 0.0], k=1)[0][0] == "c"
+
+    def test_search_excludes_keys_and_ignores_bad_dims(self):
+        index = VectorIndex("test")
+        index.upsert_many(["a", "b"], [[1.0, 0.0], [0.9, 0.1]])
+        assert index.upsert("c", [1.0, 0.0, 0.0]) == 0
+
+        results = index.search([1.0, 0.0], k=2, exclude=["a"])
+        assert [k for k, _ in results] == ["b"]
+        assert index.search([1.0, 0.0, 0.0], k=2) == []
+
+    def test_excluded_keys_do_not_reduce_top_k(self, random_vectors):
+        index = VectorIndex("test", train_threshold=10_000)
+        keys = [f"r{i}" for i in range(len(random_vectors))]
+        index.upsert_many(keys, random_vectors)
+        query = random_vectors[3]
+        nearest = [k for k, _ in index.search(query, k=50)]
+
+        results = index.search(query, k=5, exclude=nearest[:40])
+
+        assert [k for k, _ in results] == nearest[40:45]
+        [batched] = index.search_many([query], k=5, exclude=nearest[:40])
+        assert [k for k, _ in batched] == nearest[40:45]
+
+    def test_save_and_load_round_trip(self, tmp_path, random_vectors):
+        index = VectorIndex("test", path=tmp_path / "idx", train_threshold=500)
+        keys = [f"r{i}" for i in range(len(random_vectors))]
+        index.upsert_many(keys, random_vectors)
+        index.train()
+        index.remove("r3")
+        assert index.save()
+
+        loaded = VectorIndex("test", path=tmp_path / "idx", train_threshold=500)
+        assert loaded.load()
+        assert len(loaded) == len(keys) - 1
+        assert loaded.is_trained
+        assert "r3" not in loaded
+        assert loaded.search(random_vectors[5], k=1)[0][0] == "r5"
+
+    def test_saves_stage_in_unique_directories(self, tmp_path, random_vectors):
+        path = tmp_path / "idx"
+        assert staging_dir(path) != staging_dir(path)
+
+        index = VectorIndex("test", path=path)
+        index.upsert_many(["a", "b"], random_vectors[:2])
+        assert index.save()
+        assert index.save()
+        assert [p.name for p in tmp_path.iterdir()] == ["idx"]
+
+    def test_dimension_change_on_empty_index_resets_storage(self):
+        index = VectorIndex("test")
+        index.upsert_many(["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+        index.remove("a")
+        index.remove("b")
+
+        assert index.upsert_many(["c"], [[1.0, 0.0, 0.0]]) == 1
+        assert index.dim == 3
+        assert index.search([1.0, 0.0, 0.0], k=1)[0][0] == "c"
+
+    def test_stats_report_staleness(self):
+        index = VectorIndex("test")
+        index.upsert_many(["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+        stats = index.stats()
+        assert stats["size"] == 2
+        assert stats["trained"] is False
+        assert stats["staleness"] == 1.0
+
+
+def test_parse_embedding_handles_json_and_lists():
+    assert parse_embedding(json.dumps([0.1, 0.2])) == [0.1, 0.2]
+    assert parse_embedding([0.1]) == [0.1]
+    assert parse_embedding("") is None
+    assert parse_embedding("not json") is None
+    assert parse_embedding(None) is None
+
+
+# ============================================================================
+# Resource index sync
+# ============================================================================
+
+
+class TestResourceIndexSync:
+    def test_registry_is_scoped_per_engine(self, db_engine):
+        assert get_vector_index(db_engine, "resources") is get_vector_index(
+            db_engine, "resources"
+        )
+        assert get_vector_index(db_engine, "resources").path is None
+
+    def test_search_reflects_inserts_updates_and_deletes(
+        self, db_session, create_test_resource
+    ):
+        from app.modules.search.dense_index import search_resource_index
+
+        a = create_test_resource(title="A", embedding=json.dumps([1.0, 0.0, 0.0]))
+        b = create_test_resource(title="B", embedding=json.dumps([0.0, 1.0, 0.0]))
+
+        results = search_resource_index(db_session, [1.0, 0.0, 0.0], limit=2)
+        assert [rid for rid, _ in results] == [str(a.id), str(b.id)]
+
+        # New resource is picked up by the delta sync
+        c = create_test_resource(title="C", embedding=json.dumps([0.9, 0.1, 0.0]))
+        results = search_resource_index(db_session, [1.0, 0.0, 0.0], limit=2)
+        assert [rid for rid, _ in results] == [str(a.id), str(c.id)]
+
+        # Deleted resources are dropped from results and evicted
+        db_session.delete(a)
+        db_session.commit()
+        results = search_resource_index(db_session, [1.0, 0.0, 0.0], limit=3)
+        assert str(a.id) not in [rid for rid, _ in results]
+
+    def test_idle_syncs_do_not_mutate_index(self, db_session, create_test_resource):
+        from app.modules.search.dense_index import (
+            get_resource_index,
+            search_resource_index,
+        )
+
+        for i in range(5):
+            create_test_resource(
+                title=f"R{i}", embedding=json.dumps([1.0, float(i), 0.0])
+            )
+        search_resource_index(db_session, [1.0, 0.0, 0.0], limit=5)
+        index = get_resource_index(db_session)
+        before = index.stats()
+
+        for _ in range(10):
+            search_resource_index(db_session, [1.0, 0.0, 0.0], limit=5)
+
+        after = index.stats()
+        assert after["unsaved_mutations"] == before["unsaved_mutations"]
+        assert after["mutations_since_train"] == before["mutations_since_train"]
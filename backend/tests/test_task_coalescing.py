@@ -0,0 +1,213 @@
+"""Unit tests for hook-triggered task coalescing.
+
+Tests cover:
+- Duplicate submissions inside the window collapse into one run
+- Due keys of a channel dispatch as one batch (split at max_batch)
+- Keys not yet due stay queued and re-arm the channel
+- Redis delay queue against a minimal sorted-set stand-in
+- Hooks submit to the coalescer instead of enqueuing tasks
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.events.hooks import Event, on_metadata_changed_recompute_quality
+from app.tasks.coalescing import (
+    CoalescingChannel,
+    LocalDelayQueue,
+    RedisDelayQueue,
+    TaskCoalescer,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+class SortedSetRedis:
+    """Minimal decoded-response Redis stand-in (zset/set/hash subset)."""
+
+    def __init__(self):
+        self.zsets = {}
+        self.keys = {}
+        self.hashes = {}
+
+    def zadd(self, name, mapping, nx=False):
+        zset = self.zsets.setdefault(name, {})
+        added = 0
+        for member, score in mapping.items():
+            if nx and member in zset:
+                continue
+            added += member not in zset
+            zset[member] = score
+        return added
+
+    def zrangebyscore(self, name, low, high):
+        zset = self.zsets.get(name, {})
+        return [m for m, s in sorted(zset.items(), key=lambda i: i[1]) if s <= high]
+
+    def zrange(self, name, start, end, withscores=False):
+        items = sorted(self.zsets.get(name, {}).items(), key=lambda i: i[1])
+        items = items[start : end + 1]
+        return items if withscores else [m for m, _ in items]
+
+    def zrem(self, name, member):
+        return 1 if self.zsets.get(name, {}).pop(member, None) is not None else 0
+
+    def pipeline(self):
+        redis = self
+
+        class Pipeline:
+            def __init__(self):
+                self.calls = []
+
+            def zrem(self, name, member):
+                self.calls.append((name, member))
+
+            def execute(self):
+                return [redis.zrem(name, member) for name, member in self.calls]
+
+        return Pipeline()
+
+    def set(self, name, value, nx=False, px=None):
+        if nx and name in self.keys:
+            return None
+        self.keys[name] = value
+        return True
+
+    def delete(self, name):
+        self.keys.pop(name, None)
+
+    def hincrby(self, name, field, amount):
+        h = self.hashes.setdefault(name, {})
+        h[field] = h.get(field, 0) + amount
+
+    def hgetall(self, name):
+        return {k: str(v) for k, v in self.hashes.get(name, {}).items()}
+
+
+@pytest.fixture
+def dispatched():
+    return []
+
+
+@pytest.fixture
+def coalescer(dispatched):
+    channel = CoalescingChannel("quality", window=10, dispatch=dispatched.append)
+    return TaskCoalescer(
+        store=LocalDelayQueue(use_timers=False), channels=[channel], max_batch=2
+    )
+
+
+# ============================================================================
+# Coalescing
+# ============================================================================
+
+
+class TestTaskCoalescer:
+    def test_duplicates_collapse_within_window(self, coalescer, dispatched):
+        assert coalescer.submit("quality", "r1") is True
+        assert coalescer.submit("quality", "r1") is False
+        assert coalescer.submit("quality", "r1") is False
+
+        coalescer.flush("quality", now=float("inf"))
+
+        assert dispatched == [["r1"]]
+        stats = coalescer.get_stats()["quality"]
+        assert stats["submitted"] == 3
+        assert stats["coalesced"] == 2
+        assert stats["enqueued"] == 1
+        assert stats["batched"] == 1
+
+    def test_due_keys_dispatch_in_batches(self, coalescer, dispatched):
+        for key in ("r1", "r2", "r3"):
+            coalescer.submit("quality", key)
+
+        assert coalescer.flush("quality", now=float("inf")) == 3
+
+        assert dispatched == [["r1", "r2"], ["r3"]]
+        assert coalescer.get_stats()["quality"]["enqueued"] == 2
+
+    def test_keys_not_yet_due_stay_queued(self, coalescer, dispatched):
+        coalescer.submit("quality", "r1")
+
+        assert coalescer.flush("quality", now=0) == 0
+        assert dispatched == []
+        assert coalescer.store.next_due("quality") is not None
+
+        # Resubmitting while still pending is coalesced
+        assert coalescer.submit("quality", "r1") is False
+
+    def test_key_reschedules_after_dispatch(self, coalescer, dispatched):
+        coalescer.submit("quality", "r1")
+        coalescer.flush("quality", now=float("inf"))
+
+        assert coalescer.submit("quality", "r1") is True
+
+    def test_executed_counts(self, coalescer):
+        coalescer.record_executed("quality", 4)
+
+        assert coalescer.get_stats()["quality"]["executed"] == 4
+
+    def test_unknown_channel(self, coalescer):
+        with pytest.raises(ValueError, match="Unknown coalescing channel"):
+            coalescer.submit("nope", "r1")
+
+    def test_store_failure_dispatches_directly(self, dispatched):
+        store = Mock()
+        store.add.side_effect = ConnectionError("redis down")
+        channel = CoalescingChannel("quality", window=10, dispatch=dispatched.append)
+        coalescer = TaskCoalescer(store=store, channels=[channel])
+
+        assert coalescer.submit("quality", "r1") is True
+        assert dispatched == [["r1"]]
+
+
+class TestRedisDelayQueue:
+    def test_flush_through_redis(self, dispatched):
+        channel = CoalescingChannel("graph_edges", window=30, dispatch=dispatched.append)
+        store = RedisDelayQueue(SortedSetRedis())
+        coalescer = TaskCoalescer(store=store, channels=[channel])
+
+        with patch(
+            "app.tasks.celery_tasks.flush_coalesced_tasks_task.apply_async"
+        ) as arm:
+            coalescer.submit("graph_edges", "r1")
+            coalescer.submit("graph_edges", "r1")
+            coalescer.submit("graph_edges", "r2")
+
+            # One flush task per window, not one per submission
+            assert arm.call_count == 1
+            assert arm.call_args.kwargs["countdown"] == 30
+
+            coalescer.flush("graph_edges", now=float("inf"))
+
+        assert dispatched == [["r1", "r2"]]
+        stats = coalescer.get_stats()["graph_edges"]
+        assert stats["submitted"] == 3
+        assert stats["coalesced"] == 1
+        assert stats["batched"] == 2
+
+
+# ============================================================================
+# Hooks
+# ============================================================================
+
+
+class TestHooks:
+    def test_metadata_hook_submits_to_coalescer(self):
+        coalescer = Mock()
+        with (
+            patch("app.tasks.coalescing.get_coalescer", return_value=coalescer),
+            patch("app.tasks.celery_tasks.recompute_quality_task.apply_async") as task,
+        ):
+            for _ in range(10):
+                on_metadata_changed_recompute_quality(
+                    Event(name="resource.metadata_changed", data={"resource_id": "r1"})
+                )
+
+        assert coalescer.submit.call_count == 10
+        coalescer.submit.assert_called_with("quality", "r1")
+        task.assert_not_called()